@@ -23,7 +23,7 @@ import omni.kit.app
 import omni.kit.usd.layers
 import omni.ui as ui
 from isaacsim.asset.gen.omap.bindings import _omap
-from isaacsim.asset.gen.omap.utils import compute_coordinates, generate_image, update_location
+from isaacsim.asset.gen.omap.utils import compute_coordinates, generate_image_array, update_location
 from isaacsim.core.utils.stage import get_stage_units
 from isaacsim.gui.components.element_wrappers import ScrollingWindow
 from isaacsim.gui.components.menu import make_menu_item_description
@@ -427,27 +427,11 @@ class OccupancyMapWindow(MenuHelperWindow):
         # self.draw_voxel_btn.visible = True
 
     def _fill_image(self):
-        dims = self._om.get_dimensions()
         scale = self._models["cell_size"].get_value_as_float()
         if scale <= 0:
             carb.log_warn("Cell size is less than or equal to 0. A value of 0.01 meters will be used instead.")
             scale = 0.01
         # Clockwise rotation
-        rotate_image_angle = 180
-        current_image_rotation_index = self._models["rotation"].get_item_value_model().as_int
-        if current_image_rotation_index == 0:  # 180 degrees
-            top_left, top_right, bottom_left, bottom_right, image_coords = compute_coordinates(self._om, scale)
-            rotate_image_angle = 180
-        elif current_image_rotation_index == 1:  # 0 degrees
-            top_right, bottom_right, top_left, bottom_left, image_coords = compute_coordinates(self._om, scale)
-            rotate_image_angle = 0
-        elif current_image_rotation_index == 2:  # -90 degrees
-            top_right, bottom_right, top_left, bottom_left, image_coords = compute_coordinates(self._om, scale)
-            rotate_image_angle = -90
-        elif current_image_rotation_index == 3:  # 90 degrees
-            bottom_left, top_left, bottom_right, top_right, image_coords = compute_coordinates(self._om, scale)
-            rotate_image_angle = 90
-
         rotate_image_angle = 180
         current_image_rotation_index = self._models["rotation"].get_item_value_model().as_int
         if current_image_rotation_index == 0:  # 180 degrees
@@ -478,11 +462,11 @@ class OccupancyMapWindow(MenuHelperWindow):
             component = self._models["unknown_color"].get_item_value_model(item)
             unknown_col.append(int(component.get_value_as_float() * 255))
 
-        self._image = generate_image(self._om, occupied_col, unknown_col, freespace_col)
+        image_array = generate_image_array(self._om, occupied_col, unknown_col, freespace_col)
 
         from PIL import Image
 
-        self._im = Image.frombytes("RGBA", (dims.x, dims.y), bytes(self._image))
+        self._im = Image.fromarray(image_array)
         self._im = self._im.rotate(-rotate_image_angle, expand=True)
         self._image = list(self._im.tobytes())
 
@@ -524,14 +508,9 @@ class OccupancyMapWindow(MenuHelperWindow):
             self._models["config_data"].set_value(image_details_text)
 
     def save_image(self, file, folder):
-        from PIL import Image
-
-        image_width = self._im.width
-        image_height = self._im.height
         file = file if file[-4:].lower() == ".png" else "{}.png".format(file)
-        im = Image.frombytes("RGBA", (image_width, image_height), bytes(self._image))
         print("Saving occupancy map image to", folder + "/" + file)
-        im.save(folder + "/" + file)
+        self._im.save(folder + "/" + file)
         self._filepicker.hide()
 
     def save_file(self):
@@ -23,7 +23,13 @@ import omni.kit.test
 
 # Import extension python module we are testing with absolute import path, as if we are external user (other extension)
 from isaacsim.asset.gen.omap.bindings import _omap
-from isaacsim.asset.gen.omap.utils import compute_coordinates, generate_image, update_location
+from isaacsim.asset.gen.omap.utils import (
+    compute_coordinates,
+    generate_image,
+    generate_image_array,
+    generate_image_tiles,
+    update_location,
+)
 from isaacsim.core.utils.stage import open_stage_async
 from isaacsim.storage.native import get_assets_root_path_async
 from pxr import PhysxSchema, Sdf, UsdGeom, UsdPhysics
@@ -130,6 +136,18 @@ class TestOccupancyMapGenerator(omni.kit.test.AsyncTestCase):
         self.assertEqual(image_buffer[(30 * dims[0] + 14) * 4 + 0], 127)
         self.assertEqual(image_buffer[(197 * dims[0] + 107) * 4 + 0], 0)
 
+        # vectorized and tiled image generation must match the flat image buffer
+        colors = ([0, 0, 0, 255], [127, 127, 127, 255], [255, 255, 255, 255])
+        image_array = generate_image_array(self._om, *colors)
+        self.assertEqual(image_array.shape, (dims[1], dims[0], 4))
+        self.assertEqual(image_array.dtype, np.uint8)
+        self.assertEqual(image_array.reshape(-1).tolist(), image_buffer)
+        self.assertEqual(image_array[85, 75, 0], 0)
+        self.assertEqual(image_array[64, 47, 0], 255)
+        tiles = list(generate_image_tiles(self._om, *colors, tile_rows=64))
+        self.assertEqual([row for row, _ in tiles], list(range(0, dims[1], 64)))
+        self.assertTrue(np.array_equal(np.concatenate([tile for _, tile in tiles]), image_array))
+
         # raw data: computed index, point value, point index
         # no reason for picking these specific points
         # 368 (-382.5,-322.5,42.5) 0
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+
 
 def update_location(om, start_location, lower_bound, upper_bound):
     om.set_transform(
@@ -24,8 +26,6 @@ def update_location(om, start_location, lower_bound, upper_bound):
 
 
 def compute_coordinates(om, cell_size):
-    import numpy as np
-
     min_b = om.get_min_bound()
     max_b = om.get_max_bound()
     scale = cell_size
@@ -35,26 +35,104 @@ def compute_coordinates(om, cell_size):
     bottom_left = (max_b[0] - half_w, max_b[1] - half_w)
     bottom_right = (min_b[0] + half_w, max_b[1] - half_w)
 
-    image_coords = np.matrix([[0, 1], [-1, 0]]) * np.matrix([[-top_left[0]], [-top_left[1]]])
+    image_coords = np.array([[0, 1], [-1, 0]]) @ np.array([[-top_left[0]], [-top_left[1]]])
 
     return top_left, top_right, bottom_left, bottom_right, image_coords
 
 
-def generate_image(om, occupied_col, unknown_col, freespace_col):
-    buffer = om.get_buffer()
+def _color_lookup_table(occupied_col, unknown_col, freespace_col):
+    # Row index matches the cell state computed by _classify_cells: 0 unknown, 1 occupied, 2 free
+    lut = np.asarray([unknown_col, occupied_col, freespace_col], dtype=np.uint8)
+    if lut.shape != (3, 4):
+        raise ValueError("Occupied, unknown and freespace colors must be RGBA sequences with 4 components each")
+    return lut
+
+
+def _classify_cells(values):
+    states = (values == 1.0).view(np.uint8)
+    states += (values == 0.0).view(np.uint8) * np.uint8(2)
+    return states
+
+
+def get_buffer_array(om):
+    """Get the occupancy buffer of a map as a NumPy array.
+
+    Args:
+        om: Occupancy map interface or generator.
+
+    Returns:
+        np.ndarray: Cell values as a ``float32`` array of shape ``(height, width)``.
+    """
     dims = om.get_dimensions()
-    image = unknown_col * dims[0] * dims[1]
-    idx = 0
-    for b in buffer:
-        if b == 1.0:
-            image[idx * 4 + 0] = occupied_col[0]
-            image[idx * 4 + 1] = occupied_col[1]
-            image[idx * 4 + 2] = occupied_col[2]
-            image[idx * 4 + 3] = occupied_col[3]
-        if b == 0.0:
-            image[idx * 4 + 0] = freespace_col[0]
-            image[idx * 4 + 1] = freespace_col[1]
-            image[idx * 4 + 2] = freespace_col[2]
-            image[idx * 4 + 3] = freespace_col[3]
-        idx += 1
-    return image
+    return np.asarray(om.get_buffer(), dtype=np.float32).reshape(dims[1], dims[0])
+
+
+def generate_image_array(om, occupied_col, unknown_col, freespace_col, buffer=None, out=None):
+    """Generate the RGBA image of an occupancy map as a NumPy array.
+
+    Cells are classified once and mapped to their colors through a lookup table,
+    so the cost is a handful of vectorized passes over the buffer.
+
+    Args:
+        om: Occupancy map interface or generator.
+        occupied_col (list): RGBA color (0-255) for occupied cells.
+        unknown_col (list): RGBA color (0-255) for unknown cells.
+        freespace_col (list): RGBA color (0-255) for free cells.
+        buffer (np.ndarray, optional): Occupancy buffer as returned by :func:`get_buffer_array`.
+            If not provided it is read from ``om``.
+        out (np.ndarray, optional): ``uint8`` array of shape ``(height, width, 4)`` to write the image into.
+
+    Returns:
+        np.ndarray: ``uint8`` image of shape ``(height, width, 4)``.
+    """
+    if buffer is None:
+        buffer = get_buffer_array(om)
+    lut = _color_lookup_table(occupied_col, unknown_col, freespace_col)
+    return np.take(lut, _classify_cells(buffer), axis=0, out=out)
+
+
+def generate_image_tiles(om, occupied_col, unknown_col, freespace_col, tile_rows=1024, buffer=None):
+    """Generate the RGBA image of an occupancy map in tiles of rows.
+
+    Use this variant for large maps where holding the full RGBA image (and its temporaries)
+    in memory is not desirable, e.g. to stream the tiles into a file or a memory-mapped array.
+
+    Args:
+        om: Occupancy map interface or generator.
+        occupied_col (list): RGBA color (0-255) for occupied cells.
+        unknown_col (list): RGBA color (0-255) for unknown cells.
+        freespace_col (list): RGBA color (0-255) for free cells.
+        tile_rows (int, optional): Number of image rows per tile. Defaults to 1024.
+        buffer (np.ndarray, optional): Occupancy buffer as returned by :func:`get_buffer_array`.
+            If not provided it is read from ``om``.
+
+    Raises:
+        ValueError: If ``tile_rows`` is not positive.
+
+    Yields:
+        tuple: Index of the first row of the tile and the ``uint8`` tile of shape ``(rows, width, 4)``.
+    """
+    if tile_rows <= 0:
+        raise ValueError(f"tile_rows must be positive, got {tile_rows}")
+    if buffer is None:
+        buffer = get_buffer_array(om)
+    lut = _color_lookup_table(occupied_col, unknown_col, freespace_col)
+    for row in range(0, buffer.shape[0], tile_rows):
+        yield row, np.take(lut, _classify_cells(buffer[row : row + tile_rows]), axis=0)
+
+
+def generate_image(om, occupied_col, unknown_col, freespace_col):
+    """Generate the RGBA image of an occupancy map as a flat list of bytes.
+
+    See :func:`generate_image_array` for a version that returns a NumPy array.
+
+    Args:
+        om: Occupancy map interface or generator.
+        occupied_col (list): RGBA color (0-255) for occupied cells.
+        unknown_col (list): RGBA color (0-255) for unknown cells.
+        freespace_col (list): RGBA color (0-255) for free cells.
+
+    Returns:
+        list: Flattened RGBA values in row-major order.
+    """
+    return generate_image_array(om, occupied_col, unknown_col, freespace_col).reshape(-1).tolist()
@@ -71,6 +71,7 @@ class BaseIsaacBenchmark:
         report_generation: bool = True,
         workflow_metadata: dict = {},
         gpu_frametime: bool = False,
+        streaming_frametime_stats: bool = False,
     ):
         """
 
@@ -78,13 +79,17 @@ class BaseIsaacBenchmark:
             benchmark_name (str, optional): Name of benchmark - will be printed in outputs. Defaults to
                 "BaseIsaacBenchmark".
             backend_type (str, optional): Type of backend used to collect and print metrics. Supported values provided
-                in metrics.backend. Defaults to "OmniPerfKPIFile".
+                in metrics.backend. Defaults to "OmniPerfKPIFile". "TimeSeriesFileMetrics" additionally records
+                per-frame frametimes of each phase to columnar files written alongside the KPI file.
             report_generation (bool, optional): Generates a formatted, ordered report of all phases/metrics in local
                 log.
             workflow_metadata (dict, optional): Metadata describing benchmark (eg. number of GPUs, number of cameras,
                 etc.) Most useful for OsmoKPIFile backend. Expected as JSON-style input - nested dictionary of
                 {"metadata": [{"name": <name>, "data": <value>}, ...]}. Defaults to {}.
             gpu_frametime (bool, optional): Whether to collect GPU frametime. Defaults to False.
+            streaming_frametime_stats (bool, optional): Whether to record frametimes into fixed-memory histograms
+                instead of keeping every sample. Statistics become approximate and raw samples are not reported,
+                which bounds memory for long running benchmarks. Defaults to False.
         """
         self.benchmark_name = benchmark_name
         self.report = report_generation
@@ -105,7 +110,16 @@ class BaseIsaacBenchmark:
             phase="benchmark",
         )
 
-        self.frametime_recorder = IsaacFrameTimeRecorder(self.context, gpu_frametime=gpu_frametime)
+        # Get metrics backend based on user-provided type
+        logger.info(f"Using metrics backend = {backend_type}")
+        self._metrics = backend.MetricsBackend.get_instance(instance_type=backend_type)
+
+        self.frametime_recorder = IsaacFrameTimeRecorder(
+            self.context,
+            gpu_frametime=gpu_frametime,
+            streaming_stats=streaming_frametime_stats,
+            record_timeseries=isinstance(self._metrics, backend.TimeSeriesFileMetrics),
+        )
         self.runtime_recorder = IsaacRuntimeRecorder(self.context)
         self.recorders = [
             IsaacMemoryRecorder(self.context),
@@ -127,10 +141,6 @@ class BaseIsaacBenchmark:
         if self.report:
             self.final_report = report.Report()
 
-        # Get metrics backend based on user-provided type
-        logger.info(f"Using metrics backend = {backend_type}")
-        self._metrics = backend.MetricsBackend.get_instance(instance_type=backend_type)
-
         # Generate workflow-level metadata
         self._metadata = [measurements.StringMetadata(name="workflow_name", data=self.benchmark_name)]
         if "metadata" in workflow_metadata:
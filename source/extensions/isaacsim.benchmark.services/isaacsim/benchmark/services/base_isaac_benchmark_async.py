@@ -72,7 +72,14 @@ class BaseIsaacBenchmarkAsync(omni.kit.test.AsyncTestCase):
             phase="benchmark",
         )
 
-        self.frametime_recorder = IsaacFrameTimeRecorder(self.context)
+        # Get metrics backend based on user-provided type
+        self._metrics = backend.MetricsBackend.get_instance(
+            execution_environment=self._execution_env, instance_type=backend_type
+        )
+
+        self.frametime_recorder = IsaacFrameTimeRecorder(
+            self.context, record_timeseries=isinstance(self._metrics, backend.TimeSeriesFileMetrics)
+        )
         self.runtime_recorder = IsaacRuntimeRecorder(self.context)
         self.recorders = [
             IsaacMemoryRecorder(self.context),
@@ -87,11 +94,6 @@ class BaseIsaacBenchmarkAsync(omni.kit.test.AsyncTestCase):
         if not self._metrics_output_folder:
             self._metrics_output_folder = tempfile.gettempdir()
 
-        # Get metrics backend based on user-provided type
-        self._metrics = backend.MetricsBackend.get_instance(
-            execution_environment=self._execution_env, instance_type=backend_type
-        )
-
         # Generate workflow-level metadata
         self._metadata = []
 
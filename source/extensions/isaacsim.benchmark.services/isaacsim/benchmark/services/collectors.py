@@ -15,11 +15,14 @@
 from __future__ import annotations
 
 import time
+from array import array
 from typing import List, Optional, Tuple
 
 import carb
 import omni.kit.test
 
+from .datarecorders.frametime import FrametimeHistogram
+
 
 def get_last_gpu_time_ms(
     hydra_engine_stats: HydraEngineStats,
@@ -44,6 +47,31 @@ def get_last_gpu_time_ms(
     return round(total_time, 6)
 
 
+class FrametimeSeries:
+    """
+    Compact per-frame record of a frametime series: frame index, wall-clock timestamp and frametime of every sample.
+    """
+
+    def __init__(self) -> None:
+        self.frame_index = array("q")
+        self.timestamp = array("d")
+        self.frametime_ms = array("d")
+
+    def append(self, frame_index: int, timestamp: float, frametime_ms: float) -> None:
+        self.frame_index.append(frame_index)
+        self.timestamp.append(timestamp)
+        self.frametime_ms.append(frametime_ms)
+
+    def pop_first(self) -> None:
+        if len(self.frametime_ms) > 0:
+            self.frame_index.pop(0)
+            self.timestamp.pop(0)
+            self.frametime_ms.pop(0)
+
+    def __len__(self) -> int:
+        return len(self.frametime_ms)
+
+
 class IsaacUpdateFrametimeCollector:
     """
     Utility to collect
@@ -53,8 +81,19 @@ class IsaacUpdateFrametimeCollector:
 
     """
 
-    def __init__(self, usd_context_name="", hydra_engine="rtx", gpu_frametime: bool = True) -> None:
+    def __init__(
+        self,
+        usd_context_name="",
+        hydra_engine="rtx",
+        gpu_frametime: bool = True,
+        streaming_stats: bool = False,
+        record_timeseries: bool = False,
+    ) -> None:
         self.gpu_frametime = gpu_frametime
+        # when streaming, samples are recorded into fixed-memory histograms instead of lists
+        self.streaming_stats = streaming_stats
+        # when recording time series, every sample is also stored with its frame index and wall-clock timestamp
+        self.record_timeseries = record_timeseries
         self.hydra_engine_stats = None
         if self.gpu_frametime:
             try:
@@ -78,6 +117,19 @@ class IsaacUpdateFrametimeCollector:
         self.physics_frametimes_ms: List[float] = []
         self.render_frametimes_ms: List[float] = []
 
+        self.app_frametime_histogram: Optional[FrametimeHistogram] = None
+        self.gpu_frametime_histogram: Optional[FrametimeHistogram] = None
+        self.physics_frametime_histogram: Optional[FrametimeHistogram] = None
+        self.render_frametime_histogram: Optional[FrametimeHistogram] = None
+        # the first sample of each series is dropped, see stop_collecting
+        self.__skip_first_sample = set()
+
+        self.app_frametime_series: Optional[FrametimeSeries] = None
+        self.gpu_frametime_series: Optional[FrametimeSeries] = None
+        self.physics_frametime_series: Optional[FrametimeSeries] = None
+        self.render_frametime_series: Optional[FrametimeSeries] = None
+        self.frame_index = 0
+
         self.__last_main_frametime_timestamp_ns = 0
         self.__last_render_frametime_timestamp_ns = 0
 
@@ -90,23 +142,54 @@ class IsaacUpdateFrametimeCollector:
         timestamp_ns = time.perf_counter_ns()
         app_update_time_ms = round((timestamp_ns - self.__last_main_frametime_timestamp_ns) / 1000 / 1000, 6)
         self.__last_main_frametime_timestamp_ns = timestamp_ns
+        self.frame_index += 1
         if self.gpu_frametime:
             gpu_frametime_ms = get_last_gpu_time_ms(self.hydra_engine_stats)
-            self.gpu_frametimes_ms.append(gpu_frametime_ms)
-        self.app_frametimes_ms.append(app_update_time_ms)
+            self.__record(
+                self.gpu_frametimes_ms, self.gpu_frametime_histogram, gpu_frametime_ms, self.gpu_frametime_series
+            )
+        self.__record(
+            self.app_frametimes_ms, self.app_frametime_histogram, app_update_time_ms, self.app_frametime_series
+        )
         self.elapsed_sim_time += event.payload["dt"]
 
+    def __record(
+        self,
+        samples: List[float],
+        histogram: Optional[FrametimeHistogram],
+        value: float,
+        series: Optional[FrametimeSeries] = None,
+    ):
+        if series is not None:
+            series.append(self.frame_index, time.time(), value)
+        if histogram is None:
+            samples.append(value)
+        elif id(histogram) in self.__skip_first_sample:
+            self.__skip_first_sample.discard(id(histogram))
+        else:
+            histogram.record(value)
+
     def __render_update_event_callback(self, event: carb.events.IEvent):
         timestamp_ns = time.perf_counter_ns()
         render_update_tims_ms = round((timestamp_ns - self.__last_render_frametime_timestamp_ns) / 1000 / 1000, 6)
         self.__last_render_frametime_timestamp_ns = timestamp_ns
-        self.render_frametimes_ms.append(render_update_tims_ms)
+        self.__record(
+            self.render_frametimes_ms,
+            self.render_frametime_histogram,
+            render_update_tims_ms,
+            self.render_frametime_series,
+        )
 
     def __physics_stats_callback(self, profile_stats):
         if len(profile_stats) > 0:
             for stat in profile_stats:
                 if stat.zone_name == "PhysX Update":
-                    self.physics_frametimes_ms.append(stat.ms)
+                    self.__record(
+                        self.physics_frametimes_ms,
+                        self.physics_frametime_histogram,
+                        stat.ms,
+                        self.physics_frametime_series,
+                    )
 
     def start_collecting(self):
         # reset our tracking variables
@@ -114,6 +197,26 @@ class IsaacUpdateFrametimeCollector:
         self.gpu_frametimes_ms: List[float] = []
         self.physics_frametimes_ms: List[float] = []
         self.render_frametimes_ms: List[float] = []
+        if self.streaming_stats:
+            self.app_frametime_histogram = FrametimeHistogram()
+            self.gpu_frametime_histogram = FrametimeHistogram()
+            self.physics_frametime_histogram = FrametimeHistogram()
+            self.render_frametime_histogram = FrametimeHistogram()
+            self.__skip_first_sample = {
+                id(histogram)
+                for histogram in (
+                    self.app_frametime_histogram,
+                    self.gpu_frametime_histogram,
+                    self.physics_frametime_histogram,
+                    self.render_frametime_histogram,
+                )
+            }
+        if self.record_timeseries:
+            self.app_frametime_series = FrametimeSeries()
+            self.gpu_frametime_series = FrametimeSeries()
+            self.physics_frametime_series = FrametimeSeries()
+            self.render_frametime_series = FrametimeSeries()
+        self.frame_index = 0
         self.__last_main_frametime_timestamp_ns = time.perf_counter_ns()
         self.__last_render_frametime_timestamp_ns = time.perf_counter_ns()
 
@@ -149,6 +252,11 @@ class IsaacUpdateFrametimeCollector:
             self.physics_frametimes_ms.pop(0)
         if len(self.render_frametimes_ms) > 0:
             self.render_frametimes_ms.pop(0)
+        if self.record_timeseries:
+            self.app_frametime_series.pop_first()
+            self.gpu_frametime_series.pop_first()
+            self.physics_frametime_series.pop_first()
+            self.render_frametime_series.pop_first()
 
         # convert s to ms for consistency
         self.elapsed_sim_time *= 1000
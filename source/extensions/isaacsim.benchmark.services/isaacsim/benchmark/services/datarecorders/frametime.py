@@ -16,7 +16,9 @@ import math
 import statistics
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+import numpy as np
 
 from .. import utils
 
@@ -26,11 +28,135 @@ if TYPE_CHECKING:
 logger = utils.set_up_logging(__name__)
 
 
+# Percentiles reported for every frametime series, as (name, fraction) pairs.
+PERCENTILES = [("p50", 0.5), ("p90", 0.9), ("p99", 0.99), ("p99.9", 0.999)]
+
+
+class FrametimeHistogram:
+    """
+    Fixed-memory histogram of frametime samples (in milliseconds).
+
+    Buckets are spaced geometrically, so any recorded value is represented with a relative error bounded by
+    `relative_error` regardless of the number of samples (similar to an HDR histogram). Count, sum, min and max are
+    tracked exactly.
+
+    Args:
+        min_value: Smallest distinguishable value. Smaller values are recorded in the first bucket.
+        max_value: Largest distinguishable value. Larger values are recorded in the last bucket.
+        relative_error: Maximum relative error of the values reconstructed from the buckets.
+    """
+
+    def __init__(self, min_value: float = 1e-3, max_value: float = 1e5, relative_error: float = 0.01):
+        self.min_value = min_value
+        self.max_value = max_value
+        self._log_base = math.log1p(relative_error)
+        num_buckets = int(math.ceil(math.log(max_value / min_value) / self._log_base)) + 1
+        self.counts = np.zeros(num_buckets, dtype=np.int64)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def record(self, value: float) -> None:
+        """
+        Record a single sample.
+
+        Args:
+            value: Sample to record.
+        """
+        clipped = min(max(value, self.min_value), self.max_value)
+        self.counts[int(math.log(clipped / self.min_value) / self._log_base)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def record_many(self, values: Union[List[float], np.ndarray]) -> None:
+        """
+        Record a batch of samples.
+
+        Args:
+            values: Samples to record.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+        clipped = np.clip(values, self.min_value, self.max_value)
+        indices = (np.log(clipped / self.min_value) / self._log_base).astype(np.int64)
+        self.counts += np.bincount(indices, minlength=self.counts.size)
+        self.count += values.size
+        self.total += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    def merge(self, other: "FrametimeHistogram") -> None:
+        """
+        Merge the samples of another histogram with the same bucket layout into this one.
+
+        Args:
+            other: Histogram to merge.
+        """
+        if other.counts.size != self.counts.size or other.min_value != self.min_value:
+            raise ValueError("Cannot merge histograms with different bucket layouts")
+        self.counts += other.counts
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def bucket_values(self) -> np.ndarray:
+        """
+        Returns:
+            The representative value (geometric midpoint) of every bucket, clamped to the recorded range.
+        """
+        values = self.min_value * np.exp((np.arange(self.counts.size) + 0.5) * self._log_base)
+        if self.count > 0:
+            values = np.clip(values, self.min, self.max)
+        return values
+
+    def percentile(self, percent: float) -> float:
+        """
+        Find the approximate percentile of the recorded samples.
+
+        Args:
+            percent: a float value from 0.0 to 1.0.
+
+        Returns:
+            The percentile of the recorded samples.
+        """
+        if self.count == 0:
+            raise ValueError("No samples recorded")
+        rank = int(math.floor((self.count - 1) * percent))
+        index = int(np.searchsorted(np.cumsum(self.counts), rank, side="right"))
+        return float(self.bucket_values()[index])
+
+    def trimmed(self, fraction: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Remove the lowest and highest `fraction` of the recorded samples.
+
+        Args:
+            fraction: Fraction of samples to remove at each end.
+
+        Returns:
+            The representative values of the buckets and the number of remaining samples in each of them.
+        """
+        remove_count = math.floor(self.count * fraction)
+        upper = np.cumsum(self.counts)
+        lower = upper - self.counts
+        kept = np.minimum(upper, self.count - remove_count) - np.maximum(lower, remove_count)
+        return self.bucket_values(), np.maximum(kept, 0)
+
+
 @dataclass
 class FrametimeStats:
     app_frametime_samples: List[float] = field(default_factory=list)
     gpu_frametime_samples: List[float] = field(default_factory=list)
     render_frametimes_ms: List[float] = field(default_factory=list)
+    # when set, statistics are computed from these fixed-memory histograms instead of the raw samples
+    app_frametime_histogram: Optional[FrametimeHistogram] = None
+    physics_frametime_histogram: Optional[FrametimeHistogram] = None
+    gpu_frametime_histogram: Optional[FrametimeHistogram] = None
+    renderer_frametime_histogram: Optional[FrametimeHistogram] = None
 
     app_stats = {}
     physics_stats = {}
@@ -91,22 +217,91 @@ class FrametimeStats:
         trimmed_data = sorted_data[remove_count:-remove_count]
         return trimmed_data
 
-    def stats_helper(self, metric: List[float]):
+    def _empty_stats(self) -> dict:
         result = {"mean": 0, "median": 0, "stdev": 0, "min": 0, "max": 0, "one_percent": 0}
+        result.update({name: 0 for name, _ in PERCENTILES})
+        return result
+
+    def stats_helper(self, metric: Union[List[float], FrametimeHistogram]):
+        """
+        Compute the statistics of a frametime series.
+
+        Mean, median, stdev, min, max and one percent high are computed after trimming outliers (see `trim_outliers`),
+        while percentiles are computed over all samples.
+
+        Args:
+            metric: Raw samples (exact statistics) or a histogram of the samples (approximate statistics).
+
+        Returns:
+            A dictionary of statistics.
+        """
+        if isinstance(metric, FrametimeHistogram):
+            return self._histogram_stats_helper(metric)
+
+        result = self._empty_stats()
+        try:
+            sorted_data = np.sort(np.asarray(metric, dtype=np.float64))
+            if sorted_data.size == 0:
+                raise ValueError("no samples")
+            for name, percent in PERCENTILES:
+                result[name] = round(float(np.percentile(sorted_data, percent * 100.0)), 2)
+            # trim outliers on the already sorted data
+            if sorted_data.size >= 100:
+                remove_count = math.floor(sorted_data.size * 0.1)
+                sorted_data = sorted_data[remove_count:-remove_count]
+            result["mean"] = round(float(sorted_data.mean()), 2)
+            result["median"] = round(float(np.median(sorted_data)), 2)
+            if sorted_data.size < 2:
+                raise ValueError("stdev requires at least two data points")
+            result["stdev"] = round(float(sorted_data.std(ddof=1)), 2)
+            result["min"] = round(float(sorted_data[0]), 2)
+            result["max"] = round(float(sorted_data[-1]), 2)
+            ninety_nine_p = np.percentile(sorted_data, 99.0)
+            result["one_percent"] = round(float(sorted_data[sorted_data >= ninety_nine_p].mean()), 2)
+        except Exception as e:
+            logger.warn(f"Unable to calculate frametime stats: {e}")
+        return result
+
+    def _histogram_stats_helper(self, histogram: FrametimeHistogram):
+        result = self._empty_stats()
         try:
-            metric = self.trim_outliers(metric)
-            result["mean"] = round(statistics.mean(metric), 2)
-            result["median"] = round(statistics.median(metric), 2)
-            result["stdev"] = round(statistics.stdev(metric), 2)
-            result["min"] = round(min(metric), 2)
-            result["max"] = round(max(metric), 2)
-            result["one_percent"] = round(self.get_one_percent_high(metric), 2)
+            if histogram.count == 0:
+                raise ValueError("no samples")
+            for name, percent in PERCENTILES:
+                result[name] = round(histogram.percentile(percent), 2)
+            values, counts = histogram.trimmed(0.1 if histogram.count >= 100 else 0.0)
+            num_values = int(counts.sum())
+            mean = float(np.dot(values, counts)) / num_values
+            result["mean"] = round(mean, 2)
+            cumulative = np.cumsum(counts)
+            result["median"] = round(float(values[np.searchsorted(cumulative, (num_values - 1) // 2, side="right")]), 2)
+            if num_values < 2:
+                raise ValueError("stdev requires at least two data points")
+            result["stdev"] = round(math.sqrt(float(np.dot(counts, (values - mean) ** 2)) / (num_values - 1)), 2)
+            nonzero = np.flatnonzero(counts)
+            result["min"] = round(float(values[nonzero[0]]), 2)
+            result["max"] = round(float(values[nonzero[-1]]), 2)
+            ninety_nine_p = values[np.searchsorted(cumulative, int(math.floor((num_values - 1) * 0.99)), side="right")]
+            high = values >= ninety_nine_p
+            result["one_percent"] = round(float(np.dot(values[high], counts[high])) / int(counts[high].sum()), 2)
         except Exception as e:
             logger.warn(f"Unable to calculate frametime stats: {e}")
         return result
 
     def calc_stats(self) -> None:
-        self.app_stats = self.stats_helper(self.app_frametime_samples)
-        self.physics_stats = self.stats_helper(self.physics_frametime_samples)
-        self.gpu_stats = self.stats_helper(self.gpu_frametime_samples)
-        self.renderer_stats = self.stats_helper(self.renderer_frametime_samples)
+        self.app_stats = self.stats_helper(
+            self.app_frametime_histogram if self.app_frametime_histogram is not None else self.app_frametime_samples
+        )
+        self.physics_stats = self.stats_helper(
+            self.physics_frametime_histogram
+            if self.physics_frametime_histogram is not None
+            else self.physics_frametime_samples
+        )
+        self.gpu_stats = self.stats_helper(
+            self.gpu_frametime_histogram if self.gpu_frametime_histogram is not None else self.gpu_frametime_samples
+        )
+        self.renderer_stats = self.stats_helper(
+            self.renderer_frametime_histogram
+            if self.renderer_frametime_histogram is not None
+            else self.renderer_frametime_samples
+        )
@@ -22,6 +22,7 @@ from datetime import datetime as dt
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import omni.kit.app
 import toml
 from isaacsim.core.version import get_version
@@ -300,6 +301,92 @@ class OmniPerfKPIFile(MetricsBackendInterface):
             f.write(json_data)
 
 
+class TimeSeriesFileMetrics(MetricsBackendInterface):
+    """
+    Writes the per-frame time series of each phase to a compressed columnar NumPy archive, and forwards all other
+    measurements to a KPI backend (OmniPerfKPIFile by default) so that KPI files are written alongside.
+    """
+
+    def __init__(
+        self,
+        execution_environment: Optional[TestExecutionEnvironmentInterface] = None,
+        kpi_backend: Optional[MetricsBackendInterface] = None,
+    ):
+        self._execution_environment = execution_environment
+        self._kpi_backend = kpi_backend if kpi_backend is not None else OmniPerfKPIFile(execution_environment)
+        self._series = []
+
+    def add_metrics(self, test_phase: measurements.TestPhase) -> None:
+        """Stores the time series of the provided test_phase and forwards its other measurements to the KPI backend.
+
+        Args:
+            test_phase (measurements.TestPhase): Current test phase.
+        """
+        columns = {}
+        kpi_measurements = []
+        for measurement in test_phase.measurements:
+            if isinstance(measurement, measurements.TimeSeriesMeasurement):
+                columns[f"{measurement.name}:frame_index"] = np.asarray(measurement.frame_index, dtype=np.int64)
+                columns[f"{measurement.name}:timestamp"] = np.asarray(measurement.timestamp, dtype=np.float64)
+                columns[f"{measurement.name}:value"] = np.asarray(measurement.value, dtype=np.float64)
+            else:
+                kpi_measurements.append(measurement)
+        if columns:
+            test_name = test_phase.get_metadata_field("workflow_name")
+            phase_name = test_phase.get_metadata_field("phase")
+            self._series.append((test_name, phase_name, columns))
+        self._kpi_backend.add_metrics(
+            measurements.TestPhase(
+                phase_name=test_phase.phase_name, measurements=kpi_measurements, metadata=test_phase.metadata
+            )
+        )
+
+    def finalize(self, metrics_output_folder: str, randomize_filename_prefix: bool = False) -> None:
+        """Write time series and KPIs to output files.
+
+        The time series of each test phase are written to an output archive, at path
+        `[metrics_output_folder]/[optional random prefix]timeseries_{test_name}_{test_phase}.npz`. Each series is
+        stored as three columns `{series}:frame_index`, `{series}:timestamp` and `{series}:value`, see
+        `load_timeseries`.
+
+        Args:
+            metrics_output_folder (str): Output folder in which metrics files will be stored.
+            randomize_filename_prefix (bool, optional): True to randomize filename prefix. Defaults to False.
+        """
+        for test_name, phase_name, columns in self._series:
+            # Generate the output filename
+            if randomize_filename_prefix:
+                _, timeseries_filename_out = tempfile.mkstemp(
+                    dir=metrics_output_folder, prefix=f"timeseries_{test_name}_{phase_name}", suffix=".npz"
+                )
+            else:
+                timeseries_filename_out = Path(metrics_output_folder) / f"timeseries_{test_name}_{phase_name}.npz"
+            logger.info(f"Writing time series to {timeseries_filename_out}")
+            with open(timeseries_filename_out, "wb") as f:
+                np.savez_compressed(f, **columns)
+        self._series.clear()
+
+        self._kpi_backend.finalize(metrics_output_folder, randomize_filename_prefix)
+
+
+def load_timeseries(path: typing.Union[str, Path]) -> typing.Dict[str, typing.Dict[str, np.ndarray]]:
+    """Load the time series written by `TimeSeriesFileMetrics` for a single phase.
+
+    Args:
+        path (typing.Union[str, Path]): Path to a `timeseries_*.npz` file.
+
+    Returns:
+        typing.Dict[str, typing.Dict[str, np.ndarray]]: For each series name (e.g. "App_Update Frametime"), its
+            "frame_index", "timestamp" and "value" columns.
+    """
+    series = {}
+    with np.load(path) as data:
+        for key in data.files:
+            name, column = key.rsplit(":", 1)
+            series.setdefault(name, {})[column] = data[key]
+    return series
+
+
 class MetricsBackend:
     """
     Note the OVATMetrics is handled by a post process that takes the files generated by JSONFileMetricsEvent
@@ -323,6 +410,8 @@ class MetricsBackend:
             return OsmoKPIFile()
         elif instance_type == "OmniPerfKPIFile":
             return OmniPerfKPIFile()
+        elif instance_type == "TimeSeriesFileMetrics":
+            return TimeSeriesFileMetrics()
         else:
             if bool(os.getenv("TEAMCITY_VERSION")) or bool(os.getenv("ETM_ACTIVE")):
                 return JSONFileMetrics(execution_environment)
@@ -0,0 +1,400 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compare benchmark results between runs and report regressions.
+
+Result sets are folders (or single files) written by the JSONFileMetrics, OsmoKPIFile, OmniPerfKPIFile and
+TimeSeriesFileMetrics backends. When a metric is present in several files of the same result set (e.g. repeated runs
+written with a randomized filename prefix), the runs are aggregated. Raw frametime samples (JSONFileMetrics sample lists
+or TimeSeriesFileMetrics archives) or repeated runs are used to compute bootstrap confidence intervals, so that only
+statistically significant changes are reported as regressions.
+
+This module only depends on NumPy so that it can be run outside of Kit:
+
+.. code-block:: bash
+
+    python comparator.py <baseline> <candidate> [<candidate> ...] --tolerance 0.05 --metrics "FPS|Frametime"
+"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Metric name patterns used to decide whether an increase of the metric is an improvement or a regression
+HIGHER_IS_BETTER = [r"\bfps\b", r"per second", r"/s\b", r"real time factor", r"throughput"]
+LOWER_IS_BETTER = [r"frametime", r"runtime", r"\btime\b", r"memory", r"latency"]
+
+# Metric keys are (workflow name, phase name, metric name)
+MetricKey = Tuple[str, str, str]
+
+
+@dataclass
+class MetricResult:
+    """
+    Value of a metric in a result set, with its per-run values and the raw samples it was computed from (if any)
+    """
+
+    workflow: str
+    phase: str
+    name: str
+    runs: List[float] = field(default_factory=list)
+    samples: List[np.ndarray] = field(default_factory=list)
+
+    @property
+    def value(self) -> float:
+        return float(np.mean(self.runs))
+
+    def get_samples(self) -> Optional[np.ndarray]:
+        """
+        Returns:
+            The raw samples of all runs, the per-run values if there are no raw samples but several runs, or None.
+        """
+        if self.samples:
+            return np.concatenate(self.samples)
+        if len(self.runs) > 1:
+            return np.asarray(self.runs, dtype=np.float64)
+        return None
+
+
+@dataclass
+class MetricComparison:
+    """
+    Comparison of a metric between a baseline and a candidate result set
+    """
+
+    workflow: str
+    phase: str
+    name: str
+    baseline: Optional[float]
+    candidate: Optional[float]
+    relative_delta: Optional[float] = None
+    ci_low: Optional[float] = None
+    ci_high: Optional[float] = None
+    status: str = "pass"
+
+
+def get_metric_direction(name: str) -> int:
+    """Get whether higher or lower values of a metric are better.
+
+    Args:
+        name (str): Metric name.
+
+    Returns:
+        int: 1 if higher is better, -1 if lower is better, 0 if unknown.
+    """
+    lower_name = name.lower()
+    if any(re.search(pattern, lower_name) for pattern in HIGHER_IS_BETTER):
+        return 1
+    if any(re.search(pattern, lower_name) for pattern in LOWER_IS_BETTER):
+        return -1
+    return 0
+
+
+def _add_run(results: Dict[MetricKey, MetricResult], workflow: str, phase: str, name: str, value) -> None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        return
+    key = (workflow, phase, name)
+    if key not in results:
+        results[key] = MetricResult(workflow=workflow, phase=phase, name=name)
+    results[key].runs.append(float(value))
+
+
+def _add_samples(results: Dict[MetricKey, MetricResult], workflow: str, phase: str, name: str, samples) -> None:
+    # raw samples are attached to the mean metric they were aggregated into
+    key = (workflow, phase, f"Mean {name}")
+    if key in results and len(samples) > 0:
+        results[key].samples.append(np.asarray(samples, dtype=np.float64))
+
+
+def _load_json_file_metrics(results: Dict[MetricKey, MetricResult], data: List[Dict]) -> None:
+    # JSONFileMetrics prefixes measurement and metadata names with "{workflow} {phase} "
+    pending_samples = []
+    for test_phase in data:
+        phase = test_phase.get("phase_name", "")
+        workflow = ""
+        for metadata in test_phase.get("metadata", []):
+            if metadata.get("name", "").endswith("workflow_name"):
+                workflow = metadata.get("data", "")
+        prefix = f"{workflow} {phase} "
+        for measurement in test_phase.get("measurements", []):
+            name = measurement.get("name", "")
+            name = name[len(prefix) :] if name.startswith(prefix) else name
+            value = measurement.get("value")
+            if isinstance(value, list):
+                if name.endswith(" Samples"):
+                    pending_samples.append((workflow, phase, name[: -len(" Samples")], value))
+            else:
+                _add_run(results, workflow, phase, name, value)
+    for workflow, phase, name, samples in pending_samples:
+        _add_samples(results, workflow, phase, name, samples)
+
+
+def _load_timeseries_file(results: Dict[MetricKey, MetricResult], path: str) -> None:
+    # TimeSeriesFileMetrics archives are named "timeseries_{workflow}_{phase}.npz", match them against loaded phases
+    stem = os.path.splitext(os.path.basename(path))[0][len("timeseries_") :]
+    phases = {(workflow, phase) for workflow, phase, _ in results}
+    matches = [(workflow, phase) for workflow, phase in phases if stem.startswith(f"{workflow}_{phase}")]
+    if not matches:
+        return
+    workflow, phase = max(matches, key=lambda match: len(match[0]) + len(match[1]))
+    with np.load(path) as data:
+        for key in data.files:
+            name, column = key.rsplit(":", 1)
+            if column == "value":
+                _add_samples(results, workflow, phase, name, data[key])
+
+
+def load_results(path: str) -> Dict[MetricKey, MetricResult]:
+    """Load a benchmark result set.
+
+    Args:
+        path (str): Folder containing metrics files, or a single metrics file.
+
+    Returns:
+        Dict[MetricKey, MetricResult]: Metrics of the result set, keyed by (workflow name, phase name, metric name).
+    """
+    if os.path.isdir(path):
+        json_files = sorted(glob.glob(os.path.join(path, "*.json")))
+        timeseries_files = sorted(glob.glob(os.path.join(path, "timeseries_*.npz")))
+    else:
+        json_files = [path] if path.endswith(".json") else []
+        timeseries_files = [path] if path.endswith(".npz") else []
+
+    results = {}
+    for json_file in json_files:
+        with open(json_file, "r") as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError:
+                continue
+        if isinstance(data, list):
+            # JSONFileMetrics
+            _load_json_file_metrics(results, data)
+        elif isinstance(data, dict) and "App Info" in data:
+            # OmniPerfKPIFile: one entry per phase
+            for phase, phase_data in data.items():
+                if isinstance(phase_data, dict):
+                    workflow = phase_data.get("workflow_name", "")
+                    for name, value in phase_data.items():
+                        _add_run(results, workflow, phase, name, value)
+        elif isinstance(data, dict) and "phase" in data:
+            # OsmoKPIFile: one file per phase
+            workflow = data.get("workflow_name", "")
+            for name, value in data.items():
+                _add_run(results, workflow, data["phase"], name, value)
+    for timeseries_file in timeseries_files:
+        _load_timeseries_file(results, timeseries_file)
+    return results
+
+
+def bootstrap_relative_delta(
+    baseline: np.ndarray,
+    candidate: np.ndarray,
+    confidence: float = 0.95,
+    num_bootstrap: int = 1000,
+    max_samples: int = 10000,
+    seed: int = 0,
+) -> Tuple[float, float]:
+    """Compute a bootstrap confidence interval of the relative change of the mean between two sets of samples.
+
+    Args:
+        baseline (np.ndarray): Baseline samples.
+        candidate (np.ndarray): Candidate samples.
+        confidence (float, optional): Confidence level of the interval. Defaults to 0.95.
+        num_bootstrap (int, optional): Number of bootstrap resamples. Defaults to 1000.
+        max_samples (int, optional): Samples are randomly subsampled to this size to bound the cost. Defaults to 10000.
+        seed (int, optional): Seed of the random number generator. Defaults to 0.
+
+    Returns:
+        Tuple[float, float]: Lower and upper bounds of the interval of (candidate mean - baseline mean) / baseline mean.
+    """
+    rng = np.random.default_rng(seed)
+
+    def resampled_means(samples: np.ndarray) -> np.ndarray:
+        if samples.size > max_samples:
+            samples = rng.choice(samples, size=max_samples, replace=False)
+        means = np.empty(num_bootstrap)
+        # resample in chunks to bound memory
+        chunk_size = max(1, 1000000 // samples.size)
+        for start in range(0, num_bootstrap, chunk_size):
+            stop = min(start + chunk_size, num_bootstrap)
+            indices = rng.integers(0, samples.size, size=(stop - start, samples.size))
+            means[start:stop] = samples[indices].mean(axis=1)
+        return means
+
+    baseline_means = resampled_means(baseline)
+    candidate_means = resampled_means(candidate)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        deltas = (candidate_means - baseline_means) / np.abs(baseline_means)
+    alpha = 0.5 * (1.0 - confidence)
+    low, high = np.nanquantile(deltas, [alpha, 1.0 - alpha])
+    return float(low), float(high)
+
+
+def compare_results(
+    baseline: Dict[MetricKey, MetricResult],
+    candidate: Dict[MetricKey, MetricResult],
+    tolerance: float = 0.05,
+    confidence: float = 0.95,
+    num_bootstrap: int = 1000,
+    metric_filter: Optional[str] = None,
+) -> List[MetricComparison]:
+    """Compare a candidate result set against a baseline.
+
+    A metric regresses when it gets worse by more than `tolerance` (relative). If samples are available for both
+    result sets, the change must also be significant: the confidence interval of the relative change must not include
+    zero. Metrics whose direction is unknown (see `get_metric_direction`) are reported but never fail.
+
+    Args:
+        baseline (Dict[MetricKey, MetricResult]): Baseline result set, see `load_results`.
+        candidate (Dict[MetricKey, MetricResult]): Candidate result set, see `load_results`.
+        tolerance (float, optional): Relative change tolerated before flagging a metric. Defaults to 0.05.
+        confidence (float, optional): Confidence level of the bootstrap intervals. Defaults to 0.95.
+        num_bootstrap (int, optional): Number of bootstrap resamples. Defaults to 1000.
+        metric_filter (Optional[str], optional): Regular expression; only matching metric names are compared.
+
+    Returns:
+        List[MetricComparison]: Comparison of every metric, sorted by workflow, phase and metric name.
+    """
+    comparisons = []
+    for key in sorted(set(baseline) | set(candidate)):
+        workflow, phase, name = key
+        if metric_filter is not None and not re.search(metric_filter, name):
+            continue
+        if key not in baseline or key not in candidate:
+            comparisons.append(
+                MetricComparison(
+                    workflow=workflow,
+                    phase=phase,
+                    name=name,
+                    baseline=baseline[key].value if key in baseline else None,
+                    candidate=candidate[key].value if key in candidate else None,
+                    status="missing",
+                )
+            )
+            continue
+
+        comparison = MetricComparison(
+            workflow=workflow, phase=phase, name=name, baseline=baseline[key].value, candidate=candidate[key].value
+        )
+        if comparison.baseline != 0:
+            comparison.relative_delta = (comparison.candidate - comparison.baseline) / abs(comparison.baseline)
+        elif comparison.candidate != 0:
+            comparison.relative_delta = math.inf
+
+        baseline_samples = baseline[key].get_samples()
+        candidate_samples = candidate[key].get_samples()
+        if baseline_samples is not None and candidate_samples is not None:
+            comparison.ci_low, comparison.ci_high = bootstrap_relative_delta(
+                baseline_samples, candidate_samples, confidence, num_bootstrap
+            )
+
+        direction = get_metric_direction(name)
+        if direction == 0 or comparison.relative_delta is None:
+            comparison.status = "untracked" if direction == 0 else "pass"
+        else:
+            # positive when the metric got worse
+            worsening = -direction * comparison.relative_delta
+            significant = comparison.ci_low is None or comparison.ci_low > 0 or comparison.ci_high < 0
+            if worsening > tolerance and significant:
+                comparison.status = "regression"
+            elif worsening < -tolerance and significant:
+                comparison.status = "improvement"
+        comparisons.append(comparison)
+    return comparisons
+
+
+def format_report(comparisons: List[MetricComparison], title: str = "") -> str:
+    """Format comparisons as a plain text report.
+
+    Args:
+        comparisons (List[MetricComparison]): Comparisons, see `compare_results`.
+        title (str, optional): Title of the report.
+
+    Returns:
+        str: Report.
+    """
+
+    def fmt(value: Optional[float], percent: bool = False) -> str:
+        if value is None:
+            return "-"
+        return f"{value * 100:+.2f}%" if percent else f"{value:.4g}"
+
+    lines = [title] if title else []
+    header = f"{'status':<12}{'baseline':>12}{'candidate':>12}{'delta':>10}{'ci':>22}  metric"
+    lines.append(header)
+    lines.append("-" * len(header))
+    for c in comparisons:
+        ci = f"[{fmt(c.ci_low, True)}, {fmt(c.ci_high, True)}]" if c.ci_low is not None else "-"
+        lines.append(
+            f"{c.status:<12}{fmt(c.baseline):>12}{fmt(c.candidate):>12}{fmt(c.relative_delta, True):>10}{ci:>22}"
+            f"  {c.workflow} / {c.phase} / {c.name}"
+        )
+    num_regressions = sum(c.status == "regression" for c in comparisons)
+    lines.append(f"{'FAIL' if num_regressions else 'PASS'}: {num_regressions} regression(s)")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Compare one or more candidate result sets against a baseline and print a regression report.
+
+    Returns:
+        int: 1 if any candidate regresses, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Compare benchmark results and report regressions.")
+    parser.add_argument("baseline", help="Baseline result folder or file")
+    parser.add_argument("candidates", nargs="+", help="Candidate result folders or files")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="Relative change tolerated, defaults to 0.05")
+    parser.add_argument("--confidence", type=float, default=0.95, help="Bootstrap confidence level")
+    parser.add_argument("--num-bootstrap", type=int, default=1000, help="Number of bootstrap resamples")
+    parser.add_argument("--metrics", default=None, help="Regular expression selecting the metrics to compare")
+    parser.add_argument("--output", default=None, help="Optional path of a JSON report")
+    parser.add_argument("--show-all", action="store_true", help="Also print metrics that did not change")
+    args = parser.parse_args(argv)
+
+    baseline = load_results(args.baseline)
+    failed = False
+    json_report = {}
+    for candidate_path in args.candidates:
+        comparisons = compare_results(
+            baseline,
+            load_results(candidate_path),
+            tolerance=args.tolerance,
+            confidence=args.confidence,
+            num_bootstrap=args.num_bootstrap,
+            metric_filter=args.metrics,
+        )
+        failed = failed or any(c.status == "regression" for c in comparisons)
+        json_report[candidate_path] = [c.__dict__ for c in comparisons]
+        shown = comparisons if args.show_all else [c for c in comparisons if c.status not in ("pass", "untracked")]
+        print(format_report(shown, title=f"{args.baseline} -> {candidate_path}"))
+        print()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(json_report, f, indent=4)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,7 +17,7 @@ import logging
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Any, Dict, List, Union
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +59,23 @@ class ListMeasurement(Measurement):
         return f"{self.__class__.__name__}(name={self.name!r}, length={len(self.value)})"
 
 
+@dataclass
+class TimeSeriesMeasurement(Measurement):
+    """
+    represents per-frame samples of a quantity as equally sized columns (frame index, wall-clock timestamp in
+    seconds since the epoch, and sample value)
+    """
+
+    frame_index: Any
+    timestamp: Any
+    value: Any
+    unit: str = "ms"
+    type: str = "timeseries"
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name={self.name!r}, length={len(self.value)})"
+
+
 @dataclass
 class MetadataBase(object):
     name: str
@@ -16,6 +16,7 @@ import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
+import numpy as np
 import psutil
 
 if TYPE_CHECKING:
@@ -36,12 +37,20 @@ class IsaacFrameTimeRecorder(interface.MeasurementDataRecorder):
         root_dir: Optional[Path] = None,
         benchmark_settings: Optional["BenchmarkSettings"] = None,
         gpu_frametime: Optional[bool] = False,
+        streaming_stats: Optional[bool] = False,
+        record_timeseries: Optional[bool] = False,
     ):
         self.context = context
         self.root_dir = root_dir
         self.benchmark_settings = benchmark_settings
         self.gpu_frametime = gpu_frametime
-        self.frametime_collector = IsaacUpdateFrametimeCollector(gpu_frametime=self.gpu_frametime)
+        self.streaming_stats = streaming_stats
+        self.record_timeseries = record_timeseries
+        self.frametime_collector = IsaacUpdateFrametimeCollector(
+            gpu_frametime=self.gpu_frametime,
+            streaming_stats=self.streaming_stats,
+            record_timeseries=self.record_timeseries,
+        )
         self.phase = None
 
         self.real_time_start = None
@@ -68,6 +77,11 @@ class IsaacFrameTimeRecorder(interface.MeasurementDataRecorder):
         frametime_stats.physics_frametime_samples = self.frametime_collector.physics_frametimes_ms
         frametime_stats.gpu_frametime_samples = self.frametime_collector.gpu_frametimes_ms
         frametime_stats.renderer_frametime_samples = self.frametime_collector.render_frametimes_ms
+        if self.streaming_stats:
+            frametime_stats.app_frametime_histogram = self.frametime_collector.app_frametime_histogram
+            frametime_stats.physics_frametime_histogram = self.frametime_collector.physics_frametime_histogram
+            frametime_stats.gpu_frametime_histogram = self.frametime_collector.gpu_frametime_histogram
+            frametime_stats.renderer_frametime_histogram = self.frametime_collector.render_frametime_histogram
         frametime_stats.calc_stats()
 
         measurements_out = []
@@ -100,12 +114,14 @@ class IsaacFrameTimeRecorder(interface.MeasurementDataRecorder):
                 unit="ms",
             )
         )
-        measurements_out.append(
-            measurements.ListMeasurement(
-                name=f"App_Update Frametime Samples",
-                value=frametime_stats.app_frametime_samples,
+        if not self.streaming_stats:
+            measurements_out.append(
+                measurements.ListMeasurement(
+                    name=f"App_Update Frametime Samples",
+                    value=frametime_stats.app_frametime_samples,
+                )
             )
-        )
+        measurements_out.extend(self._percentile_measurements("App_Update", frametime_stats.app_stats))
 
         measurements_out.append(
             measurements.SingleMeasurement(
@@ -135,12 +151,14 @@ class IsaacFrameTimeRecorder(interface.MeasurementDataRecorder):
                 unit="ms",
             )
         )
-        measurements_out.append(
-            measurements.ListMeasurement(
-                name=f"Physics Frametime Samples",
-                value=frametime_stats.physics_frametime_samples,
+        if not self.streaming_stats:
+            measurements_out.append(
+                measurements.ListMeasurement(
+                    name=f"Physics Frametime Samples",
+                    value=frametime_stats.physics_frametime_samples,
+                )
             )
-        )
+        measurements_out.extend(self._percentile_measurements("Physics", frametime_stats.physics_stats))
 
         if self.gpu_frametime:
             measurements_out.append(
@@ -167,9 +185,13 @@ class IsaacFrameTimeRecorder(interface.MeasurementDataRecorder):
                 )
             )
 
-            measurements_out.append(
-                measurements.ListMeasurement(name=f"GPU Frametime Samples", value=frametime_stats.gpu_frametime_samples)
-            )
+            if not self.streaming_stats:
+                measurements_out.append(
+                    measurements.ListMeasurement(
+                        name=f"GPU Frametime Samples", value=frametime_stats.gpu_frametime_samples
+                    )
+                )
+            measurements_out.extend(self._percentile_measurements("GPU", frametime_stats.gpu_stats))
 
         if frametime_stats.renderer_stats["mean"]:
             measurements_out.append(
@@ -200,6 +222,7 @@ class IsaacFrameTimeRecorder(interface.MeasurementDataRecorder):
                     unit="ms",
                 )
             )
+            measurements_out.extend(self._percentile_measurements("Render", frametime_stats.renderer_stats))
             measurements_out.append(
                 measurements.SingleMeasurement(
                     name=f"Rendering FPS",
@@ -224,8 +247,34 @@ class IsaacFrameTimeRecorder(interface.MeasurementDataRecorder):
                 unit="",
             )
         )
+
+        if self.record_timeseries:
+            collector = self.frametime_collector
+            series = [
+                ("App_Update", collector.app_frametime_series),
+                ("Physics", collector.physics_frametime_series),
+                ("GPU", collector.gpu_frametime_series if self.gpu_frametime else None),
+                ("Render", collector.render_frametime_series),
+            ]
+            for label, frametime_series in series:
+                if frametime_series is None or len(frametime_series) == 0:
+                    continue
+                measurements_out.append(
+                    measurements.TimeSeriesMeasurement(
+                        name=f"{label} Frametime",
+                        frame_index=np.array(frametime_series.frame_index, dtype=np.int64),
+                        timestamp=np.array(frametime_series.timestamp, dtype=np.float64),
+                        value=np.array(frametime_series.frametime_ms, dtype=np.float64),
+                    )
+                )
         return interface.MeasurementData(measurements=measurements_out)
 
+    def _percentile_measurements(self, label: str, stats: dict) -> list:
+        return [
+            measurements.SingleMeasurement(name=f"{name.upper()} {label} Frametime", value=stats[name], unit="ms")
+            for name, _ in frametime.PERCENTILES
+        ]
+
 
 class IsaacMemoryRecorder(memory.MemoryRecorder):
     def __init__(
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import os
+import tempfile
+
+import numpy as np
+import omni.kit.test
+from isaacsim.benchmark.services.metrics import comparator
+
+
+class TestComparator(omni.kit.test.AsyncTestCase):
+    def _write_results(self, folder: str, frametime_offset: float, runtime: float) -> None:
+        samples = (np.random.default_rng(0).normal(16.6, 1.0, 500) + frametime_offset).tolist()
+        test_phase = {
+            "phase_name": "benchmark",
+            "measurements": [
+                {"name": "test benchmark Mean App_Update Frametime", "value": float(np.mean(samples)), "unit": "ms"},
+                {"name": "test benchmark App_Update Frametime Samples", "value": samples},
+            ],
+            "metadata": [{"name": "test benchmark workflow_name", "data": "test"}],
+        }
+        with open(os.path.join(folder, "metrics_test.json"), "w") as f:
+            json.dump([test_phase], f)
+        kpis = {"App Info": [], "benchmark": {"workflow_name": "test", "phase": "benchmark", "Runtime": runtime}}
+        with open(os.path.join(folder, "kpis_test.json"), "w") as f:
+            json.dump(kpis, f)
+
+    async def test_compare_results(self):
+        with tempfile.TemporaryDirectory() as baseline_folder, tempfile.TemporaryDirectory() as candidate_folder:
+            self._write_results(baseline_folder, 0.0, 100.0)
+            self._write_results(candidate_folder, 2.0, 102.0)
+            baseline = comparator.load_results(baseline_folder)
+            candidate = comparator.load_results(candidate_folder)
+
+        self.assertIsNotNone(baseline[("test", "benchmark", "Mean App_Update Frametime")].get_samples())
+        comparisons = comparator.compare_results(baseline, candidate, tolerance=0.05)
+        statuses = {c.name: c.status for c in comparisons}
+        # frametime increased by ~12%, runtime by 2% which is within tolerance
+        self.assertEqual(statuses["Mean App_Update Frametime"], "regression")
+        self.assertEqual(statuses["Runtime"], "pass")
+
+        comparisons = comparator.compare_results(baseline, baseline)
+        self.assertFalse(any(c.status == "regression" for c in comparisons))
+
+    async def test_metric_direction(self):
+        self.assertEqual(comparator.get_metric_direction("Mean FPS"), 1)
+        self.assertEqual(comparator.get_metric_direction("Real Time Factor"), 1)
+        self.assertEqual(comparator.get_metric_direction("Mean Physics Frametime"), -1)
+        self.assertEqual(comparator.get_metric_direction("num_cpus"), 0)
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import omni.kit.test
+from isaacsim.benchmark.services.datarecorders.frametime import FrametimeHistogram, FrametimeStats
+
+
+class TestFrametimeStats(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._samples = np.random.default_rng(0).lognormal(mean=2.8, sigma=0.3, size=5000).tolist()
+
+    async def test_exact_stats(self):
+        stats = FrametimeStats().stats_helper(self._samples)
+        sorted_samples = np.sort(self._samples)
+        trimmed = sorted_samples[500:-500]
+        self.assertAlmostEqual(stats["mean"], round(float(trimmed.mean()), 2))
+        self.assertAlmostEqual(stats["stdev"], round(float(trimmed.std(ddof=1)), 2))
+        self.assertAlmostEqual(stats["min"], round(float(trimmed[0]), 2))
+        self.assertAlmostEqual(stats["max"], round(float(trimmed[-1]), 2))
+        self.assertAlmostEqual(stats["p99"], round(float(np.percentile(sorted_samples, 99)), 2))
+
+    async def test_histogram_stats(self):
+        histogram = FrametimeHistogram(relative_error=0.01)
+        histogram.record_many(self._samples[:2500])
+        for sample in self._samples[2500:]:
+            histogram.record(sample)
+        self.assertEqual(histogram.count, len(self._samples))
+
+        exact = FrametimeStats().stats_helper(self._samples)
+        approximate = FrametimeStats().stats_helper(histogram)
+        for key in ["mean", "median", "min", "max", "p50", "p90", "p99", "p99.9"]:
+            self.assertAlmostEqual(approximate[key], exact[key], delta=0.02 * exact[key] + 0.01)
+
+    async def test_empty_stats(self):
+        stats = FrametimeStats().stats_helper(FrametimeHistogram())
+        self.assertEqual(stats["mean"], 0)
+        self.assertEqual(stats["p99"], 0)
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import tempfile
+
+import numpy as np
+import omni.kit.test
+from isaacsim.benchmark.services.metrics import backend, measurements
+
+
+class TestTimeSeriesBackend(omni.kit.test.AsyncTestCase):
+    async def test_write_and_load_timeseries(self):
+        frametimes = np.array([16.6, 16.7, 33.4, 16.5])
+        test_phase = measurements.TestPhase(
+            phase_name="benchmark",
+            measurements=[
+                measurements.SingleMeasurement(name="Mean App_Update Frametime", value=20.8, unit="ms"),
+                measurements.TimeSeriesMeasurement(
+                    name="App_Update Frametime",
+                    frame_index=np.arange(1, 5),
+                    timestamp=np.array([0.0, 0.0167, 0.0501, 0.0666]),
+                    value=frametimes,
+                ),
+            ],
+            metadata=[
+                measurements.StringMetadata(name="workflow_name", data="test_timeseries"),
+                measurements.StringMetadata(name="phase", data="benchmark"),
+            ],
+        )
+
+        kpi_backend = backend.OsmoKPIFile()
+        metrics = backend.TimeSeriesFileMetrics(kpi_backend=kpi_backend)
+        metrics.add_metrics(test_phase)
+        # time series are not forwarded to the KPI backend
+        self.assertEqual(len(kpi_backend._test_phases[0].measurements), 1)
+
+        with tempfile.TemporaryDirectory() as output_folder:
+            metrics.finalize(output_folder)
+            self.assertTrue(os.path.isfile(os.path.join(output_folder, "kpis_test_timeseries_benchmark.json")))
+            series = backend.load_timeseries(os.path.join(output_folder, "timeseries_test_timeseries_benchmark.npz"))
+
+        self.assertEqual(list(series.keys()), ["App_Update Frametime"])
+        np.testing.assert_array_equal(series["App_Update Frametime"]["frame_index"], np.arange(1, 5))
+        np.testing.assert_allclose(series["App_Update Frametime"]["value"], frametimes)
@@ -702,6 +702,61 @@ class SimulationContext:
                 self._physics_context._step(current_time=self.current_time)
         return
 
+    def step_many(self, num_steps: int, render_every: int = 0) -> None:
+        """Steps the physics simulation several times, rendering every given number of physics steps or never.
+
+        Compared to calling ``step`` in a loop, the physics step size and the simulation interface are looked up
+        once, the timeline state is only checked at the start and after each rendering, and the app player
+        simulation setting is toggled once for the whole call. Registered physics callbacks are still called
+        on each physics step (by the physics engine), as with ``step``.
+
+        .. warning::
+
+            Calling this method with the ``render_every`` parameter set to a positive value is not intended to be used
+            in the Isaac Sim's Extensions workflow since the Kit application has the control over the rendering steps
+
+        Args:
+            num_steps (int): number of physics steps to perform.
+            render_every (int, optional): render after every ``render_every`` physics steps (e.g.: 1 to render
+                                          after each physics step). Set to 0 to only do physics simulation without
+                                          rendering. Note: app UI will be frozen (since its not rendering) in this case.
+                                          Defaults to 0.
+
+        Raises:
+            Exception: if there is no stage currently opened
+            ValueError: if the number of steps or the rendering interval is negative
+
+        Example:
+
+        .. code-block:: python
+
+            >>> # 100 physics steps, rendering after every 4 physics steps
+            >>> simulation_context.step_many(100, render_every=4)
+        """
+        if self.stage is None:
+            raise Exception("There is no stage currently opened, init_stage needed before calling this func")
+        if num_steps < 0 or render_every < 0:
+            raise ValueError(f"Invalid number of steps ({num_steps}) or rendering interval ({render_every})")
+        physics_dt = self.get_physics_dt()
+        simulate = self._physics_context._physx_sim_interface.simulate
+        fetch_results = self._physics_context._physx_sim_interface.fetch_results
+        is_playing = self.is_playing()
+        if render_every:
+            set_carb_setting(self._settings, "/app/player/playSimulations", False)
+        try:
+            for i in range(1, num_steps + 1):
+                if is_playing and physics_dt:
+                    simulate(physics_dt, self._current_time)
+                    fetch_results()
+                if render_every and not i % render_every:
+                    self._prepare_render()
+                    self._app.update()
+                    is_playing = self.is_playing()
+        finally:
+            if render_every:
+                set_carb_setting(self._settings, "/app/player/playSimulations", True)
+        return
+
     def render(self) -> None:
         """Refresh the Isaac Sim app rendering components including UI elements, viewports and others
 
@@ -716,20 +771,7 @@ class SimulationContext:
 
             >>> simulation_context.render()
         """
-        if (
-            self.device is not None
-            and "cuda" in self.device
-            and self.physics_sim_view is not None
-            and self.is_playing()
-        ):
-            self.physics_sim_view.update_articulations_kinematic()
-        if self._physx_fabric_interface is None:
-            if self.current_time > 0 and self._extension_manager.is_extension_enabled("omni.physx.fabric"):
-                from omni.physxfabric import get_physx_fabric_interface
-
-                self._physx_fabric_interface = get_physx_fabric_interface()
-        if self._physx_fabric_interface:
-            self._physx_fabric_interface.force_update(self._physics_context.get_physics_dt(), self.current_time)
+        self._prepare_render()
         set_carb_setting(self._settings, "/app/player/playSimulations", False)
         self._app.update()
         set_carb_setting(self._settings, "/app/player/playSimulations", True)
@@ -754,21 +796,7 @@ class SimulationContext:
             ...
             >>> run_coroutine(task())
         """
-        if (
-            self.device is not None
-            and "cuda" in self.device
-            and self.physics_sim_view is not None
-            and self.is_playing()
-        ):
-            self.physics_sim_view.update_articulations_kinematic()
-
-        if self._physx_fabric_interface is None:
-            if self.current_time > 0 and self._extension_manager.is_extension_enabled("omni.physx.fabric"):
-                from omni.physxfabric import get_physx_fabric_interface
-
-                self._physx_fabric_interface = get_physx_fabric_interface()
-        if self._physx_fabric_interface:
-            self._physx_fabric_interface.force_update(self._physics_context.get_physics_dt(), self.current_time)
+        self._prepare_render()
         set_carb_setting(self._settings, "/app/player/playSimulations", False)
         await omni.kit.app.get_app().next_update_async()
         set_carb_setting(self._settings, "/app/player/playSimulations", True)
@@ -1383,6 +1411,24 @@ class SimulationContext:
         self.set_simulation_dt(physics_dt=physics_dt, rendering_dt=rendering_dt)
         return self.stage
 
+    def _prepare_render(self) -> None:
+        """Update the articulations kinematic (GPU pipeline) and force a Fabric update before rendering"""
+        if (
+            self.device is not None
+            and "cuda" in self.device
+            and self.physics_sim_view is not None
+            and self.is_playing()
+        ):
+            self.physics_sim_view.update_articulations_kinematic()
+        if self._physx_fabric_interface is None:
+            if self.current_time > 0 and self._extension_manager.is_extension_enabled("omni.physx.fabric"):
+                from omni.physxfabric import get_physx_fabric_interface
+
+                self._physx_fabric_interface = get_physx_fabric_interface()
+        if self._physx_fabric_interface:
+            self._physx_fabric_interface.force_update(self._physics_context.get_physics_dt(), self.current_time)
+        return
+
     def _setup_default_callback_fns(self):
         self._physics_timer_callback = self._physics_context._physx_interface.subscribe_physics_step_events(
             self._physics_timer_callback_fn
@@ -551,6 +551,49 @@ class World(SimulationContext):
             )
         return
 
+    def step_many(self, num_steps: int, render_every: int = 0) -> None:
+        """Step the physics simulation several times, rendering every given number of physics steps or never.
+
+        .. note::
+
+            If there are tasks in the scene, the bounding box computations are enabled or the data logger is started,
+            this method calls ``step`` (without rendering) for each physics step (so that the ``pre_step`` of each
+            task, the Bounding Box Cache time update and the data logging take place on every physics step as usual),
+            and renders (without stepping the physics) after every ``render_every`` physics steps.
+            Otherwise, the physics steps are batched (see :py:meth:`SimulationContext.step_many`).
+            In both cases, exactly ``num_steps`` physics steps are performed
+
+        .. warning::
+
+            Calling this method with the ``render_every`` parameter set to a positive value is not intended to be used
+            in the Isaac Sim's Extensions workflow since the Kit application has the control over the rendering steps
+
+        Args:
+            num_steps (int): number of physics steps to perform.
+            render_every (int, optional): render after every ``render_every`` physics steps.
+                                          Set to 0 to only do physics simulation without rendering. Defaults to 0.
+
+        Example:
+
+        .. code-block:: python
+
+            >>> world.step_many(100, render_every=4)
+        """
+        if (
+            (self._task_scene_built and self._current_tasks)
+            or self.scene._enable_bounding_box_computations
+            or self._data_logger.is_started()
+        ):
+            if num_steps < 0 or render_every < 0:
+                raise ValueError(f"Invalid number of steps ({num_steps}) or rendering interval ({render_every})")
+            for i in range(1, num_steps + 1):
+                self.step(render=False)
+                if render_every and not i % render_every:
+                    SimulationContext.render(self)
+            return
+        SimulationContext.step_many(self, num_steps, render_every=render_every)
+        return
+
     def step_async(self, step_size: Optional[float] = None) -> None:
         """Call all functions that should be called pre stepping the physics
 
@@ -15,6 +15,7 @@
 
 import omni.kit.test
 from isaacsim.core.api import SimulationContext, World
+from isaacsim.core.api.tasks import BaseTask
 from isaacsim.core.utils.stage import create_new_stage_async, get_stage_units, set_stage_units
 
 
@@ -68,3 +69,49 @@ class TestSimulationContext(omni.kit.test.AsyncTestCase):
         # try set simulation dt with Nones
         simulation_context.set_simulation_dt(physics_dt=None, rendering_dt=None)
         return
+
+    async def test_step_many(self):
+        simulation_context = SimulationContext(physics_dt=1.0 / 60.0, rendering_dt=1.0 / 60.0)
+        await simulation_context.initialize_simulation_context_async()
+        await simulation_context.play_async()
+        step_sizes = []
+        simulation_context.add_physics_callback("record_step", lambda step_size: step_sizes.append(step_size))
+        start_index = simulation_context.current_time_step_index
+        simulation_context.step_many(10)
+        self.assertEqual(simulation_context.current_time_step_index - start_index, 10)
+        self.assertEqual(len(step_sizes), 10)
+        self.assertAlmostEqual(sum(step_sizes), 10.0 / 60.0, places=5)
+        simulation_context.step_many(0)
+        self.assertEqual(len(step_sizes), 10)
+        # invalid arguments
+        with self.assertRaises(ValueError):
+            simulation_context.step_many(-1)
+        # stopped simulation: physics is not stepped
+        await simulation_context.stop_async()
+        simulation_context.step_many(5)
+        self.assertEqual(simulation_context.current_time_step_index, 0)
+        simulation_context.clear_instance()
+        return
+
+    async def test_world_step_many_with_tasks(self):
+        world = World(physics_dt=1.0 / 60.0, rendering_dt=2.0 / 60.0)
+        await world.initialize_simulation_context_async()
+        pre_step_indices = []
+
+        class Task(BaseTask):
+            def pre_step(self, time_step_index, simulation_time):
+                pre_step_indices.append(time_step_index)
+
+        world.add_task(Task(name="task"))
+        await world.reset_async()
+        step_sizes = []
+        world.add_physics_callback("record_step", lambda step_size: step_sizes.append(step_size))
+        # with a task, each physics step goes through World.step: rendering must not step the physics
+        world.step_many(10, render_every=2)
+        self.assertEqual(len(pre_step_indices), 10)
+        self.assertEqual(len(step_sizes), 10)
+        self.assertAlmostEqual(sum(step_sizes), 10.0 / 60.0, places=5)
+        world.step_many(7, render_every=3)
+        self.assertEqual(len(step_sizes), 17)
+        world.clear_instance()
+        return
@@ -32,7 +32,8 @@ class Cloner:
     placed at user-specified locations in the scene.
 
     Note that the cloning process is performed in a for-loop, so performance should
-    be expected to follow linear scaling with an increase of clones.
+    be expected to follow linear scaling with an increase of clones. Use ``batch_authoring=True``
+    to reduce the per-clone authoring cost when creating a large number of clones.
     """
 
     def __init__(self, stage: Usd.Stage = None):
@@ -70,6 +71,32 @@ class Cloner:
         self._root_path = root_path + "_"
         return [f"{root_path}_{i}" for i in range(num_paths)]
 
+    def generate_hierarchical_paths(self, root_paths: List[str], num_paths: List[int]) -> List[List[str]]:
+        """Generates the paths of a nested hierarchy of clones, one level per entry of root_paths.
+
+        The first entry of root_paths is an absolute path prefix, the following ones are prim names relative to the
+        previous level. For example, ``root_paths=["/World/tasks/task", "env"]`` and ``num_paths=[2, 3]`` generates
+        ``/World/tasks/task_{0,1}`` for the first level and ``/World/tasks/task_{i}/env_{0,1,2}`` for the second one.
+
+        Args:
+            root_paths (List[str]): Path prefix for each level of the hierarchy.
+            num_paths (List[int]): Number of paths to generate under each parent for each level of the hierarchy.
+
+        Raises:
+            ValueError: If root_paths and num_paths have different lengths or are empty.
+
+        Returns:
+            paths (List[List[str]]): For each level, the list of paths of that level in row-major order.
+        """
+        if len(root_paths) != len(num_paths) or len(root_paths) == 0:
+            raise ValueError("root_paths and num_paths must be non-empty and have the same length!")
+
+        paths = [[f"{root_paths[0]}_{i}" for i in range(num_paths[0])]]
+        for root_path, num in zip(root_paths[1:], num_paths[1:]):
+            suffixes = [f"/{root_path}_{i}" for i in range(num)]
+            paths.append([parent + suffix for parent in paths[-1] for suffix in suffixes])
+        return paths
+
     def replicate_physics(
         self,
         source_prim_path: str,
@@ -103,6 +130,72 @@ class Cloner:
         clone_root = self._base_env_path if base_env_path is None else base_env_path
         num_replications = len(prim_paths) if replicate_first else len(prim_paths) - 1
 
+        def hierarchyRenameFn(replicatePath, index):
+            if replicate_first:
+                stringPath = clone_base_path + str(index)
+            else:
+                stringPath = clone_base_path + str(index + 1)
+            return stringPath
+
+        self._register_replicator(
+            source_prim_path, num_replications, clone_root, hierarchyRenameFn, enable_env_ids, clone_in_fabric
+        )
+
+    def replicate_physics_to_paths(
+        self,
+        source_prim_path: str,
+        prim_paths: List[str],
+        base_env_path: str,
+        enable_env_ids: bool = False,
+        clone_in_fabric: bool = False,
+    ):
+        """Replicates physics properties of the source object to an arbitrary list of destination paths.
+
+        Unlike :meth:`replicate_physics`, destination paths do not need to share a common ``root_path`` prefix,
+        which allows nested hierarchies of clones (e.g. ``/World/tasks/task_i/env_j``) to be registered with a single
+        physics replication.
+
+        Args:
+            source_prim_path (str): Path of source object.
+            prim_paths (List[str]): List of destination paths. The source path is skipped if present.
+            base_env_path (str): Path to namespace for all clones. Physics parsing is skipped for anything under it.
+            enable_env_ids (bool): Whether to use envIDs functionality in physics to enable co-location of clones. Clones will be filtered automatically.
+            clone_in_fabric (bool): Whether the clones were created in Fabric.
+        Raises:
+            ValueError: Raises exception if base_env_path is None.
+        """
+        clone_root = self._base_env_path if base_env_path is None else base_env_path
+        if clone_root is None:
+            raise ValueError("base_env_path needs to be specified!")
+
+        clone_paths = [prim_path for prim_path in prim_paths if prim_path != source_prim_path]
+
+        def hierarchyRenameFn(replicatePath, index):
+            return clone_paths[index]
+
+        self._register_replicator(
+            source_prim_path, len(clone_paths), clone_root, hierarchyRenameFn, enable_env_ids, clone_in_fabric
+        )
+
+    def _register_replicator(
+        self,
+        source_prim_path: str,
+        num_replications: int,
+        clone_root: str,
+        rename_fn,
+        enable_env_ids: bool,
+        clone_in_fabric: bool,
+    ):
+        """Registers the physics replicator for the current stage.
+
+        Args:
+            source_prim_path (str): Path of source object.
+            num_replications (int): Number of replications to be made.
+            clone_root (str): Path to namespace for all clones, excluded from physics parsing.
+            rename_fn (Callable[[str, int], str]): Function returning the path of the replication at the given index.
+            enable_env_ids (bool): Whether to use envIDs functionality in physics.
+            clone_in_fabric (bool): Whether the clones were created in Fabric.
+        """
         stageId = UsdUtils.StageCache.Get().Insert(self._stage).ToLongInt()
 
         # if enable_env_ids, set the envIdInBoundsBitCount to 4
@@ -122,15 +215,8 @@ class Cloner:
                 stageId, source_prim_path, num_replications, enable_env_ids, clone_in_fabric
             )
 
-        def hierarchyRenameFn(replicatePath, index):
-            if replicate_first:
-                stringPath = clone_base_path + str(index)
-            else:
-                stringPath = clone_base_path + str(index + 1)
-            return stringPath
-
         get_physx_replicator_interface().register_replicator(
-            stageId, replicationAttachFn, replicationAttachEndFn, hierarchyRenameFn
+            stageId, replicationAttachFn, replicationAttachEndFn, rename_fn
         )
 
     def disable_change_listener(self):
@@ -184,6 +270,7 @@ class Cloner:
         unregister_physics_replication: bool = False,
         enable_env_ids: bool = False,
         clone_in_fabric: bool = False,
+        batch_authoring: bool = False,
     ):
         """Clones a source prim at user-specified destination paths.
             Clones will be placed at user-specified positions and orientations.
@@ -202,6 +289,9 @@ class Cloner:
                          Setting this to True will make copies of the source prim when creating new clones; changes to the source prim will not be reflected in clones. Defaults to False. Note that setting this to True will take longer to execute.
             unregister_physics_replication (bool): Setting this to True will unregister the physics replicator on the current stage.
             enable_env_ids (bool): Setting this enables co-location of clones in physics with automatic filtering of collisions between clones.
+            clone_in_fabric (bool): Setting this to True will clone the source prim in Fabric instead of authoring clones in USD.
+            batch_authoring (bool): Setting this to True authors all clone specs in a single pass by copying a fully authored template clone,
+                         which is considerably faster for large numbers of clones. Ignored if clone_in_fabric=True. Defaults to False.
         Raises:
             Exception: Raises exception if source prim path is not valid.
 
@@ -358,65 +448,46 @@ class Cloner:
             else:
                 carb.log_error("Failed to clone in Fabric")
         else:
-            with Sdf.ChangeBlock():
-                for i, prim_path in enumerate(prim_paths):
-                    if prim_path != source_prim_path:
-                        has_clones = True
-
-                        env_spec = Sdf.CreatePrimInLayer(self._stage.GetRootLayer(), prim_path)
-                        stack = UsdGeom.Xform(self._stage.GetPrimAtPath(source_prim_path)).GetPrim().GetPrimStack()
-
-                        if copy_from_source:
-                            Sdf.CopySpec(
-                                env_spec.layer, Sdf.Path(source_prim_path), env_spec.layer, Sdf.Path(prim_path)
-                            )
-                        else:
-                            env_spec.inheritPathList.Prepend(source_prim_path)
-
-                        if positions is not None:
-                            translation = positions[i]  # use specified translation
-                        else:
-                            translation = current_translation  # use the same translation as source
-
-                        if orientations is not None:
-                            orientation = orientations[i]  # use specified orientation
-                        else:
-                            orientation = current_orientation  # use the same orientation as source
-
-                        translate_spec = env_spec.GetAttributeAtPath(prim_path + ".xformOp:translate")
-                        if translate_spec is None:
-                            translate_spec = Sdf.AttributeSpec(
-                                env_spec, "xformOp:translate", Sdf.ValueTypeNames.Double3
-                            )
-                        translate_spec.default = translation
-
-                        orient_spec = env_spec.GetAttributeAtPath(prim_path + ".xformOp:orient")
-                        default_precision = carb.settings.get_settings().get_as_string(
-                            "app/primCreation/DefaultXformOpPrecision"
-                        )
-                        if orient_spec is None:
-                            if len(default_precision) > 0 and default_precision == "Float":
-                                orient_spec = Sdf.AttributeSpec(env_spec, "xformOp:orient", Sdf.ValueTypeNames.Quatf)
-                                orient_spec.default = Gf.Quatf(orientation)
+            default_precision = carb.settings.get_settings().get_as_string("app/primCreation/DefaultXformOpPrecision")
+            if batch_authoring:
+                has_clones = self._batch_author_clone_specs(
+                    source_prim_path,
+                    prim_paths,
+                    positions,
+                    orientations,
+                    current_translation,
+                    current_orientation,
+                    current_scale,
+                    copy_from_source,
+                    default_precision,
+                )
+            else:
+                layer = self._stage.GetRootLayer()
+                with Sdf.ChangeBlock():
+                    for i, prim_path in enumerate(prim_paths):
+                        if prim_path != source_prim_path:
+                            has_clones = True
+
+                            if positions is not None:
+                                translation = positions[i]  # use specified translation
                             else:
-                                orient_spec = Sdf.AttributeSpec(env_spec, "xformOp:orient", Sdf.ValueTypeNames.Quatd)
-                                orient_spec.default = Gf.Quatd(orientation)
-                        elif orient_spec.default is not None and type(orient_spec.default) == Gf.Quatf:
-                            orient_spec.default = Gf.Quatf(orientation)
-                        else:
-                            orient_spec.default = Gf.Quatd(orientation)
-
-                        scale_spec = env_spec.GetAttributeAtPath(prim_path + ".xformOp:scale")
-                        if scale_spec is None:
-                            scale_spec = Sdf.AttributeSpec(env_spec, "xformOp:scale", Sdf.ValueTypeNames.Double3)
-                        scale_spec.default = current_scale
+                                translation = current_translation  # use the same translation as source
 
-                        op_order_spec = env_spec.GetAttributeAtPath(prim_path + ".xformOpOrder")
-                        if op_order_spec is None:
-                            op_order_spec = Sdf.AttributeSpec(
-                                env_spec, UsdGeom.Tokens.xformOpOrder, Sdf.ValueTypeNames.TokenArray
+                            if orientations is not None:
+                                orientation = orientations[i]  # use specified orientation
+                            else:
+                                orientation = current_orientation  # use the same orientation as source
+
+                            self._author_clone_spec(
+                                layer,
+                                source_prim_path,
+                                prim_path,
+                                translation,
+                                orientation,
+                                current_scale,
+                                copy_from_source,
+                                default_precision,
                             )
-                        op_order_spec.default = Vt.TokenArray(["xformOp:translate", "xformOp:orient", "xformOp:scale"])
 
         if replicate_physics and has_clones:
             self.replicate_physics(
@@ -429,8 +500,166 @@ class Cloner:
 
         self.enable_change_listener()
 
+    def _author_clone_spec(
+        self,
+        layer: Sdf.Layer,
+        source_prim_path: str,
+        prim_path: str,
+        translation,
+        orientation,
+        scale,
+        copy_from_source: bool,
+        default_precision: str,
+    ) -> Sdf.PrimSpec:
+        """Authors the prim spec and the xform op attribute specs of a single clone in the given layer.
+
+        Args:
+            layer (Sdf.Layer): Layer to author the clone in.
+            source_prim_path (str): Path of source object.
+            prim_path (str): Destination path of the clone.
+            translation: Translation of the clone.
+            orientation: Orientation of the clone.
+            scale: Scale of the clone.
+            copy_from_source (bool): Whether to copy the source prim spec instead of inheriting from it.
+            default_precision (str): Value of the ``app/primCreation/DefaultXformOpPrecision`` setting.
+
+        Returns:
+            Sdf.PrimSpec: Prim spec of the clone.
+        """
+        env_spec = Sdf.CreatePrimInLayer(layer, prim_path)
+
+        if copy_from_source:
+            Sdf.CopySpec(env_spec.layer, Sdf.Path(source_prim_path), env_spec.layer, Sdf.Path(prim_path))
+        else:
+            env_spec.inheritPathList.Prepend(source_prim_path)
+
+        translate_spec = env_spec.GetAttributeAtPath(prim_path + ".xformOp:translate")
+        if translate_spec is None:
+            translate_spec = Sdf.AttributeSpec(env_spec, "xformOp:translate", Sdf.ValueTypeNames.Double3)
+        translate_spec.default = translation
+
+        orient_spec = env_spec.GetAttributeAtPath(prim_path + ".xformOp:orient")
+        if orient_spec is None:
+            if len(default_precision) > 0 and default_precision == "Float":
+                orient_spec = Sdf.AttributeSpec(env_spec, "xformOp:orient", Sdf.ValueTypeNames.Quatf)
+                orient_spec.default = Gf.Quatf(orientation)
+            else:
+                orient_spec = Sdf.AttributeSpec(env_spec, "xformOp:orient", Sdf.ValueTypeNames.Quatd)
+                orient_spec.default = Gf.Quatd(orientation)
+        elif orient_spec.default is not None and type(orient_spec.default) == Gf.Quatf:
+            orient_spec.default = Gf.Quatf(orientation)
+        else:
+            orient_spec.default = Gf.Quatd(orientation)
+
+        scale_spec = env_spec.GetAttributeAtPath(prim_path + ".xformOp:scale")
+        if scale_spec is None:
+            scale_spec = Sdf.AttributeSpec(env_spec, "xformOp:scale", Sdf.ValueTypeNames.Double3)
+        scale_spec.default = scale
+
+        op_order_spec = env_spec.GetAttributeAtPath(prim_path + ".xformOpOrder")
+        if op_order_spec is None:
+            op_order_spec = Sdf.AttributeSpec(env_spec, UsdGeom.Tokens.xformOpOrder, Sdf.ValueTypeNames.TokenArray)
+        op_order_spec.default = Vt.TokenArray(["xformOp:translate", "xformOp:orient", "xformOp:scale"])
+
+        return env_spec
+
+    def _batch_author_clone_specs(
+        self,
+        source_prim_path: str,
+        prim_paths: List[str],
+        positions: Vt.Vec3fArray,
+        orientations: Vt.QuatdArray,
+        current_translation: Gf.Vec3d,
+        current_orientation: Union[Gf.Quatd, Gf.Quatf],
+        current_scale: Gf.Vec3d,
+        copy_from_source: bool,
+        default_precision: str,
+    ) -> bool:
+        """Authors all clone specs in the root layer in a single pass.
+
+        The first new clone is fully authored and used as a template: every other clone is created with a single
+        ``Sdf.CopySpec`` from it, after which only its translation and orientation defaults are overwritten.
+        Per-clone values are gathered into ``Vt`` arrays up front. Clones whose spec already exists in the layer are
+        authored individually so that their existing opinions are preserved.
+
+        Args:
+            source_prim_path (str): Path of source object.
+            prim_paths (List[str]): List of destination paths.
+            positions (Vt.Vec3fArray): Target positions of the clones, or None to use the source translation.
+            orientations (Vt.QuatdArray): Target orientations of the clones, or None to use the source orientation.
+            current_translation (Gf.Vec3d): Translation of the source prim.
+            current_orientation (Union[Gf.Quatd, Gf.Quatf]): Orientation of the source prim.
+            current_scale (Gf.Vec3d): Scale of the source prim.
+            copy_from_source (bool): Whether to copy the source prim spec instead of inheriting from it.
+            default_precision (str): Value of the ``app/primCreation/DefaultXformOpPrecision`` setting.
+
+        Returns:
+            bool: True if at least one clone was authored.
+        """
+        indices = [i for i, prim_path in enumerate(prim_paths) if prim_path != source_prim_path]
+        if not indices:
+            return False
+
+        # gather per-clone values in bulk
+        if positions is not None:
+            translations = np.asarray(positions, dtype=np.float64)[indices]
+        else:
+            translations = np.tile(np.asarray(current_translation, dtype=np.float64), (len(indices), 1))
+        translations = Vt.Vec3dArray.FromNumpy(np.ascontiguousarray(translations))
+        if orientations is not None:
+            # Vt quaternion arrays are stored as xyzw
+            rotations = np.asarray(orientations, dtype=np.float64)[indices]
+        else:
+            rotations = np.tile(
+                np.array([*current_orientation.GetImaginary(), current_orientation.GetReal()], dtype=np.float64),
+                (len(indices), 1),
+            )
+        rotations = np.ascontiguousarray(rotations)
+
+        layer = self._stage.GetRootLayer()
+        translate_token = "xformOp:translate"
+        orient_token = "xformOp:orient"
+        template_path = None
+        template_orientations = None
+        with Sdf.ChangeBlock():
+            for j, i in enumerate(indices):
+                prim_path = Sdf.Path(prim_paths[i])
+                has_spec = bool(layer.GetPrimAtPath(prim_path))
+                if template_path is None or has_spec:
+                    env_spec = self._author_clone_spec(
+                        layer,
+                        source_prim_path,
+                        prim_paths[i],
+                        translations[j],
+                        Gf.Quatd(rotations[j][3], Gf.Vec3d(*rotations[j][:3].tolist())),
+                        current_scale,
+                        copy_from_source,
+                        default_precision,
+                    )
+                    if template_path is None and not has_spec:
+                        template_path = env_spec.path
+                        # match the orientation precision authored on the template
+                        template_orient = layer.GetAttributeAtPath(template_path.AppendProperty(orient_token)).default
+                        if type(template_orient) == Gf.Quatf:
+                            template_orientations = Vt.QuatfArray.FromNumpy(rotations.astype(np.float32))
+                        else:
+                            template_orientations = Vt.QuatdArray.FromNumpy(rotations)
+                    continue
+                parent_path = prim_path.GetParentPath()
+                if not parent_path.IsAbsoluteRootPath():
+                    Sdf.CreatePrimInLayer(layer, parent_path)
+                Sdf.CopySpec(layer, template_path, layer, prim_path)
+                layer.GetAttributeAtPath(prim_path.AppendProperty(translate_token)).default = translations[j]
+                layer.GetAttributeAtPath(prim_path.AppendProperty(orient_token)).default = template_orientations[j]
+        return True
+
     def filter_collisions(
-        self, physicsscene_path: str, collision_root_path: str, prim_paths: List[str], global_paths: List[str] = []
+        self,
+        physicsscene_path: str,
+        collision_root_path: str,
+        prim_paths: List[str],
+        global_paths: List[str] = [],
+        batch_authoring: bool = False,
     ):
         """Filters collisions between clones. Clones will not collide with each other, but can collide with objects specified in global_paths.
 
@@ -439,6 +668,9 @@ class Cloner:
             collision_root_path (str): Path to place collision groups under.
             prim_paths (List[str]): Paths of objects to filter out collision.
             global_paths (List[str]): Paths of objects to generate collision (e.g. ground plane).
+            batch_authoring (bool): Setting this to True authors the relationship targets of each collision group as a single explicit list
+                         and only references the global group from the clone groups (filtered group pairs are symmetric), so that
+                         the global group does not grow with the number of clones. Defaults to False.
 
         """
 
@@ -479,8 +711,11 @@ class Cloner:
                 global_includes_rel = Sdf.RelationshipSpec(
                     global_collision_group, "collection:colliders:includes", False
                 )
-                for global_path in global_paths:
-                    global_includes_rel.targetPathList.Append(global_path)
+                if batch_authoring:
+                    global_includes_rel.targetPathList.explicitItems = global_paths
+                else:
+                    for global_path in global_paths:
+                        global_includes_rel.targetPathList.Append(global_path)
 
                 # filteredGroups rel
                 global_filtered_groups = Sdf.RelationshipSpec(global_collision_group, "physics:filteredGroups", False)
@@ -489,12 +724,13 @@ class Cloner:
                 # each other.
                 global_filtered_groups.targetPathList.Append(global_collision_group_path)
 
+            collision_root_spec = self._stage.GetRootLayer().GetPrimAtPath(collision_root_path)
             # set collision groups and filters
             for i, prim_path in enumerate(prim_paths):
                 collision_group_path = collision_root_path + f"/group{i}"
                 # add collision group prim
                 collision_group = Sdf.PrimSpec(
-                    self._stage.GetRootLayer().GetPrimAtPath(collision_root_path),
+                    collision_root_spec,
                     f"group{i}",
                     Sdf.SpecifierDef,
                     "PhysicsCollisionGroup",
@@ -513,10 +749,23 @@ class Cloner:
 
                 # includes rel
                 includes_rel = Sdf.RelationshipSpec(collision_group, "collection:colliders:includes", False)
-                includes_rel.targetPathList.Append(prim_path)
 
                 # filteredGroups rel
                 filtered_groups = Sdf.RelationshipSpec(collision_group, "physics:filteredGroups", False)
+                if batch_authoring:
+                    includes_rel.targetPathList.explicitItems = [prim_path]
+                    # The filtered pair with the global group is symmetric, so it is only authored on the clone group
+                    # to keep the global group relationship constant in size.
+                    if len(global_paths) > 0:
+                        filtered_groups.targetPathList.explicitItems = [
+                            collision_group_path,
+                            global_collision_group_path,
+                        ]
+                    else:
+                        filtered_groups.targetPathList.explicitItems = [collision_group_path]
+                    continue
+
+                includes_rel.targetPathList.Append(prim_path)
                 # We are using inverted collision group filtering, which means objects by default don't collide across
                 # groups. We need to add this group as a filtered group, so that objects within this group collide with
                 # each other.
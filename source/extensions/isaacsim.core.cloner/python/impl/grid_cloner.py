@@ -12,13 +12,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import List, Union
+from typing import List, Tuple, Union
 
 import numpy as np
 import omni.usd
 import torch
 from isaacsim.core.cloner import Cloner
-from pxr import Gf, Usd, UsdGeom
+from pxr import Sdf, Usd, UsdGeom, Vt
 
 
 class GridCloner(Cloner):
@@ -80,52 +80,198 @@ class GridCloner(Cloner):
             return self._positions, self._orientations
 
         self._num_per_row = int(np.sqrt(num_clones)) if self._num_per_row == -1 else self._num_per_row
-        num_rows = np.ceil(num_clones / self._num_per_row)
-        num_cols = np.ceil(num_clones / num_rows)
+        positions = self._compute_grid_positions(num_clones, self._spacing, self._num_per_row)
 
-        row_offset = 0.5 * self._spacing * (num_rows - 1)
-        col_offset = 0.5 * self._spacing * (num_cols - 1)
+        if position_offsets is not None:
+            positions = positions + position_offsets
+        if orientation_offsets is not None:
+            # offsets are applied as local rotations on top of the identity orientation
+            orientations = np.asarray(orientation_offsets, dtype=np.float64)
+        else:
+            orientations = np.tile(np.array([1.0, 0.0, 0.0, 0.0]), (num_clones, 1))
 
-        positions = []
-        orientations = []
-
-        for i in range(num_clones):
-            # compute transform
-            row = i // num_cols
-            col = i % num_cols
-            x = row_offset - row * self._spacing
-            y = col * self._spacing - col_offset
-
-            up_axis = UsdGeom.GetStageUpAxis(self._stage)
-            position = [x, y, 0] if up_axis == UsdGeom.Tokens.z else [x, 0, y]
-            orientation = Gf.Quatd.GetIdentity()
-
-            if position_offsets is not None:
-                translation = position_offsets[i] + position
-            else:
-                translation = position
-
-            if orientation_offsets is not None:
-                orientation = (
-                    Gf.Quatd(orientation_offsets[i][0].item(), Gf.Vec3d(orientation_offsets[i][1:].tolist()))
-                    * orientation
-                )
-
-            orientation = [
-                orientation.GetReal(),
-                orientation.GetImaginary()[0],
-                orientation.GetImaginary()[1],
-                orientation.GetImaginary()[2],
-            ]
-
-            positions.append(translation)
-            orientations.append(orientation)
+        positions = positions.tolist()
+        orientations = orientations.tolist()
 
         self._positions = positions
         self._orientations = orientations
 
         return positions, orientations
 
+    def _compute_grid_positions(self, num_clones: int, spacing: float, num_per_row: int) -> np.ndarray:
+        """Computes the positions of clones laid out in a grid centered at the origin.
+
+        Args:
+            num_clones (int): Number of clones.
+            spacing (float): Spacing between clones.
+            num_per_row (int): Number of clones to place in a row.
+
+        Returns:
+            np.ndarray: Positions of the clones, with shape (num_clones, 3).
+        """
+        num_rows = np.ceil(num_clones / num_per_row)
+        num_cols = np.ceil(num_clones / num_rows)
+
+        row_offset = 0.5 * spacing * (num_rows - 1)
+        col_offset = 0.5 * spacing * (num_cols - 1)
+
+        indices = np.arange(num_clones)
+        x = row_offset - (indices // num_cols) * spacing
+        y = (indices % num_cols) * spacing - col_offset
+
+        positions = np.zeros((num_clones, 3))
+        positions[:, 0] = x
+        if UsdGeom.GetStageUpAxis(self._stage) == UsdGeom.Tokens.z:
+            positions[:, 1] = y
+        else:
+            positions[:, 2] = y
+        return positions
+
+    def get_hierarchical_clone_transforms(
+        self, num_clones: List[int], spacings: List[float] = None
+    ) -> Tuple[List[np.ndarray], np.ndarray]:
+        """Computes the local positions of nested grids of clones.
+
+        Each level of the hierarchy is laid out as a grid (with sqrt(num_clones) clones per row) local to its parent.
+        Leaf clones use the spacing of this cloner; unless specified, the spacing of each parent level is chosen
+        so that the grids of its children do not overlap.
+
+        Args:
+            num_clones (List[int]): Number of clones under each parent for each level of the hierarchy.
+            spacings (List[float]): Spacing between clones for each level of the hierarchy. Defaults to None.
+
+        Raises:
+            ValueError: If spacings is specified and its length does not match the number of levels.
+
+        Returns:
+            positions (List[np.ndarray]): For each level, the local positions of all clones of that level in row-major order.
+            orientations (np.ndarray): Identity orientations of the leaf clones.
+        """
+        if spacings is None:
+            spacings = [self._spacing]
+            for num in reversed(num_clones[1:]):
+                num_rows = np.ceil(num / int(np.sqrt(num)))
+                num_cols = np.ceil(num / num_rows)
+                spacings.insert(0, spacings[0] * max(num_rows, num_cols))
+        elif len(spacings) != len(num_clones):
+            raise ValueError("Dimension mismatch between spacings and num_clones!")
+
+        positions = []
+        num_parents = 1
+        for num, spacing in zip(num_clones, spacings):
+            grid = self._compute_grid_positions(num, spacing, int(np.sqrt(num)))
+            positions.append(np.tile(grid, (num_parents, 1)))
+            num_parents *= num
+        orientations = np.tile(np.array([1.0, 0.0, 0.0, 0.0]), (num_parents, 1))
+        return positions, orientations
+
+    def clone_hierarchy(
+        self,
+        source_prim_path: str,
+        root_paths: List[str],
+        num_clones: List[int],
+        spacings: List[float] = None,
+        position_offsets: np.ndarray = None,
+        orientation_offsets: np.ndarray = None,
+        replicate_physics: bool = False,
+        base_env_path: str = None,
+        copy_from_source: bool = False,
+        enable_env_ids: bool = False,
+        clone_in_fabric: bool = False,
+        batch_authoring: bool = True,
+    ) -> List[str]:
+        """Clones a source prim into nested grids, e.g. N tasks with M environments each.
+
+        Intermediate levels are authored as Xform prims placed on their own grid. The source prim must be the first leaf
+        of the hierarchy (e.g. ``/World/tasks/task_0/env_0``). All leaves are cloned in a single pass and, if requested,
+        registered with a single physics replication.
+
+        Args:
+            source_prim_path (str): Path of source object, the first leaf of the hierarchy.
+            root_paths (List[str]): Path prefix for each level of the hierarchy (see :meth:`generate_hierarchical_paths`).
+            num_clones (List[int]): Number of clones under each parent for each level of the hierarchy.
+            spacings (List[float]): Spacing between clones for each level of the hierarchy.
+                                    Defaults to None, see :meth:`get_hierarchical_clone_transforms`.
+            position_offsets (np.ndarray | torch.Tensor): Positions to be applied as local translations on top of computed leaf clone positions.
+                                           Defaults to None, no offset will be applied.
+            orientation_offsets (np.ndarray | torch.Tensor): Orientations to be applied as local rotations for each leaf clone.
+                                           Defaults to None, no offset will be applied.
+            replicate_physics (bool): Uses omni.physics replication for all leaf clones.
+            base_env_path (str): Path to namespace for all clones. Required if replicate_physics=True and define_base_env() not called.
+            copy_from_source: (bool): Setting this to True will make copies of the source prim instead of inheriting from it. Defaults to False.
+            enable_env_ids (bool): Setting this enables co-location of clones in physics with automatic filtering of collisions between clones.
+            clone_in_fabric (bool): Setting this to True will clone the source prim in Fabric instead of authoring clones in USD.
+            batch_authoring (bool): Setting this to True authors all clone specs in a single pass. Defaults to True.
+
+        Raises:
+            ValueError: If the source prim is not the first leaf of the hierarchy or offsets have the wrong dimension.
+
+        Returns:
+            paths (List[str]): Paths of all leaf clones.
+        """
+        paths = self.generate_hierarchical_paths(root_paths, num_clones)
+        leaf_paths = paths[-1]
+        if leaf_paths[0] != source_prim_path:
+            raise ValueError(f"Source prim path must be the first leaf of the hierarchy: {leaf_paths[0]}")
+
+        positions, orientations = self.get_hierarchical_clone_transforms(num_clones, spacings)
+
+        # author the intermediate levels as Xform prims
+        layer = self._stage.GetRootLayer()
+        with Sdf.ChangeBlock():
+            for level_paths, level_positions in zip(paths[:-1], positions[:-1]):
+                translations = Vt.Vec3dArray.FromNumpy(np.ascontiguousarray(level_positions))
+                for i, prim_path in enumerate(level_paths):
+                    prim_spec = Sdf.CreatePrimInLayer(layer, prim_path)
+                    # ancestors of the source prim may already exist as typeless defs
+                    if prim_spec.specifier != Sdf.SpecifierDef:
+                        prim_spec.specifier = Sdf.SpecifierDef
+                    if not prim_spec.typeName:
+                        prim_spec.typeName = "Xform"
+                    translate_spec = prim_spec.GetAttributeAtPath(prim_path + ".xformOp:translate")
+                    if translate_spec is None:
+                        translate_spec = Sdf.AttributeSpec(prim_spec, "xformOp:translate", Sdf.ValueTypeNames.Double3)
+                    translate_spec.default = translations[i]
+                    op_order_spec = prim_spec.GetAttributeAtPath(prim_path + ".xformOpOrder")
+                    if op_order_spec is None:
+                        op_order_spec = Sdf.AttributeSpec(
+                            prim_spec, UsdGeom.Tokens.xformOpOrder, Sdf.ValueTypeNames.TokenArray
+                        )
+                    op_order_spec.default = Vt.TokenArray(["xformOp:translate"])
+
+        # apply leaf offsets
+        leaf_positions = positions[-1]
+        if position_offsets is not None:
+            if len(position_offsets) != len(leaf_paths):
+                raise ValueError("Dimension mismatch between position_offsets and leaf paths!")
+            if isinstance(position_offsets, torch.Tensor):
+                position_offsets = position_offsets.detach().cpu().numpy()
+            leaf_positions = leaf_positions + np.asarray(position_offsets)
+        if orientation_offsets is not None:
+            if len(orientation_offsets) != len(leaf_paths):
+                raise ValueError("Dimension mismatch between orientation_offsets and leaf paths!")
+            if isinstance(orientation_offsets, torch.Tensor):
+                orientation_offsets = orientation_offsets.detach().cpu().numpy()
+            orientations = np.asarray(orientation_offsets, dtype=np.float64)
+
+        super().clone(
+            source_prim_path=source_prim_path,
+            prim_paths=leaf_paths,
+            positions=leaf_positions,
+            orientations=orientations,
+            replicate_physics=False,
+            copy_from_source=copy_from_source,
+            clone_in_fabric=clone_in_fabric,
+            batch_authoring=batch_authoring,
+        )
+
+        if replicate_physics and len(leaf_paths) > 1:
+            self.replicate_physics_to_paths(
+                source_prim_path, leaf_paths, base_env_path, enable_env_ids, clone_in_fabric
+            )
+
+        return leaf_paths
+
     def clone(
         self,
         source_prim_path: str,
@@ -138,6 +284,7 @@ class GridCloner(Cloner):
         copy_from_source: bool = False,
         enable_env_ids: bool = False,
         clone_in_fabric: bool = False,
+        batch_authoring: bool = False,
     ):
         """Creates clones in a grid fashion. Positions of clones are computed automatically.
 
@@ -154,6 +301,8 @@ class GridCloner(Cloner):
             copy_from_source: (bool): Setting this to False will inherit all clones from the source prim; any changes made to the source prim will be reflected in the clones.
                          Setting this to True will make copies of the source prim when creating new clones; changes to the source prim will not be reflected in clones. Defaults to False. Note that setting this to True will take longer to execute.
             enable_env_ids (bool): Setting this enables co-location of clones in physics with automatic filtering of collisions between clones.
+            clone_in_fabric (bool): Setting this to True will clone the source prim in Fabric instead of authoring clones in USD.
+            batch_authoring (bool): Setting this to True authors all clone specs in a single pass. Defaults to False.
         Returns:
             positions (List): Computed positions of all clones.
         """
@@ -173,6 +322,7 @@ class GridCloner(Cloner):
             copy_from_source=copy_from_source,
             enable_env_ids=enable_env_ids,
             clone_in_fabric=clone_in_fabric,
+            batch_authoring=batch_authoring,
         )
 
         return positions
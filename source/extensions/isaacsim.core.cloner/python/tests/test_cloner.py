@@ -21,7 +21,7 @@ import usdrt
 from isaacsim.core.cloner import Cloner, GridCloner
 from isaacsim.storage.native import get_assets_root_path_async
 from omni.physx import get_physx_simulation_interface, get_physxunittests_interface
-from pxr import Gf, Usd, UsdGeom, UsdPhysics, UsdUtils, Vt
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdPhysics, UsdUtils, Vt
 
 
 class TestSimpleCloner(omni.kit.test.AsyncTestCase):
@@ -527,6 +527,71 @@ class TestSimpleCloner(omni.kit.test.AsyncTestCase):
                 == target_translations[i]
             )
 
+    async def test_batch_authoring_cloner(self):
+        stage = omni.usd.get_context().get_stage()
+
+        # create our base environment with one cube
+        UsdGeom.Xform.Define(stage, "/World/envs/env_0")
+        UsdGeom.Cube.Define(stage, "/World/envs/env_0/Cube")
+
+        cloner = Cloner()
+        target_paths = cloner.generate_paths("/World/envs/env", 16)
+
+        positions = np.array([[i, 2.0 * i, 0.0] for i in range(16)])
+        orientations = np.array([[0.0, 0.0, 0.0, 1.0]] * 16)
+
+        for copy_from_source in [False, True]:
+            cloner.clone(
+                source_prim_path="/World/envs/env_0",
+                prim_paths=target_paths,
+                positions=positions,
+                orientations=orientations,
+                copy_from_source=copy_from_source,
+                batch_authoring=True,
+            )
+
+            for i in range(16):
+                prim = stage.GetPrimAtPath(f"/World/envs/env_{i}")
+                self.assertTrue(prim.IsValid())
+                self.assertTrue(stage.GetPrimAtPath(f"/World/envs/env_{i}/Cube").GetTypeName() == "Cube")
+                self.assertTrue(prim.GetAttribute("xformOp:translate").Get() == Gf.Vec3d(*positions[i].tolist()))
+                self.assertTrue(prim.GetAttribute("xformOp:orient").Get() == Gf.Quatd(0.0, Gf.Vec3d(0.0, 0.0, 1.0)))
+                self.assertTrue(
+                    list(prim.GetAttribute("xformOpOrder").Get())
+                    == ["xformOp:translate", "xformOp:orient", "xformOp:scale"]
+                )
+
+    async def test_filter_collisions_batch_authoring(self):
+        stage = omni.usd.get_context().get_stage()
+
+        UsdPhysics.Scene.Define(stage, "/physicsScene")
+        UsdGeom.Cube.Define(stage, "/World/groundPlane")
+        prim_paths = [f"/World/envs/env_{i}" for i in range(8)]
+        for prim_path in prim_paths:
+            UsdGeom.Cube.Define(stage, prim_path)
+
+        cloner = Cloner()
+        cloner.filter_collisions(
+            "/physicsScene", "/World/collisions", prim_paths, global_paths=["/World/groundPlane"], batch_authoring=True
+        )
+
+        global_group = stage.GetPrimAtPath("/World/collisions/global_group")
+        self.assertTrue(global_group.GetTypeName() == "PhysicsCollisionGroup")
+        self.assertTrue(
+            global_group.GetRelationship("physics:filteredGroups").GetTargets()
+            == [Sdf.Path("/World/collisions/global_group")]
+        )
+        for i, prim_path in enumerate(prim_paths):
+            group = stage.GetPrimAtPath(f"/World/collisions/group{i}")
+            self.assertTrue(group.GetTypeName() == "PhysicsCollisionGroup")
+            self.assertTrue(
+                group.GetRelationship("collection:colliders:includes").GetTargets() == [Sdf.Path(prim_path)]
+            )
+            self.assertTrue(
+                group.GetRelationship("physics:filteredGroups").GetTargets()
+                == [Sdf.Path(f"/World/collisions/group{i}"), Sdf.Path("/World/collisions/global_group")]
+            )
+
     async def test_fabric_cloner(self):
         stage = Usd.Stage.CreateInMemory()
 
@@ -656,6 +721,58 @@ class TestSimpleCloner(omni.kit.test.AsyncTestCase):
 
         cache.Erase(stage)
 
+    async def test_grid_cloner_hierarchy(self):
+        stage = Usd.Stage.CreateInMemory()
+
+        cache = UsdUtils.StageCache.Get()
+        cache.Insert(stage)
+
+        stage_id = cache.GetId(stage).ToLongInt()
+
+        # create the first leaf of a 2 tasks x 3 envs hierarchy with one cube
+        base_env_path = "/World/tasks"
+        UsdGeom.Xform.Define(stage, base_env_path)
+        source_prim_path = "/World/tasks/task_0/env_0"
+        UsdGeom.Xform.Define(stage, source_prim_path)
+        cube = UsdGeom.Cube.Define(stage, source_prim_path + "/Cube")
+        UsdPhysics.RigidBodyAPI.Apply(cube.GetPrim())
+        UsdPhysics.CollisionAPI.Apply(cube.GetPrim())
+
+        cloner = GridCloner(spacing=3, stage=stage)
+        leaf_paths = cloner.clone_hierarchy(
+            source_prim_path=source_prim_path,
+            root_paths=["/World/tasks/task", "env"],
+            num_clones=[2, 3],
+            replicate_physics=True,
+            base_env_path=base_env_path,
+        )
+
+        self.assertTrue(len(leaf_paths) == 6)
+        positions, _ = cloner.get_hierarchical_clone_transforms([2, 3])
+        for i in range(2):
+            task_prim = stage.GetPrimAtPath(f"/World/tasks/task_{i}")
+            self.assertTrue(task_prim.GetTypeName() == "Xform")
+            self.assertTrue(task_prim.GetAttribute("xformOp:translate").Get() == Gf.Vec3d(*positions[0][i].tolist()))
+            for j in range(3):
+                env_path = f"/World/tasks/task_{i}/env_{j}"
+                self.assertTrue(leaf_paths[i * 3 + j] == env_path)
+                self.assertTrue(stage.GetPrimAtPath(env_path + "/Cube").GetTypeName() == "Cube")
+                self.assertTrue(
+                    stage.GetPrimAtPath(env_path).GetAttribute("xformOp:translate").Get()
+                    == Gf.Vec3d(*positions[1][i * 3 + j].tolist())
+                )
+
+        # attach physics to the stage
+        get_physx_simulation_interface().attach_stage(stage_id)
+
+        # check that all leaves are in physics
+        num_dynamic_rigid_bodies = self.get_num_dynamic_rigid_bodies()
+        self.assertTrue(num_dynamic_rigid_bodies == 6)
+
+        get_physx_simulation_interface().detach_stage()
+
+        cache.Erase(stage)
+
     async def test_fabric_physics_cloner_usd_context(self):
 
         await omni.usd.get_context().new_stage_async()
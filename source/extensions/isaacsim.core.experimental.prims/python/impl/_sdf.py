@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+from pxr import Sdf, Usd
+
+_NUMPY_DTYPES = {
+    "half": np.float16,
+    "float": np.float32,
+    "double": np.float64,
+    "quath": np.float16,
+    "quatf": np.float32,
+    "quatd": np.float64,
+}
+
+
+def to_vt_array(values: np.ndarray, type_name: Sdf.ValueTypeName) -> Sequence:
+    """Convert a NumPy array of vector/quaternion values to the ``Vt`` array of the specified value type.
+
+    Args:
+        values: Values to convert (shape ``(N, M)``). Quaternions are expected as ``wxyz``.
+        type_name: Value type name of a single element (e.g.: ``double3``, ``quatf``).
+
+    Returns:
+        Vt array whose elements have the value type.
+    """
+    type_name = str(type_name)
+    if type_name.startswith("quat"):
+        values = values[:, [1, 2, 3, 0]]  # Gf quaternions memory layout: imaginary (xyz), real (w)
+    values = np.ascontiguousarray(values, dtype=_NUMPY_DTYPES[type_name.rstrip("0123456789")])
+    return Sdf.ValueTypeNames.Find(type_name).arrayType.type.pythonClass.FromNumpy(values)
+
+
+def set_attribute_values(
+    stage: Usd.Stage,
+    paths: Sequence[str],
+    name: str,
+    type_names: Sequence[Sdf.ValueTypeName],
+    values: np.ndarray | Sequence,
+) -> None:
+    """Author the default value of an attribute for many prims within a single change block.
+
+    Missing prim/attribute specs are created in the edit target's layer (prim specs as ``over``).
+
+    Args:
+        stage: USD stage.
+        paths: Prim paths.
+        name: Attribute name.
+        type_names: Attribute value type name for each prim.
+        values: Values for each prim. NumPy arrays (shape ``(N, M)``) are converted once per value type
+            (see :py:func:`to_vt_array`), other sequences are authored as is.
+    """
+    edit_target = stage.GetEditTarget()
+    layer = edit_target.GetLayer()
+    converted = {}
+    with Sdf.ChangeBlock():
+        for i, (path, type_name) in enumerate(zip(paths, type_names)):
+            if isinstance(values, np.ndarray):
+                key = str(type_name)
+                if key not in converted:
+                    converted[key] = to_vt_array(values, type_name)
+                value = converted[key][i]
+            else:
+                value = values[i]
+            spec_path = edit_target.MapToSpecPath(Sdf.Path(path))
+            attribute_spec = layer.GetAttributeAtPath(spec_path.AppendProperty(name))
+            if attribute_spec is None:
+                attribute_spec = Sdf.AttributeSpec(Sdf.CreatePrimInLayer(layer, spec_path), name, type_name)
+            attribute_spec.default = value
+
+
+def set_relationship_targets(
+    stage: Usd.Stage,
+    paths: Sequence[str],
+    name: str,
+    targets: Sequence[str],
+    *,
+    metadata: dict[str, Sequence] | None = None,
+) -> None:
+    """Author the (single, explicit) target of a relationship for many prims within a single change block.
+
+    Args:
+        stage: USD stage.
+        paths: Prim paths.
+        name: Relationship name.
+        targets: Target path for each prim.
+        metadata: Relationship metadata to author (mapping of field name to a value for each prim).
+    """
+    edit_target = stage.GetEditTarget()
+    layer = edit_target.GetLayer()
+    with Sdf.ChangeBlock():
+        for i, (path, target) in enumerate(zip(paths, targets)):
+            spec_path = edit_target.MapToSpecPath(Sdf.Path(path))
+            relationship_spec = layer.GetRelationshipAtPath(spec_path.AppendProperty(name))
+            if relationship_spec is None:
+                relationship_spec = Sdf.RelationshipSpec(Sdf.CreatePrimInLayer(layer, spec_path), name, custom=False)
+            relationship_spec.targetPathList.explicitItems = [edit_target.MapToSpecPath(Sdf.Path(target))]
+            for key, values in (metadata or {}).items():
+                relationship_spec.SetInfo(key, values[i])
+
+
+def apply_api_schema(stage: Usd.Stage, paths: Sequence[str], schema_name: str) -> None:
+    """Add a single-apply API schema to the ``apiSchemas`` list-op of many prims within a single change block.
+
+    Args:
+        stage: USD stage.
+        paths: Prim paths.
+        schema_name: API schema name (e.g.: ``MaterialBindingAPI``).
+    """
+    edit_target = stage.GetEditTarget()
+    layer = edit_target.GetLayer()
+    with Sdf.ChangeBlock():
+        for path in paths:
+            prim_spec = Sdf.CreatePrimInLayer(layer, edit_target.MapToSpecPath(Sdf.Path(path)))
+            list_op = prim_spec.GetInfo("apiSchemas")
+            if list_op.isExplicit:
+                if schema_name not in list_op.explicitItems:
+                    list_op.explicitItems = [*list_op.explicitItems, schema_name]
+            elif schema_name not in list_op.prependedItems:
+                list_op.prependedItems = [*list_op.prependedItems, schema_name]
+            prim_spec.SetInfo("apiSchemas", list_op)
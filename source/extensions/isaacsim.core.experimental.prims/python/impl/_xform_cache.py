@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import numpy as np
+from pxr import Tf, Usd, UsdGeom
+from scipy.spatial.transform import Rotation
+
+_evaluator = None
+
+
+class XformCacheEvaluator:
+    """Batch evaluator of USD prim transformations backed by a shared ``UsdGeom.XformCache``.
+
+    The cache stores the local-to-world transformations of the visited prims (and their ancestors),
+    so that prims sharing parts of their hierarchy are not recomputed from scratch on each query.
+    The cache is cleared when a change notice reports a resync or an edit of an ``xformOp`` property.
+
+    Args:
+        stage: USD stage whose prims are evaluated.
+    """
+
+    def __init__(self, stage: Usd.Stage) -> None:
+        self._stage = stage
+        self._cache = UsdGeom.XformCache(Usd.TimeCode.Default())
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    @property
+    def stage(self) -> Usd.Stage:
+        """USD stage whose prims are evaluated."""
+        return self._stage
+
+    def invalidate(self) -> None:
+        """Clear the cached transformations."""
+        self._cache.Clear()
+
+    def release(self) -> None:
+        """Revoke the change notice listener and clear the cached transformations."""
+        if self._listener is not None:
+            self._listener.Revoke()
+            self._listener = None
+        self._cache.Clear()
+
+    def compute_world_transforms(self, prims: list[Usd.Prim]) -> np.ndarray:
+        """Compute the local-to-world transformation matrices of the prims (shape ``(N, 4, 4)``)."""
+        return np.array([self._cache.GetLocalToWorldTransform(prim) for prim in prims], dtype=np.float64)
+
+    def compute_parent_transforms(self, prims: list[Usd.Prim]) -> np.ndarray:
+        """Compute the parent-to-world transformation matrices of the prims (shape ``(N, 4, 4)``)."""
+        return np.array([self._cache.GetParentToWorldTransform(prim) for prim in prims], dtype=np.float64)
+
+    def compute_local_transforms(self, prims: list[Usd.Prim]) -> np.ndarray:
+        """Compute the local transformation matrices of the prims (shape ``(N, 4, 4)``)."""
+        return np.array([self._cache.GetLocalTransformation(prim)[0] for prim in prims], dtype=np.float64)
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, sender: Usd.Stage) -> None:
+        if notice.GetResyncedPaths():
+            self._cache.Clear()
+            return
+        for path in notice.GetChangedInfoOnlyPaths():
+            if path.IsPrimPath() or path.name.startswith("xformOp"):
+                self._cache.Clear()
+                return
+
+
+def get_xform_cache_evaluator(stage: Usd.Stage) -> XformCacheEvaluator:
+    """Get the shared transformation evaluator for the given stage (re-created if the stage changed)."""
+    global _evaluator
+    if _evaluator is None or _evaluator.stage != stage:
+        if _evaluator is not None:
+            _evaluator.release()
+        _evaluator = XformCacheEvaluator(stage)
+    return _evaluator
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=-1, keepdims=True), 1e-10)
+
+
+def _reject(vectors: np.ndarray, axes: np.ndarray) -> np.ndarray:
+    return vectors - np.sum(vectors * axes, axis=-1, keepdims=True) * axes
+
+
+def orthonormalize_bases(bases: np.ndarray, *, max_iterations: int = 20, tolerance: float = 1e-6) -> np.ndarray:
+    """Orthonormalize stacked 3x3 bases (row vectors) using the iterative method of ``Gf.Vec3d.OrthogonalizeBasis``.
+
+    Args:
+        bases: Bases to orthonormalize (shape ``(N, 3, 3)``).
+        max_iterations: Maximum number of iterations.
+        tolerance: Convergence tolerance.
+
+    Returns:
+        The orthonormalized bases (shape ``(N, 3, 3)``).
+    """
+    bases = _normalize(np.array(bases, dtype=np.float64))
+    active = np.arange(bases.shape[0])
+    for _ in range(max_iterations):
+        if not active.size:
+            break
+        x, y, z = bases[active, 0], bases[active, 1], bases[active, 2]
+        orthogonalized = np.stack(
+            [_reject(_reject(x, y), z), _reject(_reject(y, x), z), _reject(_reject(z, x), y)], axis=1
+        )
+        candidates = _normalize(0.5 * (bases[active] + orthogonalized))
+        pending = np.sum(np.square(bases[active] - candidates), axis=(1, 2)) >= tolerance**2
+        active = active[pending]
+        bases[active] = candidates[pending]
+    return bases
+
+
+def decompose_transformation_matrices(matrices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Decompose stacked (USD row-major convention) transformation matrices into translations and orientations.
+
+    Scale and shear are removed by orthonormalizing the 3x3 block, as done by ``Gf.Matrix4d.Orthonormalize``.
+    A negative determinant (reflection) is folded into the scale, as done by ``Gf.Matrix4d.Factor``.
+
+    Args:
+        matrices: Transformation matrices (shape ``(N, 4, 4)``).
+
+    Returns:
+        Two-elements tuple. 1) The translations (shape ``(N, 3)``).
+        2) The orientations (shape ``(N, 4)``, quaternion ``wxyz`` with non-negative real part).
+    """
+    matrices = np.asarray(matrices, dtype=np.float64).reshape((-1, 4, 4))
+    translations = matrices[:, 3, :3].astype(np.float32)
+    if not matrices.shape[0]:
+        return translations, np.zeros((0, 4), dtype=np.float32)
+    rotations = orthonormalize_bases(matrices[:, :3, :3])
+    rotations[np.linalg.det(rotations) < 0] *= -1
+    # USD matrices transform row vectors: transpose to get the column-vector rotation matrices
+    quaternions = Rotation.from_matrix(rotations.transpose(0, 2, 1)).as_quat()[:, [3, 0, 1, 2]]
+    quaternions[quaternions[:, 0] < 0] *= -1
+    return translations, quaternions.astype(np.float32)
@@ -26,9 +26,9 @@ import usdrt.Gf
 import warp as wp
 from isaacsim.core.simulation_manager import SimulationManager
 from isaacsim.core.utils.prims import is_prim_non_root_articulation_link
-from pxr import Gf, Usd, UsdGeom, UsdShade
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdShade
 
-from . import _fabric
+from . import _fabric, _sdf, _xform_cache
 from .prim import _MSG_PRIM_NOT_VALID, Prim
 
 
@@ -94,6 +94,7 @@ class XformPrim(Prim):
         self._fabric_stage = None
         self._fabric_hierarchy = None
         self._fabric_view_index_attr = None
+        self._usdrt_paths = None
         # initialize base class
         super().__init__(paths, resolve_paths=resolve_paths)
         # initialize instance from arguments
@@ -179,12 +180,26 @@ class XformPrim(Prim):
         """
         assert self.valid, _MSG_PRIM_NOT_VALID
         # USD API
-        indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu")
+        indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu").numpy()
         visibilities = ops_utils.place(visibilities, device="cpu").numpy().reshape((-1, 1))
-        broadcast = visibilities.shape[0] == 1
-        for i, index in enumerate(indices.numpy()):
-            imageable = UsdGeom.Imageable(self.prims[index])
-            imageable.MakeVisible() if visibilities[0 if broadcast else i].item() else imageable.MakeInvisible()
+        visibilities = np.broadcast_to(visibilities, (indices.shape[0], 1))[:, 0].astype(bool)
+        _sdf.set_attribute_values(
+            self.prims[0].GetStage(),
+            [self.paths[index] for index in indices],
+            UsdGeom.Tokens.visibility,
+            [Sdf.ValueTypeNames.Token] * indices.shape[0],
+            [UsdGeom.Tokens.inherited if visible else UsdGeom.Tokens.invisible for visible in visibilities],
+        )
+        # visible prims under invisible ancestors require authoring the ancestors' (and their siblings') visibility
+        parent_visibilities = {}
+        for index in indices[visibilities]:
+            parent = self.prims[index].GetParent()
+            if parent.GetPath() not in parent_visibilities:
+                parent_visibilities[parent.GetPath()] = (
+                    UsdGeom.Imageable(parent).ComputeVisibility(Usd.TimeCode.Default()) != UsdGeom.Tokens.invisible
+                )
+            if not parent_visibilities[parent.GetPath()]:
+                UsdGeom.Imageable(self.prims[index]).MakeVisible()
 
     def get_visibilities(self, *, indices: list | np.ndarray | wp.array | None = None) -> wp.array:
         """Get the visibility state (whether prims are visible or invisible during rendering) of the prims.
@@ -362,15 +377,29 @@ class XformPrim(Prim):
         weaker_than_descendants = ops_utils.place(weaker_than_descendants, device="cpu").numpy().reshape((-1, 1))
         broadcast_weaker_than_descendants = weaker_than_descendants.shape[0] == 1
         # set values
-        for i, index in enumerate(indices.numpy()):
-            material_binding_api = XformPrim.ensure_api([self.prims[index]], UsdShade.MaterialBindingAPI)[0]
-            binding_strength = (
-                UsdShade.Tokens.weakerThanDescendants
-                if weaker_than_descendants[0 if broadcast_weaker_than_descendants else i].item()
-                else UsdShade.Tokens.strongerThanDescendants
+        indices = indices.numpy()
+        stage = self.prims[0].GetStage()
+        with Sdf.ChangeBlock():
+            _sdf.apply_api_schema(
+                stage,
+                [self.paths[index] for index in indices if not self.prims[index].HasAPI(UsdShade.MaterialBindingAPI)],
+                Usd.SchemaRegistry.GetSchemaTypeName(UsdShade.MaterialBindingAPI),
             )
-            material_binding_api.Bind(
-                materials[0 if broadcast_materials else i].materials[0], bindingStrength=binding_strength
+            _sdf.set_relationship_targets(
+                stage,
+                [self.paths[index] for index in indices],
+                UsdShade.Tokens.materialBinding,
+                [materials[0 if broadcast_materials else i].paths[0] for i in range(indices.shape[0])],
+                metadata={
+                    UsdShade.Tokens.bindMaterialAs: [
+                        (
+                            UsdShade.Tokens.weakerThanDescendants
+                            if weaker_than_descendants[0 if broadcast_weaker_than_descendants else i].item()
+                            else UsdShade.Tokens.strongerThanDescendants
+                        )
+                        for i in range(indices.shape[0])
+                    ]
+                },
             )
 
     def get_applied_visual_materials(
@@ -447,28 +476,17 @@ class XformPrim(Prim):
         backend = backend_utils.get_current_backend(["usd", "usdrt", "fabric"])
         # USD API
         if backend == "usd":
-            indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu")
-            positions = np.zeros((indices.shape[0], 3), dtype=np.float32)
-            orientations = np.zeros((indices.shape[0], 4), dtype=np.float32)
-            for i, index in enumerate(indices.numpy()):
-                transform = UsdGeom.Xformable(self.prims[index]).ComputeLocalToWorldTransform(Usd.TimeCode.Default())
-                transform.Orthonormalize()
-                positions[i] = transform.ExtractTranslation()
-                orientations[i] = np.array(
-                    [transform.ExtractRotationQuat().GetReal(), *transform.ExtractRotationQuat().GetImaginary()]
-                )
+            indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu").numpy()
+            matrices = self._get_xform_cache_evaluator().compute_world_transforms([self.prims[i] for i in indices])
+            positions, orientations = _xform_cache.decompose_transformation_matrices(matrices)
             return ops_utils.place(positions, device=self._device), ops_utils.place(orientations, device=self._device)
         # USDRT API (with FSD and IFabricHierarchy)
         elif backend == "usdrt":
-            indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu")
-            positions = np.zeros((indices.shape[0], 3), dtype=np.float32)
-            orientations = np.zeros((indices.shape[0], 4), dtype=np.float32)
+            indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu").numpy()
             fabric_hierarchy = self._get_fabric_hierarchy()
-            for i, index in enumerate(indices.numpy()):
-                matrix = fabric_hierarchy.get_world_xform(usdrt.Sdf.Path(self.paths[index]))
-                quaternion = matrix.RemoveScaleShear().ExtractRotationQuat()
-                positions[i] = matrix.ExtractTranslation()
-                orientations[i] = np.array([quaternion.GetReal(), *quaternion.GetImaginary()])
+            usdrt_paths = self._get_usdrt_paths()
+            matrices = np.array([fabric_hierarchy.get_world_xform(usdrt_paths[i]) for i in indices], dtype=np.float64)
+            positions, orientations = _xform_cache.decompose_transformation_matrices(matrices)
             return ops_utils.place(positions, device=self._device), ops_utils.place(orientations, device=self._device)
         # Fabric API
         elif backend == "fabric":
@@ -563,14 +581,9 @@ class XformPrim(Prim):
             if orientations.shape[0] == 1:
                 orientations = orientations.repeat(indices.shape[0], axis=0)
             # compute parent transform
-            parent_transforms = np.zeros((indices.shape[0], 4, 4), dtype=np.float32)
-            for i, index in enumerate(indices.numpy()):
-                parent_transforms[i] = np.array(
-                    UsdGeom.Xformable(self.prims[index].GetParent()).ComputeLocalToWorldTransform(
-                        Usd.TimeCode.Default()
-                    ),
-                    dtype=np.float32,
-                )
+            parent_transforms = self._get_xform_cache_evaluator().compute_parent_transforms(
+                [self.prims[i] for i in indices.numpy()]
+            )
             # get and apply local transformation
             local_translations, local_orientations = numpy_utils.transformations.get_local_from_world(
                 parent_transforms, positions, orientations
@@ -630,31 +643,20 @@ class XformPrim(Prim):
         backend = backend_utils.get_current_backend(["usd", "usdrt", "fabric"])
         # USD API
         if backend == "usd":
-            indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu")
-            translations = np.zeros((indices.shape[0], 3), dtype=np.float32)
-            orientations = np.zeros((indices.shape[0], 4), dtype=np.float32)
-            for i, index in enumerate(indices.numpy()):
-                transform = UsdGeom.Xformable(self.prims[index]).GetLocalTransformation(Usd.TimeCode.Default())
-                transform.Orthonormalize()
-                translations[i] = transform.ExtractTranslation()
-                orientations[i] = np.array(
-                    [transform.ExtractRotationQuat().GetReal(), *transform.ExtractRotationQuat().GetImaginary()]
-                )
+            indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu").numpy()
+            matrices = self._get_xform_cache_evaluator().compute_local_transforms([self.prims[i] for i in indices])
+            translations, orientations = _xform_cache.decompose_transformation_matrices(matrices)
             return (
                 ops_utils.place(translations, device=self._device),
                 ops_utils.place(orientations, device=self._device),
             )
         # USDRT API (with FSD and IFabricHierarchy)
         elif backend == "usdrt":
-            indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu")
-            translations = np.zeros((indices.shape[0], 3), dtype=np.float32)
-            orientations = np.zeros((indices.shape[0], 4), dtype=np.float32)
+            indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu").numpy()
             fabric_hierarchy = self._get_fabric_hierarchy()
-            for i, index in enumerate(indices.numpy()):
-                matrix = fabric_hierarchy.get_local_xform(usdrt.Sdf.Path(self.paths[index]))
-                quaternion = matrix.RemoveScaleShear().ExtractRotationQuat()
-                translations[i] = matrix.ExtractTranslation()
-                orientations[i] = np.array([quaternion.GetReal(), *quaternion.GetImaginary()])
+            usdrt_paths = self._get_usdrt_paths()
+            matrices = np.array([fabric_hierarchy.get_local_xform(usdrt_paths[i]) for i in indices], dtype=np.float64)
+            translations, orientations = _xform_cache.decompose_transformation_matrices(matrices)
             return (
                 ops_utils.place(translations, device=self._device),
                 ops_utils.place(orientations, device=self._device),
@@ -734,33 +736,24 @@ class XformPrim(Prim):
         backend = backend_utils.get_current_backend(["usd", "usdrt", "fabric"])
         # USD API
         if backend == "usd":
-            indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu")
+            indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu").numpy()
             # accommodate and broadcast the pose
             if translations is not None:
                 translations = ops_utils.place(translations, device="cpu").numpy().reshape((-1, 3))
-                if translations.shape[0] == 1:
-                    translations = translations.repeat(indices.shape[0], axis=0)
-                translations = translations.tolist()
+                translations = np.broadcast_to(translations, (indices.shape[0], 3))
             if orientations is not None:
                 orientations = ops_utils.place(orientations, device="cpu").numpy().reshape((-1, 4))
-                if orientations.shape[0] == 1:
-                    orientations = orientations.repeat(indices.shape[0], axis=0)
-                orientations = orientations.tolist()
-            # apply transformation
-            for i, index in enumerate(indices.numpy()):
-                prim = self.prims[index]
-                property_names = prim.GetPropertyNames()
+                orientations = np.broadcast_to(orientations, (indices.shape[0], 4))
+            # apply transformation (all values are authored at once)
+            stage = self.prims[0].GetStage()
+            paths = [self.paths[index] for index in indices]
+            with Sdf.ChangeBlock():
                 if translations is not None:
-                    assert (
-                        "xformOp:translate" in property_names
-                    ), f"Undefined 'xformOp:translate' property for {self.paths[index]}. Call '.reset_xform_op_properties()' first"
-                    prim.GetAttribute("xformOp:translate").Set(Gf.Vec3d(*translations[i]))
+                    type_names = self._get_xform_op_type_names("xformOp:translate", indices)
+                    _sdf.set_attribute_values(stage, paths, "xformOp:translate", type_names, translations)
                 if orientations is not None:
-                    assert (
-                        "xformOp:orient" in property_names
-                    ), f"Undefined 'xformOp:orient' property for {self.paths[index]}. Call '.reset_xform_op_properties()' first"
-                    xform_op = prim.GetAttribute("xformOp:orient")
-                    xform_op.Set((Gf.Quatf if xform_op.GetTypeName() == "quatf" else Gf.Quatd)(*orientations[i]))
+                    type_names = self._get_xform_op_type_names("xformOp:orient", indices)
+                    _sdf.set_attribute_values(stage, paths, "xformOp:orient", type_names, orientations)
         # USDRT API (with FSD and IFabricHierarchy)
         elif backend == "usdrt":
             indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu")
@@ -849,17 +842,16 @@ class XformPrim(Prim):
         backend = backend_utils.get_current_backend(["usd", "usdrt", "fabric"])
         # USD API
         if backend == "usd":
-            indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu")
+            indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu").numpy()
             scales = ops_utils.place(scales, device="cpu").numpy().reshape((-1, 3))
-            broadcast = scales.shape[0] == 1
-            scales = scales.tolist()
-            for i, index in enumerate(indices.numpy()):
-                prim = self.prims[index]
-                property_names = prim.GetPropertyNames()
-                assert (
-                    "xformOp:scale" in property_names
-                ), f"Undefined 'xformOp:scale' property for {self.paths[index]}. Call '.reset_xform_op_properties()' first"
-                prim.GetAttribute("xformOp:scale").Set(Gf.Vec3d(*scales[0 if broadcast else i]))
+            scales = np.broadcast_to(scales, (indices.shape[0], 3))
+            _sdf.set_attribute_values(
+                self.prims[0].GetStage(),
+                [self.paths[index] for index in indices],
+                "xformOp:scale",
+                self._get_xform_op_type_names("xformOp:scale", indices),
+                scales,
+            )
         # USDRT API (with FSD and IFabricHierarchy)
         elif backend == "usdrt":
             indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu")
@@ -1131,6 +1123,27 @@ class XformPrim(Prim):
             )
         return self._fabric_hierarchy
 
+    def _get_xform_cache_evaluator(self) -> _xform_cache.XformCacheEvaluator:
+        """Get the shared (USD change-aware) transformation evaluator of the wrapped prims' stage."""
+        return _xform_cache.get_xform_cache_evaluator(self.prims[0].GetStage())
+
+    def _get_xform_op_type_names(self, name: str, indices: np.ndarray) -> list:
+        """Get the value type names of a transformation operation attribute of the prims."""
+        type_names = []
+        for index in indices:
+            attribute = self.prims[index].GetAttribute(name)
+            assert (
+                attribute.IsValid()
+            ), f"Undefined '{name}' property for {self.paths[index]}. Call '.reset_xform_op_properties()' first"
+            type_names.append(attribute.GetTypeName())
+        return type_names
+
+    def _get_usdrt_paths(self) -> list[usdrt.Sdf.Path]:
+        """Get the USDRT paths of the wrapped prims."""
+        if self._usdrt_paths is None:
+            self._usdrt_paths = [usdrt.Sdf.Path(path) for path in self.paths]
+        return self._usdrt_paths
+
     def _ensure_fabric_data(self, key: str) -> dict:
         """Ensure fabric-related data is initialized."""
         if self._fabric_view_index_attr is None:
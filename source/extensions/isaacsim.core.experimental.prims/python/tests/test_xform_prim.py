@@ -23,6 +23,7 @@ import warp as wp
 from isaacsim.core.experimental.prims import XformPrim
 from isaacsim.core.experimental.utils.backend import use_backend
 from isaacsim.core.simulation_manager import IsaacEvents
+from pxr import Gf, Tf, Usd
 
 from .common import (
     check_allclose,
@@ -75,6 +76,29 @@ class TestXformPrim(omni.kit.test.AsyncTestCase):
                 check_array(output, shape=(expected_count, 1), dtype=wp.bool, device=device)
                 check_equal(expected_v0, output, given=(v0,))
 
+    async def test_batched_authoring(self):
+        await populate_stage(max_num_prims=4, operation="wrap")
+        stage = stage_utils.get_current_stage()
+        parents = XformPrim("/World/A_.*", reset_xform_op_properties=True)
+        children = XformPrim("/World/A_.*/B", reset_xform_op_properties=True)
+        # all values are authored within a single change block
+        notices = []
+        listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, lambda notice, sender: notices.append(notice), stage)
+        children.set_local_poses(translations=[[1.0, 2.0, 3.0]], orientations=[[0.0, 0.0, 1.0, 0.0]])
+        children.set_local_scales([[2.0, 2.0, 2.0]])
+        listener.Revoke()
+        self.assertEqual(len(notices), 2)
+        translations, orientations = children.get_local_poses()
+        check_allclose(
+            (np.array([[1.0, 2.0, 3.0]] * 4), np.array([[0.0, 0.0, 1.0, 0.0]] * 4)), (translations, orientations)
+        )
+        check_allclose(np.array([[2.0, 2.0, 2.0]] * 4), children.get_local_scales())
+        # visible prims under invisible ancestors
+        parents.set_visibilities([False])
+        children.set_visibilities([True, False, True, False])
+        check_equal(np.array([[True], [False], [True], [False]]), children.get_visibilities())
+        check_equal(np.array([[True], [False], [True], [False]]), parents.get_visibilities())
+
     @parametrize(
         backends=["usd", "usdrt", "fabric"],
         operations=["wrap"],
@@ -127,6 +151,30 @@ class TestXformPrim(omni.kit.test.AsyncTestCase):
                 check_array(output[1], shape=(expected_count, 4), dtype=wp.float32, device=device)
                 check_allclose((expected_v0, expected_v1), output, given=(v0, v1))
 
+    async def test_world_poses_hierarchy(self):
+        await populate_stage(max_num_prims=3, operation="wrap")
+        parents = XformPrim("/World/A_.*", reset_xform_op_properties=True)
+        children = XformPrim("/World/A_.*/B", reset_xform_op_properties=True)
+        with use_backend("usd", raise_on_unsupported=True, raise_on_fallback=True):
+            children.set_local_poses(translations=[0.0, 0.0, 1.0])
+            check_allclose(np.array([[0.0, 0.0, 1.0]] * 3), children.get_world_poses()[0])
+            # transform the parents (cached world transforms of the children are invalidated)
+            parents.set_world_poses(positions=[1.0, 2.0, 3.0], orientations=[0.0, 1.0, 0.0, 0.0])
+            positions, orientations = children.get_world_poses()
+            check_allclose(np.array([[1.0, 2.0, 2.0]] * 3), positions)
+            check_allclose(np.array([[0.0, 1.0, 0.0, 0.0]] * 3), orientations)
+            # transform a parent using the USD API
+            stage_utils.get_current_stage().GetPrimAtPath("/World/A_1").GetAttribute("xformOp:translate").Set(
+                Gf.Vec3d(0.0, 0.0, 0.0)
+            )
+            positions, _ = children.get_world_poses(indices=[1])
+            check_allclose(np.array([[0.0, 0.0, -1.0]]), positions)
+            # re-create a child (resync)
+            stage_utils.get_current_stage().RemovePrim("/World/A_2/B")
+            stage_utils.define_prim("/World/A_2/B", "Cube")
+            children = XformPrim("/World/A_.*/B")
+            check_allclose(np.array([[1.0, 2.0, 3.0]]), children.get_world_poses(indices=[2])[0])
+
     @parametrize(
         backends=["usd", "usdrt", "fabric"],
         operations=["wrap"],
@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import functools
+import time
+import traceback
+import types
+import weakref
+
+import carb
+
+
+class _Entry:
+    __slots__ = ("callback_id", "order", "name", "callback", "weak", "calls", "total_time", "max_time")
+
+    def __init__(self, callback_id: int, callback: callable, order: int, name: str) -> None:
+        self.callback_id = callback_id
+        self.order = order
+        self.name = name
+        # bound methods are held through a weak reference so that the registration does not keep the object alive
+        self.weak = isinstance(callback, types.MethodType)
+        self.callback = weakref.WeakMethod(callback) if self.weak else callback
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+
+class PhysicsStepDispatcher:
+    """Fan-out dispatcher of the (pre or post) physics step events to the registered callbacks.
+
+    The dispatcher holds a single physics step subscription per distinct callback order, and calls the callbacks
+    registered with that order in registration order. All the callbacks of a given order are called at the position
+    of the subscription created for the first of them (i.e.: relative to other physics step subscribers with the same
+    order, later callbacks no longer run after those subscribers). The callback tables are rebuilt on registration
+    changes only.
+
+    Args:
+        physx_interface: PhysX interface used to subscribe to the physics step events.
+        pre_step (bool): Whether to dispatch the pre physics step events (True) or the post physics step events (False).
+        condition (callable): Function evaluated once per physics step. The callbacks are called only if it returns True.
+    """
+
+    def __init__(self, physx_interface, pre_step: bool, condition: callable) -> None:
+        self._physx_interface = physx_interface
+        self._pre_step = pre_step
+        self._condition = condition
+        self._entries = {}
+        self._tables = {}
+        self._subscriptions = {}
+        self._profiling = False
+
+    @property
+    def profiling(self) -> bool:
+        """Whether the callback timing counters are updated on each call"""
+        return self._profiling
+
+    @profiling.setter
+    def profiling(self, flag: bool) -> None:
+        self._profiling = flag
+
+    def add(self, callback_id: int, callback: callable, order: int = 0, name: str = None) -> None:
+        """Register a callback.
+
+        Args:
+            callback_id (int): Unique identifier of the callback.
+            callback (callable): Function (or bound method) to call with the physics step size.
+            order (int, optional): Order of the callback (lower values are called first). Defaults to 0.
+            name (str, optional): Name of the callback (for timing reports). Defaults to the callback qualified name.
+        """
+        name = name or getattr(callback, "__qualname__", repr(callback))
+        self._entries[callback_id] = _Entry(callback_id, callback, order, name)
+        self._update_table(order)
+
+    def remove(self, callback_id: int) -> bool:
+        """Deregister a callback.
+
+        Args:
+            callback_id (int): Identifier of the callback.
+
+        Returns:
+            bool: Whether the callback was registered.
+        """
+        entry = self._entries.pop(callback_id, None)
+        if entry is None:
+            return False
+        self._update_table(entry.order)
+        return True
+
+    def clear(self) -> None:
+        """Deregister all the callbacks and release the physics step subscriptions"""
+        self._entries.clear()
+        self._tables.clear()
+        self._subscriptions.clear()
+
+    def get_timings(self) -> dict:
+        """Get the timing counters of the registered callbacks.
+
+        Returns:
+            dict: Mapping of callback identifiers to their name, order, number of calls,
+            total time and maximum time (in seconds) of a single call.
+        """
+        return {
+            callback_id: {
+                "name": entry.name,
+                "order": entry.order,
+                "calls": entry.calls,
+                "total_time": entry.total_time,
+                "max_time": entry.max_time,
+            }
+            for callback_id, entry in self._entries.items()
+        }
+
+    def reset_timings(self) -> None:
+        """Reset the timing counters of the registered callbacks"""
+        for entry in self._entries.values():
+            entry.calls, entry.total_time, entry.max_time = 0, 0.0, 0.0
+
+    def _update_table(self, order: int) -> None:
+        table = tuple(entry for entry in self._entries.values() if entry.order == order)
+        if table:
+            self._tables[order] = table
+            if order not in self._subscriptions:
+                self._subscriptions[order] = self._physx_interface.subscribe_physics_on_step_events(
+                    functools.partial(self._dispatch, order), pre_step=self._pre_step, order=order
+                )
+        else:
+            self._tables.pop(order, None)
+            self._subscriptions.pop(order, None)
+
+    def _dispatch(self, order: int, step_dt: float) -> None:
+        if not self._condition():
+            return
+        profiling = self._profiling
+        # the table is a snapshot: (de)registrations during the dispatch take effect on the next physics step
+        for entry in self._tables.get(order, ()):
+            callback = entry.callback() if entry.weak else entry.callback
+            if callback is None:  # the object of the bound method was deleted (the entry is kept until deregistered)
+                continue
+            try:
+                if profiling:
+                    start = time.perf_counter()
+                    callback(step_dt)
+                    elapsed = time.perf_counter() - start
+                    entry.calls += 1
+                    entry.total_time += elapsed
+                    entry.max_time = max(entry.max_time, elapsed)
+                else:
+                    callback(step_dt)
+            except Exception:
+                carb.log_error(f"Physics step callback `{entry.name}` failed: {traceback.format_exc()}")
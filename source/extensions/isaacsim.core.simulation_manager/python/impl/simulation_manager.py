@@ -28,6 +28,7 @@ from isaacsim.core.utils.stage import get_current_stage, get_current_stage_id
 from pxr import PhysxSchema
 
 from .isaac_events import IsaacEvents
+from .physics_step_dispatcher import PhysicsStepDispatcher
 
 
 class SimulationManager:
@@ -57,6 +58,12 @@ class SimulationManager:
     _assets_loading_callback = None
     _assets_loaded_callback = None
     _default_physics_scene_idx = -1
+    _pre_physics_step_dispatcher = PhysicsStepDispatcher(
+        _physx_interface, pre_step=True, condition=lambda: SimulationManager._simulation_view_created
+    )
+    _post_physics_step_dispatcher = PhysicsStepDispatcher(
+        _physx_interface, pre_step=False, condition=lambda: SimulationManager._simulation_view_created
+    )
 
     @classmethod
     def _initialize(cls) -> None:
@@ -95,11 +102,15 @@ class SimulationManager:
         SimulationManager._simulation_manager_interface.reset()
         SimulationManager._physics_scene_apis.clear()
         SimulationManager._callbacks.clear()
+        SimulationManager._pre_physics_step_dispatcher.clear()
+        SimulationManager._post_physics_step_dispatcher.clear()
 
     def _post_stage_open(event) -> None:
         SimulationManager._simulation_manager_interface.reset()
         SimulationManager._physics_scene_apis.clear()
         SimulationManager._callbacks.clear()
+        SimulationManager._pre_physics_step_dispatcher.clear()
+        SimulationManager._post_physics_step_dispatcher.clear()
         SimulationManager._track_physics_scenes()
         SimulationManager._assets_loaded = True
         SimulationManager._assets_loading_callback = None
@@ -686,43 +697,9 @@ class SimulationManager:
             else:
                 SimulationManager._simulation_manager_interface.register_deletion_callback(callback)
         elif event == IsaacEvents.POST_PHYSICS_STEP:
-            if proxy_needed:
-                SimulationManager._callbacks[callback_id] = (
-                    SimulationManager._physx_interface.subscribe_physics_on_step_events(
-                        lambda step_dt, obj=weakref.proxy(callback.__self__): (
-                            getattr(obj, callback_name)(step_dt) if SimulationManager._simulation_view_created else None
-                        ),
-                        pre_step=False,
-                        order=order,
-                    )
-                )
-            else:
-                SimulationManager._callbacks[callback_id] = (
-                    SimulationManager._physx_interface.subscribe_physics_on_step_events(
-                        lambda step_dt: callback(step_dt) if SimulationManager._simulation_view_created else None,
-                        pre_step=False,
-                        order=order,
-                    )
-                )
+            SimulationManager._post_physics_step_dispatcher.add(callback_id, callback, order=order, name=name)
         elif event == IsaacEvents.PRE_PHYSICS_STEP:
-            if proxy_needed:
-                SimulationManager._callbacks[callback_id] = (
-                    SimulationManager._physx_interface.subscribe_physics_on_step_events(
-                        lambda step_dt, obj=weakref.proxy(callback.__self__): (
-                            getattr(obj, callback_name)(step_dt) if SimulationManager._simulation_view_created else None
-                        ),
-                        pre_step=True,
-                        order=order,
-                    )
-                )
-            else:
-                SimulationManager._callbacks[callback_id] = (
-                    SimulationManager._physx_interface.subscribe_physics_on_step_events(
-                        lambda step_dt: callback(step_dt) if SimulationManager._simulation_view_created else None,
-                        pre_step=True,
-                        order=order,
-                    )
-                )
+            SimulationManager._pre_physics_step_dispatcher.add(callback_id, callback, order=order, name=name)
         elif event == IsaacEvents.TIMELINE_STOP:
             if proxy_needed:
                 SimulationManager._callbacks[
@@ -746,13 +723,70 @@ class SimulationManager:
 
     @classmethod
     def deregister_callback(cls, callback_id):
-        if callback_id in SimulationManager._callbacks:
+        if SimulationManager._pre_physics_step_dispatcher.remove(callback_id):
+            return
+        elif SimulationManager._post_physics_step_dispatcher.remove(callback_id):
+            return
+        elif callback_id in SimulationManager._callbacks:
             del SimulationManager._callbacks[callback_id]
         elif SimulationManager._simulation_manager_interface.deregister_callback(callback_id):
             return
         else:
             raise Exception("callback with id {} doesn't exist to be deregistered".format(callback_id))
 
+    @classmethod
+    def enable_callback_profiling(cls, flag: bool) -> None:
+        """Enable or disable the timing counters of the physics step (pre and post) callbacks.
+
+        Args:
+            flag (bool): Whether to measure the time spent in each physics step callback.
+        """
+        SimulationManager._pre_physics_step_dispatcher.profiling = flag
+        SimulationManager._post_physics_step_dispatcher.profiling = flag
+
+    @classmethod
+    def is_callback_profiling_enabled(cls) -> bool:
+        """Check whether the timing counters of the physics step callbacks are enabled.
+
+        Returns:
+            bool: True if the time spent in each physics step callback is measured, otherwise False.
+        """
+        return SimulationManager._pre_physics_step_dispatcher.profiling
+
+    @classmethod
+    def get_callback_timings(cls) -> dict:
+        """Get the timing counters of the registered physics step (pre and post) callbacks.
+
+        The counters are only updated while the callback profiling is enabled (see ``enable_callback_profiling``).
+
+        Returns:
+            dict: Mapping of callback identifiers to a dictionary with the ``event`` (``IsaacEvents``), ``name``,
+            ``order``, number of ``calls``, ``total_time`` and ``max_time`` (in seconds) of a single call.
+
+        Example:
+
+        .. code-block:: python
+
+            >>> SimulationManager.enable_callback_profiling(True)
+            >>> # ... step the simulation
+            >>> timings = SimulationManager.get_callback_timings()
+            >>> slowest = sorted(timings.values(), key=lambda timing: timing["total_time"], reverse=True)
+        """
+        timings = {}
+        for event, dispatcher in [
+            (IsaacEvents.PRE_PHYSICS_STEP, SimulationManager._pre_physics_step_dispatcher),
+            (IsaacEvents.POST_PHYSICS_STEP, SimulationManager._post_physics_step_dispatcher),
+        ]:
+            for callback_id, timing in dispatcher.get_timings().items():
+                timings[callback_id] = {"event": event, **timing}
+        return timings
+
+    @classmethod
+    def reset_callback_timings(cls) -> None:
+        """Reset the timing counters of the registered physics step (pre and post) callbacks"""
+        SimulationManager._pre_physics_step_dispatcher.reset_timings()
+        SimulationManager._post_physics_step_dispatcher.reset_timings()
+
     @classmethod
     def enable_usd_notice_handler(cls, flag):
         SimulationManager._simulation_manager_interface.enable_usd_notice_handler(flag)
@@ -133,3 +133,46 @@ class TestExtension(omni.kit.test.AsyncTestCase):
         self.assertEqual(SimulationManager.is_paused(), False)
         self.assertEqual(SimulationManager.get_num_physics_steps(), 0)
         self.assertEqual(SimulationManager.get_simulation_time(), 0)
+
+    async def test_physics_callbacks_profiling(self):
+        await create_new_stage_async()
+
+        class Sensor:
+            def __init__(self):
+                self.steps = 0
+
+            def on_physics_step(self, dt):
+                self.steps += 1
+
+        sensors = [Sensor() for _ in range(10)]
+        callback_ids = [
+            SimulationManager.register_callback(sensor.on_physics_step, event=IsaacEvents.POST_PHYSICS_STEP)
+            for sensor in sensors
+        ]
+        SimulationManager.enable_callback_profiling(True)
+        self.assertTrue(SimulationManager.is_callback_profiling_enabled())
+        timeline = omni.timeline.get_timeline_interface()
+        timeline.play()
+        timeline.commit()
+        SimulationManager.reset_callback_timings()
+        SimulationManager.step(render=False)
+        SimulationManager.step(render=False)
+        self.assertEqual([sensor.steps for sensor in sensors], [sensors[0].steps] * 10)
+        timings = SimulationManager.get_callback_timings()
+        self.assertEqual(sorted(timings.keys()), sorted(callback_ids))
+        for timing in timings.values():
+            self.assertEqual(timing["event"], IsaacEvents.POST_PHYSICS_STEP)
+            self.assertEqual(
+                timing["name"], "TestExtension.test_physics_callbacks_profiling.<locals>.Sensor.on_physics_step"
+            )
+            self.assertEqual(timing["calls"], 2)
+            self.assertGreaterEqual(timing["total_time"], timing["max_time"])
+        # deleted objects are not called (nor kept alive by the registration)
+        del sensors[0]
+        SimulationManager.step(render=False)
+        self.assertEqual(SimulationManager.get_callback_timings()[callback_ids[0]]["calls"], 2)
+        SimulationManager.enable_callback_profiling(False)
+        for callback_id in callback_ids:
+            SimulationManager.deregister_callback(callback_id)
+        self.assertEqual(SimulationManager.get_callback_timings(), {})
+        timeline.stop()
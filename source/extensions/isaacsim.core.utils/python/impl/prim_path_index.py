@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import re
+import typing
+
+from pxr import Sdf, Tf, Usd, UsdPhysics
+
+_PRIM_TYPE_APIS = {
+    "articulation": UsdPhysics.ArticulationRootAPI,
+    "rigid_body": UsdPhysics.RigidBodyAPI,
+}
+
+_index = None
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_segment(segment: str) -> typing.Optional[typing.Callable]:
+    """Compile a path segment (glob) pattern, or return None if the segment is a literal prim name"""
+    if re.escape(segment) == segment:
+        return None
+    # same glob-to-regex conversion as the native (TfPatternMatcher) implementation
+    regex = segment.replace(".", "\\.").replace("*", ".*").replace("?", ".")
+    return re.compile(f"^{regex}$").match
+
+
+class PrimPathIndex:
+    """Stage-level index of prim paths for resolving prim path regex expressions.
+
+    The index caches the (ordered) children names of the visited prims and the API schemas of the matched prims,
+    so that a path expression is resolved segment by segment without traversing the stage.
+    Literal segments (e.g.: ``Robot``) are resolved with a lookup, while pattern segments (e.g.: ``env_.*``)
+    are matched against the cached children names only.
+    The resolved expressions are cached too. The cache entries are invalidated by USD change notices.
+
+    Args:
+        stage (Usd.Stage): USD stage to index.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> from isaacsim.core.utils.prim_path_index import PrimPathIndex
+        >>> from isaacsim.core.utils.stage import get_current_stage
+        >>>
+        >>> # given the stage: /World/env/Cube, /World/env_01/Cube, /World/env_02/Cube
+        >>> index = PrimPathIndex(get_current_stage())
+        >>> index.find_matching_prim_paths("/World/env_.*/Cube")
+        ['/World/env_01/Cube', '/World/env_02/Cube']
+    """
+
+    def __init__(self, stage: Usd.Stage) -> None:
+        self._stage = stage
+        self._children = {}
+        self._apis = {prim_type: {} for prim_type in _PRIM_TYPE_APIS}
+        self._queries = {}
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    @property
+    def stage(self) -> Usd.Stage:
+        """USD stage indexed"""
+        return self._stage
+
+    def clear(self) -> None:
+        """Clear all the cached entries"""
+        self._children.clear()
+        for memo in self._apis.values():
+            memo.clear()
+        self._queries.clear()
+
+    def release(self) -> None:
+        """Stop listening to USD change notices and clear all the cached entries"""
+        if self._listener is not None:
+            self._listener.Revoke()
+            self._listener = None
+        self.clear()
+
+    def find_matching_prim_paths(
+        self, prim_path_regex: str, prim_type: typing.Optional[str] = None
+    ) -> typing.List[str]:
+        """Find all the matching prim paths in the stage based on Regex expression.
+
+        Args:
+            prim_path_regex (str): The Regex expression for prim path.
+            prim_type (typing.Optional[str]): The type of the prims to filter, only supports articulation and rigid_body currently. Defaults to None.
+
+        Raises:
+            ValueError: If the prim type is not supported.
+
+        Returns:
+            typing.List[str]: List of prim paths that match input expression (in stage traversal order).
+        """
+        key = (prim_path_regex, prim_type or "")
+        paths = self._queries.get(key)
+        if paths is None:
+            paths = self._queries[key] = tuple(self._find_matching_prim_paths(prim_path_regex, prim_type))
+        return list(paths)
+
+    def _find_matching_prim_paths(self, prim_path_regex: str, prim_type: typing.Optional[str]) -> typing.List[str]:
+        if prim_type and prim_type not in _PRIM_TYPE_APIS:
+            raise ValueError("apis supported: articulation and rigid_body.")
+        pattern = prim_path_regex.replace(".*", "*").strip("/")
+        if not pattern:
+            return []
+        paths = [""]
+        for segment in pattern.split("/"):
+            matcher = _compile_segment(segment)
+            matches = []
+            for parent in paths:
+                children = self._get_children(parent)
+                if matcher is None:
+                    if segment in children:
+                        matches.append(f"{parent}/{segment}")
+                else:
+                    matches.extend(f"{parent}/{name}" for name in children if matcher(name))
+            paths = matches
+            if not paths:
+                break
+        if prim_type:
+            paths = [path for path in paths if self._has_api(path, prim_type)]
+        return paths
+
+    def _get_children(self, path: str) -> dict:
+        children = self._children.get(path)
+        if children is None:
+            prim = self._stage.GetPrimAtPath(path or "/")
+            children = dict.fromkeys(prim.GetAllChildrenNames() if prim else [])
+            self._children[path] = children
+        return children
+
+    def _has_api(self, path: str, prim_type: str) -> bool:
+        memo = self._apis[prim_type]
+        has_api = memo.get(path)
+        if has_api is None:
+            has_api = memo[path] = self._stage.GetPrimAtPath(path).HasAPI(_PRIM_TYPE_APIS[prim_type])
+        return has_api
+
+    def _drop(self, path: str) -> None:
+        for memo in self._apis.values():
+            memo.pop(path, None)
+        children = self._children.pop(path, None)
+        if children:
+            for name in children:
+                self._drop(f"{path}/{name}")
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, sender: Usd.Stage) -> None:
+        changed = False
+        for path in notice.GetResyncedPaths():
+            if path == Sdf.Path.absoluteRootPath:
+                self.clear()
+                return
+            if path.IsPrimPath():
+                # drop the resynced subtree and the children of its parent (prim may have been added/removed)
+                self._drop(path.pathString)
+                parent = path.GetParentPath()
+                self._children.pop("" if parent == Sdf.Path.absoluteRootPath else parent.pathString, None)
+                changed = True
+        for path in notice.GetChangedInfoOnlyPaths():
+            if path.IsPrimPath():
+                for memo in self._apis.values():
+                    memo.pop(path.pathString, None)
+                changed = True
+        if changed:
+            self._queries.clear()
+
+
+def get_prim_path_index(stage: Usd.Stage) -> PrimPathIndex:
+    """Get the shared prim path index of the given stage (re-created if the stage changed)
+
+    Args:
+        stage (Usd.Stage): USD stage to index.
+
+    Returns:
+        PrimPathIndex: The prim path index of the stage.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> from isaacsim.core.utils.prim_path_index import get_prim_path_index
+        >>> from isaacsim.core.utils.stage import get_current_stage
+        >>>
+        >>> # given the stage: /World/env/Cube, /World/env_01/Cube, /World/env_02/Cube
+        >>> get_prim_path_index(get_current_stage()).find_matching_prim_paths("/World/env_.*/Cube")
+        ['/World/env_01/Cube', '/World/env_02/Cube']
+    """
+    global _index
+    if _index is None or _index.stage != stage:
+        if _index is not None:
+            _index.release()
+        _index = PrimPathIndex(stage)
+    return _index
@@ -24,9 +24,9 @@ import omni.usd
 import usdrt
 
 # isaacsim
-from isaacsim.core.utils._isaac_utils import _find_matching_prim_paths
+from isaacsim.core.utils.prim_path_index import get_prim_path_index
 from isaacsim.core.utils.semantics import add_labels
-from isaacsim.core.utils.stage import add_reference_to_stage, get_current_stage, get_current_stage_id
+from isaacsim.core.utils.stage import add_reference_to_stage, get_current_stage
 from isaacsim.core.utils.string import find_root_prim_path_from_regex
 from isaacsim.core.utils.types import SDF_type_to_Gf
 from omni.usd.commands import DeletePrimsCommand, MovePrimCommand
@@ -391,6 +391,11 @@ def find_matching_prim_paths(prim_path_regex: str, prim_type: typing.Optional[st
     Returns:
         typing.List[str]: List of prim paths that match input expression.
 
+    .. note::
+
+        The expression is resolved using the stage's prim path index (see :py:class:`~isaacsim.core.utils.prim_path_index.PrimPathIndex`),
+        which is kept up to date by USD change notices. Repeated queries do not traverse the stage.
+
     Example:
 
     .. code-block:: python
@@ -402,10 +407,7 @@ def find_matching_prim_paths(prim_path_regex: str, prim_type: typing.Optional[st
         >>> prims_utils.find_matching_prim_paths("/World/env_.*/Cube")
         ['/World/env_01/Cube', '/World/env_02/Cube']
     """
-    stage_id = get_current_stage_id()
-    if prim_type is None:
-        prim_type = ""
-    return _find_matching_prim_paths(prim_path_regex.replace(".*", "*"), stage_id, prim_type)
+    return get_prim_path_index(get_current_stage()).find_matching_prim_paths(prim_path_regex, prim_type)
 
 
 def get_prim_children(prim: Usd.Prim) -> typing.List[Usd.Prim]:
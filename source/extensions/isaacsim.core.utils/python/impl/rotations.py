@@ -20,12 +20,43 @@ import typing
 import numpy as np
 
 # omniverse
-from pxr import Gf
+from pxr import Gf, Vt
 
 # internal global constants
 _POLE_LIMIT = 1.0 - 1e-6
 
 
+def _linear_map(outputs: typing.Tuple[str, ...], symbols: typing.List[str]) -> np.ndarray:
+    """Build the (len(symbols), len(outputs)) matrix of a linear map whose outputs are written as signed sums"""
+    table = np.zeros((len(symbols), len(outputs)))
+    for column, output in enumerate(outputs):
+        for term in output.split():
+            table[symbols.index(term[1:]), column] = 1.0 if term[0] == "+" else -1.0
+    return table
+
+
+# unscaled quaternion (w, x, y, z) candidates computed from the rotation matrix elements:
+# one candidate for the trace and one for each diagonal element
+_MATRIX_TO_QUATS = _linear_map(
+    (
+        *("+m00 +m11 +m22 +m33", "+m21 -m12", "+m02 -m20", "+m10 -m01"),
+        *("+m21 -m12", "+m00 -m11 -m22 +m33", "+m01 +m10", "+m20 +m02"),
+        *("+m02 -m20", "+m01 +m10", "-m00 +m11 -m22 +m33", "+m12 +m21"),
+        *("+m10 -m01", "+m20 +m02", "+m12 +m21", "-m00 -m11 +m22 +m33"),
+    ),
+    [f"m{i}{j}" for i in range(3) for j in range(3)] + ["m33"],
+)
+# rotation matrix elements (minus identity) computed from the outer product of the (scaled) quaternion
+_QUAT_TO_MATRIX = _linear_map(
+    (
+        *("-yy -zz", "+xy -zw", "+xz +yw"),
+        *("+xy +zw", "-xx -zz", "+yz -xw"),
+        *("+xz -yw", "+yz +xw", "-xx -yy"),
+    ),
+    [i + j for i in "wxyz" for j in "wxyz"],
+)
+
+
 def rot_matrix_to_quat(mat: np.ndarray) -> np.ndarray:
     """Convert rotation matrix to Quaternion.
 
@@ -35,31 +66,7 @@ def rot_matrix_to_quat(mat: np.ndarray) -> np.ndarray:
     Returns:
         np.ndarray: quaternion (w, x, y, z).
     """
-    if mat.shape == (3, 3):
-        tmp = np.eye(4)
-        tmp[0:3, 0:3] = mat
-        mat = tmp
-
-    q = np.empty((4,), dtype=np.float64)
-    t = np.trace(mat)
-    if t > mat[3, 3]:
-        q[0] = t
-        q[3] = mat[1, 0] - mat[0, 1]
-        q[2] = mat[0, 2] - mat[2, 0]
-        q[1] = mat[2, 1] - mat[1, 2]
-    else:
-        i, j, k = 0, 1, 2
-        if mat[1, 1] > mat[0, 0]:
-            i, j, k = 1, 2, 0
-        if mat[2, 2] > mat[i, i]:
-            i, j, k = 2, 0, 1
-        t = mat[i, i] - (mat[j, j] + mat[k, k]) + mat[3, 3]
-        q[i + 1] = t
-        q[j + 1] = mat[i, j] + mat[j, i]
-        q[k + 1] = mat[k, i] + mat[i, k]
-        q[0] = mat[k, j] - mat[j, k]
-    q *= 0.5 / np.sqrt(t * mat[3, 3])
-    return q
+    return rot_matrices_to_quats(mat)
 
 
 def quat_to_rot_matrix(quat: np.ndarray) -> np.ndarray:
@@ -71,20 +78,7 @@ def quat_to_rot_matrix(quat: np.ndarray) -> np.ndarray:
     Returns:
         np.ndarray: A 3x3 rotation matrix.
     """
-    q = np.array(quat, dtype=np.float64, copy=True)
-    nq = np.dot(q, q)
-    if nq < 1e-10:
-        return np.identity(3)
-    q *= np.sqrt(2.0 / nq)
-    q = np.outer(q, q)
-    return np.array(
-        (
-            (1.0 - q[2, 2] - q[3, 3], q[1, 2] - q[3, 0], q[1, 3] + q[2, 0]),
-            (q[1, 2] + q[3, 0], 1.0 - q[1, 1] - q[3, 3], q[2, 3] - q[1, 0]),
-            (q[1, 3] - q[2, 0], q[2, 3] + q[1, 0], 1.0 - q[1, 1] - q[2, 2]),
-        ),
-        dtype=np.float64,
-    )
+    return quats_to_rot_matrices(quat)
 
 
 def matrix_to_euler_angles(mat: np.ndarray, degrees: bool = False, extrinsic: bool = True) -> np.ndarray:
@@ -101,48 +95,7 @@ def matrix_to_euler_angles(mat: np.ndarray, degrees: bool = False, extrinsic: bo
     Returns:
         np.ndarray: Euler XYZ angles (intrinsic form) if extrinsic is False and Euler XYZ angles (extrinsic form) if extrinsic is True.
     """
-    if extrinsic:
-        if mat[2, 0] > _POLE_LIMIT:
-            roll = np.arctan2(mat[0, 1], mat[0, 2])
-            pitch = -np.pi / 2
-            yaw = 0.0
-            return np.array([roll, pitch, yaw])
-
-        if mat[2, 0] < -_POLE_LIMIT:
-            roll = np.arctan2(mat[0, 1], mat[0, 2])
-            pitch = np.pi / 2
-            yaw = 0.0
-            return np.array([roll, pitch, yaw])
-
-        roll = np.arctan2(mat[2, 1], mat[2, 2])
-        pitch = -np.arcsin(mat[2, 0])
-        yaw = np.arctan2(mat[1, 0], mat[0, 0])
-        if degrees:
-            roll = math.degrees(roll)
-            pitch = math.degrees(pitch)
-            yaw = math.degrees(yaw)
-        return np.array([roll, pitch, yaw])
-    else:
-        if mat[0, 2] > _POLE_LIMIT:
-            roll = np.arctan2(mat[1, 0], mat[1, 1])
-            pitch = np.pi / 2
-            yaw = 0.0
-            return np.array([roll, pitch, yaw])
-
-        if mat[0, 2] < -_POLE_LIMIT:
-            roll = np.arctan2(mat[1, 0], mat[1, 1])
-            pitch = -np.pi / 2
-            yaw = 0.0
-            return np.array([roll, pitch, yaw])
-        roll = -math.atan2(mat[1, 2], mat[2, 2])
-        pitch = math.asin(mat[0, 2])
-        yaw = -math.atan2(mat[0, 1], mat[0, 0])
-
-        if degrees:
-            roll = math.degrees(roll)
-            pitch = math.degrees(pitch)
-            yaw = math.degrees(yaw)
-        return np.array([roll, pitch, yaw])
+    return matrices_to_euler_angles(mat, degrees=degrees, extrinsic=extrinsic)
 
 
 def euler_to_rot_matrix(euler_angles: np.ndarray, degrees: bool = False, extrinsic: bool = True) -> np.ndarray:
@@ -159,36 +112,7 @@ def euler_to_rot_matrix(euler_angles: np.ndarray, degrees: bool = False, extrins
     Returns:
         np.ndarray:  A 3x3 rotation matrix in its extrinsic or intrinsic form depends on the extrinsic argument.
     """
-    if extrinsic:
-        yaw, pitch, roll = euler_angles
-    else:
-        roll, pitch, yaw = euler_angles
-    if degrees:
-        roll = math.radians(roll)
-        pitch = math.radians(pitch)
-        yaw = math.radians(yaw)
-    cr = np.cos(roll)
-    sr = np.sin(roll)
-    cy = np.cos(yaw)
-    sy = np.sin(yaw)
-    cp = np.cos(pitch)
-    sp = np.sin(pitch)
-    if extrinsic:
-        return np.array(
-            [
-                [(cp * cr), ((cr * sp * sy) - (cy * sr)), ((cr * cy * sp) + (sr * sy))],
-                [(cp * sr), ((cy * cr) + (sr * sp * sy)), ((cy * sp * sr) - (cr * sy))],
-                [-sp, (cp * sy), (cy * cp)],
-            ]
-        )
-    else:
-        return np.array(
-            [
-                [(cp * cy), (-cp * sy), sp],
-                [((cy * sr * sp) + (cr * sy)), ((cr * cy) - (sr * sp * sy)), (-cp * sr)],
-                [((-cr * cy * sp) + (sr * sy)), ((cy * sr) + (cr * sp * sy)), (cr * cp)],
-            ]
-        )
+    return euler_angles_to_rot_matrices(euler_angles, degrees=degrees, extrinsic=extrinsic)
 
 
 def quat_to_euler_angles(quat: np.ndarray, degrees: bool = False, extrinsic: bool = True) -> np.ndarray:
@@ -206,7 +130,7 @@ def quat_to_euler_angles(quat: np.ndarray, degrees: bool = False, extrinsic: boo
     Returns:
         np.ndarray: Euler XYZ angles (intrinsic form) if extrinsic is False and Euler XYZ angles (extrinsic form) if extrinsic is True.
     """
-    return matrix_to_euler_angles(quat_to_rot_matrix(quat), degrees=degrees, extrinsic=extrinsic)
+    return quats_to_euler_angles(quat, degrees=degrees, extrinsic=extrinsic)
 
 
 def euler_angles_to_quat(euler_angles: np.ndarray, degrees: bool = False, extrinsic: bool = True) -> np.ndarray:
@@ -223,8 +147,7 @@ def euler_angles_to_quat(euler_angles: np.ndarray, degrees: bool = False, extrin
     Returns:
         np.ndarray: quaternion (w, x, y, z).
     """
-    mat = np.array(euler_to_rot_matrix(euler_angles, degrees=degrees, extrinsic=extrinsic))
-    return rot_matrix_to_quat(mat)
+    return euler_angles_to_quats(euler_angles, degrees=degrees, extrinsic=extrinsic)
 
 
 def lookat_to_quatf(camera: Gf.Vec3f, target: Gf.Vec3f, up: Gf.Vec3f) -> Gf.Quatf:
@@ -285,3 +208,197 @@ def gf_rotation_to_np_array(orientation: Gf.Rotation) -> np.ndarray:
         np.ndarray: A (4,) quaternion array in (w, x, y, z).
     """
     return gf_quat_to_np_array(orientation.GetQuat())
+
+
+def rot_matrices_to_quats(mats: np.ndarray) -> np.ndarray:
+    """Convert a batch of rotation matrices to quaternions (vectorized, without per-matrix branching).
+
+    Args:
+        mats (np.ndarray): Rotation matrices with shape (N, 3, 3), or homogeneous transformation matrices
+                           with shape (N, 4, 4). A single matrix (3, 3) or (4, 4) is also supported.
+
+    Returns:
+        np.ndarray: quaternions (w, x, y, z) with shape (N, 4), or (4,) for a single matrix.
+    """
+    mats = np.asarray(mats, dtype=np.float64)
+    shape, size = mats.shape[:-2], mats.shape[-1]
+    mats = mats.reshape((-1, size, size))
+    elements = np.empty((mats.shape[0], 10))
+    elements[:, :9] = mats[:, :3, :3].reshape((-1, 9))
+    elements[:, 9] = mats[:, 3, 3] if size == 4 else 1.0
+    candidates = (elements @ _MATRIX_TO_QUATS).reshape((-1, 4, 4))
+    # select the numerically stable candidate: the trace if positive, otherwise the largest diagonal element
+    diagonal = elements[:, [0, 4, 8]]
+    indices = np.where(np.sum(diagonal, axis=-1) > 0, 0, 1 + np.argmax(diagonal, axis=-1))
+    rows = np.arange(mats.shape[0])
+    quats = candidates[rows, indices]
+    quats *= (0.5 / np.sqrt(quats[rows, indices] * elements[:, 9]))[:, np.newaxis]
+    return quats.reshape(shape + (4,))
+
+
+def quats_to_rot_matrices(quats: np.ndarray) -> np.ndarray:
+    """Convert a batch of quaternions to rotation matrices (vectorized, without per-quaternion branching).
+
+    Quaternions are normalized. Quaternions with (near) zero norm are converted to the identity matrix.
+
+    Args:
+        quats (np.ndarray): quaternions (w, x, y, z) with shape (N, 4). A single quaternion (4,) is also supported.
+
+    Returns:
+        np.ndarray: Rotation matrices with shape (N, 3, 3), or (3, 3) for a single quaternion.
+    """
+    quats = np.asarray(quats, dtype=np.float64)
+    shape = quats.shape[:-1]
+    quats = quats.reshape((-1, 4))
+    norms = np.sum(quats * quats, axis=-1, keepdims=True)
+    valid = norms >= 1e-10
+    quats = np.where(valid, quats * np.sqrt(2.0 / np.where(valid, norms, 1.0)), 0.0)
+    mats = (quats[:, :, np.newaxis] * quats[:, np.newaxis, :]).reshape((-1, 16)) @ _QUAT_TO_MATRIX
+    mats[:, [0, 4, 8]] += 1.0
+    return mats.reshape(shape + (3, 3))
+
+
+def matrices_to_euler_angles(mats: np.ndarray, degrees: bool = False, extrinsic: bool = True) -> np.ndarray:
+    """Convert a batch of rotation matrices to Euler XYZ extrinsic or intrinsic angles (vectorized).
+
+    Args:
+        mats (np.ndarray): Rotation matrices with shape (N, 3, 3). A single matrix (3, 3) is also supported.
+        degrees (bool, optional): Whether returned angles should be in degrees.
+        extrinsic (bool, optional): True if the rotation matrix follows the extrinsic matrix
+                   convention (equivalent to ZYX ordering but returned in the reverse) and False if it follows
+                   the intrinsic matrix conventions (equivalent to XYZ ordering).
+                   Defaults to True.
+
+    Returns:
+        np.ndarray: Euler XYZ angles (intrinsic form) if extrinsic is False and Euler XYZ angles (extrinsic form)
+        if extrinsic is True, with shape (N, 3), or (3,) for a single matrix.
+    """
+    mats = np.asarray(mats, dtype=np.float64)[..., :3, :3]
+    if extrinsic:
+        sine = mats[..., 2, 0]
+        pole = np.abs(sine) > _POLE_LIMIT
+        roll = np.where(
+            pole, np.arctan2(mats[..., 0, 1], mats[..., 0, 2]), np.arctan2(mats[..., 2, 1], mats[..., 2, 2])
+        )
+        pitch = np.where(pole, -np.sign(sine) * np.pi / 2, -np.arcsin(np.clip(sine, -1.0, 1.0)))
+        yaw = np.where(pole, 0.0, np.arctan2(mats[..., 1, 0], mats[..., 0, 0]))
+    else:
+        sine = mats[..., 0, 2]
+        pole = np.abs(sine) > _POLE_LIMIT
+        roll = np.where(
+            pole, np.arctan2(mats[..., 1, 0], mats[..., 1, 1]), -np.arctan2(mats[..., 1, 2], mats[..., 2, 2])
+        )
+        pitch = np.where(pole, np.sign(sine) * np.pi / 2, np.arcsin(np.clip(sine, -1.0, 1.0)))
+        yaw = np.where(pole, 0.0, -np.arctan2(mats[..., 0, 1], mats[..., 0, 0]))
+    angles = np.stack([roll, pitch, yaw], axis=-1)
+    return np.degrees(angles) if degrees else angles
+
+
+def euler_angles_to_rot_matrices(euler_angles: np.ndarray, degrees: bool = False, extrinsic: bool = True) -> np.ndarray:
+    """Convert a batch of Euler XYZ or ZYX angles to rotation matrices (vectorized).
+
+    Args:
+        euler_angles (np.ndarray): Euler angles with shape (N, 3). A single set of angles (3,) is also supported.
+        degrees (bool, optional): Whether passed angles are in degrees.
+        extrinsic (bool, optional): True if the euler angles follows the extrinsic angles
+                   convention (equivalent to ZYX ordering but returned in the reverse) and False if it follows
+                   the intrinsic angles conventions (equivalent to XYZ ordering).
+                   Defaults to True.
+
+    Returns:
+        np.ndarray: Rotation matrices in their extrinsic or intrinsic form (depending on the extrinsic argument)
+        with shape (N, 3, 3), or (3, 3) for a single set of angles.
+    """
+    euler_angles = np.asarray(euler_angles, dtype=np.float64)
+    if degrees:
+        euler_angles = np.radians(euler_angles)
+    if extrinsic:
+        yaw, pitch, roll = euler_angles[..., 0], euler_angles[..., 1], euler_angles[..., 2]
+    else:
+        roll, pitch, yaw = euler_angles[..., 0], euler_angles[..., 1], euler_angles[..., 2]
+    cr, sr = np.cos(roll), np.sin(roll)
+    cy, sy = np.cos(yaw), np.sin(yaw)
+    cp, sp = np.cos(pitch), np.sin(pitch)
+    if extrinsic:
+        elements = [
+            cp * cr,
+            cr * sp * sy - cy * sr,
+            cr * cy * sp + sr * sy,
+            cp * sr,
+            cy * cr + sr * sp * sy,
+            cy * sp * sr - cr * sy,
+            -sp,
+            cp * sy,
+            cy * cp,
+        ]
+    else:
+        elements = [
+            cp * cy,
+            -cp * sy,
+            sp,
+            cy * sr * sp + cr * sy,
+            cr * cy - sr * sp * sy,
+            -cp * sr,
+            -cr * cy * sp + sr * sy,
+            cy * sr + cr * sp * sy,
+            cr * cp,
+        ]
+    return np.stack(elements, axis=-1).reshape(euler_angles.shape[:-1] + (3, 3))
+
+
+def quats_to_euler_angles(quats: np.ndarray, degrees: bool = False, extrinsic: bool = True) -> np.ndarray:
+    """Convert a batch of quaternions to Euler XYZ or ZYX angles (vectorized).
+
+    Args:
+        quats (np.ndarray): quaternions (w, x, y, z) with shape (N, 4). A single quaternion (4,) is also supported.
+        degrees (bool, optional): Whether returned angles should be in degrees. Defaults to False.
+        extrinsic (bool, optional): True if the euler angles follows the extrinsic angles
+                   convention (equivalent to ZYX ordering but returned in the reverse) and False if it follows
+                   the intrinsic angles conventions (equivalent to XYZ ordering).
+                   Defaults to True.
+
+    Returns:
+        np.ndarray: Euler XYZ angles (intrinsic form) if extrinsic is False and Euler XYZ angles (extrinsic form)
+        if extrinsic is True, with shape (N, 3), or (3,) for a single quaternion.
+    """
+    return matrices_to_euler_angles(quats_to_rot_matrices(quats), degrees=degrees, extrinsic=extrinsic)
+
+
+def euler_angles_to_quats(euler_angles: np.ndarray, degrees: bool = False, extrinsic: bool = True) -> np.ndarray:
+    """Convert a batch of Euler angles to quaternions (vectorized).
+
+    Args:
+        euler_angles (np.ndarray): Euler XYZ angles with shape (N, 3). A single set of angles (3,) is also supported.
+        degrees (bool, optional): Whether input angles are in degrees. Defaults to False.
+        extrinsic (bool, optional): True if the euler angles follows the extrinsic angles
+                   convention (equivalent to ZYX ordering but returned in the reverse) and False if it follows
+                   the intrinsic angles conventions (equivalent to XYZ ordering).
+                   Defaults to True.
+
+    Returns:
+        np.ndarray: quaternions (w, x, y, z) with shape (N, 4), or (4,) for a single set of angles.
+    """
+    return rot_matrices_to_quats(euler_angles_to_rot_matrices(euler_angles, degrees=degrees, extrinsic=extrinsic))
+
+
+def gf_quats_to_np_array(
+    orientations: typing.Sequence[typing.Union[Gf.Quatd, Gf.Quatf, Gf.Quaternion]],
+) -> np.ndarray:
+    """Converts a sequence of pxr Quaternion types (or a ``Vt.QuatdArray``/``Vt.QuatfArray``) to a numpy array
+    following [w, x, y, z] convention.
+
+    Args:
+        orientations (typing.Sequence[typing.Union[Gf.Quatd, Gf.Quatf, Gf.Quaternion]]): Input quaternion objects.
+
+    Returns:
+        np.ndarray: A (N, 4) quaternion array in (w, x, y, z).
+    """
+    try:
+        # Vt arrays expose their (x, y, z, w) memory layout to numpy without per-element conversion
+        if not isinstance(orientations, (Vt.QuatdArray, Vt.QuatfArray, Vt.QuathArray)):
+            orientations = Vt.QuatdArray(orientations)
+    except TypeError:  # Gf.Quaternion elements
+        return np.array([gf_quat_to_np_array(orientation) for orientation in orientations], dtype=np.float64).reshape(
+            (-1, 4)
+        )
+    return np.array(orientations, dtype=np.float64).reshape((-1, 4))[:, [3, 0, 1, 2]]
@@ -12,14 +12,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, List, Optional, Tuple
+import bisect
+from typing import Callable, Dict, List, Optional, Tuple
 
 import carb
 import isaacsim.core.utils.prims as prim_utils
 import omni.usd
 import Semantics
 from isaacsim.core.utils.stage import get_current_stage, get_current_stage_id
-from pxr import Usd, UsdGeom, UsdSemantics
+from pxr import Sdf, Tf, Usd, UsdGeom, UsdSemantics
 
 
 def add_update_semantics(prim: Usd.Prim, semantic_label: str, type_label: str = "class", suffix="") -> None:
@@ -98,6 +99,11 @@ def get_semantics(prim: Usd.Prim) -> Dict[str, Tuple[str, str]]:
         "Function 'get_semantics' reads the deprecated SemanticsAPI. "
         "Consider upgrading the semantics with `upgrade_prim_semantics_to_labels(prim)` first and then using `get_labels` instead."
     )
+    return _get_semantics(prim)
+
+
+def _get_semantics(prim: Usd.Prim) -> Dict[str, Tuple[str, str]]:
+    """Returns semantics (old SemanticsAPI) that are applied to a prim (without logging deprecation warnings)"""
     result = {}
     for prop in prim.GetProperties():
         is_semantic = Semantics.SemanticsAPI.IsSemanticsAPIPath(prop.GetPath())
@@ -135,7 +141,7 @@ def check_missing_semantics(prim_path: str = None) -> List[str]:
 
     for prim in prims:
         if prim.IsA(UsdGeom.Mesh):
-            semantics = get_semantics(prim)
+            semantics = _get_semantics(prim)
             if not semantics:
                 prim_paths.append(prim.GetPath().pathString)
     return prim_paths
@@ -163,7 +169,7 @@ def check_incorrect_semantics(prim_path: str = None) -> List[List[str]]:
 
     for prim in prims:
         if prim.IsA(UsdGeom.Mesh):
-            semantics = get_semantics(prim)
+            semantics = _get_semantics(prim)
             prim_path = prim.GetPath().pathString
             if semantics:
                 for key in list(semantics.keys()):
@@ -202,7 +208,7 @@ def count_semantics_in_scene(prim_path: str = None) -> Dict[str, int]:
         print(len(prims))
     for prim in prims:
         if prim.IsA(UsdGeom.Mesh):
-            semantics = get_semantics(prim)
+            semantics = _get_semantics(prim)
             if not semantics:
                 semantics_counter["missing"] += 1
             else:
@@ -347,24 +353,30 @@ def check_incorrect_labels(prim_path: str | None = None) -> list[list[str]]:
         if prim.IsA(UsdGeom.Mesh):
             labels_dict = get_labels(prim)
             if labels_dict:
-                prim_path_str = prim.GetPath().pathString.lower()
                 all_labels = [
                     label for sublist in labels_dict.values() for label in sublist if label
                 ]  # Flatten and filter None/empty
-                for label in all_labels:
-                    label_lower = label.lower()
-                    # Check if label (or label without separators) is in path
-                    if (
-                        label_lower not in prim_path_str
-                        and label_lower.replace("_", "") not in prim_path_str
-                        and label_lower.replace("-", "") not in prim_path_str
-                    ):
-                        incorrect_pair = [prim.GetPath().pathString, label]
-                        incorrect_pairs.append(incorrect_pair)
-                        break  # Only report first incorrect label per prim
+                label = _find_incorrect_label(prim.GetPath().pathString, all_labels)
+                if label is not None:
+                    incorrect_pairs.append([prim.GetPath().pathString, label])
     return incorrect_pairs
 
 
+def _find_incorrect_label(prim_path: str, labels: List[str]) -> Optional[str]:
+    """Returns the first label not found within the prim path string (case-insensitive, ignoring '_' and '-')"""
+    prim_path = prim_path.lower()
+    for label in labels:
+        label_lower = label.lower()
+        # Check if label (or label without separators) is in path
+        if (
+            label_lower not in prim_path
+            and label_lower.replace("_", "") not in prim_path
+            and label_lower.replace("-", "") not in prim_path
+        ):
+            return label
+    return None
+
+
 def count_labels_in_scene(prim_path: str | None = None) -> dict[str, int]:
     """Returns a dictionary of semantic labels (UsdSemantics.LabelsAPI) and their corresponding count.
 
@@ -473,3 +485,211 @@ def upgrade_prim_semantics_to_labels(prim: Usd.Prim, include_descendants: bool =
                 carb.log_warn(f"Failed to upgrade instance '{old_instance_name}' on {current_prim.GetPath()}: {e}")
                 continue
     return total_upgraded
+
+
+class LabelsAuditor:
+    """Single-pass, incremental audit of the semantic labels (UsdSemantics.LabelsAPI) of the meshes in a stage.
+
+    Computes at once the results of :py:func:`check_missing_labels`, :py:func:`check_incorrect_labels`
+    and :py:func:`count_labels_in_scene` with a single traversal of the stage.
+    Changes to the stage (notified by USD) are tracked between audits, so that subsequent audits
+    only re-traverse the changed subtrees (or re-read the labels of the prims whose labels changed).
+
+    Args:
+        prim_path (str | None): Root of the audited subtree. If None, audits the whole stage.
+        stage (Usd.Stage | None): Stage to audit. If None, the current stage is used.
+        predicate (Callable): Traversal predicate. Defaults to ``Usd.PrimDefaultPredicate``
+            (active, loaded, defined and non-abstract prims).
+
+    Example:
+
+    .. code-block:: python
+
+        >>> from isaacsim.core.utils.semantics import LabelsAuditor
+        >>>
+        >>> auditor = LabelsAuditor("/World")
+        >>> results = auditor.audit()  # full traversal
+        >>> results["missing_labels"], results["incorrect_labels"], results["label_counts"]
+        ([...], [...], {'missing_labels': ...})
+        >>> results = auditor.audit()  # only changed subtrees since last audit are traversed
+        >>> auditor.release()
+    """
+
+    def __init__(
+        self,
+        prim_path: str | None = None,
+        stage: Usd.Stage | None = None,
+        predicate: Callable = Usd.PrimDefaultPredicate,
+    ) -> None:
+        self._stage = get_current_stage() if stage is None else stage
+        self._root_path = Sdf.Path(prim_path) if prim_path else Sdf.Path.absoluteRootPath
+        self._predicate = predicate
+        # audited meshes: sorted paths and their labels (None if no LabelsAPI is applied)
+        self._paths = []
+        self._labels = {}
+        # aggregated results
+        self._missing = set()
+        self._incorrect = {}
+        self._counts = {}
+        # pending changes
+        self._full_audit = True
+        self._dirty_subtrees = set()
+        self._dirty_prims = set()
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, self._stage)
+
+    def release(self) -> None:
+        """Stop tracking the stage changes"""
+        if self._listener is not None:
+            self._listener.Revoke()
+            self._listener = None
+
+    def audit(self, full: bool = False) -> dict:
+        """Audit the semantic labels of the meshes.
+
+        Args:
+            full (bool, optional): Force a full traversal. Defaults to False (traverse only the changed subtrees
+                since the last audit, or the whole subtree in the first audit).
+
+        Returns:
+            dict: Dictionary with the following (prim path sorted) results
+
+            - ``"missing_labels"`` (list[str]): Prim paths of meshes with no LabelsAPI applied.
+            - ``"incorrect_labels"`` (list[list[str]]): Pairs of [prim_path, first_incorrect_label].
+            - ``"label_counts"`` (dict[str, int]): Labels and their total count, including a ``"missing_labels"`` count.
+        """
+        if full or self._full_audit or self._listener is None:
+            self._audit_full()
+        elif self._dirty_subtrees or self._dirty_prims:
+            self._audit_changes()
+        self._full_audit = False
+        self._dirty_subtrees.clear()
+        self._dirty_prims.clear()
+        label_counts = {"missing_labels": len(self._missing)}
+        label_counts.update(sorted(self._counts.items()))
+        return {
+            "missing_labels": sorted(self._missing),
+            "incorrect_labels": [[path, self._incorrect[path]] for path in sorted(self._incorrect)],
+            "label_counts": label_counts,
+        }
+
+    def _audit_full(self) -> None:
+        self._paths.clear()
+        self._labels.clear()
+        self._missing.clear()
+        self._incorrect.clear()
+        self._counts.clear()
+        root = self._stage.GetPrimAtPath(self._root_path)
+        if not root:
+            carb.log_warn(f"Prim path not found: {self._root_path}")
+            return
+        self._paths.extend(self._traverse(root))
+        self._paths.sort()
+
+    def _audit_changes(self) -> None:
+        # coalesce changed subtrees (discard those nested in other changed subtrees)
+        subtrees = []
+        for path in sorted(self._dirty_subtrees):
+            if not subtrees or not path.HasPrefix(subtrees[-1]):
+                subtrees.append(path)
+        # remove the audited meshes of the changed subtrees
+        ranges = []
+        for path in subtrees:
+            path_string = path.pathString
+            start = bisect.bisect_left(self._paths, path_string)
+            stop = bisect.bisect_left(self._paths, path_string + "0", lo=start)  # '0' follows '/' in ASCII
+            ranges.append((start, stop))
+        removed = [path for start, stop in ranges for path in self._paths[start:stop]]
+        for path in removed:
+            self._remove(path)
+        paths = []
+        start = 0
+        for range_start, range_stop in ranges:
+            paths.extend(self._paths[start:range_start])
+            start = range_stop
+        paths.extend(self._paths[start:])
+        # re-traverse the changed subtrees
+        added = []
+        for path in subtrees:
+            prim = self._stage.GetPrimAtPath(path)
+            if self._is_traversed(prim):
+                added.extend(self._traverse(prim))
+        # re-read the labels of the changed prims
+        for path in self._dirty_prims:
+            if any(path.HasPrefix(subtree) for subtree in subtrees):
+                continue
+            path_string = path.pathString
+            exists = path_string in self._labels
+            if exists:
+                self._remove(path_string)
+            prim = self._stage.GetPrimAtPath(path)
+            if self._is_traversed(prim) and prim.IsA(UsdGeom.Mesh):
+                self._add(path_string, prim)
+                if not exists:
+                    added.append(path_string)
+            elif exists:
+                paths.remove(path_string)
+        paths.extend(added)
+        paths.sort()
+        self._paths = paths
+
+    def _is_traversed(self, prim: Usd.Prim) -> bool:
+        # whether a full audit traversal (from the root) visits the prim
+        while prim and prim.GetPath().HasPrefix(self._root_path):
+            if prim.GetPath() == self._root_path:
+                return True
+            if not self._predicate(prim):
+                return False
+            prim = prim.GetParent()
+        return False
+
+    def _traverse(self, prim: Usd.Prim) -> List[str]:
+        paths = []
+        for descendant in Usd.PrimRange(prim, self._predicate):
+            if descendant.IsA(UsdGeom.Mesh):
+                path = descendant.GetPath().pathString
+                self._add(path, descendant)
+                paths.append(path)
+        return paths
+
+    def _add(self, path: str, prim: Usd.Prim) -> None:
+        labels_dict = get_labels(prim)
+        if not labels_dict:
+            self._labels[path] = None
+            self._missing.add(path)
+            return
+        labels = [label for sublist in labels_dict.values() for label in sublist if label]
+        self._labels[path] = labels
+        for label in labels:
+            self._counts[label] = self._counts.get(label, 0) + 1
+        incorrect_label = _find_incorrect_label(path, labels)
+        if incorrect_label is not None:
+            self._incorrect[path] = incorrect_label
+
+    def _remove(self, path: str) -> None:
+        labels = self._labels.pop(path)
+        if labels is None:
+            self._missing.discard(path)
+            return
+        for label in labels:
+            self._counts[label] -= 1
+            if not self._counts[label]:
+                del self._counts[label]
+        self._incorrect.pop(path, None)
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, sender: Usd.Stage) -> None:
+        if self._full_audit:
+            return
+        for path in notice.GetResyncedPaths():
+            if path.IsPrimPath() or path.IsAbsoluteRootPath():
+                if self._root_path.HasPrefix(path):
+                    # the audited root (or one of its ancestors) changed
+                    self._full_audit = True
+                    return
+                if path.HasPrefix(self._root_path):
+                    self._dirty_subtrees.add(path)
+            elif path.GetPrimPath().HasPrefix(self._root_path) and path.name.startswith("semantics:"):
+                self._dirty_prims.add(path.GetPrimPath())
+        for path in notice.GetChangedInfoOnlyPaths():
+            if path.IsPropertyPath() and path.name.startswith("semantics:"):
+                if path.GetPrimPath().HasPrefix(self._root_path):
+                    self._dirty_prims.add(path.GetPrimPath())
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import omni.kit.test
+import omni.usd
+from isaacsim.core.utils._isaac_utils import _find_matching_prim_paths
+from isaacsim.core.utils.prim_path_index import get_prim_path_index
+from isaacsim.core.utils.prims import define_prim, delete_prim, find_matching_prim_paths
+from isaacsim.core.utils.stage import get_current_stage, get_current_stage_id
+from pxr import UsdPhysics
+
+PATTERNS = [
+    "/World/envs/env_.*/Robot/.*",
+    "/World/envs/env_.*/Robot",
+    "/World/envs/env_1.*/Table",
+    "/World/envs/env_[0-9]/Robot",
+    "/World/envs/env_0/Robot/",
+    "/World/missing/.*",
+]
+
+
+class TestPrimPathIndex(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        await omni.usd.get_context().new_stage_async()
+        await omni.kit.app.get_app().next_update_async()
+        for i in range(12):
+            for name in ["base", "arm", "hand"]:
+                define_prim(f"/World/envs/env_{i}/Robot/{name}")
+            define_prim(f"/World/envs/env_{i}/Table")
+            if i % 2:
+                UsdPhysics.ArticulationRootAPI.Apply(get_current_stage().GetPrimAtPath(f"/World/envs/env_{i}/Robot"))
+
+    async def tearDown(self):
+        await omni.kit.app.get_app().next_update_async()
+
+    def check_matches(self):
+        stage_id = get_current_stage_id()
+        for pattern in PATTERNS:
+            expected = _find_matching_prim_paths(pattern.replace(".*", "*"), stage_id, "")
+            self.assertListEqual(find_matching_prim_paths(pattern), expected, pattern)
+        expected = _find_matching_prim_paths("/World/envs/env_*/Robot", stage_id, "articulation")
+        self.assertListEqual(find_matching_prim_paths("/World/envs/env_.*/Robot", "articulation"), expected)
+
+    async def test_find_matching_prim_paths(self):
+        self.check_matches()
+        # queries are cached (returned lists can be modified)
+        paths = find_matching_prim_paths("/World/envs/env_.*/Table")
+        paths.clear()
+        self.assertEqual(len(find_matching_prim_paths("/World/envs/env_.*/Table")), 12)
+        with self.assertRaises(ValueError):
+            find_matching_prim_paths("/World/envs/env_.*/Robot", "camera")
+
+    async def test_stage_changes(self):
+        self.check_matches()
+        # add, remove and re-create prims
+        define_prim("/World/envs/env_12/Robot/base")
+        delete_prim("/World/envs/env_3")
+        define_prim("/World/envs/env_3/Robot/gripper")
+        get_current_stage().GetPrimAtPath("/World/envs/env_5/Robot").SetActive(False)
+        # apply/remove API schemas
+        UsdPhysics.ArticulationRootAPI.Apply(get_current_stage().GetPrimAtPath("/World/envs/env_0/Robot"))
+        get_current_stage().GetPrimAtPath("/World/envs/env_1/Robot").RemoveAPI(UsdPhysics.ArticulationRootAPI)
+        self.check_matches()
+        # new stage
+        await omni.usd.get_context().new_stage_async()
+        self.assertListEqual(find_matching_prim_paths("/World/envs/env_.*"), [])
+        self.assertEqual(get_prim_path_index(get_current_stage()).stage, get_current_stage())
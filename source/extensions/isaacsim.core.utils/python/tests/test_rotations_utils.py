@@ -17,11 +17,21 @@ import numpy as np
 import omni.kit.test
 from isaacsim.core.utils.rotations import (
     euler_angles_to_quat,
+    euler_angles_to_quats,
+    euler_angles_to_rot_matrices,
     euler_to_rot_matrix,
+    gf_quat_to_np_array,
+    gf_quats_to_np_array,
+    matrices_to_euler_angles,
     matrix_to_euler_angles,
     quat_to_euler_angles,
+    quat_to_rot_matrix,
+    quats_to_euler_angles,
+    quats_to_rot_matrices,
+    rot_matrices_to_quats,
     rot_matrix_to_quat,
 )
+from pxr import Gf, Vt
 from scipy.spatial.transform import Rotation
 
 
@@ -120,3 +130,58 @@ class TestRotations(omni.kit.test.AsyncTestCase):
                 )
             )
         )
+
+    async def test_batched_rotations(self):
+        matrices = Rotation.random(100).as_matrix()
+        # identity and 180 degrees rotations (non-positive trace)
+        matrices[:4] = [np.eye(3), np.diag([1, -1, -1]), np.diag([-1, 1, -1]), np.diag([-1, -1, 1])]
+        quats = rot_matrices_to_quats(matrices)
+        self.assertEqual(quats.shape, (100, 4))
+        for matrix, quat in zip(matrices, quats):
+            self.assertTrue(np.allclose(rot_matrix_to_quat(matrix), quat))
+            self.assertTrue(np.allclose(quat_to_rot_matrix(quat), matrix))
+        self.assertTrue(np.allclose(quats_to_rot_matrices(quats), matrices))
+        # homogeneous (scaled) transformation matrices
+        transforms = np.tile(np.eye(4), (100, 1, 1))
+        transforms[:, :3, :3] = 2.0 * matrices
+        transforms[:, 3, 3] = 2.0
+        self.assertTrue(np.allclose(rot_matrices_to_quats(transforms), quats))
+        # zero-norm quaternions
+        self.assertTrue(np.allclose(quats_to_rot_matrices(np.zeros((2, 4))), np.eye(3)))
+        # euler angles
+        for extrinsic in [True, False]:
+            for degrees in [True, False]:
+                euler_angles = matrices_to_euler_angles(matrices, degrees=degrees, extrinsic=extrinsic)
+                self.assertEqual(euler_angles.shape, (100, 3))
+                self.assertTrue(
+                    np.allclose(
+                        euler_angles_to_rot_matrices(euler_angles, degrees=degrees, extrinsic=extrinsic), matrices
+                    )
+                )
+                self.assertTrue(
+                    np.allclose(quats_to_euler_angles(quats, degrees=degrees, extrinsic=extrinsic), euler_angles)
+                )
+                self.assertTrue(
+                    np.allclose(euler_angles_to_quats(euler_angles, degrees=degrees, extrinsic=extrinsic), quats)
+                )
+                for matrix, angles in zip(matrices, euler_angles):
+                    self.assertTrue(
+                        np.allclose(matrix_to_euler_angles(matrix, degrees=degrees, extrinsic=extrinsic), angles)
+                    )
+                    self.assertTrue(
+                        np.allclose(euler_to_rot_matrix(angles, degrees=degrees, extrinsic=extrinsic), matrix)
+                    )
+        # gimbal lock (angles in degrees)
+        matrices = euler_angles_to_rot_matrices([[10, 90, 0], [10, -90, 0]], degrees=True)
+        euler_angles = matrices_to_euler_angles(matrices, degrees=True)
+        self.assertTrue(np.allclose(euler_angles[:, 1], [90, -90]))
+        self.assertTrue(np.allclose(euler_angles_to_rot_matrices(euler_angles[0], degrees=True), matrices[0]))
+
+    async def test_gf_quats_to_np_array(self):
+        quats = [Gf.Quatd(0.5, 0.5, -0.5, 0.5), Gf.Quatf(0.0, 1.0, 0.0, 0.0), Gf.Quatd(1.0, 0.0, 0.0, 0.0)]
+        expected = np.array([gf_quat_to_np_array(quat) for quat in quats])
+        self.assertTrue(np.allclose(gf_quats_to_np_array(quats), expected))
+        self.assertTrue(np.allclose(gf_quats_to_np_array(Vt.QuatdArray(quats)), expected))
+        self.assertTrue(np.allclose(gf_quats_to_np_array(Vt.QuatfArray([Gf.Quatf(quat) for quat in quats])), expected))
+        self.assertTrue(np.allclose(gf_quats_to_np_array([Gf.Quaternion(1.0, Gf.Vec3d(0.0))]), [[1, 0, 0, 0]]))
+        self.assertEqual(gf_quats_to_np_array([]).shape, (0, 4))
@@ -23,6 +23,7 @@ from isaacsim.core.utils.prims import get_prim_at_path
 
 # Import extension python module we are testing with absolute import path, as if we are external user (other extension)
 from isaacsim.core.utils.semantics import (
+    LabelsAuditor,
     add_labels,
     add_update_semantics,
     check_incorrect_labels,
@@ -367,3 +368,35 @@ class TestSemantics(omni.kit.test.AsyncTestCase):
         self.assertEqual(labels_dict_subtree.get("nested", 0), 1)
         # Expect 3 keys: cube, nested, and missing_labels (even if 0)
         self.assertEqual(len(labels_dict_subtree), 3)
+
+    async def test_labels_auditor(self):
+        """Test the single-pass (and incremental) audit of the new LabelsAPI."""
+        cube_paths = self.create_test_environment_new_labels()
+        auditor = LabelsAuditor()
+        results = auditor.audit()
+        self.assertListEqual(results["missing_labels"], sorted(check_missing_labels()))
+        self.assertListEqual(results["incorrect_labels"], sorted(check_incorrect_labels()))
+        self.assertDictEqual(results["label_counts"], count_labels_in_scene())
+
+        # Modify the stage: relabel, remove and add meshes
+        add_labels(prim=get_prim_at_path(cube_paths[3]), labels=["cube"], instance_name="class")
+        remove_labels(get_prim_at_path(cube_paths[0]))
+        omni.kit.commands.execute("DeletePrims", paths=[cube_paths[1]])
+        result, path = omni.kit.commands.execute("CreateMeshPrimCommand", prim_type="Cube", prim_path="/World/Cone")
+        add_labels(prim=get_prim_at_path(path), labels=["cone", "shape"], instance_name="class")
+        results = auditor.audit()
+        self.assertListEqual(results["missing_labels"], [cube_paths[0]])
+        self.assertListEqual(results["incorrect_labels"], [["/World/Cone", "shape"], [cube_paths[2], "sphere"]])
+        self.assertDictEqual(
+            results["label_counts"], {"missing_labels": 1, "cone": 1, "cube": 1, "nested": 1, "shape": 1, "sphere": 1}
+        )
+        self.assertDictEqual(results, auditor.audit(full=True))
+
+        # Audit a subtree
+        auditor.release()
+        auditor = LabelsAuditor(prim_path="/World/Cube_0")
+        results = auditor.audit()
+        self.assertListEqual(results["missing_labels"], [cube_paths[0]])
+        self.assertListEqual(results["incorrect_labels"], [])
+        self.assertDictEqual(results["label_counts"], {"missing_labels": 1, "nested": 1})
+        auditor.release()
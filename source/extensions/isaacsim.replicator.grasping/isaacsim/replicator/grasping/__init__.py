@@ -14,4 +14,5 @@
 # limitations under the License.
 
 from .extension import *
+from .grasp_results import GraspResultsReader, GraspResultsWriter
 from .grasping_manager import GraspingManager, GraspPhase
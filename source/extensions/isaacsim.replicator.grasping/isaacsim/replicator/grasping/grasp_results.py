@@ -0,0 +1,365 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Columnar storage of grasp evaluation results.
+
+Results are buffered in memory and flushed as append-only ``.npz`` shards holding one column per field:
+
+- ``locations``: (N, 3) gripper locations.
+- ``orientations``: (N, 4) gripper orientations as (w, x, y, z) quaternions.
+- ``joint_positions``: (N, J) gripper joint states, NaN where a joint was not reported for a result.
+- ``metrics.<name>``: (N,) per-result metrics (e.g. success scores), NaN where a metric was not reported.
+
+A single ``manifest.json`` lists the shards in order together with their joint and metric names, it is rewritten
+atomically after each shard so that readers always see a consistent set of complete shards.
+"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+import numpy as np
+
+MANIFEST_FILE_NAME = "manifest.json"
+RESULTS_FORMAT_VERSION = 1
+DEFAULT_SHARD_SIZE = 1024
+
+
+def _shard_file_name(shard_index: int) -> str:
+    return f"shard_{shard_index:08d}.npz"
+
+
+def _read_manifest(output_dir: str) -> dict | None:
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE_NAME)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, "r") as f:
+        manifest = json.load(f)
+    if manifest.get("format_version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported grasp results format version in '{manifest_path}'.")
+    return manifest
+
+
+def _write_manifest(output_dir: str, manifest: dict) -> None:
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE_NAME)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+
+class GraspResultsWriter:
+    """Buffers grasp results and writes them as append-only columnar shards with a single manifest.
+
+    Shards are written by a background thread so that serialization and file I/O stay off the simulation loop.
+    Errors raised by the background writes are re-raised by `flush` and `close`.
+
+    Args:
+        output_dir: Directory of the shards and manifest, created if it does not exist.
+        gripper_path: Path of the evaluated gripper, stored with each shard.
+        object_path: Path of the evaluated object, stored with each shard.
+        shard_size: Number of results per shard.
+        overwrite: If True, the existing shards of the output directory are deleted, otherwise new shards are
+                   appended to them.
+        compress: Whether to compress the shards.
+        max_pending_shards: Maximum number of shards queued for writing before `add` blocks.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        gripper_path: str | None = None,
+        object_path: str | None = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        overwrite: bool = False,
+        compress: bool = False,
+        max_pending_shards: int = 4,
+    ):
+        if shard_size < 1:
+            raise ValueError("shard_size must be positive")
+        if max_pending_shards < 1:
+            raise ValueError("max_pending_shards must be positive")
+        self.output_dir = output_dir
+        self.gripper_path = gripper_path
+        self.object_path = object_path
+        self.shard_size = shard_size
+        self.compress = compress
+        self._max_pending_shards = max_pending_shards
+
+        os.makedirs(output_dir, exist_ok=True)
+        manifest = _read_manifest(output_dir)
+        if manifest is not None and overwrite:
+            for shard in manifest["shards"]:
+                shard_path = os.path.join(output_dir, shard["file"])
+                if os.path.exists(shard_path):
+                    os.remove(shard_path)
+            manifest = None
+        if manifest is None:
+            manifest = {"format_version": RESULTS_FORMAT_VERSION, "num_results": 0, "shards": []}
+            _write_manifest(output_dir, manifest)
+        # The manifest is only modified by the background thread once the writer is created
+        self._manifest = manifest
+        self._next_shard_index = len(manifest["shards"])
+
+        self._buffer = []
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="GraspResultsWriter")
+        self._pending = deque()
+        self._error = None
+        self._closed = False
+
+    @property
+    def num_buffered(self) -> int:
+        """Number of results added but not yet submitted for writing."""
+        return len(self._buffer)
+
+    def add(
+        self,
+        location,
+        orientation,
+        joint_states: dict[str, float] | None = None,
+        metrics: dict[str, float] | None = None,
+    ) -> None:
+        """Add a grasp result.
+
+        Args:
+            location: The (x, y, z) gripper location.
+            orientation: The gripper orientation as a (w, x, y, z) sequence or a Gf.Quatd/Gf.Quatf.
+            joint_states: Mapping of the (relative) gripper joint paths to their positions.
+            metrics: Mapping of metric names (e.g. success scores) to their values.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot add results to a closed GraspResultsWriter.")
+        if hasattr(orientation, "GetReal"):
+            orientation = (orientation.GetReal(), *orientation.GetImaginary())
+        self._buffer.append((tuple(location), tuple(orientation), joint_states or {}, metrics or {}))
+        if len(self._buffer) >= self.shard_size:
+            self._submit_buffer()
+
+    def flush(self) -> None:
+        """Write all buffered results and wait for the pending shard writes to finish."""
+        if self._buffer:
+            self._submit_buffer()
+        while self._pending:
+            self._wait_oldest_pending()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Flush the buffered results and stop the background writer."""
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _wait_oldest_pending(self) -> None:
+        error = self._pending.popleft().exception()
+        if error is not None and self._error is None:
+            self._error = error
+
+    def _raise_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise RuntimeError(f"Failed to write grasp results to '{self.output_dir}'.") from error
+
+    def _submit_buffer(self) -> None:
+        self._raise_error()
+        # Backpressure: bound the memory held by shards waiting to be written
+        while len(self._pending) >= self._max_pending_shards:
+            self._wait_oldest_pending()
+        results, self._buffer = self._buffer, []
+        shard_index = self._next_shard_index
+        self._next_shard_index += 1
+        self._pending.append(self._executor.submit(self._write_shard, shard_index, results))
+
+    def _write_shard(self, shard_index: int, results: list[tuple]) -> None:
+        joint_names = list(dict.fromkeys(name for result in results for name in result[2]))
+        metric_names = list(dict.fromkeys(name for result in results for name in result[3]))
+        joint_indices = {name: index for index, name in enumerate(joint_names)}
+        metric_indices = {name: index for index, name in enumerate(metric_names)}
+
+        num_results = len(results)
+        joint_positions = np.full((num_results, len(joint_names)), np.nan)
+        metric_values = np.full((len(metric_names), num_results), np.nan)
+        for row, (_, _, joint_states, metrics) in enumerate(results):
+            for name, value in joint_states.items():
+                joint_positions[row, joint_indices[name]] = value
+            for name, value in metrics.items():
+                metric_values[metric_indices[name], row] = value
+        columns = {
+            "locations": np.array([result[0] for result in results], dtype=np.float64).reshape(num_results, 3),
+            "orientations": np.array([result[1] for result in results], dtype=np.float64).reshape(num_results, 4),
+            "joint_positions": joint_positions,
+        }
+        for name, values in zip(metric_names, metric_values):
+            columns[f"metrics.{name}"] = values
+
+        file_name = _shard_file_name(shard_index)
+        save = np.savez_compressed if self.compress else np.savez
+        with open(os.path.join(self.output_dir, file_name), "wb") as f:
+            save(f, **columns)
+
+        # Shards are written in order by a single thread, so the manifest always lists complete shards
+        self._manifest["shards"].append(
+            {
+                "file": file_name,
+                "num_results": num_results,
+                "joint_names": joint_names,
+                "metric_names": metric_names,
+                "gripper_path": self.gripper_path,
+                "object_path": self.object_path,
+            }
+        )
+        self._manifest["num_results"] += num_results
+        _write_manifest(self.output_dir, self._manifest)
+
+
+class GraspResultsReader:
+    """Streams grasp results written by `GraspResultsWriter`.
+
+    Args:
+        output_dir: Directory of the shards and manifest.
+    """
+
+    def __init__(self, output_dir: str):
+        manifest = _read_manifest(output_dir)
+        if manifest is None:
+            raise FileNotFoundError(f"No grasp results manifest found in '{output_dir}'.")
+        self.output_dir = output_dir
+        self.shards = manifest["shards"]
+        self._num_results = manifest["num_results"]
+
+    def __len__(self) -> int:
+        return self._num_results
+
+    @property
+    def joint_names(self) -> list[str]:
+        """Union of the joint names of all shards, in order of appearance."""
+        return list(dict.fromkeys(name for shard in self.shards for name in shard["joint_names"]))
+
+    @property
+    def metric_names(self) -> list[str]:
+        """Union of the metric names of all shards, in order of appearance."""
+        return list(dict.fromkeys(name for shard in self.shards for name in shard["metric_names"]))
+
+    def read_shard(self, index: int) -> dict:
+        """Read a shard as a dictionary of columns.
+
+        Returns:
+            Dictionary with the "locations", "orientations", "joint_positions" and "metrics" (name to values)
+            columns, and the "joint_names", "metric_names", "gripper_path" and "object_path" of the shard.
+        """
+        shard = self.shards[index]
+        with np.load(os.path.join(self.output_dir, shard["file"])) as data:
+            return {
+                "locations": data["locations"],
+                "orientations": data["orientations"],
+                "joint_positions": data["joint_positions"],
+                "metrics": {name: data[f"metrics.{name}"] for name in shard["metric_names"]},
+                "joint_names": shard["joint_names"],
+                "metric_names": shard["metric_names"],
+                "gripper_path": shard["gripper_path"],
+                "object_path": shard["object_path"],
+            }
+
+    def iter_shards(self) -> Iterator[dict]:
+        """Iterate over the shards as dictionaries of columns, see `read_shard`."""
+        for index in range(len(self.shards)):
+            yield self.read_shard(index)
+
+    def iter_batches(
+        self, joint_names: list[str] | None = None, metric_names: list[str] | None = None
+    ) -> Iterator[dict]:
+        """Iterate over the shards with their joint and metric columns aligned to common names.
+
+        Args:
+            joint_names: Joint names of the "joint_positions" columns, defaults to the joint names of all shards.
+            metric_names: Names of the metrics, defaults to the metric names of all shards.
+
+        Yields:
+            Dictionaries with the "locations" (N, 3), "orientations" (N, 4), "joint_positions" (N, J) and
+            "metrics" (name to (N,) values) arrays, NaN where a joint or metric is missing from a shard.
+        """
+        joint_names = self.joint_names if joint_names is None else joint_names
+        metric_names = self.metric_names if metric_names is None else metric_names
+        for shard in self.iter_shards():
+            num_results = len(shard["locations"])
+            joint_positions = np.full((num_results, len(joint_names)), np.nan)
+            shard_joint_indices = {name: index for index, name in enumerate(shard["joint_names"])}
+            for column, name in enumerate(joint_names):
+                if name in shard_joint_indices:
+                    joint_positions[:, column] = shard["joint_positions"][:, shard_joint_indices[name]]
+            yield {
+                "locations": shard["locations"],
+                "orientations": shard["orientations"],
+                "joint_positions": joint_positions,
+                "metrics": {name: shard["metrics"].get(name, np.full(num_results, np.nan)) for name in metric_names},
+            }
+
+    def iter_results(self) -> Iterator[dict]:
+        """Iterate over the individual results, using the layout of the YAML grasp result files."""
+        for shard in self.iter_shards():
+            for row in range(len(shard["locations"])):
+                orientation = shard["orientations"][row]
+                result = {
+                    "gripper_path": shard["gripper_path"],
+                    "object_path": shard["object_path"],
+                    "gripper_location": shard["locations"][row].tolist(),
+                    "gripper_orientation": {"w": float(orientation[0]), "xyz": orientation[1:].tolist()},
+                    "joint_states": {
+                        name: float(value)
+                        for name, value in zip(shard["joint_names"], shard["joint_positions"][row])
+                        if not np.isnan(value)
+                    },
+                }
+                if shard["metric_names"]:
+                    result["metrics"] = {
+                        name: float(values[row])
+                        for name, values in shard["metrics"].items()
+                        if not np.isnan(values[row])
+                    }
+                yield {"grasp_result": result}
+
+    def load(self) -> dict:
+        """Load all the results as concatenated columns, see `iter_batches`."""
+        joint_names = self.joint_names
+        metric_names = self.metric_names
+        batches = list(self.iter_batches(joint_names, metric_names))
+        return {
+            "locations": np.concatenate([batch["locations"] for batch in batches]) if batches else np.zeros((0, 3)),
+            "orientations": (
+                np.concatenate([batch["orientations"] for batch in batches]) if batches else np.zeros((0, 4))
+            ),
+            "joint_positions": (
+                np.concatenate([batch["joint_positions"] for batch in batches])
+                if batches
+                else np.zeros((0, len(joint_names)))
+            ),
+            "metrics": {
+                name: np.concatenate([batch["metrics"][name] for batch in batches]) if batches else np.zeros(0)
+                for name in metric_names
+            },
+            "joint_names": joint_names,
+            "metric_names": metric_names,
+        }
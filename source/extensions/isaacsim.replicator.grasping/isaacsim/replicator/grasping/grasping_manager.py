@@ -13,19 +13,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 import os
 from dataclasses import asdict, dataclass, field
 
 import carb
 import isaacsim.replicator.grasping.grasping_utils as grasping_utils
+import isaacsim.replicator.grasping.grasp_results as grasp_results
 import isaacsim.replicator.grasping.sampler_utils as sampler_utils
 import isaacsim.replicator.grasping.transform_utils as transform_utils
+import numpy as np
+import omni.physics.tensors
+import omni.physx
 import omni.usd
 import yaml
-from pxr import Gf, Sdf, Usd, UsdPhysics
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdPhysics
 
 DEFAULT_NUM_SIMULATION_STEPS = 32
 DEFAULT_SIMULATION_STEP_DT = 1 / 60
+DEFAULT_NUM_ENVS = 16
+DEFAULT_ENV_SPACING = 1.0
+GRASPING_ENVS_ROOT_PATH = "/GraspingEnvs"
+RESULTS_FORMAT_YAML = "yaml"  # One capture_<index>.yaml file per grasp result
+RESULTS_FORMAT_COLUMNAR = "columnar"  # Columnar shards with a manifest, see grasp_results.GraspResultsWriter
 DEFAULT_SAMPLER_CONFIG = {
     "sampler_type": "antipodal",
     "num_candidates": 100,
@@ -92,6 +102,9 @@ class GraspingManager:
         self._results_output_dir: str | None = None
         self._write_frame_counter: int = 0  # Counter of the current frame being written
         self._overwrite_results_output: bool = False  # Flag to control result file overwriting
+        self._results_output_format: str = RESULTS_FORMAT_YAML
+        self._results_writer: grasp_results.GraspResultsWriter | None = None  # Open columnar writer of the workflow
+        self._existing_result_files: set[str] | None = None  # Cached yaml result file names of the output directory
 
         # Store sampler configuration - initialized with defaults
         self.sampler_config = DEFAULT_SAMPLER_CONFIG.copy()
@@ -109,6 +122,7 @@ class GraspingManager:
         self.object_simulation_phases = []
         self.joint_pregrasp_states.clear()
         self._clear_all_simulation_aspects()
+        self.close_results_writer()
         self.clear_gripper()
         self.clear_object()
         self.sampler_config = DEFAULT_SAMPLER_CONFIG.copy()
@@ -160,6 +174,8 @@ class GraspingManager:
     # --- Results ---
     def set_results_output_dir(self, dir_path: str | None):
         """Set the output directory for grasp results."""
+        self.close_results_writer()
+        self._existing_result_files = None
         if dir_path and isinstance(dir_path, str) and dir_path.strip():
             expanded_path = os.path.expanduser(dir_path.strip())
             if not os.path.isabs(expanded_path):
@@ -180,6 +196,53 @@ class GraspingManager:
         """Set whether to overwrite or find the next available index for result files."""
         self._overwrite_results_output = overwrite
 
+    def set_results_output_format(self, results_format: str):
+        """Set the format of the written grasp results.
+
+        Args:
+            results_format: RESULTS_FORMAT_YAML to write one YAML file per grasp result, or RESULTS_FORMAT_COLUMNAR
+                            to buffer the results and write them as columnar shards with a manifest in the background
+                            (see `grasp_results.GraspResultsWriter`, read back with `grasp_results.GraspResultsReader`).
+        """
+        if results_format not in (RESULTS_FORMAT_YAML, RESULTS_FORMAT_COLUMNAR):
+            raise ValueError(f"Unknown results format '{results_format}'.")
+        self.close_results_writer()
+        self._results_output_format = results_format
+
+    def get_results_output_format(self) -> str:
+        """Get the current results output format."""
+        return self._results_output_format
+
+    def close_results_writer(self) -> None:
+        """Flush the pending columnar grasp results and close the results writer, if open."""
+        if self._results_writer is None:
+            return
+        writer, self._results_writer = self._results_writer, None
+        try:
+            writer.close()
+        except Exception as e:
+            carb.log_warn(f"Failed to write grasp results to {writer.output_dir}: {e}")
+
+    def _open_results_writer(self, overwrite: bool) -> grasp_results.GraspResultsWriter | None:
+        self.close_results_writer()
+        try:
+            self._results_writer = grasp_results.GraspResultsWriter(
+                self._results_output_dir,
+                gripper_path=self.gripper_path,
+                object_path=self.get_object_prim_path(),
+                overwrite=overwrite,
+            )
+        except Exception as e:
+            carb.log_warn(f"Failed to open grasp results writer in {self._results_output_dir}: {e}")
+        return self._results_writer
+
+    def _start_results_workflow(self) -> None:
+        """Reset the result writing state at the start of an evaluation workflow."""
+        self._write_frame_counter = 0  # Reset counter for this workflow
+        self._existing_result_files = None
+        if self._results_output_format == RESULTS_FORMAT_COLUMNAR and self._can_write_grasp_results():
+            self._open_results_writer(overwrite=self._overwrite_results_output)
+
     # --- Gripper Management ---
     def set_gripper(self, gripper: str | Usd.Prim) -> bool:
         """Set the gripper prim by path (str) or prim (Usd.Prim)."""
@@ -983,6 +1046,8 @@ class GraspingManager:
         isolate_simulation: bool = False,
         simulate_using_timeline: bool = False,
         progress_callback: callable = None,
+        num_envs: int = 1,
+        env_spacing: float = DEFAULT_ENV_SPACING,
     ):
         """Evaluates a list of grasp poses by simulating the grasp phases for each.
 
@@ -993,13 +1058,32 @@ class GraspingManager:
             isolate_simulation: Isolate gripper/object to the scene if `physics_scene_path` is used. Ignored if `simulate_using_timeline` is True.
             simulate_using_timeline: Use the main timeline for simulation.
             progress_callback: Optional async callable that takes the number of evaluated poses as an argument.
+            num_envs: Number of grasp poses evaluated in parallel, if larger than 1 the poses are evaluated in
+                      batches using `evaluate_grasp_poses_batched`. Ignored if `simulate_using_timeline` is True.
+            env_spacing: Distance between the parallel environments in stage units, used if `num_envs` > 1.
 
         """
+        if num_envs > 1:
+            if simulate_using_timeline:
+                carb.log_warn(
+                    "Batched grasp evaluation is not supported with timeline simulation, evaluating serially."
+                )
+            else:
+                await self.evaluate_grasp_poses_batched(
+                    grasp_poses,
+                    num_envs=num_envs,
+                    env_spacing=env_spacing,
+                    render=render,
+                    physics_scene_path=physics_scene_path,
+                    progress_callback=progress_callback,
+                )
+                return
+
         initial_pose = self.get_initial_gripper_pose()
-        self._write_frame_counter = 0  # Reset counter for this workflow
         self._workflow_stop_requested = False  # Reset stop flag at the start of a new workflow
         self._workflow_printed_messages.clear()  # Clear printed messages for new workflow
         self._first_write_failure_logged_this_workflow = False  # Reset write failure log flag
+        self._start_results_workflow()
 
         # Run the workflow for each grasp pose
         for idx, (world_location, world_orientation) in enumerate(grasp_poses):
@@ -1024,6 +1108,7 @@ class GraspingManager:
         if initial_pose:
             self.set_gripper_pose(initial_pose[0], initial_pose[1])
         self.clear_simulation(simulate_using_timeline=simulate_using_timeline)
+        self.close_results_writer()
         if self._workflow_stop_requested:
             print("Grasping workflow execution stopped by request.")
         else:
@@ -1032,6 +1117,200 @@ class GraspingManager:
         # Reset flag in case it was set during the final phase of a stopped workflow
         self._workflow_stop_requested = False
 
+    async def evaluate_grasp_poses_batched(
+        self,
+        grasp_poses: list[tuple[Gf.Vec3d, Gf.Quatd]],
+        num_envs: int = DEFAULT_NUM_ENVS,
+        env_spacing: float = DEFAULT_ENV_SPACING,
+        render: bool = False,
+        physics_scene_path: str | None = None,
+        progress_callback: callable = None,
+    ) -> bool:
+        """Evaluates a list of grasp poses in batches of parallel environments.
+
+        The gripper and object are cloned (as internal references) into `num_envs` environments laid out on a grid
+        under `GRASPING_ENVS_ROOT_PATH`, simulated in a dedicated physics scene while the source gripper and object are
+        deactivated. For each batch, the gripper poses of all environments are authored at once, the grasp phases are
+        driven in lockstep through a tensor articulation view and the joint states of all environments are read in a
+        single call before writing the batch results.
+
+        Args:
+            grasp_poses: A list of tuples, where each tuple contains (location, orientation) for a grasp pose.
+            num_envs: Maximum number of grasp poses evaluated in parallel.
+            env_spacing: Distance between the environments in stage units, must be large enough to keep the
+                         gripper and object of neighboring environments from colliding.
+            render: Whether to render/update Kit for every simulation frame during simulation phases.
+            physics_scene_path: Optional path to a UsdPhysics.Scene prim whose settings are used for the
+                                environments' physics scene. If None or invalid, a default scene is created.
+            progress_callback: Optional async callable that takes the number of evaluated poses as an argument.
+
+        Returns:
+            True if all batches were evaluated (or the workflow was stopped by request), False otherwise.
+        """
+        if num_envs < 1:
+            raise ValueError("num_envs must be positive.")
+        if not self.grasp_phases:
+            carb.log_warn("No grasp phases defined.")
+            return False
+        stage = omni.usd.get_context().get_stage()
+        if not stage:
+            carb.log_warn("Cannot evaluate grasp poses: Stage is not available.")
+            return False
+        object_prim = self.get_object_prim()
+        if not self._gripper_prim or not object_prim:
+            carb.log_warn("Cannot evaluate grasp poses: Gripper or object prim is not set.")
+            return False
+        articulation_root_prim = grasping_utils.find_articulation_root_prim(self._gripper_prim)
+        if not articulation_root_prim:
+            carb.log_warn(
+                f"Cannot evaluate grasp poses in batches: No articulation root found under '{self.gripper_path}'."
+            )
+            return False
+        if not grasp_poses:
+            return True
+
+        self._workflow_stop_requested = False  # Reset stop flag at the start of a new workflow
+        self._workflow_printed_messages.clear()  # Clear printed messages for new workflow
+        self._first_write_failure_logged_this_workflow = False  # Reset write failure log flag
+        self._start_results_workflow()
+
+        gripper_path = self.gripper_path
+        num_envs = min(num_envs, len(grasp_poses))
+        articulation_root_relative_path = articulation_root_prim.GetPath().MakeRelativePath(gripper_path)
+        joint_relative_paths = {
+            Sdf.Path(info["path"]).name: os.path.relpath(info["path"], start=gripper_path)
+            for info in grasping_utils.get_gripper_joints_info(gripper_path)
+        }
+
+        # The gripper pose is authored on its local transform (as in `set_gripper_pose`), keep its scale
+        xform_cache = UsdGeom.XformCache()
+        gripper_scale = Gf.Transform(xform_cache.GetLocalToWorldTransform(self._gripper_prim)).GetScale()
+        object_transform = xform_cache.GetLocalToWorldTransform(object_prim)
+
+        source_prims = [self._gripper_prim, object_prim]
+        source_active_states = [prim.IsActive() for prim in source_prims]
+        physx_interface = omni.physx.get_physx_interface()
+        stage_id = omni.usd.get_context().get_stage_id()
+        envs_scene = None
+        sim_view = None
+        try:
+            env_paths = grasping_utils.create_grasping_envs(
+                stage,
+                {"Gripper": gripper_path, "Object": str(object_prim.GetPath())},
+                GRASPING_ENVS_ROOT_PATH,
+                num_envs,
+                env_spacing,
+            )
+            env_gripper_paths = [f"{env_path}/Gripper" for env_path in env_paths]
+            env_articulation_paths = [
+                str(Sdf.Path(path).AppendPath(articulation_root_relative_path)) for path in env_gripper_paths
+            ]
+            grasping_utils.set_prims_transform_matrices(
+                stage, [f"{env_path}/Object" for env_path in env_paths], [object_transform] * num_envs
+            )
+
+            # Simulate the environments in their own physics scene, without the (deactivated) source prims
+            envs_scene_path = f"{GRASPING_ENVS_ROOT_PATH}/PhysicsScene"
+            base_physics_scene = (
+                grasping_utils.get_physics_scene(stage, physics_scene_path) if physics_scene_path else None
+            )
+            if base_physics_scene:
+                duplicated_prim = grasping_utils.duplicate_prim(
+                    stage, str(base_physics_scene.GetPath()), envs_scene_path
+                )
+                envs_scene = UsdPhysics.Scene(duplicated_prim) if duplicated_prim else None
+            if not envs_scene:
+                envs_scene = grasping_utils.create_or_get_physics_scene(stage, envs_scene_path)
+            for prim in source_prims:
+                prim.SetActive(False)
+            grasping_utils.isolate_prims_to_scene([stage.GetPrimAtPath(path) for path in env_paths], envs_scene)
+
+            num_evaluated = 0
+            for batch_start in range(0, len(grasp_poses), num_envs):
+                if self._workflow_stop_requested:
+                    print("Workflow stopped by request during batched evaluation loop.")
+                    break
+                batch_poses = grasp_poses[batch_start : batch_start + num_envs]
+                print(f"  Executing grasps {batch_start + 1}-{batch_start + len(batch_poses)}/{len(grasp_poses)}")
+
+                # Author the gripper poses of the batch, unused environments keep their previous pose
+                gripper_transforms = [
+                    Gf.Matrix4d().SetScale(gripper_scale)
+                    * Gf.Matrix4d().SetTransform(Gf.Rotation(orientation), location)
+                    for location, orientation in batch_poses
+                ]
+                grasping_utils.set_prims_transform_matrices(
+                    stage, env_gripper_paths[: len(batch_poses)], gripper_transforms
+                )
+
+                # Restart the simulation from the authored state and create the tensor views
+                grasping_utils.reset_physics_simulation()
+                physx_interface.force_load_physics_from_usd()
+                physx_interface.start_simulation()
+                sim_view = omni.physics.tensors.create_simulation_view("numpy", stage_id=stage_id)
+                articulation_view = sim_view.create_articulation_view(env_articulation_paths)
+                if articulation_view is None or articulation_view.count != num_envs:
+                    carb.log_warn(f"Could not create an articulation view for the {num_envs} grasping environments.")
+                    return False
+                dof_names = articulation_view.shared_metatype.dof_names
+                # USD joint drive targets and states of revolute joints are in degrees, tensor views use radians
+                dof_unit_scales = np.array(
+                    [
+                        math.radians(1.0) if dof_type == omni.physics.tensors.DofType.Rotation else 1.0
+                        for dof_type in articulation_view.shared_metatype.dof_types
+                    ]
+                )
+                env_indices = np.arange(articulation_view.count, dtype=np.int32)
+
+                for phase in self.grasp_phases:
+                    dof_targets = articulation_view.get_dof_position_targets()
+                    for joint_path, target_position in phase.joint_drive_targets.items():
+                        joint_name = Sdf.Path(joint_path).name
+                        if joint_name not in dof_names:
+                            self._log_once(f"Joint '{joint_path}' is not a degree of freedom of the gripper.", "warn")
+                            continue
+                        dof_index = dof_names.index(joint_name)
+                        dof_targets[:, dof_index] = target_position * dof_unit_scales[dof_index]
+                    articulation_view.set_dof_position_targets(dof_targets, env_indices)
+                    await grasping_utils.simulate_physics_async(
+                        num_frames=phase.simulation_steps,
+                        step_dt=phase.simulation_step_dt,
+                        physics_scene=envs_scene,
+                        render=render,
+                    )
+
+                # Read the joint states of all the environments at once
+                dof_positions = articulation_view.get_dof_positions()[: len(batch_poses)] / dof_unit_scales
+                joint_states_batch = [
+                    {
+                        joint_relative_paths.get(dof_name, dof_name): float(position)
+                        for dof_name, position in zip(dof_names, env_dof_positions)
+                    }
+                    for env_dof_positions in dof_positions
+                ]
+                self.write_grasp_results_batch(batch_poses, joint_states_batch)
+                sim_view.invalidate()
+                sim_view = None
+
+                num_evaluated += len(batch_poses)
+                if progress_callback:
+                    await progress_callback(num_evaluated)
+            return True
+        finally:
+            if sim_view:
+                sim_view.invalidate()
+            grasping_utils.reset_physics_simulation()
+            if stage.GetPrimAtPath(GRASPING_ENVS_ROOT_PATH):
+                stage.RemovePrim(GRASPING_ENVS_ROOT_PATH)
+            for prim, is_active in zip(source_prims, source_active_states):
+                prim.SetActive(is_active)
+            self.close_results_writer()
+            if self._workflow_stop_requested:
+                print("Batched grasping workflow execution stopped by request.")
+            else:
+                print("Batched grasping workflow execution finished.")
+            self._workflow_stop_requested = False
+
     async def evaluate_grasp_pose(
         self,
         location: Gf.Vec3d,
@@ -1091,15 +1370,12 @@ class GraspingManager:
 
     # --- Results ---
     def write_grasp_results(self, location: Gf.Vec3d, orientation: Gf.Quatd):
-        """Write the grasp results to the results output path."""
-        if not self._results_output_dir:
-            self._log_once(
-                "Results output directory is not set. Grasp results will not be written for this workflow.", "warn"
-            )
-            return
+        """Write the grasp results to the results output path.
 
-        if not self.gripper_path:
-            carb.log_warn("Cannot write results: Gripper path is not set.")
+        In the columnar results format, the results are buffered by an open results writer and written as full
+        shards; call `close_results_writer` to write the remaining results and the manifest.
+        """
+        if not self._can_write_grasp_results():
             return
 
         joint_states = grasping_utils.get_gripper_joint_states(self.gripper_path)
@@ -1108,7 +1384,64 @@ class GraspingManager:
             carb.log_warn(f"Could not retrieve joint states for {self.gripper_path}, skipping result writing.")
             return
 
-        result_data = {
+        self._write_grasp_result(location, orientation, joint_states)
+
+    def write_grasp_results_batch(
+        self, grasp_poses: list[tuple[Gf.Vec3d, Gf.Quatd]], joint_states_batch: list[dict[str, float]]
+    ):
+        """Write the grasp results of a batch of evaluated grasp poses to the results output path.
+
+        Args:
+            grasp_poses: The evaluated (location, orientation) grasp poses.
+            joint_states_batch: The gripper joint states (relative joint path to position) for each grasp pose.
+        """
+        if not self._can_write_grasp_results():
+            return
+        for (location, orientation), joint_states in zip(grasp_poses, joint_states_batch):
+            self._write_grasp_result(location, orientation, joint_states)
+
+    def _can_write_grasp_results(self) -> bool:
+        if not self._results_output_dir:
+            self._log_once(
+                "Results output directory is not set. Grasp results will not be written for this workflow.", "warn"
+            )
+            return False
+
+        if not self.gripper_path:
+            carb.log_warn("Cannot write results: Gripper path is not set.")
+            return False
+        return True
+
+    def _write_grasp_result(self, location: Gf.Vec3d, orientation: Gf.Quatd, joint_states: dict[str, float]):
+        if self._results_output_format == RESULTS_FORMAT_COLUMNAR:
+            self._add_columnar_grasp_result(location, orientation, joint_states)
+        else:
+            self._write_grasp_result_data(self._create_grasp_result_data(location, orientation, joint_states))
+
+    def _add_columnar_grasp_result(self, location: Gf.Vec3d, orientation: Gf.Quatd, joint_states: dict[str, float]):
+        # Results written outside of an evaluation workflow are appended to the existing shards, the writer is kept
+        # open (buffering the results) until closed, or until the gripper or object of the results changes
+        writer = self._results_writer
+        if writer is not None and (
+            writer.gripper_path != self.gripper_path or writer.object_path != self.get_object_prim_path()
+        ):
+            self.close_results_writer()
+            writer = None
+        if writer is None:
+            writer = self._open_results_writer(overwrite=False)
+            if writer is None:
+                return
+        try:
+            writer.add(location, orientation, joint_states)
+        except Exception as e:
+            if not self._first_write_failure_logged_this_workflow:
+                carb.log_warn(f"Failed to write grasp results to {writer.output_dir}: {e}")
+                self._first_write_failure_logged_this_workflow = True
+
+    def _create_grasp_result_data(
+        self, location: Gf.Vec3d, orientation: Gf.Quatd, joint_states: dict[str, float]
+    ) -> dict:
+        return {
             "grasp_result": {
                 "gripper_path": self.gripper_path,
                 "object_path": self.get_object_prim_path(),
@@ -1118,6 +1451,7 @@ class GraspingManager:
             }
         }
 
+    def _write_grasp_result_data(self, result_data: dict):
         try:
             # Ensure the base output directory exists
             output_dir = self._results_output_dir
@@ -1130,12 +1464,16 @@ class GraspingManager:
             # --- Overwrite Logic --- #
             # If not overwriting, find the next available index
             if not self._overwrite_results_output:
+                # List the output directory once per workflow instead of probing the file system for every index
+                if self._existing_result_files is None:
+                    self._existing_result_files = set(os.listdir(output_dir))
                 current_index = self._write_frame_counter
-                while os.path.exists(full_output_path):
+                while output_filename in self._existing_result_files:
                     current_index += 1
                     output_filename = f"capture_{current_index}.yaml"
                     full_output_path = os.path.join(output_dir, output_filename)
                 self._write_frame_counter = current_index
+                self._existing_result_files.add(output_filename)
             # If overwriting, full_output_path already uses self._write_frame_counter
 
             # Open the specific file for writing (overwrite if exists and overwrite=True, or use new index if overwrite=False)
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 
+import math
 import os
 
 import carb
@@ -567,6 +568,93 @@ def duplicate_prim(stage: Usd.Stage, source_prim_path: str, destination_prim_pat
     return prim
 
 
+def find_articulation_root_prim(prim: Usd.Prim) -> Usd.Prim | None:
+    """Find the first prim with the UsdPhysics.ArticulationRootAPI under the given prim (including itself)."""
+    for descendant in Usd.PrimRange(prim, Usd.TraverseInstanceProxies(Usd.PrimAllPrimsPredicate)):
+        if descendant.HasAPI(UsdPhysics.ArticulationRootAPI):
+            return descendant
+    return None
+
+
+def create_grasping_envs(
+    stage: Usd.Stage, source_prim_paths: dict[str, str], root_path: str, num_envs: int, env_spacing: float
+) -> list[str]:
+    """Create a grid of environments referencing the given source prims.
+
+    Each environment ``{root_path}/env_{i}`` is an Xform translated on a square grid with the given spacing, holding
+    one child per entry of ``source_prim_paths`` that internally references the source prim. The environments are
+    authored with the Sdf API in a single change block and are forced active so they are simulated even if the
+    source prims are deactivated.
+
+    Args:
+        stage: The USD stage.
+        source_prim_paths: Mapping of the child prim name in each environment to the source prim path to reference.
+        root_path: The path of the Xform holding all the environments.
+        num_envs: The number of environments to create (> 0).
+        env_spacing: The distance between neighboring environments in stage units.
+
+    Returns:
+        The paths of the created environments.
+
+    Raises:
+        ValueError: If num_envs <= 0 or a prim already exists at root_path.
+    """
+    if num_envs <= 0:
+        raise ValueError("num_envs must be positive.")
+    if stage.GetPrimAtPath(root_path):
+        raise ValueError(f"Prim already exists at grasping environments root path: {root_path}")
+
+    layer = stage.GetEditTarget().GetLayer()
+    num_columns = math.ceil(math.sqrt(num_envs))
+    env_paths = []
+    with Sdf.ChangeBlock():
+        root_spec = Sdf.CreatePrimInLayer(layer, root_path)
+        root_spec.specifier = Sdf.SpecifierDef
+        root_spec.typeName = "Xform"
+        for env_index in range(num_envs):
+            env_path = f"{root_path}/env_{env_index}"
+            env_spec = Sdf.CreatePrimInLayer(layer, env_path)
+            env_spec.specifier = Sdf.SpecifierDef
+            env_spec.typeName = "Xform"
+            env_origin = Gf.Vec3d(
+                (env_index % num_columns) * env_spacing, (env_index // num_columns) * env_spacing, 0.0
+            )
+            Sdf.AttributeSpec(env_spec, "xformOp:translate", Sdf.ValueTypeNames.Double3).default = env_origin
+            Sdf.AttributeSpec(env_spec, "xformOpOrder", Sdf.ValueTypeNames.TokenArray).default = ["xformOp:translate"]
+            for name, source_prim_path in source_prim_paths.items():
+                child_spec = Sdf.CreatePrimInLayer(layer, f"{env_path}/{name}")
+                child_spec.specifier = Sdf.SpecifierDef
+                child_spec.active = True
+                child_spec.referenceList.Prepend(Sdf.Reference(primPath=source_prim_path))
+            env_paths.append(env_path)
+    return env_paths
+
+
+def set_prims_transform_matrices(stage: Usd.Stage, prim_paths: list[str], transforms: list[Gf.Matrix4d]) -> None:
+    """Set the local transform of the given prims to a single transform op, authored in one Sdf change block.
+
+    Any xformOps inherited from references are dropped from the xformOpOrder, so the given matrices fully define
+    the local transforms of the prims.
+
+    Args:
+        stage: The USD stage.
+        prim_paths: The paths of the prims to set the transforms for.
+        transforms: The local transformation matrices, one per prim path.
+    """
+    layer = stage.GetEditTarget().GetLayer()
+    with Sdf.ChangeBlock():
+        for prim_path, transform in zip(prim_paths, transforms):
+            prim_spec = Sdf.CreatePrimInLayer(layer, prim_path)
+            transform_spec = prim_spec.attributes.get("xformOp:transform")
+            if transform_spec is None:
+                transform_spec = Sdf.AttributeSpec(prim_spec, "xformOp:transform", Sdf.ValueTypeNames.Matrix4d)
+            transform_spec.default = transform
+            op_order_spec = prim_spec.attributes.get("xformOpOrder")
+            if op_order_spec is None:
+                op_order_spec = Sdf.AttributeSpec(prim_spec, "xformOpOrder", Sdf.ValueTypeNames.TokenArray)
+                op_order_spec.default = ["xformOp:transform"]
+
+
 def get_gripper_joints_info(gripper_prim_path: str) -> list[dict]:
     """Get all the joints from the gripper prim at the given path with their relevant information."""
     stage = omni.usd.get_context().get_stage()
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+
+import numpy as np
+import omni.kit.test
+from isaacsim.replicator.grasping.grasp_results import MANIFEST_FILE_NAME, GraspResultsReader, GraspResultsWriter
+
+
+class TestGraspResults(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self._output_dir = os.path.join(self._temp_dir.name, "results")
+
+    async def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def write_results(self, num_results, start=0, **kwargs):
+        with GraspResultsWriter(self._output_dir, gripper_path="/Gripper", object_path="/Object", **kwargs) as writer:
+            for index in range(start, start + num_results):
+                joint_states = {"joints/drive_joint": index * 0.5}
+                if index % 2:
+                    joint_states["joints/finger_joint"] = -index
+                writer.add((index, 0.0, 1.0), (1.0, 0.0, 0.0, 0.0), joint_states, metrics={"success": index % 3 == 0})
+
+    async def test_write_read_results(self):
+        self.write_results(10, shard_size=4)
+        with open(os.path.join(self._output_dir, MANIFEST_FILE_NAME)) as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest["num_results"], 10)
+        self.assertEqual([shard["num_results"] for shard in manifest["shards"]], [4, 4, 2])
+
+        reader = GraspResultsReader(self._output_dir)
+        self.assertEqual(len(reader), 10)
+        self.assertEqual(reader.joint_names, ["joints/drive_joint", "joints/finger_joint"])
+        self.assertEqual(reader.metric_names, ["success"])
+
+        results = reader.load()
+        self.assertEqual(results["locations"].shape, (10, 3))
+        self.assertTrue(np.array_equal(results["locations"][:, 0], np.arange(10)))
+        self.assertTrue(np.array_equal(results["joint_positions"][:, 0], np.arange(10) * 0.5))
+        self.assertTrue(np.isnan(results["joint_positions"][0, 1]))
+        self.assertEqual(results["joint_positions"][3, 1], -3)
+        self.assertTrue(np.array_equal(results["metrics"]["success"], np.arange(10) % 3 == 0))
+
+        result = list(reader.iter_results())[1]["grasp_result"]
+        self.assertEqual(result["gripper_path"], "/Gripper")
+        self.assertEqual(result["gripper_location"], [1.0, 0.0, 1.0])
+        self.assertEqual(result["gripper_orientation"], {"w": 1.0, "xyz": [0.0, 0.0, 0.0]})
+        self.assertEqual(result["joint_states"], {"joints/drive_joint": 0.5, "joints/finger_joint": -1.0})
+
+    async def test_append_and_overwrite(self):
+        self.write_results(3, compress=True)
+        self.write_results(2, start=3)
+        reader = GraspResultsReader(self._output_dir)
+        self.assertEqual(len(reader), 5)
+        self.assertEqual(len(reader.shards), 2)
+        self.assertTrue(np.array_equal(reader.load()["locations"][:, 0], np.arange(5)))
+
+        self.write_results(1, start=7, overwrite=True)
+        reader = GraspResultsReader(self._output_dir)
+        self.assertEqual(len(reader), 1)
+        self.assertEqual(sorted(os.listdir(self._output_dir)), [MANIFEST_FILE_NAME, "shard_00000000.npz"])
+        self.assertEqual(reader.load()["locations"][0, 0], 7)
@@ -15,10 +15,16 @@
 
 import os
 
+import isaacsim.replicator.grasping.grasping_utils as grasping_utils
 import omni.kit.app
 import omni.usd
 from isaacsim.core.utils.extensions import get_extension_path_from_name
-from isaacsim.replicator.grasping.grasping_manager import GraspingManager
+from isaacsim.replicator.grasping.grasp_results import GraspResultsReader
+from isaacsim.replicator.grasping.grasping_manager import (
+    GRASPING_ENVS_ROOT_PATH,
+    RESULTS_FORMAT_COLUMNAR,
+    GraspingManager,
+)
 from isaacsim.storage.native import get_assets_root_path_async
 
 from .common import check_grasp_pose_generation_dependencies
@@ -149,3 +155,67 @@ class TestGraspingWorkflow((omni.kit.test.AsyncTestCase)):
         # Check that the expected files are present in the output directory
         expected_num_files = 4
         self.assertEqual(len(os.listdir(output_dir)), expected_num_files)
+
+    async def test_grasping_workflow_batched(self):
+        if not check_grasp_pose_generation_dependencies():
+            print("Warning: Skipping test because grasp pose generation dependencies are not installed.")
+            return
+
+        assets_root_path = await get_assets_root_path_async()
+        await omni.usd.get_context().open_stage_async(
+            assets_root_path + "/Isaac/Samples/Replicator/Stage/sdg_grasping_xarm.usd"
+        )
+        stage = omni.usd.get_context().get_stage()
+
+        ext_path = get_extension_path_from_name("isaacsim.replicator.grasping")
+        config_path = os.path.join(ext_path, "data/gripper_configs/xarm_antipodal_soup_can.yaml")
+        grasping_manager = GraspingManager()
+        grasping_manager.load_config(config_path)
+        self.assertTrue(grasping_manager.generate_grasp_poses())
+        poses_to_evaluate = grasping_manager.get_grasp_poses(in_world_frame=True)[:6]
+
+        output_dir = os.path.join(os.getcwd(), "xarm_antipodal_batched")
+        grasping_manager.set_results_output_dir(output_dir)
+        grasping_manager.set_overwrite_results_output(True)
+
+        evaluated_counts = []
+
+        async def progress_callback(num_evaluated):
+            evaluated_counts.append(num_evaluated)
+
+        await grasping_manager.evaluate_grasp_poses(
+            grasp_poses=poses_to_evaluate, render=False, progress_callback=progress_callback, num_envs=4
+        )
+        # Two batches (4 + 2 poses), one result file per pose
+        self.assertEqual(evaluated_counts, [4, len(poses_to_evaluate)])
+        result_files = sorted(os.listdir(output_dir))
+        self.assertEqual(len(result_files), len(poses_to_evaluate))
+        result_data = grasping_utils.read_yaml_config(os.path.join(output_dir, result_files[0]))
+        self.assertEqual(result_data["grasp_result"]["gripper_path"], grasping_manager.gripper_path)
+        self.assertIn("joints/drive_joint", result_data["grasp_result"]["joint_states"])
+
+        # The cloned environments are removed and the source prims restored after the evaluation
+        self.assertFalse(stage.GetPrimAtPath(GRASPING_ENVS_ROOT_PATH))
+        self.assertTrue(grasping_manager.gripper_prim.IsActive())
+        self.assertTrue(grasping_manager.get_object_prim().IsActive())
+
+        # Columnar results are buffered and written as shards with a manifest
+        columnar_output_dir = os.path.join(os.getcwd(), "xarm_antipodal_batched_columnar")
+        grasping_manager.set_results_output_dir(columnar_output_dir)
+        grasping_manager.set_results_output_format(RESULTS_FORMAT_COLUMNAR)
+        await grasping_manager.evaluate_grasp_poses(grasp_poses=poses_to_evaluate, render=False, num_envs=4)
+        reader = GraspResultsReader(columnar_output_dir)
+        self.assertEqual(len(reader), len(poses_to_evaluate))
+        self.assertIn("joints/drive_joint", reader.joint_names)
+        self.assertEqual(reader.load()["locations"].shape, (len(poses_to_evaluate), 3))
+
+        # Results written outside of a workflow are buffered by a single open writer (one shard, not one per result)
+        num_shards = len(reader.shards)
+        joint_states = {"joints/drive_joint": 0.0}
+        for _ in range(3):
+            grasping_manager.write_grasp_results_batch(poses_to_evaluate[:1], [joint_states])
+        grasping_manager.close_results_writer()
+        reader = GraspResultsReader(columnar_output_dir)
+        self.assertEqual(len(reader), len(poses_to_evaluate) + 3)
+        self.assertEqual(len(reader.shards), num_shards + 1)
+        grasping_manager.clear()
@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import omni.kit.test
+
+from .common import check_grasp_pose_generation_dependencies
+
+SAMPLER_CONFIG = {
+    "num_candidates": 400,
+    "num_orientations": 4,
+    "gripper_maximum_aperture": 0.08,
+    "gripper_standoff_fingertips": 0.1,
+    "gripper_approach_direction": (0, 0, 1),
+    "grasp_align_axis": (0, 1, 0),
+    "orientation_sample_axis": (0, 1, 0),
+    "random_seed": 12,
+}
+
+
+class TestSamplerUtils(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        pass
+
+    async def tearDown(self):
+        pass
+
+    def check_grasp_transforms(self, mesh, grasp_transforms, lateral_sigma=0.0):
+        import trimesh
+
+        grasp_transforms = np.asarray(grasp_transforms)
+        rotations = grasp_transforms[:, :3, :3]
+        # Valid rigid transforms
+        self.assertTrue(np.allclose(rotations @ rotations.transpose(0, 2, 1), np.eye(3), atol=1e-6))
+        self.assertTrue(np.allclose(np.linalg.det(rotations), 1.0, atol=1e-6))
+        self.assertTrue(np.allclose(grasp_transforms[:, 3], [0, 0, 0, 1]))
+        # The grasp centers (fingertip midpoint, standoff removed) are inside the object
+        approach = rotations @ np.array(SAMPLER_CONFIG["gripper_approach_direction"], dtype=float)
+        centers = grasp_transforms[:, :3, 3] + approach * SAMPLER_CONFIG["gripper_standoff_fingertips"]
+        extents = mesh.bounds + np.array([[-trimesh.tol.merge], [trimesh.tol.merge]])
+        self.assertTrue(np.all((centers >= extents[0]) & (centers <= extents[1])))
+        if lateral_sigma == 0.0:
+            # Grasp axes are aligned with the box faces, so the centers lie on the box mid-planes
+            on_mid_plane = np.isclose(np.abs(centers), 0.0, atol=1e-9).any(axis=1)
+            self.assertTrue(np.all(on_mid_plane))
+
+    async def test_sample_antipodal_box(self):
+        if not check_grasp_pose_generation_dependencies():
+            print("Warning: Skipping test because grasp pose generation dependencies are not installed.")
+            return
+        import isaacsim.replicator.grasping.sampler_utils as sampler_utils
+        import trimesh
+
+        mesh = trimesh.creation.box((0.04, 0.06, 0.2))
+        grasp_transforms = sampler_utils.sample_antipodal(mesh, **SAMPLER_CONFIG)
+        # Every surface sample of a box has an opposing face; only the 0.2 wide axis exceeds the aperture
+        self.assertGreater(len(grasp_transforms), 0)
+        self.assertLessEqual(len(grasp_transforms), SAMPLER_CONFIG["num_candidates"])
+        self.assertEqual(len(grasp_transforms) % SAMPLER_CONFIG["num_orientations"], 0)
+        self.check_grasp_transforms(mesh, grasp_transforms)
+
+        grasp_transforms = sampler_utils.sample_antipodal(mesh, lateral_sigma=0.01, **SAMPLER_CONFIG)
+        self.check_grasp_transforms(mesh, grasp_transforms, lateral_sigma=0.01)
+
+    async def test_sample_antipodal_chunks(self):
+        if not check_grasp_pose_generation_dependencies():
+            print("Warning: Skipping test because grasp pose generation dependencies are not installed.")
+            return
+        import isaacsim.replicator.grasping.sampler_utils as sampler_utils
+        import trimesh
+
+        mesh = trimesh.creation.box((0.04, 0.06, 0.2))
+        chunks = list(sampler_utils.sample_antipodal_chunks(mesh, chunk_size=100, **SAMPLER_CONFIG))
+        self.assertEqual(len(chunks), 4)
+        for chunk in chunks:
+            self.assertEqual(chunk.shape[1:], (4, 4))
+            self.assertLessEqual(len(chunk), 100)
+            self.check_grasp_transforms(mesh, chunk)
+
+        # Apertures smaller than the object reject every candidate
+        grasp_transforms = sampler_utils.sample_antipodal(
+            mesh, **{**SAMPLER_CONFIG, "gripper_maximum_aperture": 0.01, "chunk_size": 64}
+        )
+        self.assertEqual(len(grasp_transforms), 0)
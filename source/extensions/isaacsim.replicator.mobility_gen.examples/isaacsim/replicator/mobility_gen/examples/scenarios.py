@@ -21,7 +21,7 @@ import PIL.Image
 from isaacsim.replicator.mobility_gen.impl.common import Buffer, Module
 from isaacsim.replicator.mobility_gen.impl.inputs import Gamepad, Keyboard
 from isaacsim.replicator.mobility_gen.impl.occupancy_map import OccupancyMap
-from isaacsim.replicator.mobility_gen.impl.path_planner import compress_path, generate_paths
+from isaacsim.replicator.mobility_gen.impl.path_planner import compress_path, get_path_planner
 from isaacsim.replicator.mobility_gen.impl.pose_samplers import GridPoseSampler, UniformPoseSampler
 from isaacsim.replicator.mobility_gen.impl.robot import MobilityGenRobot
 
@@ -161,11 +161,11 @@ class RandomPathFollowingScenario(MobilityGenScenario):
         current_pose = self.robot.get_pose_2d()
 
         start_px = self.occupancy_map.world_to_pixel_numpy(np.array([[current_pose.x, current_pose.y]]))
-        freespace = self.buffered_occupancy_map.freespace_mask()
+        planner = get_path_planner(self.buffered_occupancy_map)
 
         start = (start_px[0, 1], start_px[0, 0])
 
-        output = generate_paths(start, freespace)
+        output = planner.generate_paths(start)
         end = output.sample_random_end_point()
         path = output.unroll_path(end)
         path, _ = compress_path(path)  # remove redundant points
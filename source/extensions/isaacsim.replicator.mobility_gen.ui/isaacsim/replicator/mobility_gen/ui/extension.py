@@ -156,6 +156,7 @@ class MobilityGenExtension(omni.ext.IExt):
         return SCENARIOS.get_index(index)
 
     def on_shutdown(self):
+        self.close_writer()
         self.keyboard.disconnect()
         self.gamepad.disconnect()
         world = get_world()
@@ -165,7 +166,7 @@ class MobilityGenExtension(omni.ext.IExt):
     def start_new_recording(self):
         recording_name = datetime.datetime.now().isoformat()
         recording_path = os.path.join(RECORDINGS_DIR, recording_name)
-        writer = MobilityGenWriter(recording_path)
+        writer = MobilityGenWriter(recording_path, num_workers=1)
         writer.write_config(self.config)
         writer.write_occupancy_map(self.scenario.occupancy_map)
         writer.copy_stage(self.cached_stage_path)
@@ -176,8 +177,13 @@ class MobilityGenExtension(omni.ext.IExt):
         self.writer = writer
         self.update_recording_count()
 
+    def close_writer(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
     def clear_recording(self):
-        self.writer = None
+        self.close_writer()
         self.recording_name_label.text = "Current recording name: "
         self.recording_step_label.text = "Current recording duration: "
 
@@ -196,7 +202,7 @@ class MobilityGenExtension(omni.ext.IExt):
         self.clear_recording()
 
     def reset(self):
-        self.writer = None
+        self.close_writer()
         self.scenario.reset()
         if self.recording_enabled:
             self.start_new_recording()
@@ -139,6 +139,9 @@ void generatePaths(py::array_t<int64_t> startPoint,
     auto parentRowMapUnchecked = parentRowMap.mutable_unchecked<2>();
     auto parentColumnMapUnchecked = parentColumnMap.mutable_unchecked<2>();
 
+    // The search only touches the array buffers, release the GIL so that searches can run from several threads
+    py::gil_scoped_release release;
+
     std::priority_queue<PriorityQueueItem, std::vector<PriorityQueueItem>, PriorityQueueCompare> queue;
 
     // Initialize
@@ -181,6 +184,99 @@ void generatePaths(py::array_t<int64_t> startPoint,
     }
 }
 
+double getHeuristic(const Point& point, const Point& goal)
+{
+    // Octile distance, exact cost of the shortest 8-connected path without obstacles
+    double rowOffset = (double)std::abs(goal.row - point.row);
+    double columnOffset = (double)std::abs(goal.column - point.column);
+    return std::max(rowOffset, columnOffset) + (std::sqrt(2.0) - 1.0) * std::min(rowOffset, columnOffset);
+}
+
+bool findPath(py::array_t<int64_t> startPoint,
+              py::array_t<int64_t> goalPoint,
+              py::array_t<uint8_t> freespaceMap,
+              py::array_t<uint8_t> visitedMap,
+              py::array_t<double> distanceToStartMap,
+              py::array_t<int64_t> parentRowMap,
+              py::array_t<int64_t> parentColumnMap)
+{
+    // A* search from start to goal.
+    // The caller is expected to initialize visitedMap to 0, distanceToStartMap to +inf and the parent maps to -1.
+
+    int64_t rowCount = freespaceMap.shape(0);
+    int64_t columnCount = freespaceMap.shape(1);
+    auto startPointUnchecked = startPoint.unchecked<1>();
+    auto goalPointUnchecked = goalPoint.unchecked<1>();
+
+    Point start = { startPointUnchecked(0), startPointUnchecked(1) };
+    Point goal = { goalPointUnchecked(0), goalPointUnchecked(1) };
+
+    auto freespaceMapUnchecked = freespaceMap.unchecked<2>();
+    auto visitedMapUnchecked = visitedMap.mutable_unchecked<2>();
+    auto distanceToStartMapUnchecked = distanceToStartMap.mutable_unchecked<2>();
+    auto parentRowMapUnchecked = parentRowMap.mutable_unchecked<2>();
+    auto parentColumnMapUnchecked = parentColumnMap.mutable_unchecked<2>();
+
+    // Start and goal out of the map (or not in freespace) are not reachable
+    auto isInMap = [rowCount, columnCount](const Point& point)
+    { return point.row >= 0 && point.row < rowCount && point.column >= 0 && point.column < columnCount; };
+    if (!isInMap(start) || !isInMap(goal))
+    {
+        return false;
+    }
+    if (!freespaceMapUnchecked(start.row, start.column) || !freespaceMapUnchecked(goal.row, goal.column))
+    {
+        return false;
+    }
+
+    // The search only touches the array buffers, release the GIL so that searches can run from several threads
+    py::gil_scoped_release release;
+
+    std::priority_queue<PriorityQueueItem, std::vector<PriorityQueueItem>, PriorityQueueCompare> queue;
+
+    // Initialize
+    distanceToStartMapUnchecked(start.row, start.column) = 0.0;
+    queue.push({ getHeuristic(start, goal), start });
+
+    // Search
+    while (!queue.empty())
+    {
+        PriorityQueueItem node = queue.top();
+
+        queue.pop();
+
+        // Skip stale queue entries of already expanded nodes
+        if (visitedMapUnchecked(node.point.row, node.point.column))
+            continue;
+
+        visitedMapUnchecked(node.point.row, node.point.column) = true;
+
+        if (node.point == goal)
+            return true;
+
+        std::vector<Point> children =
+            getChildren(node.point, freespaceMapUnchecked, visitedMapUnchecked, rowCount, columnCount);
+
+        for (unsigned int i = 0; i < children.size(); i++)
+        {
+            Point child = children[i];
+
+            double childDistanceToStart =
+                distanceToStartMapUnchecked(node.point.row, node.point.column) + getDistance(node.point, child);
+
+            if (childDistanceToStart < distanceToStartMapUnchecked(child.row, child.column))
+            {
+                distanceToStartMapUnchecked(child.row, child.column) = childDistanceToStart;
+                parentRowMapUnchecked(child.row, child.column) = node.point.row;
+                parentColumnMapUnchecked(child.row, child.column) = node.point.column;
+                queue.push({ childDistanceToStart + getHeuristic(child, goal), child });
+            }
+        }
+    }
+
+    return false;
+}
+
 std::vector<std::pair<int64_t, int64_t>> unrollPath(py::array_t<int64_t> endPoint,
                                                     py::array_t<int64_t> parentRowMap,
                                                     py::array_t<int64_t> parentColumnMap)
@@ -215,5 +311,6 @@ PYBIND11_MODULE(_path_planner, m)
 {
     m.doc() = "MobilityGen Path Planner C++ Bindings";
     m.def("generate_paths", &generatePaths, "Generate paths");
+    m.def("find_path", &findPath, "Find a path from start to goal with A*");
     m.def("unroll_path", &unrollPath, "Unroll a path");
 }
@@ -13,13 +13,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import random
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Callable, List, Tuple
 
 import numpy as np
 
 from ..bindings import _path_planner
+from .occupancy_map import OccupancyMap
 
 
 @dataclass
@@ -34,6 +39,14 @@ class GeneratePathsOutput:
         path = _path_planner.unroll_path(end, self.prev_i, self.prev_j)
         return np.array(path)
 
+    def copy(self) -> "GeneratePathsOutput":
+        return GeneratePathsOutput(
+            visited=self.visited.copy(),
+            distance_to_start=self.distance_to_start.copy(),
+            prev_i=self.prev_i.copy(),
+            prev_j=self.prev_j.copy(),
+        )
+
     def get_valid_end_points(self):
         return np.where(self.visited != 0)
 
@@ -61,6 +74,188 @@ def generate_paths(start: Tuple[int, int], freespace: np.ndarray) -> GeneratePat
     return GeneratePathsOutput(visited=visited, distance_to_start=distance_to_start, prev_i=prev_i, prev_j=prev_j)
 
 
+class _Workspace:
+    """Search buffers reused across path planner queries."""
+
+    def __init__(self, shape: Tuple[int, int]):
+        self.visited = np.zeros(shape, dtype=np.uint8)
+        self.distance_to_start = np.zeros(shape, dtype=np.float64)
+        self.prev_i = np.empty(shape, dtype=np.int64)
+        self.prev_j = np.empty(shape, dtype=np.int64)
+
+    def reset(self, distance: float = 0.0):
+        self.visited.fill(0)
+        self.distance_to_start.fill(distance)
+        self.prev_i.fill(-1)
+        self.prev_j.fill(-1)
+
+    def output(self) -> GeneratePathsOutput:
+        return GeneratePathsOutput(
+            visited=self.visited, distance_to_start=self.distance_to_start, prev_i=self.prev_i, prev_j=self.prev_j
+        )
+
+
+class PathPlanner:
+    """Path planner over a fixed freespace mask.
+
+    Unlike :func:`generate_paths`, the planner keeps its search buffers (one set per thread) and reuses them across
+    queries, so repeated queries on the same map do not allocate full-map arrays. A planner can be queried from
+    several threads at once. Several start points can be
+    searched in parallel with :meth:`generate_paths_batch`, and a single start/goal query can be answered
+    with a goal-directed A* search with :meth:`find_path`.
+
+    Use :func:`get_path_planner` to get a planner cached per occupancy map and buffer radius.
+
+    Args:
+        freespace (np.ndarray): Binary mask of the freespace, indexed as (row, column).
+    """
+
+    def __init__(self, freespace: np.ndarray):
+        self.freespace = np.ascontiguousarray(freespace, dtype=np.uint8)
+        self._workspaces = []
+        self._workspaces_lock = threading.Lock()
+        self._thread_local = threading.local()
+
+    def _thread_workspace(self) -> _Workspace:
+        # The native searches release the GIL, so each thread needs its own buffers
+        workspace = getattr(self._thread_local, "workspace", None)
+        if workspace is None:
+            workspace = self._thread_local.workspace = _Workspace(self.freespace.shape)
+        return workspace
+
+    def _acquire_workspace(self) -> _Workspace:
+        with self._workspaces_lock:
+            if self._workspaces:
+                return self._workspaces.pop()
+        return _Workspace(self.freespace.shape)
+
+    def _release_workspace(self, workspace: _Workspace):
+        with self._workspaces_lock:
+            self._workspaces.append(workspace)
+
+    def _search(self, workspace: _Workspace, start: Tuple[int, int]):
+        workspace.reset()
+        _path_planner.generate_paths(
+            np.array([start[0], start[1]], dtype=np.int64),
+            self.freespace,
+            workspace.visited,
+            workspace.distance_to_start,
+            workspace.prev_i,
+            workspace.prev_j,
+        )
+
+    def generate_paths(self, start: Tuple[int, int], copy: bool = False) -> GeneratePathsOutput:
+        """Generate the paths from a start point to every reachable point of the freespace.
+
+        Args:
+            start (Tuple[int, int]): Start point as (row, column).
+            copy (bool, optional): Whether to return a copy of the search buffers. If False, the returned
+                output is backed by the planner buffers of the calling thread and is only valid until the next
+                call from that thread. Defaults to False.
+
+        Returns:
+            GeneratePathsOutput: The search output.
+        """
+        workspace = self._thread_workspace()
+        self._search(workspace, start)
+        output = workspace.output()
+        return output.copy() if copy else output
+
+    def generate_paths_batch(
+        self,
+        starts: List[Tuple[int, int]],
+        fn: Callable[[GeneratePathsOutput], any] | None = None,
+        num_workers: int | None = None,
+    ) -> List:
+        """Generate the paths from several start points in parallel.
+
+        Each worker thread owns a set of search buffers that is reused for all the start points it processes.
+
+        Args:
+            starts (List[Tuple[int, int]]): Start points as (row, column).
+            fn (Callable[[GeneratePathsOutput], any] | None, optional): Function applied to the output of each
+                search while its buffers are valid (e.g. ``lambda output: output.sample_random_path()``). If None,
+                a copy of each search output is returned. Defaults to None.
+            num_workers (int | None, optional): Number of worker threads. Defaults to the number of CPUs.
+
+        Returns:
+            List: The result of ``fn`` (or the search output) for each start point, in order.
+        """
+        if fn is None:
+            fn = GeneratePathsOutput.copy
+
+        def run(start):
+            workspace = self._acquire_workspace()
+            try:
+                self._search(workspace, start)
+                return fn(workspace.output())
+            finally:
+                self._release_workspace(workspace)
+
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        num_workers = max(1, min(num_workers, len(starts)))
+        if num_workers == 1:
+            return [run(start) for start in starts]
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            return list(executor.map(run, starts))
+
+    def find_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> np.ndarray | None:
+        """Find the shortest path between a start and a goal point with a goal-directed A* search.
+
+        Args:
+            start (Tuple[int, int]): Start point as (row, column).
+            goal (Tuple[int, int]): Goal point as (row, column).
+
+        Returns:
+            np.ndarray | None: The path as an array of (row, column) points, or None if the goal is not reachable
+            (including a start or goal point outside of the map).
+        """
+        workspace = self._thread_workspace()
+        workspace.reset(distance=np.inf)
+        found = _path_planner.find_path(
+            np.array([start[0], start[1]], dtype=np.int64),
+            np.array([goal[0], goal[1]], dtype=np.int64),
+            self.freespace,
+            workspace.visited,
+            workspace.distance_to_start,
+            workspace.prev_i,
+            workspace.prev_j,
+        )
+        if not found:
+            return None
+        return workspace.output().unroll_path(goal)
+
+
+_path_planner_cache = weakref.WeakKeyDictionary()
+_path_planner_cache_lock = threading.Lock()
+
+
+def get_path_planner(occupancy_map: OccupancyMap, buffer_distance_pixels: int = 0) -> PathPlanner:
+    """Get the path planner of an occupancy map, cached per occupancy map and buffer radius.
+
+    Args:
+        occupancy_map (OccupancyMap): The occupancy map.
+        buffer_distance_pixels (int, optional): Radius (in pixels) used to buffer the occupied regions
+            before planning. See :meth:`OccupancyMap.buffered`. Defaults to 0.
+
+    Returns:
+        PathPlanner: The path planner over the (buffered) freespace of the occupancy map.
+    """
+    buffer_distance_pixels = int(buffer_distance_pixels)
+    with _path_planner_cache_lock:
+        planners = _path_planner_cache.setdefault(occupancy_map, {})
+        planner = planners.get(buffer_distance_pixels)
+        if planner is None:
+            if buffer_distance_pixels > 0:
+                freespace = occupancy_map.buffered(buffer_distance_pixels).freespace_mask()
+            else:
+                freespace = occupancy_map.freespace_mask()
+            planner = PathPlanner(freespace)
+            planners[buffer_distance_pixels] = planner
+    return planner
+
+
 def compress_path(path: np.ndarray, eps=1e-3):
     pref = path[1:-1]
     pnext = path[2:]
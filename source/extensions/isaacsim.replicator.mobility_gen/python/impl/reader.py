@@ -15,20 +15,121 @@
 
 
 import glob
+import json
 import os
+import threading
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import PIL.Image
 
 from .config import Config
 from .occupancy_map import OccupancyMap
+from .writer import CHUNKED_FORMAT, CHUNKED_FORMAT_VERSION, LEGACY_FORMAT
+
+
+class _Chunk:
+    """Lazy column access to a single chunk of a chunked recording."""
+
+    def __init__(self, chunk_folder: str, info: dict):
+        self.offset = info["offset"]
+        self.num_steps = info["num_steps"]
+        self._columns = {}
+        if info["compressed"]:
+            self._archive = np.load(os.path.join(chunk_folder, f"{info['name']}.npz"), allow_pickle=True)
+            self._keys = set(self._archive.files)
+            self._folder = None
+        else:
+            self._archive = None
+            self._folder = os.path.join(chunk_folder, info["name"])
+            self._keys = None
+
+    def steps(self) -> np.ndarray:
+        if self._archive is not None:
+            return self._archive["steps"]
+        return np.load(os.path.join(self._folder, "steps.npy"))
+
+    def column(self, group: str, name: str) -> np.ndarray | None:
+        key = f"{group}/{name}"
+        if key not in self._columns:
+            if self._archive is not None:
+                self._columns[key] = self._archive[key] if key in self._keys else None
+            else:
+                path = os.path.join(self._folder, group, f"{name}.npy")
+                if os.path.exists(path):
+                    # numeric columns are memory-mapped, object columns need to be unpickled
+                    try:
+                        self._columns[key] = np.load(path, mmap_mode="r")
+                    except ValueError:
+                        self._columns[key] = np.load(path, allow_pickle=True)
+                else:
+                    self._columns[key] = None
+        return self._columns[key]
+
+    def value(self, group: str, name: str, local_index: int):
+        column = self.column(group, name)
+        if column is None:
+            return None
+        return column[local_index]
+
+    def load(self, columns: dict):
+        """Read all columns into memory (used for prefetching)."""
+        for group, names in columns.items():
+            for name in names:
+                column = self.column(group, name)
+                if isinstance(column, np.memmap):
+                    self._columns[f"{group}/{name}"] = np.array(column)
+        return self
 
 
 class MobilityGenReader:
+    """Reader for MobilityGen recordings.
 
-    def __init__(self, recording_path: str):
+    Both the chunked and the legacy recording layouts (see :class:`MobilityGenWriter`) are supported.
+    The layout is detected from the presence of ``state/index.json``.
+
+    Args:
+        recording_path (str): Recording directory.
+        cache_size (int, optional): Maximum number of chunks kept open (chunked layout only). Defaults to 4.
+    """
+
+    def __init__(self, recording_path: str, cache_size: int = 4):
         self.recording_path = recording_path
+        self.cache_size = max(1, cache_size)
+
+        index_path = os.path.join(self.recording_path, "state", "index.json")
+        if os.path.exists(index_path):
+            self._init_chunked(index_path)
+        else:
+            self._init_legacy()
+
+    def _init_chunked(self, index_path: str):
+        with open(index_path, "r") as f:
+            index = json.load(f)
+        if index.get("version", 0) > CHUNKED_FORMAT_VERSION:
+            raise ValueError(f"Unsupported chunked recording version {index['version']} in {self.recording_path}")
+        self.format = CHUNKED_FORMAT
+        self._columns = index["columns"]
+        self._chunk_infos = index["chunks"]
+        self._chunk_offsets = np.asarray([info["offset"] for info in self._chunk_infos], dtype=np.int64)
+        self._chunk_folder = os.path.join(self.recording_path, "state", "chunks")
+
+        self.steps = []
+        for info in self._chunk_infos:
+            self.steps.extend(_Chunk(self._chunk_folder, info).steps().tolist())
+        self._chunk_cache = OrderedDict()
+        self._chunk_lock = threading.Lock()
+        self._prefetch_futures = {}
+        self._executor = None
+
+        self.rgb_names = list(self._columns.get("rgb", []))
+        self.segmentation_names = list(self._columns.get("segmentation", []))
+        self.depth_names = list(self._columns.get("depth", []))
+        self.normals_names = list(self._columns.get("normals", []))
+
+    def _init_legacy(self):
+        self.format = LEGACY_FORMAT
 
         state_dict_paths = glob.glob(os.path.join(self.recording_path, "state", "common", "*.npy"))
 
@@ -45,6 +146,89 @@ class MobilityGenReader:
         self.depth_names = [os.path.basename(folder) for folder in self.depth_folders]
         self.normals_names = [os.path.basename(folder) for folder in self.normals_folders]
 
+    def _get_chunk(self, chunk_index: int) -> _Chunk:
+        with self._chunk_lock:
+            chunk = self._chunk_cache.get(chunk_index)
+            if chunk is not None:
+                self._chunk_cache.move_to_end(chunk_index)
+                return chunk
+            future = self._prefetch_futures.pop(chunk_index, None)
+        chunk = future.result() if future is not None else _Chunk(self._chunk_folder, self._chunk_infos[chunk_index])
+        with self._chunk_lock:
+            self._chunk_cache[chunk_index] = chunk
+            while len(self._chunk_cache) > self.cache_size:
+                self._chunk_cache.popitem(last=False)
+        return chunk
+
+    def _locate(self, index: int):
+        if index < 0:
+            index += len(self.steps)
+        if index < 0 or index >= len(self.steps):
+            raise IndexError(f"Step index {index} out of range for recording with {len(self.steps)} steps")
+        chunk_index = int(np.searchsorted(self._chunk_offsets, index, side="right")) - 1
+        return self._get_chunk(chunk_index), index - int(self._chunk_offsets[chunk_index])
+
+    def _read_chunked(self, group: str, name: str, index: int):
+        chunk, local_index = self._locate(index)
+        return chunk.value(group, name, local_index)
+
+    def _read_chunked_group(self, group: str, index: int) -> OrderedDict:
+        chunk, local_index = self._locate(index)
+        values = OrderedDict()
+        for name in self._columns.get(group, []):
+            values[name] = chunk.value(group, name, local_index)
+        return values
+
+    def prefetch_chunk(self, chunk_index: int):
+        """Load a chunk into memory in a background thread (chunked layout only).
+
+        Args:
+            chunk_index (int): Index of the chunk to prefetch. Out of range indices are ignored.
+        """
+        if self.format != CHUNKED_FORMAT or chunk_index < 0 or chunk_index >= len(self._chunk_infos):
+            return
+        with self._chunk_lock:
+            if chunk_index in self._chunk_cache or chunk_index in self._prefetch_futures:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            info = self._chunk_infos[chunk_index]
+            self._prefetch_futures[chunk_index] = self._executor.submit(
+                lambda: _Chunk(self._chunk_folder, info).load(self._columns)
+            )
+
+    def iter_state_dicts(self, start: int = 0, stop: int | None = None, step: int = 1, prefetch: bool = True):
+        """Iterate sequentially over the recording state dictionaries.
+
+        For chunked recordings the chunk following the one being read is loaded in the background.
+
+        Args:
+            start (int, optional): First step index. Defaults to 0.
+            stop (int | None, optional): Step index to stop at (exclusive). Defaults to the recording length.
+            step (int, optional): Stride between step indices. Defaults to 1.
+            prefetch (bool, optional): Whether to prefetch the next chunk (chunked layout only). Defaults to True.
+
+        Yields:
+            OrderedDict: Full state dictionary for each step.
+        """
+        if stop is None:
+            stop = len(self)
+        for index in range(start, stop, step):
+            if prefetch and self.format == CHUNKED_FORMAT:
+                chunk_index = int(np.searchsorted(self._chunk_offsets, index, side="right")) - 1
+                self.prefetch_chunk(chunk_index + 1)
+            yield self.read_state_dict(index)
+
+    def close(self):
+        """Release open chunks and stop the prefetch thread."""
+        if self.format != CHUNKED_FORMAT:
+            return
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._prefetch_futures.clear()
+        self._chunk_cache.clear()
+
     def read_config(self) -> Config:
         with open(os.path.join(self.recording_path, "config.json"), "r") as f:
             config = Config.from_json(f.read())
@@ -54,11 +238,15 @@ class MobilityGenReader:
         return OccupancyMap.from_ros_yaml(os.path.join(self.recording_path, "occupancy_map", "map.yaml"))
 
     def read_rgb(self, name: str, index: int):
+        if self.format == CHUNKED_FORMAT:
+            return self._read_chunked("rgb", name, index)
         step = self.steps[index]
         image = PIL.Image.open(os.path.join(self.recording_path, "state", "rgb", name, f"{step:08d}.jpg"))
         return np.asarray(image)
 
     def read_state_dict_rgb(self, index: int):
+        if self.format == CHUNKED_FORMAT:
+            return self._read_chunked_group("rgb", index)
         rgb_dict = OrderedDict()
         for name in self.rgb_names:
             data = self.read_rgb(name, index)
@@ -66,16 +254,22 @@ class MobilityGenReader:
         return rgb_dict
 
     def read_segmentation(self, name: str, index: int):
+        if self.format == CHUNKED_FORMAT:
+            return self._read_chunked("segmentation", name, index)
         step = self.steps[index]
         image = PIL.Image.open(os.path.join(self.recording_path, "state", "segmentation", name, f"{step:08d}.png"))
         return np.asarray(image)
 
     def read_normals(self, name: str, index: int):
+        if self.format == CHUNKED_FORMAT:
+            return self._read_chunked("normals", name, index)
         step = self.steps[index]
         data = np.load(os.path.join(self.recording_path, "state", "normals", name, f"{step:08d}.npy"))
         return data
 
     def read_state_dict_segmentation(self, index: int):
+        if self.format == CHUNKED_FORMAT:
+            return self._read_chunked_group("segmentation", index)
         segmentation_dict = OrderedDict()
         for name in self.segmentation_names:
             data = self.read_segmentation(name, index)
@@ -83,6 +277,9 @@ class MobilityGenReader:
         return segmentation_dict
 
     def read_depth(self, name: str, index: int, eps=1e-6):
+        if self.format == CHUNKED_FORMAT:
+            # depth is stored as raw values in chunked recordings
+            return self._read_chunked("depth", name, index)
         step = self.steps[index]
         image = PIL.Image.open(os.path.join(self.recording_path, "state", "depth", name, f"{step:08d}.png")).convert(
             "I;16"
@@ -91,6 +288,8 @@ class MobilityGenReader:
         return depth
 
     def read_state_dict_depth(self, index: int):
+        if self.format == CHUNKED_FORMAT:
+            return self._read_chunked_group("depth", index)
         depth_dict = OrderedDict()
         for name in self.depth_names:
             data = self.read_depth(name, index)
@@ -98,6 +297,8 @@ class MobilityGenReader:
         return depth_dict
 
     def read_state_dict_normals(self, index: int):
+        if self.format == CHUNKED_FORMAT:
+            return self._read_chunked_group("normals", index)
         normals_dict = OrderedDict()
         for name in self.normals_names:
             data = self.read_normals(name, index)
@@ -105,6 +306,8 @@ class MobilityGenReader:
         return normals_dict
 
     def read_state_dict_common(self, index: int):
+        if self.format == CHUNKED_FORMAT:
+            return self._read_chunked_group("common", index)
         step = self.steps[index]
         state_dict = np.load(
             os.path.join(self.recording_path, "state", "common", f"{step:08d}.npy"), allow_pickle=True
@@ -14,8 +14,13 @@
 # limitations under the License.
 
 
+import copy
+import json
 import os
 import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
 import numpy as np
 import PIL.Image
@@ -23,63 +28,299 @@ import PIL.Image
 from .config import Config
 from .occupancy_map import OccupancyMap
 
+LEGACY_FORMAT = "legacy"
+CHUNKED_FORMAT = "chunked"
+
+CHUNKED_FORMAT_VERSION = 1
+
+STATE_GROUPS = ["common", "rgb", "segmentation", "depth", "normals"]
+
+
+def _copy_value(value):
+    # Values buffered until their chunk is written are copied, since the caller may reuse (and modify)
+    # its arrays between steps
+    if isinstance(value, np.ndarray):
+        return np.array(value, copy=True)
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+def _stack_column(values: list) -> np.ndarray:
+    # Columns of equally shaped numeric values are stacked into a single (memory-mappable) array,
+    # anything else (None, dicts, ragged arrays, ...) is stored as an object column
+    if all(value is not None for value in values):
+        arrays = [np.asarray(value) for value in values]
+        first = arrays[0]
+        if first.dtype.kind in "biufc" and all(
+            array.shape == first.shape and array.dtype == first.dtype for array in arrays
+        ):
+            return np.stack(arrays)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
 
 class MobilityGenWriter:
+    """Writer for MobilityGen recordings.
+
+    Two layouts are supported:
 
-    def __init__(self, path: str):
+    * ``"chunked"``: steps are grouped in chunks of ``chunk_size`` steps. Each chunk stores one
+      columnar array per state value (common state and every camera modality) together with its
+      step numbers, and is indexed by ``state/index.json``. Uncompressed chunks are memory-mappable,
+      compressed chunks are stored as a single ``.npz`` archive.
+    * ``"legacy"``: one file per step for the common state plus one image/array file per step, camera and modality.
+
+    With ``num_workers > 0`` encoding and file writes are handed to a pool of worker threads so that
+    the simulation thread only pays for queuing the data. At most ``max_queue_size`` writes can be
+    pending, further writes block until a slot is available. Errors raised by the workers are
+    re-raised on the next write or on :meth:`flush`.
+
+    :meth:`close` must be called once the recording is complete to write the last (partial) chunk
+    and wait for the pending writes.
+
+    Args:
+        path (str): Recording directory.
+        format (str, optional): Recording layout, ``"chunked"`` or ``"legacy"``. Defaults to ``"chunked"``.
+        chunk_size (int, optional): Number of steps per chunk (chunked layout only). Defaults to 256.
+        compress (bool, optional): Whether to store chunks as compressed ``.npz`` archives instead of
+            memory-mappable ``.npy`` files (chunked layout only). Defaults to False.
+        num_workers (int, optional): Number of worker threads used to encode and write data.
+            Writes are performed synchronously if 0. Defaults to 0.
+        max_queue_size (int, optional): Maximum number of pending writes when using workers. Defaults to 64.
+
+    Raises:
+        ValueError: If the format is unknown or the chunk size, number of workers or queue size are invalid.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        format: str = CHUNKED_FORMAT,
+        chunk_size: int = 256,
+        compress: bool = False,
+        num_workers: int = 0,
+        max_queue_size: int = 64,
+    ):
+        if format not in [LEGACY_FORMAT, CHUNKED_FORMAT]:
+            raise ValueError(f"Unknown recording format '{format}', expected '{CHUNKED_FORMAT}' or '{LEGACY_FORMAT}'")
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+        if num_workers < 0:
+            raise ValueError(f"Number of workers must be non-negative, got {num_workers}")
+        if max_queue_size <= 0:
+            raise ValueError(f"Maximum queue size must be positive, got {max_queue_size}")
         self.path = path
+        self.format = format
+        self.chunk_size = chunk_size
+        self.compress = compress
+        self.num_workers = num_workers
+        self.max_queue_size = max_queue_size
+        self._pending_steps = OrderedDict()
+        self._num_steps = 0
+        self._chunks = []
+        self._columns = OrderedDict((group, []) for group in STATE_GROUPS)
+        self._folders = set()
+        self._executor = None
+        self._queue_slots = None
+        self._futures = set()
+        self._futures_lock = threading.Lock()
+        self._errors = []
+        self._last_chunk_future = None
+        if num_workers > 0:
+            self._executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="MobilityGenWriter")
+            self._queue_slots = threading.BoundedSemaphore(max_queue_size)
+
+    def _ensure_folder(self, folder: str):
+        # Created folders are cached to avoid querying the filesystem for every file written
+        if folder not in self._folders:
+            os.makedirs(folder, exist_ok=True)
+            self._folders.add(folder)
+
+    def _raise_worker_errors(self):
+        if self._errors:
+            error = self._errors[0]
+            self._errors.clear()
+            raise RuntimeError(f"MobilityGenWriter failed to write data to {self.path}") from error
+
+    def _on_write_done(self, future: Future):
+        if not future.cancelled() and future.exception() is not None:
+            self._errors.append(future.exception())
+        self._queue_slots.release()
+        with self._futures_lock:
+            self._futures.discard(future)
+
+    def _submit(self, fn, *args) -> Future | None:
+        if self._executor is None:
+            fn(*args)
+            return None
+        self._raise_worker_errors()
+        # Block (backpressure) until one of the pending writes completes if the queue is full
+        self._queue_slots.acquire()
+        future = self._executor.submit(fn, *args)
+        with self._futures_lock:
+            self._futures.add(future)
+        future.add_done_callback(self._on_write_done)
+        return future
+
+    def _add_values(self, group: str, values: dict, step: int, skip_none: bool = False):
+        values = {name: _copy_value(value) for name, value in values.items() if value is not None or not skip_none}
+        if step not in self._pending_steps:
+            if len(self._pending_steps) >= self.chunk_size:
+                self._write_chunk()
+            self._pending_steps[step] = {group: OrderedDict() for group in STATE_GROUPS}
+        self._pending_steps[step][group].update(values)
+        columns = self._columns[group]
+        for name in values:
+            if name not in columns:
+                columns.append(name)
+
+    def _write_chunk(self):
+        if not self._pending_steps:
+            return
+        chunk_folder = os.path.join(self.path, "state", "chunks")
+        self._ensure_folder(chunk_folder)
+        chunk_name = f"{len(self._chunks):08d}"
+        step_values = list(self._pending_steps.values())
+
+        # Columns are stacked on the calling thread: the pending values may be reused by the caller afterwards
+        arrays = OrderedDict()
+        arrays["steps"] = np.asarray(list(self._pending_steps.keys()), dtype=np.int64)
+        for group, names in self._columns.items():
+            for name in names:
+                arrays[f"{group}/{name}"] = _stack_column([values[group].get(name) for values in step_values])
+
+        self._chunks.append(
+            {"name": chunk_name, "offset": self._num_steps, "num_steps": len(step_values), "compressed": self.compress}
+        )
+        self._num_steps += len(step_values)
+        self._pending_steps.clear()
+        index = {
+            "format": CHUNKED_FORMAT,
+            "version": CHUNKED_FORMAT_VERSION,
+            "chunk_size": self.chunk_size,
+            "num_steps": self._num_steps,
+            "columns": {group: list(names) for group, names in self._columns.items()},
+            "chunks": list(self._chunks),
+        }
+        self._last_chunk_future = self._submit(
+            self._save_chunk, os.path.join(chunk_folder, chunk_name), arrays, index, self._last_chunk_future
+        )
+
+    def _save_chunk(self, chunk_path: str, arrays: OrderedDict, index: dict, previous_chunk: Future | None):
+        if self.compress:
+            np.savez_compressed(f"{chunk_path}.npz", **arrays)
+        else:
+            for key, array in arrays.items():
+                folder, name = os.path.split(os.path.join(chunk_path, f"{key}.npy"))
+                self._ensure_folder(folder)
+                np.save(os.path.join(folder, name), array, allow_pickle=array.dtype == object)
+        # The index must only reference chunks that are completely written
+        if previous_chunk is not None:
+            previous_chunk.result()
+        self._write_index(index)
+
+    def _write_index(self, index: dict):
+        # Write to a temporary file first so that an interrupted recording always has a readable index
+        index_path = os.path.join(self.path, "state", "index.json")
+        with open(index_path + ".tmp", "w") as f:
+            json.dump(index, f, indent=2)
+        os.replace(index_path + ".tmp", index_path)
+
+    def flush(self):
+        """Write the pending steps to a new chunk (chunked layout only) and wait for all pending writes.
+
+        Raises:
+            RuntimeError: If a write performed by a worker failed.
+        """
+        if self.format == CHUNKED_FORMAT:
+            self._write_chunk()
+        # Futures are only discarded once their completion callback ran, so an empty set means all errors are recorded
+        while True:
+            with self._futures_lock:
+                futures = list(self._futures)
+            if not futures:
+                break
+            wait(futures)
+        self._raise_worker_errors()
+
+    def close(self):
+        """Flush any pending data to disk and stop the workers.
+
+        Raises:
+            RuntimeError: If a write performed by a worker failed.
+        """
+        try:
+            self.flush()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    @staticmethod
+    def _save_image(value: np.ndarray, path: str, mode: str | None = None):
+        PIL.Image.fromarray(value, mode).save(path)
+
+    @staticmethod
+    def _save_depth(value: np.ndarray, path: str):
+        # Inverse depth 16bit
+        inverse_depth = 1.0 / (1.0 + value)
+        inverse_depth = (65535 * inverse_depth).astype(np.uint16)
+        PIL.Image.fromarray(inverse_depth, "I;16").save(path)
 
     def write_state_dict_common(self, state_dict: dict, step: int):
+        if self.format == CHUNKED_FORMAT:
+            self._add_values("common", state_dict, step)
+            return
         dict_folder = os.path.join(self.path, "state", "common")
-        if not os.path.exists(dict_folder):
-            os.makedirs(dict_folder)
+        self._ensure_folder(dict_folder)
         state_dict_path = os.path.join(dict_folder, f"{step:08d}.npy")
-        np.save(state_dict_path, state_dict)
+        self._submit(np.save, state_dict_path, state_dict)
 
     def write_state_dict_rgb(self, state_rgb: dict, step: int):
+        if self.format == CHUNKED_FORMAT:
+            self._add_values("rgb", state_rgb, step, skip_none=True)
+            return
         for name, value in state_rgb.items():
             if value is not None:
                 image_folder = os.path.join(self.path, "state", "rgb", name)
-                if not os.path.exists(image_folder):
-                    os.makedirs(image_folder)
+                self._ensure_folder(image_folder)
                 image_path = os.path.join(image_folder, f"{step:08d}.jpg")
-                image = PIL.Image.fromarray(value)
-                image.save(image_path)
+                self._submit(self._save_image, value, image_path)
 
     def write_state_dict_segmentation(self, state_segmentation: dict, step: int):
+        if self.format == CHUNKED_FORMAT:
+            self._add_values("segmentation", state_segmentation, step, skip_none=True)
+            return
         for name, value in state_segmentation.items():
             if value is not None:
                 image_folder = os.path.join(self.path, "state", "segmentation", name)
-                if not os.path.exists(image_folder):
-                    os.makedirs(image_folder)
+                self._ensure_folder(image_folder)
                 image_path = os.path.join(image_folder, f"{step:08d}.png")
-                image = PIL.Image.fromarray(value)
-                image.save(image_path)
+                self._submit(self._save_image, value, image_path)
 
     def write_state_dict_depth(self, state_np: dict, step: int):
+        if self.format == CHUNKED_FORMAT:
+            self._add_values("depth", state_np, step, skip_none=True)
+            return
         for name, value in state_np.items():
             if value is not None:
                 output_folder = os.path.join(self.path, "state", "depth", name)
-                if not os.path.exists(output_folder):
-                    os.makedirs(output_folder)
-
-                # Inverse depth 16bit
-                inverse_depth = 1.0 / (1.0 + value)
-                inverse_depth = (65535 * inverse_depth).astype(np.uint16)
-                image = PIL.Image.fromarray(inverse_depth, "I;16")
-
+                self._ensure_folder(output_folder)
                 output_path = os.path.join(output_folder, f"{step:08d}.png")
-
-                image.save(output_path)
+                self._submit(self._save_depth, value, output_path)
 
     def write_state_dict_normals(self, state_np: dict, step: int):
+        if self.format == CHUNKED_FORMAT:
+            self._add_values("normals", state_np, step, skip_none=True)
+            return
         for name, value in state_np.items():
             if value is not None:
                 output_folder = os.path.join(self.path, "state", "normals", name)
-                if not os.path.exists(output_folder):
-                    os.makedirs(output_folder)
+                self._ensure_folder(output_folder)
                 output_path = os.path.join(output_folder, f"{step:08d}.npy")
-                np.save(output_path, value)
+                self._submit(np.save, output_path, value)
 
     def copy_stage(self, input_path: str):
         if not os.path.exists(self.path):
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
+
 import carb.tokens
 import numpy as np
 
@@ -21,7 +23,7 @@ import numpy as np
 #   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
 import omni.kit.test
 import omni.usd
-from isaacsim.replicator.mobility_gen.impl.path_planner import compress_path, generate_paths
+from isaacsim.replicator.mobility_gen.impl.path_planner import PathPlanner, compress_path, generate_paths
 
 
 # Having a test class dervived from omni.kit.test.AsyncTestCase declared on the root of module will make it auto-discoverable by omni.kit.test
@@ -73,6 +75,68 @@ class TestPathPlanner(omni.kit.test.AsyncTestCase):
 
         self.assertTrue(np.allclose(path, ground_truth))
 
+    async def test_generate_paths_batch(self):
+
+        freespace = np.array([[1, 0, 0, 1], [1, 0, 1, 1], [1, 1, 1, 0], [0, 1, 1, 1]]).astype(np.uint8)
+        starts = [(0, 0), (3, 3), (0, 3), (2, 1)]
+
+        planner = PathPlanner(freespace)
+        outputs = planner.generate_paths_batch(starts, num_workers=2)
+        paths = planner.generate_paths_batch(starts, fn=lambda output: output.unroll_path(end=(1, 2)), num_workers=2)
+
+        for start, output, path in zip(starts, outputs, paths):
+            expected = generate_paths(start=start, freespace=freespace)
+            self.assertTrue(np.array_equal(output.visited, expected.visited))
+            self.assertTrue(np.allclose(output.distance_to_start, expected.distance_to_start))
+            self.assertTrue(np.array_equal(path, expected.unroll_path(end=(1, 2))))
+
+        # single queries reuse the planner buffers
+        output = planner.generate_paths(start=(0, 0))
+        self.assertTrue(np.array_equal(output.prev_i, outputs[0].prev_i))
+        self.assertTrue(np.array_equal(output.prev_j, outputs[0].prev_j))
+
+    async def test_find_path_l_shaped(self):
+
+        freespace = np.array([[1, 0, 0], [1, 0, 0], [1, 1, 1]]).astype(np.uint8)
+
+        planner = PathPlanner(freespace)
+        path = planner.find_path(start=(0, 0), goal=(2, 2))
+
+        ground_truth = np.array([[0, 0], [1, 0], [2, 1], [2, 2]])
+
+        self.assertTrue(np.allclose(path, ground_truth))
+
+    async def test_find_path_unreachable(self):
+
+        freespace = np.array([[1, 0, 1], [1, 0, 1], [1, 0, 1]]).astype(np.uint8)
+
+        planner = PathPlanner(freespace)
+
+        self.assertIsNone(planner.find_path(start=(0, 0), goal=(2, 2)))
+        self.assertIsNone(planner.find_path(start=(0, 0), goal=(0, 1)))
+        self.assertTrue(np.allclose(planner.find_path(start=(0, 0), goal=(2, 0)), [[0, 0], [1, 0], [2, 0]]))
+
+        # start or goal out of the map
+        self.assertIsNone(planner.find_path(start=(-1, 0), goal=(2, 0)))
+        self.assertIsNone(planner.find_path(start=(0, 0), goal=(3, 0)))
+        self.assertIsNone(planner.find_path(start=(0, 0), goal=(0, 3)))
+
+    async def test_find_path_threads(self):
+
+        freespace = np.ones((64, 64), dtype=np.uint8)
+        freespace[1:-1:4, 1:-1] = 0
+        goals = [(63, column) for column in range(0, 64, 3)]
+
+        planner = PathPlanner(freespace)
+        expected = [planner.find_path(start=(0, 0), goal=goal) for goal in goals]
+
+        # concurrent queries on the same planner use separate search buffers
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for _ in range(4):
+                paths = list(executor.map(lambda goal: planner.find_path(start=(0, 0), goal=goal), goals))
+                for path, expected_path in zip(paths, expected):
+                    self.assertTrue(np.array_equal(path, expected_path))
+
     async def test_compress_path_line(self):
 
         # 111 -> 1-1
@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+
+import numpy as np
+import omni.kit.test
+from isaacsim.replicator.mobility_gen.impl.reader import MobilityGenReader
+from isaacsim.replicator.mobility_gen.impl.writer import MobilityGenWriter
+
+
+class TestRecording(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+
+    async def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def write_recording(self, path, num_steps, **kwargs):
+        writer = MobilityGenWriter(path, **kwargs)
+        for step in range(num_steps):
+            writer.write_state_dict_common(
+                {
+                    "robot.position": np.array([step, 1.0, 2.0]),
+                    "robot.action": step * 0.5,
+                    "robot.camera.segmentation_info": {"id": step} if step % 2 else None,
+                },
+                step,
+            )
+            writer.write_state_dict_rgb({"robot.camera.rgb_image": np.full((4, 6, 3), step, dtype=np.uint8)}, step)
+            writer.write_state_dict_normals({"robot.camera.normals_image": np.full((4, 6, 4), step, np.float32)}, step)
+        writer.close()
+
+    def check_recording(self, path, num_steps):
+        reader = MobilityGenReader(path, cache_size=2)
+        self.assertEqual(len(reader), num_steps)
+        self.assertEqual(reader.rgb_names, ["robot.camera.rgb_image"])
+        self.assertEqual(reader.normals_names, ["robot.camera.normals_image"])
+        for index, state_dict in enumerate(reader.iter_state_dicts()):
+            self.assertEqual(state_dict["robot.position"][0], index)
+            self.assertEqual(state_dict["robot.action"], index * 0.5)
+            self.assertEqual(state_dict["robot.camera.segmentation_info"], {"id": index} if index % 2 else None)
+            self.assertEqual(state_dict["robot.camera.rgb_image"].shape, (4, 6, 3))
+            self.assertEqual(state_dict["robot.camera.rgb_image"][0, 0, 0], index)
+            self.assertEqual(state_dict["robot.camera.normals_image"][0, 0, 0], index)
+        # random access
+        self.assertEqual(reader.read_rgb("robot.camera.rgb_image", 7)[1, 1, 1], 7)
+        self.assertEqual(reader.read_state_dict_common(-1)["robot.action"], (num_steps - 1) * 0.5)
+        with self.assertRaises(IndexError):
+            reader.read_state_dict(num_steps)
+        reader.close()
+
+    async def test_chunked_recording(self):
+        path = os.path.join(self._temp_dir.name, "recording")
+        self.write_recording(path, 10, chunk_size=4)
+        self.assertTrue(os.path.exists(os.path.join(path, "state", "index.json")))
+        chunks_folder = os.path.join(path, "state", "chunks")
+        self.assertEqual(sorted(os.listdir(chunks_folder)), ["00000000", "00000001", "00000002"])
+        rgb_path = os.path.join(chunks_folder, "00000000", "rgb", "robot.camera.rgb_image.npy")
+        self.assertIsInstance(np.load(rgb_path, mmap_mode="r"), np.memmap)
+        self.check_recording(path, 10)
+
+    async def test_chunked_recording_compressed(self):
+        path = os.path.join(self._temp_dir.name, "recording")
+        self.write_recording(path, 10, chunk_size=4, compress=True)
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(path, "state", "chunks"))),
+            ["00000000.npz", "00000001.npz", "00000002.npz"],
+        )
+        self.check_recording(path, 10)
+
+    async def test_chunked_recording_reused_buffers(self):
+        path = os.path.join(self._temp_dir.name, "recording")
+        writer = MobilityGenWriter(path, chunk_size=4)
+        # the caller reuses (and modifies) the same buffers at every step
+        position = np.zeros(3)
+        rgb_image = np.zeros((4, 6, 3), dtype=np.uint8)
+        for step in range(6):
+            position[0] = step
+            rgb_image[:] = step
+            writer.write_state_dict_common({"robot.position": position}, step)
+            writer.write_state_dict_rgb({"robot.camera.rgb_image": rgb_image}, step)
+        writer.close()
+        reader = MobilityGenReader(path)
+        self.assertEqual(
+            [reader.read_state_dict_common(index)["robot.position"][0] for index in range(6)], list(range(6))
+        )
+        self.assertEqual(
+            [reader.read_rgb("robot.camera.rgb_image", index)[0, 0, 0] for index in range(6)], list(range(6))
+        )
+
+    async def test_legacy_recording(self):
+        path = os.path.join(self._temp_dir.name, "recording")
+        writer = MobilityGenWriter(path, format="legacy")
+        for step in range(3):
+            writer.write_state_dict_common({"robot.action": step * 0.5}, step)
+        writer.close()
+        self.assertEqual(len(os.listdir(os.path.join(path, "state", "common"))), 3)
+        reader = MobilityGenReader(path)
+        self.assertEqual(len(reader), 3)
+        self.assertEqual([state_dict["robot.action"] for state_dict in reader.iter_state_dicts()], [0.0, 0.5, 1.0])
+
+    async def test_chunked_recording_workers(self):
+        path = os.path.join(self._temp_dir.name, "recording")
+        self.write_recording(path, 10, chunk_size=2, num_workers=2, max_queue_size=1)
+        self.assertEqual(len(os.listdir(os.path.join(path, "state", "chunks"))), 5)
+        self.check_recording(path, 10)
+
+    async def test_legacy_recording_workers(self):
+        path = os.path.join(self._temp_dir.name, "recording")
+        writer = MobilityGenWriter(path, format="legacy", num_workers=4, max_queue_size=2)
+        for step in range(8):
+            writer.write_state_dict_common({"robot.action": step * 0.5}, step)
+            writer.write_state_dict_rgb({"robot.camera.rgb_image": np.full((4, 6, 3), 32 * step, np.uint8)}, step)
+            writer.write_state_dict_depth({"robot.camera.depth_image": np.full((4, 6), step, np.float32)}, step)
+        writer.flush()
+        self.assertEqual(len(os.listdir(os.path.join(path, "state", "rgb", "robot.camera.rgb_image"))), 8)
+        writer.close()
+        reader = MobilityGenReader(path)
+        self.assertEqual(len(reader), 8)
+        self.assertEqual(reader.read_rgb("robot.camera.rgb_image", 7).shape, (4, 6, 3))
+        self.assertAlmostEqual(float(reader.read_depth("robot.camera.depth_image", 3)[0, 0]), 3.0, delta=0.01)
@@ -12,15 +12,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
+import weakref
 from typing import Any, List, Optional, Tuple, Union
 
+import carb
 import numpy as np
 import omni.replicator.core as rep
 import torch
 import warp as wp
 from isaacsim.core.prims import XFormPrim
 from isaacsim.core.utils.carb import get_carb_setting
-from pxr import Usd, Vt
+from pxr import Tf, Usd, Vt
+
+from .camera import OPENCV_FISHEYE_ATTRIBUTE_MAP, OPENCV_PINHOLE_ATTRIBUTE_MAP
 
 # from ROS camera convention to USD camera convention
 U_R_TRANSFORM = np.array([[1, 0, 0, 0], [0, -1, 0, 0], [0, 0, -1, 0], [0, 0, 0, 1]])
@@ -47,6 +52,16 @@ ANNOTATOR_SPEC = {
     "instance_id_segmentation_fast": {"name": "instance_id_segmentation_fast", "channels": 1, "dtype": wp.uint32},
 }
 
+# camera attributes (in addition to the lens distortion ones) used to compute the ray directions
+INTRINSICS_ATTRIBUTES = {"focalLength", "horizontalAperture", "verticalAperture"}
+
+# supported output dtypes (of the bound outputs) for each annotator dtype
+OUTPUT_DTYPES = {
+    wp.uint8: [wp.uint8, wp.float32],
+    wp.float32: [wp.float32],
+    wp.uint32: [wp.uint32, wp.int32],
+}
+
 
 @wp.kernel
 def reshape_tiled_image(
@@ -97,6 +112,184 @@ wp.overload(
     {"tiled_image_buffer": wp.array(dtype=wp.float32), "batched_image": wp.array(dtype=wp.float32, ndim=4)},
 )
 
+wp.overload(
+    reshape_tiled_image,
+    {"tiled_image_buffer": wp.array(dtype=wp.uint8), "batched_image": wp.array(dtype=wp.float32, ndim=4)},
+)
+
+wp.overload(
+    reshape_tiled_image,
+    {"tiled_image_buffer": wp.array(dtype=wp.uint32), "batched_image": wp.array(dtype=wp.uint32, ndim=4)},
+)
+
+wp.overload(
+    reshape_tiled_image,
+    {"tiled_image_buffer": wp.array(dtype=wp.uint32), "batched_image": wp.array(dtype=wp.int32, ndim=4)},
+)
+
+
+@wp.kernel
+def normalize_tiled_image(
+    tiled_image_buffer: wp.array(dtype=wp.uint8),
+    batched_image: wp.array(dtype=wp.float32, ndim=4),
+    image_height: int,
+    image_width: int,
+    num_channels: int,
+    num_output_channels: int,
+    num_tiles_x: int,
+    scale: float,
+):
+    """Reshape a tiled image (height*width*num_channels*num_cameras,) to a batch of images (num_cameras, height, width, num_channels)
+    while scaling its values (e.g.: to normalize 8-bit colors to [0, 1]).
+
+    Args:
+        tiled_image_buffer: The input image buffer. Shape is ((height*width*num_channels*num_cameras,).
+        batched_image: The output image. Shape is (num_cameras, height, width, num_channels).
+        image_width: The width of the image.
+        image_height: The height of the image.
+        num_channels: The number of channels in the image.
+        num_output_channels: The number of channels to copy (leading channels).
+        num_tiles_x: The number of tiles in x direction.
+        scale: The factor by which the values are multiplied.
+    """
+    # get the thread id
+    camera_id, height_id, width_id = wp.tid()
+    # resolve the tile indices
+    tile_x_id = camera_id % num_tiles_x
+    tile_y_id = camera_id // num_tiles_x
+    # compute the start index of the pixel in the tiled image buffer
+    pixel_start = (
+        num_channels * num_tiles_x * image_width * (image_height * tile_y_id + height_id)
+        + num_channels * tile_x_id * image_width
+        + num_channels * width_id
+    )
+    # copy the scaled pixel values into the batched image
+    for i in range(num_output_channels):
+        batched_image[camera_id, height_id, width_id, i] = wp.float32(tiled_image_buffer[pixel_start + i]) * scale
+
+
+@wp.kernel
+def unproject_tiled_depth(
+    tiled_depth_buffer: wp.array(dtype=wp.float32),
+    ray_directions: wp.array(dtype=wp.vec3, ndim=3),
+    positions: wp.array(dtype=wp.vec3),
+    orientations: wp.array(dtype=wp.quat),
+    points: wp.array(dtype=wp.vec3, ndim=3),
+    image_height: int,
+    image_width: int,
+    num_tiles_x: int,
+    start_y: int,
+    start_x: int,
+    stride: int,
+    world_frame: int,
+):
+    """Unproject a tiled depth image (height*width*num_cameras,) to a batch of pointclouds (num_cameras, height, width).
+
+    Args:
+        tiled_depth_buffer: The input depth (distance to image plane) buffer. Shape is (height*width*num_cameras,).
+        ray_directions: The ray direction (with unit depth) of each pixel, in the camera frame (ROS convention).
+                        Shape is (num_cameras, height, width).
+        positions: The positions of the cameras in the world frame. Shape is (num_cameras,).
+        orientations: The orientations of the cameras (ROS convention) in the world frame. Shape is (num_cameras,).
+        points: The output points. Shape is (num_cameras, cropped and subsampled height, cropped and subsampled width).
+        image_height: The height of the image.
+        image_width: The width of the image.
+        num_tiles_x: The number of tiles in x direction.
+        start_y: The first row of the image to unproject.
+        start_x: The first column of the image to unproject.
+        stride: The step between the unprojected rows/columns.
+        world_frame: Whether to transform the points to the world frame (1) or keep them in the camera frame (0).
+    """
+    # get the thread id
+    camera_id, i, j = wp.tid()
+    height_id = start_y + i * stride
+    width_id = start_x + j * stride
+    # resolve the tile indices
+    tile_x_id = camera_id % num_tiles_x
+    tile_y_id = camera_id // num_tiles_x
+    # compute the index of the pixel in the tiled depth buffer
+    pixel = num_tiles_x * image_width * (image_height * tile_y_id + height_id) + tile_x_id * image_width + width_id
+    # scale the pixel ray by its depth and (if needed) transform it to the world frame
+    point = tiled_depth_buffer[pixel] * ray_directions[camera_id, height_id, width_id]
+    if world_frame != 0:
+        point = wp.quat_rotate(orientations[camera_id], point) + positions[camera_id]
+    points[camera_id, i, j] = point
+
+
+def compute_ray_directions(
+    height: int,
+    width: int,
+    fx: float,
+    fy: float,
+    cx: float,
+    cy: float,
+    distortion_model: str = "pinhole",
+    distortion_coefficients: Optional[List[float]] = None,
+    iterations: int = 20,
+) -> np.ndarray:
+    """Compute the ray direction (with unit depth) of each pixel (center) of an image, in the camera frame (ROS convention).
+
+    The pixel coordinates are undistorted according to the lens distortion model, such that the points
+    are recovered by scaling the rays by the depth (distance to image plane) of the pixels.
+
+    Args:
+        height: The height of the image.
+        width: The width of the image.
+        fx: The horizontal focal length (pixels).
+        fy: The vertical focal length (pixels).
+        cx: The horizontal optical center (pixels).
+        cy: The vertical optical center (pixels).
+        distortion_model: The lens distortion model: ``"pinhole"`` (no distortion), ``"opencvPinhole"``
+            (coefficients: k1, k2, p1, p2, k3, k4, k5, k6, s1, s2, s3, s4) or ``"opencvFisheye"``
+            (coefficients: k1, k2, k3, k4).
+        distortion_coefficients: The coefficients of the lens distortion model. Missing coefficients default to 0.0.
+        iterations: The number of iterations of the (iterative) undistortion.
+
+    Returns:
+        The ray directions. Shape is (height, width, 3).
+
+    Raises:
+        ValueError: If the specified distortion model is not supported.
+    """
+    xx, yy = np.meshgrid(np.arange(width) + 0.5, np.arange(height) + 0.5, indexing="xy")
+    xd, yd = (xx - cx) / fx, (yy - cy) / fy
+    if distortion_model == "pinhole":
+        x, y = xd, yd
+    elif distortion_model == "opencvPinhole":
+        k1, k2, p1, p2, k3, k4, k5, k6, s1, s2, s3, s4 = np.pad(distortion_coefficients or [], (0, 12))[:12]
+        # fixed-point iterations (same as OpenCV's undistortPoints)
+        x, y = xd, yd
+        for _ in range(iterations):
+            r2 = x * x + y * y
+            icdist = (1 + ((k6 * r2 + k5) * r2 + k4) * r2) / (1 + ((k3 * r2 + k2) * r2 + k1) * r2)
+            dx = 2 * p1 * x * y + p2 * (r2 + 2 * x * x) + s1 * r2 + s2 * r2 * r2
+            dy = p1 * (r2 + 2 * y * y) + 2 * p2 * x * y + s3 * r2 + s4 * r2 * r2
+            x, y = (xd - dx) * icdist, (yd - dy) * icdist
+    elif distortion_model == "opencvFisheye":
+        k1, k2, k3, k4 = np.pad(distortion_coefficients or [], (0, 4))[:4]
+        # Newton iterations to solve theta_d = theta * (1 + k1 * theta^2 + k2 * theta^4 + k3 * theta^6 + k4 * theta^8)
+        theta_d = np.sqrt(xd * xd + yd * yd)
+        theta = theta_d.copy()
+        for _ in range(iterations):
+            theta2 = theta * theta
+            f = theta * (1 + theta2 * (k1 + theta2 * (k2 + theta2 * (k3 + theta2 * k4)))) - theta_d
+            df = 1 + theta2 * (3 * k1 + theta2 * (5 * k2 + theta2 * (7 * k3 + theta2 * 9 * k4)))
+            theta = theta - f / df
+        scale = np.where(theta_d > 1e-8, np.tan(theta) / np.maximum(theta_d, 1e-8), 1.0)
+        x, y = xd * scale, yd * scale
+    else:
+        raise ValueError(
+            f"Unsupported lens distortion model: {distortion_model}. Supported models are pinhole, opencvPinhole and opencvFisheye"
+        )
+    return np.stack([x, y, np.ones_like(x)], axis=-1).astype(np.float32)
+
+
+def _on_camera_view_objects_changed(camera_view_ref: weakref.ref, notice: Usd.Notice.ObjectsChanged, sender: Usd.Stage):
+    """Forward the USD change notices to a camera view (if it still exists) without keeping it alive."""
+    camera_view = camera_view_ref()
+    if camera_view is not None:
+        camera_view._on_objects_changed(notice)
+
 
 class CameraView(XFormPrim):
     """Provides high level functions to deal tiled/batched data from cameras
@@ -190,11 +383,18 @@ class CameraView(XFormPrim):
         self._annotators = dict()
         self.camera_resolution = camera_resolution
         self._tiled_render_product = None
+        self._output_bindings = dict()
+        self._ray_directions = dict()
+        self._dirty_ray_directions = set()
+        self._pointcloud_poses = dict()
+        self._intrinsics_listener = None
         self._setup_tiled_sensor()
 
     def __del__(self):
         XFormPrim.__del__(self)
         self._clean_up_tiled_sensor()
+        if getattr(self, "_intrinsics_listener", None) is not None:
+            self._intrinsics_listener.Revoke()
 
     def _clean_up_tiled_sensor(self):
         """Clean up the sensor by detaching annotators and destroying render products, and removing related prims."""
@@ -273,6 +473,11 @@ class CameraView(XFormPrim):
             self.camera_resolution = resolution
             # update tiled sensor after changing resolution
             self._setup_tiled_sensor()
+            # cached ray directions and bound outputs no longer match the resolution
+            self._ray_directions.clear()
+            if self._output_bindings:
+                carb.log_warn("Camera resolutions changed, removing all the output bindings")
+                self._output_bindings.clear()
 
     def get_resolutions(self) -> Tuple[int, int]:
         """Retrieve the current resolution setting for all cameras.
@@ -506,26 +711,11 @@ class CameraView(XFormPrim):
             ValueError: If the specified annotator type is not configured when instantiating the object.
         """
         # get and check annotator specification
-        spec = ANNOTATOR_SPEC.get(annotator_type)
-        if spec is None:
-            raise ValueError(
-                f"Unsupported annotator type: {annotator_type}. Supported types are {list(ANNOTATOR_SPEC.keys())}"
-            )
-        if spec["name"] not in self._annotators:
-            raise ValueError(
-                f"The specified annotator type ({annotator_type}) was not configured. Enable it when instantiating the object"
-            )
+        spec = self._get_annotator_spec(annotator_type)
         # request data on the same device as output if specified
         output_device = str(out.device) if out is not None else "cuda"
         # get the linear sensor data from the tiled annotator and (if needed) slice it to get only the RGB data
-        data = self._annotators[spec["name"]].get_data(device=output_device)
-        # check whether returned data is a dict (used for segmentation)
-        if isinstance(data, dict):
-            tiled_data: wp.array = data["data"]
-            info = data["info"]
-        else:
-            tiled_data: wp.array = data
-            info = {}
+        tiled_data, info = self._get_annotator_data(spec["name"], output_device)
         # tiled image
         if tiled:
             shape = (*self.tiled_resolution, spec["channels"])
@@ -566,6 +756,359 @@ class CameraView(XFormPrim):
             )
         return out, info
 
+    def bind_output(
+        self,
+        annotator_type: str,
+        out: Union[torch.Tensor, wp.array],
+        *,
+        tiled: bool = False,
+        normalize: bool = False,
+    ) -> None:
+        """Bind a pre-allocated tensor/array to be filled with the specified annotator/sensor data on each update.
+
+        Bound outputs are written in place by :py:meth:`update_bound_outputs`, without allocating memory: the channel
+        selection (e.g.: RGB from RGBA), the dtype conversion and the normalization (if any) are fused in a single kernel
+        launch. If the output is on the CPU, the conversion is computed on the GPU and only the converted data is
+        transferred to the host (through a pinned-memory staging buffer, unless the output is itself pinned).
+
+        The expected shape of the output is ``(num_cameras, height, width, channels)``, or
+        ``(*tiled_resolution, channels)`` for tiled images, where ``channels`` is 3 for ``"rgb"``.
+        The output dtype can be the annotator dtype, ``float32`` for 8-bit data (e.g.: colors as float values)
+        or ``int32`` for segmentation data (``uint32``).
+
+        Args:
+            annotator_type: Annotator/sensor type whose data is written to the output.
+            out: Pre-allocated (contiguous) Torch tensor or Warp array. Any previous binding of the annotator type is replaced.
+            tiled: Whether to write the annotator/sensor data as a single tiled image.
+            normalize: Whether to normalize 8-bit data (e.g.: ``"rgb"``) to [0, 1]. Requires a ``float32`` output.
+
+        Raises:
+            ValueError: If the specified annotator type is not supported.
+            ValueError: If the specified annotator type is not configured when instantiating the object.
+            ValueError: If the output is not a Torch tensor or a Warp array.
+            ValueError: If the output shape, dtype or memory layout is not supported.
+
+        Example:
+
+        .. code-block:: python
+
+            >>> rgb = torch.zeros((camera_view.count, 256, 256, 3), dtype=torch.float32, device="cuda")
+            >>> camera_view.bind_output("rgb", rgb, normalize=True)
+            >>> # on each step
+            >>> camera_view.update_bound_outputs()  # rgb is updated in place
+        """
+        spec = self._get_annotator_spec(annotator_type)
+        if isinstance(out, torch.Tensor):
+            pinned = out.device.type == "cpu" and out.is_pinned()
+            array = wp.from_torch(out)
+        elif isinstance(out, wp.array):
+            pinned = out.device.is_cpu and out.pinned
+            array = out
+        else:
+            raise ValueError(f"Unsupported output type: {type(out)}. Supported types are torch.Tensor and wp.array")
+        # check output shape, dtype and layout
+        channels = spec["channels"]
+        output_channels = 3 if annotator_type == "rgb" else channels
+        num_images = 1 if tiled else len(self.prims)
+        height, width = self.tiled_resolution if tiled else self.camera_resolution
+        shape = (height, width, output_channels) if tiled else (num_images, height, width, output_channels)
+        if tuple(array.shape) != shape:
+            raise ValueError(f"Invalid output shape for '{annotator_type}': {tuple(array.shape)}. Expected {shape}")
+        dtypes = OUTPUT_DTYPES[spec["dtype"]]
+        if array.dtype not in dtypes:
+            raise ValueError(
+                f"Invalid output dtype for '{annotator_type}': {array.dtype}. Supported dtypes are {dtypes}"
+            )
+        if normalize and (spec["dtype"] != wp.uint8 or array.dtype != wp.float32):
+            raise ValueError(f"Normalization requires 8-bit annotator data ('{annotator_type}') and a float32 output")
+        if not array.is_contiguous:
+            raise ValueError(f"The output for '{annotator_type}' must be contiguous")
+        # compute on the output device, or on the GPU (and stage the converted data) for CPU outputs
+        array = array.reshape((num_images, height, width, output_channels))
+        staging, host = None, None
+        if array.device.is_cpu:
+            staging = wp.empty(array.shape, dtype=array.dtype, device="cuda")
+            host = array if pinned else wp.empty(array.shape, dtype=array.dtype, device="cpu", pinned=True)
+        self._output_bindings[annotator_type] = {
+            "out": out,
+            "array": array,
+            "staging": staging,
+            "host": host,
+            "spec": spec,
+            "channels": channels,
+            "output_channels": output_channels,
+            "num_tiles_x": 1 if tiled else self.tiled_resolution[0] // width,
+            "scale": 1.0 / 255.0 if normalize else None,
+        }
+
+    def unbind_output(self, annotator_type: str) -> None:
+        """Remove the output binding of the specified annotator/sensor type (if any).
+
+        Args:
+            annotator_type: Annotator/sensor type.
+        """
+        self._output_bindings.pop(annotator_type, None)
+
+    def update_bound_outputs(self) -> dict[str, Union[torch.Tensor, wp.array]]:
+        """Write the current annotator/sensor data into the bound outputs (see :py:meth:`bind_output`).
+
+        The data of each annotator is fetched once per device, regardless of the number of outputs bound to it.
+
+        Returns:
+            Dictionary mapping the bound annotator/sensor types to their (updated) outputs.
+        """
+        fetched = {}
+        staged = []
+        for binding in self._output_bindings.values():
+            array = binding["staging"] if binding["staging"] is not None else binding["array"]
+            key = (binding["spec"]["name"], str(array.device))
+            if key not in fetched:
+                fetched[key] = self._get_annotator_data(binding["spec"]["name"], key[1])[0].flatten()
+            tiled_data = fetched[key]
+            num_images, height, width, _ = array.shape
+            inputs = [tiled_data, array, height, width, binding["channels"], binding["output_channels"]]
+            if binding["scale"] is None:
+                wp.launch(
+                    kernel=reshape_tiled_image,
+                    dim=(num_images, height, width),
+                    inputs=[*inputs, binding["num_tiles_x"], 0],
+                    device=array.device,
+                )
+            else:
+                wp.launch(
+                    kernel=normalize_tiled_image,
+                    dim=(num_images, height, width),
+                    inputs=[*inputs, binding["num_tiles_x"], binding["scale"]],
+                    device=array.device,
+                )
+            if binding["staging"] is not None:
+                wp.copy(binding["host"], binding["staging"])
+                staged.append(binding)
+        # wait for the (asynchronous) device-to-host transfers and copy the staged data to the outputs
+        if staged:
+            for device in {binding["staging"].device for binding in staged}:
+                wp.synchronize_stream(wp.get_stream(device))
+            for binding in staged:
+                if binding["host"] is not binding["array"]:
+                    wp.copy(binding["array"], binding["host"])
+        return {annotator_type: binding["out"] for annotator_type, binding in self._output_bindings.items()}
+
+    def get_pointclouds(
+        self,
+        *,
+        world_frame: bool = True,
+        stride: int = 1,
+        crop: Optional[Tuple[int, int, int, int]] = None,
+        out: Optional[Union[torch.Tensor, wp.array]] = None,
+        usd: bool = True,
+    ) -> Union[torch.Tensor, wp.array]:
+        """Get the pointclouds of all cameras by unprojecting their depth (distance to image plane) data.
+
+        The unprojection of all cameras is computed in a single kernel launch that scales the (cached) ray direction
+        of each pixel by its depth and transforms the points to the world frame. The ray directions are computed once
+        per camera (accounting for the lens distortion model) and recomputed only when the camera intrinsics change.
+        Supported lens distortion models are ``pinhole`` (no distortion), ``opencvPinhole`` and ``opencvFisheye``.
+
+        .. note::
+
+            The ``"depth"`` (or ``"distance_to_image_plane"``) annotator must be configured.
+            Points of pixels without depth (e.g.: pixels that do not hit any geometry) are not finite.
+
+        Args:
+            world_frame: Whether to get the points in the world frame. Otherwise, the points are in the camera frame
+                (ROS convention: +Z forward, +X right, +Y down).
+            stride: The step between the unprojected rows/columns of the (cropped) images.
+            crop: The image region to unproject as (x, y, width, height), in pixels. Defaults to the whole image.
+            out: Pre-allocated Warp array (dtype ``wp.vec3``, shape ``(num_cameras, H, W)``) or Torch tensor
+                (dtype ``float32``, shape ``(num_cameras, H, W, 3)``) to fill with the points, where ``H`` and ``W``
+                are the number of unprojected rows and columns.
+            usd: Whether to read the camera poses from USD. Otherwise, they are read from Fabric.
+
+        Returns:
+            The points of each pixel (if ``out`` is defined, its instance will be returned).
+            Shape is ``(num_cameras, H, W)`` (dtype ``wp.vec3``).
+
+        Raises:
+            ValueError: If the depth annotator is not configured.
+            ValueError: If the stride or the crop region is not valid.
+            ValueError: If the lens distortion model of a camera is not supported.
+
+        Example:
+
+        .. code-block:: python
+
+            >>> # points of every other pixel, in the world frame
+            >>> points = camera_view.get_pointclouds(stride=2)
+            >>> wp.to_torch(points).shape
+            torch.Size([4, 128, 128, 3])
+        """
+        spec = self._get_annotator_spec("distance_to_image_plane")
+        height, width = self.camera_resolution
+        x, y, crop_width, crop_height = (0, 0, width, height) if crop is None else crop
+        if stride < 1:
+            raise ValueError(f"Invalid stride: {stride}. It must be greater than 0")
+        if x < 0 or y < 0 or crop_width < 1 or crop_height < 1 or x + crop_width > width or y + crop_height > height:
+            raise ValueError(f"Invalid crop region: {crop}. It must be within the image ({width}x{height})")
+        shape = (len(self.prims), (crop_height + stride - 1) // stride, (crop_width + stride - 1) // stride)
+        # check the output, or allocate it
+        points = out
+        if isinstance(out, torch.Tensor):
+            points = wp.from_torch(out, dtype=wp.vec3)
+        elif out is None:
+            points = wp.empty(shape, dtype=wp.vec3, device="cuda")
+        if tuple(points.shape) != shape or points.dtype != wp.vec3:
+            raise ValueError(f"Invalid output shape/dtype: {tuple(points.shape)}/{points.dtype}. Expected {shape}/vec3")
+        device = str(points.device)
+        # get the depth data, the ray directions and the camera poses (ROS convention)
+        tiled_depth, _ = self._get_annotator_data(spec["name"], device)
+        ray_directions = self._get_ray_directions(device)
+        positions, orientations = self._pointcloud_poses.get(device, (None, None))
+        if positions is None:
+            positions = wp.zeros(len(self.prims), dtype=wp.vec3, device=device)
+            orientations = wp.zeros(len(self.prims), dtype=wp.quat, device=device)
+            self._pointcloud_poses[device] = (positions, orientations)
+        if world_frame:
+            translations, quaternions = self.get_world_poses(camera_axes="ros", usd=usd)
+            positions.assign(self._backend_utils.to_numpy(translations).astype(np.float32))
+            # Warp quaternions are scalar-last (x, y, z, w)
+            orientations.assign(self._backend_utils.to_numpy(quaternions)[:, [1, 2, 3, 0]].astype(np.float32))
+        wp.launch(
+            kernel=unproject_tiled_depth,
+            dim=shape,
+            inputs=[
+                tiled_depth.flatten(),
+                ray_directions,
+                positions,
+                orientations,
+                points,
+                height,
+                width,
+                self.tiled_resolution[0] // width,
+                y,
+                x,
+                stride,
+                int(world_frame),
+            ],
+            device=device,
+        )
+        return points if out is None else out
+
+    def _get_ray_directions(self, device: str) -> wp.array:
+        """Get the (cached) ray directions of all cameras on the specified device, updating those of the cameras
+        whose intrinsics changed.
+
+        Args:
+            device: Device on which to get the ray directions.
+
+        Returns:
+            The ray directions. Shape is (num_cameras, height, width) (dtype ``wp.vec3``).
+        """
+        # listen to USD changes (to invalidate the ray directions of the cameras whose intrinsics changed)
+        if self._intrinsics_listener is None:
+            self._camera_indices = {path: i for i, path in enumerate(self.prim_paths)}
+            self._intrinsics_listener = Tf.Notice.Register(
+                Usd.Notice.ObjectsChanged,
+                functools.partial(_on_camera_view_objects_changed, weakref.ref(self)),
+                self.prims[0].GetStage(),
+            )
+        height, width = self.camera_resolution
+        if "cpu" not in self._ray_directions:
+            self._ray_directions = {"cpu": np.zeros((len(self.prims), height, width, 3), dtype=np.float32)}
+            self._dirty_ray_directions = set(range(len(self.prims)))
+        if self._dirty_ray_directions:
+            for i in sorted(self._dirty_ray_directions):
+                self._ray_directions["cpu"][i] = self._compute_camera_ray_directions(i, height, width)
+            # drop the device copies (they are re-created on demand)
+            self._ray_directions = {"cpu": self._ray_directions["cpu"]}
+            self._dirty_ray_directions.clear()
+        if device not in self._ray_directions:
+            self._ray_directions[device] = wp.array(self._ray_directions["cpu"], dtype=wp.vec3, device=device)
+        return self._ray_directions[device]
+
+    def _compute_camera_ray_directions(self, index: int, height: int, width: int) -> np.ndarray:
+        """Compute the ray directions of a camera from its intrinsics and lens distortion model.
+
+        Args:
+            index: Index of the camera in the view.
+            height: The height of the image.
+            width: The width of the image.
+
+        Returns:
+            The ray directions. Shape is (height, width, 3).
+        """
+        prim = self.prims[index]
+        distortion_model = prim.GetAttribute("omni:lensdistortion:model").Get() or "pinhole"
+        if distortion_model == "pinhole":
+            focal_length = prim.GetAttribute("focalLength").Get()
+            fx = width * focal_length / prim.GetAttribute("horizontalAperture").Get()
+            fy = height * focal_length / prim.GetAttribute("verticalAperture").Get()
+            cx, cy = width * 0.5, height * 0.5
+            distortion_coefficients = []
+        elif distortion_model in ["opencvPinhole", "opencvFisheye"]:
+            attribute_map = (
+                OPENCV_PINHOLE_ATTRIBUTE_MAP if distortion_model == "opencvPinhole" else OPENCV_FISHEYE_ATTRIBUTE_MAP
+            )
+            cx, cy, fx, fy, *distortion_coefficients = [
+                prim.GetAttribute(f"omni:lensdistortion:{distortion_model}:{name}").Get() or 0.0
+                for name in ["cx", "cy", "fx", "fy", *attribute_map]
+            ]
+        else:
+            raise ValueError(
+                f"Unsupported lens distortion model ({distortion_model}) for camera {self.prim_paths[index]}. "
+                "Supported models are pinhole, opencvPinhole and opencvFisheye"
+            )
+        return compute_ray_directions(height, width, fx, fy, cx, cy, distortion_model, distortion_coefficients)
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged) -> None:
+        """Invalidate the ray directions of the cameras whose intrinsics (or lens distortion model) changed."""
+        for path in [*notice.GetChangedInfoOnlyPaths(), *notice.GetResyncedPaths()]:
+            index = self._camera_indices.get(path.GetPrimPath().pathString)
+            if index is None:
+                continue
+            if path.IsPrimPath() or path.name in INTRINSICS_ATTRIBUTES or path.name.startswith("omni:lensdistortion:"):
+                self._dirty_ray_directions.add(index)
+
+    def _get_annotator_spec(self, annotator_type: str) -> dict:
+        """Get the specification of a configured annotator/sensor type.
+
+        Args:
+            annotator_type: Annotator/sensor type.
+
+        Returns:
+            Annotator/sensor specification.
+
+        Raises:
+            ValueError: If the specified annotator type is not supported.
+            ValueError: If the specified annotator type is not configured when instantiating the object.
+        """
+        spec = ANNOTATOR_SPEC.get(annotator_type)
+        if spec is None:
+            raise ValueError(
+                f"Unsupported annotator type: {annotator_type}. Supported types are {list(ANNOTATOR_SPEC.keys())}"
+            )
+        if spec["name"] not in self._annotators:
+            raise ValueError(
+                f"The specified annotator type ({annotator_type}) was not configured. Enable it when instantiating the object"
+            )
+        return spec
+
+    def _get_annotator_data(self, name: str, device: str) -> Tuple[wp.array, dict[str, Any]]:
+        """Get the linear (tiled) data of an annotator.
+
+        Args:
+            name: Annotator name.
+            device: Device on which to get the data.
+
+        Returns:
+            2-items tuple. The first item is the linear data. The second item is a dictionary containing
+            additional information (e.g.: for segmentation).
+        """
+        data = self._annotators[name].get_data(device=device)
+        # check whether returned data is a dict (used for segmentation)
+        if isinstance(data, dict):
+            return data["data"], data["info"]
+        return data, {}
+
     def get_rgb_tiled(self, out=None, device="cpu") -> np.ndarray | torch.Tensor:
         """Fetch the RGB data for all cameras as a single tiled image.
 
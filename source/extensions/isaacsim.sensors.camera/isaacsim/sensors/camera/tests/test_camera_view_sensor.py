@@ -26,7 +26,7 @@ import warp as wp
 from isaacsim.core.api import World
 from isaacsim.core.api.objects import VisualCuboid
 from isaacsim.core.utils.stage import create_new_stage_async, update_stage_async
-from isaacsim.sensors.camera.camera_view import ANNOTATOR_SPEC, CameraView
+from isaacsim.sensors.camera.camera_view import ANNOTATOR_SPEC, CameraView, compute_ray_directions
 from isaacsim.sensors.camera.tests.utils import compare_images, save_image
 
 SAVE_IMAGE_AS_TEST = False
@@ -326,6 +326,80 @@ class TestCameraViewSensor(omni.kit.test.AsyncTestCase):
                 f"{annotator_type} data/out mean: {np.mean(data - out)}, std: {np.std(data - out)}",
             )
 
+    async def test_output_bindings(self):
+        height, width = self.resolution
+        # cuda / torch: RGB as normalized float values
+        rgb = torch.zeros((self.num_cameras, height, width, 3), device="cuda", dtype=torch.float32)
+        self.camera_view.bind_output("rgb", rgb, normalize=True)
+        # cpu / torch: depth (staged through pinned memory)
+        depth = torch.zeros((self.num_cameras, height, width, 1), dtype=torch.float32)
+        self.camera_view.bind_output("depth", depth)
+        # cpu / warp: tiled RGBA
+        rgba_tiled = wp.zeros((*self.camera_view.tiled_resolution, 4), dtype=wp.uint8, device="cpu")
+        self.camera_view.bind_output("rgba", rgba_tiled, tiled=True)
+        # check outputs
+        outputs = self.camera_view.update_bound_outputs()
+        self.assertListEqual(sorted(outputs.keys()), ["depth", "rgb", "rgba"])
+        self.assertIs(outputs["rgb"], rgb)
+        self.assertIs(outputs["depth"], depth)
+        self.assertIs(outputs["rgba"], rgba_tiled)
+        self.assertTrue(torch.allclose(rgb, self.camera_view.get_rgb().float() / 255, atol=1e-5))
+        self.assertTrue(torch.allclose(depth, self.camera_view.get_depth().cpu(), atol=1e-5))
+        self.assertTrue(np.array_equal(rgba_tiled.numpy(), self.camera_view.get_data("rgba", tiled=True)[0].numpy()))
+        # invalid bindings
+        with self.assertRaises(ValueError):
+            self.camera_view.bind_output("rgb", torch.zeros((1, height, width, 3), device="cuda"))
+        with self.assertRaises(ValueError):
+            self.camera_view.bind_output("depth", depth, normalize=True)
+        with self.assertRaises(ValueError):
+            self.camera_view.bind_output("depth", depth.numpy())
+        # unbind
+        self.camera_view.unbind_output("rgb")
+        self.assertListEqual(sorted(self.camera_view.update_bound_outputs().keys()), ["depth", "rgba"])
+
+    async def test_pointclouds(self):
+        height, width = self.resolution
+        depth = self.camera_view.get_depth().cpu().numpy()[..., 0]
+        translations, orientations = self.camera_view.get_world_poses(camera_axes="ros")
+        translations = self.camera_view._backend_utils.to_numpy(translations)
+        orientations = self.camera_view._backend_utils.to_numpy(orientations)
+        # reference: unproject each camera separately (pinhole, centered optical center)
+        expected = []
+        for i, prim in enumerate(self.camera_view.prims):
+            focal_length = prim.GetAttribute("focalLength").Get()
+            fx = width * focal_length / prim.GetAttribute("horizontalAperture").Get()
+            fy = height * focal_length / prim.GetAttribute("verticalAperture").Get()
+            points = depth[i][..., np.newaxis] * compute_ray_directions(height, width, fx, fy, width / 2, height / 2)
+            w, x, y, z = orientations[i]
+            rotation = np.array(
+                [
+                    [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+                    [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+                    [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+                ]
+            )
+            expected.append(points @ rotation.T + translations[i])
+        expected = np.stack(expected)
+        # world frame
+        points = self.camera_view.get_pointclouds()
+        self.assertEqual(points.shape, (self.num_cameras, height, width))
+        self.assertTrue(np.allclose(points.numpy(), expected, atol=1e-3))
+        # camera frame: the z coordinate is the depth
+        points = self.camera_view.get_pointclouds(world_frame=False)
+        self.assertTrue(np.allclose(points.numpy()[..., 2], depth, atol=1e-5))
+        # stride and crop (into a pre-allocated torch tensor)
+        out = torch.zeros((self.num_cameras, 32, 16, 3), device="cuda", dtype=torch.float32)
+        points = self.camera_view.get_pointclouds(stride=4, crop=(64, 32, 64, 128), out=out)
+        self.assertIs(points, out)
+        self.assertTrue(np.allclose(out.cpu().numpy(), expected[:, 32:160:4, 64:128:4], atol=1e-3))
+        with self.assertRaises(ValueError):
+            self.camera_view.get_pointclouds(crop=(0, 0, width + 1, height))
+        # changing the intrinsics invalidates the cached ray directions
+        cached = self.camera_view._get_ray_directions("cuda:0").numpy()
+        self.camera_view.set_focal_lengths([value * 2 for value in self.camera_view.get_focal_lengths()])
+        updated = self.camera_view._get_ray_directions("cuda:0").numpy()
+        self.assertTrue(np.allclose(updated[..., :2], cached[..., :2] / 2, atol=1e-5))
+
     async def test_properties(self):
         self.assertTrue(self.num_cameras == len(self.camera_view.prims))
         self.camera_view.set_focal_lengths([5.0] * 4)
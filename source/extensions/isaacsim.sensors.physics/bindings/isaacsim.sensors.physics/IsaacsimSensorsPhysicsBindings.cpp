@@ -24,6 +24,7 @@
 #include <pybind11/stl.h>
 
 #include <string>
+#include <vector>
 CARB_BINDINGS("isaacsim.sensors.physics.python")
 
 
@@ -193,6 +194,30 @@ PYBIND11_MODULE(_sensor, m)
                 Returns:
                     :obj:`numpy.array`: The reading for the current sensor period.)pbdoc",
              py::arg("sensor_path"), py::arg("use_latest_data") = false)
+        .def(
+            "get_sensor_readings",
+            [](ContactSensorInterface* li, const std::vector<std::string>& sensorPaths, bool useLatestData) -> py::object
+            {
+                if (!li)
+                {
+                    return py::none();
+                }
+                py::array_t<CsReading> readings(static_cast<py::ssize_t>(sensorPaths.size()));
+                CsReading* data = readings.mutable_data();
+                for (size_t i = 0; i < sensorPaths.size(); i++)
+                {
+                    data[i] = li->getSensorReading(sensorPaths[i].c_str(), useLatestData);
+                }
+                return readings;
+            },
+            R"pbdoc(
+                Get the readings of many sensors at once
+                Args:
+                    arg0 (:obj:`list` of :obj:`str`): the sensor paths
+                    arg1 (:obj:`bool`): use_latest_data
+                Returns:
+                    :obj:`numpy.array`: The readings for the current sensor period, one per sensor (in the same order).)pbdoc",
+            py::arg("sensor_paths"), py::arg("use_latest_data") = false)
         .def("is_contact_sensor", wrapInterfaceFunction(&ContactSensorInterface::isContactSensor),
              R"pbdoc(
                 Args:
@@ -235,6 +260,32 @@ PYBIND11_MODULE(_sensor, m)
                     :obj:`numpy.array`: The reading for the current sensor period.)pbdoc",
             py::arg("sensor_path"), py::arg("interpolation_function") = nullptr, py::arg("use_latest_data") = false,
             py::arg("read_gravity") = true)
+        .def(
+            "get_sensor_readings",
+            [](const ImuSensorInterface* li, const std::vector<std::string>& sensorPaths, bool useLatestData,
+               bool readGravity) -> py::object
+            {
+                if (!li)
+                {
+                    return py::none();
+                }
+                py::array_t<IsReading> readings(static_cast<py::ssize_t>(sensorPaths.size()));
+                IsReading* data = readings.mutable_data();
+                for (size_t i = 0; i < sensorPaths.size(); i++)
+                {
+                    data[i] = li->getSensorReading(sensorPaths[i].c_str(), nullptr, useLatestData, readGravity);
+                }
+                return readings;
+            },
+            R"pbdoc(
+                Get the readings of many sensors at once
+                Args:
+                    arg0 (:obj:`list` of :obj:`str`): the sensor paths
+                    arg1 (:obj:`bool`): use_latest_data
+                    arg2 (:obj:`bool`): read_gravity
+                Returns:
+                    :obj:`numpy.array`: The readings for the current sensor period, one per sensor (in the same order).)pbdoc",
+            py::arg("sensor_paths"), py::arg("use_latest_data") = false, py::arg("read_gravity") = true)
         .def("is_imu_sensor", wrapInterfaceFunction(&ImuSensorInterface::isImuSensor),
              R"pbdoc(
                 Args:
@@ -15,6 +15,9 @@
 
 from .commands import *
 from .contact_sensor import ContactSensor
+from .contact_sensor_view import ContactSensorView
 from .effort_sensor import EffortSensor, EsSensorReading
+from .effort_sensor_view import EffortSensorView
 from .extension import *
 from .imu_sensor import IMUSensor
+from .imu_sensor_view import IMUSensorView
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Optional, Union
+
+import numpy as np
+import torch
+import warp as wp
+from isaacsim.core.nodes.bindings import _isaacsim_core_nodes
+from isaacsim.core.prims import XFormPrim
+from pxr import Sdf
+
+
+class BaseSensorView(XFormPrim):
+    """Base class of the views of many sensor prims of the same type (e.g.: the sensors of all the cloned environments).
+
+    Args:
+        prim_paths_expr (Union[str, List[str]]): prim paths regex expression(s) of the sensor prims.
+        schema (type): IsaacSensorSchema class of the sensor prims.
+        name (str): name of the view.
+
+    Raises:
+        Exception: if a matched prim is not a sensor prim of the given schema.
+    """
+
+    def __init__(self, prim_paths_expr: Union[str, List[str]], schema: type, name: str) -> None:
+        XFormPrim.__init__(self, prim_paths_expr=prim_paths_expr, name=name, reset_xform_properties=False)
+        for prim in self.prims:
+            if not prim.IsA(schema):
+                raise Exception(f"Prim at path {prim.GetPath()} is not a {schema.__name__} prim")
+        self._isaac_sensor_prims = [schema(prim) for prim in self.prims]
+        self._core_nodes = _isaacsim_core_nodes.acquire_interface()
+        return
+
+    def pause(self, indices: Optional[Union[np.ndarray, list]] = None) -> None:
+        """Disable the sensors
+
+        Args:
+            indices (Optional[Union[np.ndarray, list]], optional): indices of the sensors to disable.
+                                                                   Defaults to None (i.e: all sensors in the view).
+        """
+        self._set_enabled(False, indices)
+        return
+
+    def resume(self, indices: Optional[Union[np.ndarray, list]] = None) -> None:
+        """Enable the sensors
+
+        Args:
+            indices (Optional[Union[np.ndarray, list]], optional): indices of the sensors to enable.
+                                                                   Defaults to None (i.e: all sensors in the view).
+        """
+        self._set_enabled(True, indices)
+        return
+
+    def is_paused(self) -> np.ndarray:
+        """Check which sensors are disabled
+
+        Returns:
+            np.ndarray: whether each sensor is disabled. Shape is (N,).
+        """
+        return np.array([not sensor_prim.GetEnabledAttr().Get() for sensor_prim in self._isaac_sensor_prims])
+
+    def _set_enabled(self, enabled: bool, indices: Optional[Union[np.ndarray, list]]) -> None:
+        indices = range(self.count) if indices is None else indices
+        with Sdf.ChangeBlock():
+            for i in indices:
+                self._isaac_sensor_prims[int(i)].GetEnabledAttr().Set(enabled)
+
+    def _to_frame_value(self, value: np.ndarray, dtype: str, out=None) -> Union[np.ndarray, torch.Tensor, wp.array]:
+        # convert to the current backend, or copy into the given (preallocated) buffer
+        if out is None:
+            return self._backend_utils.convert(value, self._device, dtype)
+        if self._backend == "torch":
+            out.copy_(torch.from_numpy(value))
+        elif self._backend == "warp":
+            out.assign(value)
+        else:
+            np.copyto(out, value)
+        return out
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Optional, Union
+
+import numpy as np
+import omni.isaac.IsaacSensorSchema as IsaacSensorSchema
+from isaacsim.sensors.physics import _sensor
+
+from .base_sensor_view import BaseSensorView
+
+
+class ContactSensorView(BaseSensorView):
+    """Contact sensors of many prims (e.g.: the contact sensor of all the cloned environments).
+
+    The readings of all the sensors are read with a single call to the native interface, and reported as one array
+    per quantity (in the current backend). As for :py:class:`ContactSensor`, the last valid reading of a sensor is kept
+    when its current reading is not valid (e.g.: the sensor is disabled).
+
+    .. note::
+
+        The raw contact data (a variable number of contacts per sensor) is not reported by the view.
+        Use :py:class:`ContactSensor` to get it.
+
+    Args:
+        prim_paths_expr (Union[str, List[str]]): prim paths regex expression(s) of the contact sensor prims.
+        name (str, optional): name of the view. Defaults to "contact_sensor_view".
+
+    Raises:
+        Exception: if a matched prim is not a contact sensor prim.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> from isaacsim.sensors.physics import ContactSensorView
+        >>>
+        >>> sensors = ContactSensorView("/World/envs/env_.*/Robot/foot_.*/contact_sensor")
+        >>> # ... step the simulation
+        >>> frame = sensors.get_current_frame()
+        >>> frame["force"].shape  # (number of sensors,)
+        (64,)
+    """
+
+    def __init__(self, prim_paths_expr: Union[str, List[str]], name: str = "contact_sensor_view") -> None:
+        BaseSensorView.__init__(self, prim_paths_expr, IsaacSensorSchema.IsaacContactSensor, name)
+        self._contact_sensor_interface = _sensor.acquire_contact_sensor_interface()
+        self._time = np.zeros(self.count, dtype=np.float32)
+        self._force = np.zeros(self.count, dtype=np.float32)
+        self._in_contact = np.zeros(self.count, dtype=bool)
+        return
+
+    def get_current_frame(self, use_latest_data: bool = False, out: Optional[dict] = None) -> dict:
+        """Get the current readings of all the sensors.
+
+        Args:
+            use_latest_data (bool, optional): whether to report the latest simulation values. Defaults to False.
+            out (Optional[dict], optional): preallocated buffers (in the current backend and device) to copy
+                                            the readings into, keyed as the returned frame. Missing keys are allocated.
+                                            Defaults to None.
+
+        Returns:
+            dict: readings with the following keys: ``time`` (shape ``(N,)``), ``physics_step`` (float),
+            ``in_contact`` (shape ``(N,)``), ``force`` (shape ``(N,)``) and ``is_valid`` (shape ``(N,)``).
+        """
+        out = out or {}
+        readings = self._contact_sensor_interface.get_sensor_readings(self.prim_paths, use_latest_data=use_latest_data)
+        is_valid = readings["isValid"].astype(bool)
+        if is_valid.any():
+            np.copyto(self._time, readings["time"], where=is_valid)
+            np.copyto(self._force, readings["value"], where=is_valid)
+            np.copyto(self._in_contact, readings["inContact"].astype(bool), where=is_valid)
+        return {
+            "time": self._to_frame_value(self._time, "float32", out.get("time")),
+            "physics_step": float(self._core_nodes.get_physics_num_steps()),
+            "in_contact": self._to_frame_value(self._in_contact, "bool", out.get("in_contact")),
+            "force": self._to_frame_value(self._force, "float32", out.get("force")),
+            "is_valid": self._to_frame_value(is_valid, "bool", out.get("is_valid")),
+        }
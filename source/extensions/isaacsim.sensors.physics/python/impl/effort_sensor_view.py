@@ -0,0 +1,209 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import Callable, List, Optional, Union
+
+import carb
+import numpy as np
+from isaacsim.core.prims import Articulation
+from isaacsim.core.simulation_manager import IsaacEvents, SimulationManager
+
+
+class EffortSensorView(Articulation):
+    """Effort sensors for many joints (DOFs) of many articulations.
+
+    The measured joint efforts of all the sensors are read with a single physics tensor read per physics step,
+    and stored in preallocated ring buffers. Readings of all the sensors are interpolated at once.
+
+    Args:
+        prim_paths_expr (Union[str, List[str]]): prim paths regex expression(s) of the articulations.
+        dof_names (List[str]): names of the joints (DOFs) to sense, in each articulation.
+        sensor_period (float, optional): sensor period (in seconds). Values lower or equal to the physics step size
+                                         means that the latest reading is reported. Defaults to -1.
+        use_latest_data (bool, optional): whether to always report the latest reading. Defaults to False.
+        enabled (bool, optional): whether the sensors are enabled. Defaults to True.
+        buffer_size (int, optional): number of readings stored. Defaults to 10.
+        name (str, optional): name of the view. Defaults to "effort_sensor_view".
+
+    Example:
+
+    .. code-block:: python
+
+        >>> from isaacsim.sensors.physics import EffortSensorView
+        >>>
+        >>> # sense the revolute and prismatic joints of all the environments
+        >>> sensors = EffortSensorView("/World/envs/env_.*/Articulation", dof_names=["RevoluteJoint", "PrismaticJoint"])
+        >>> # ... step the simulation
+        >>> reading = sensors.get_sensor_readings()
+        >>> reading["value"].shape  # (number of articulations, number of DOFs)
+        (16, 2)
+    """
+
+    def __init__(
+        self,
+        prim_paths_expr: Union[str, List[str]],
+        dof_names: List[str],
+        sensor_period: float = -1,
+        use_latest_data: bool = False,
+        enabled: bool = True,
+        buffer_size: int = 10,
+        name: str = "effort_sensor_view",
+    ) -> None:
+        self.sensor_period = sensor_period
+        self.use_latest_data = use_latest_data
+        self.enabled = enabled
+        self.current_time = 0
+        self.sensor_time = 0
+        self.step_size = 0
+        self._sensor_dof_names = list(dof_names)
+        self._sensor_dof_indices = None
+        super().__init__(prim_paths_expr=prim_paths_expr, name=name)
+        self._allocate_buffers(buffer_size)
+        self._callbacks.append(
+            SimulationManager.register_callback(self._data_acquisition_callback, event=IsaacEvents.POST_PHYSICS_STEP)
+        )
+        self._callbacks.append(
+            SimulationManager.register_callback(self._timeline_stop_callback_fn, event=IsaacEvents.TIMELINE_STOP)
+        )
+        return
+
+    @property
+    def sensor_dof_names(self) -> List[str]:
+        """Names of the sensed joints (DOFs)
+
+        Returns:
+            List[str]: names of the sensed joints (DOFs), in the order of the readings last dimension.
+        """
+        return self._sensor_dof_names
+
+    @property
+    def data_buffer_size(self) -> int:
+        """Number of readings stored in the ring buffer
+
+        Returns:
+            int: number of readings stored.
+        """
+        return self._times.shape[0]
+
+    def get_sensor_readings(
+        self, interpolation_function: Optional[Callable] = None, use_latest_data: bool = False
+    ) -> dict:
+        """Get the readings of all the sensors.
+
+        Args:
+            interpolation_function (Optional[Callable], optional): function to compute the readings at the sensor time.
+                It is called with the stored readings values (shape ``(buffer size, articulations, DOFs)``, latest first),
+                their times (shape ``(buffer size,)``) and the sensor time, and must return a readings dictionary.
+                Defaults to None (linear interpolation).
+            use_latest_data (bool, optional): whether to report the latest readings. Defaults to False.
+
+        Returns:
+            dict: readings with the following keys: ``time`` (float), ``value`` (np.ndarray of shape
+            ``(number of articulations, number of DOFs)``) and ``is_valid`` (bool).
+        """
+        if not self.enabled:
+            return self._default_readings()
+        head = self._head
+        latest, previous = head, (head - 1) % self.data_buffer_size
+        use_latest_data = use_latest_data or self.use_latest_data
+        out_of_sync = self.sensor_time + self.sensor_period < self._times[previous]
+        # case 1: get the latest readings when sensor frequency is higher, use latest data is enabled,
+        # or sensor time + period is slower than last step (out of sync)
+        if self.sensor_period <= self.step_size or use_latest_data or out_of_sync:
+            if not self._valid[latest]:
+                return self._default_readings()
+            if self.sensor_period > self.step_size and not use_latest_data and out_of_sync:
+                carb.log_warn("sensor time out of sync, using latest data")
+            return {"time": float(self._times[latest]), "value": self._values[latest].copy(), "is_valid": True}
+        # case 2: use interpolated data
+        if self._valid[latest] and self._valid[previous]:
+            if interpolation_function is not None:
+                order = (self._interpolation_head - np.arange(self.data_buffer_size)) % self.data_buffer_size
+                return interpolation_function(
+                    self._interpolation_values[order], self._interpolation_times[order], self.sensor_time
+                )
+            latest, previous = self._interpolation_head, (self._interpolation_head - 1) % self.data_buffer_size
+            start_time, end_time = self._interpolation_times[previous], self._interpolation_times[latest]
+            interval = end_time - start_time if end_time != start_time else self.step_size
+            start_value = self._interpolation_values[previous]
+            value = start_value + (self._interpolation_values[latest] - start_value) * (
+                (self.sensor_time - start_time) / interval
+            )
+            return {"time": float(self.sensor_time), "value": value.astype(np.float32), "is_valid": True}
+        # if the most recent readings are valid, but the old ones are not, use the most recent
+        if self._valid[latest]:
+            return {"time": float(self._times[latest]), "value": self._values[latest].copy(), "is_valid": True}
+        return self._default_readings()
+
+    def change_buffer_size(self, new_buffer_size: int) -> None:
+        """Change the number of readings stored (the latest readings are kept).
+
+        Args:
+            new_buffer_size (int): number of readings to store.
+        """
+        order = (self._head - np.arange(min(new_buffer_size, self.data_buffer_size))) % self.data_buffer_size
+        values, times, valid = self._values[order], self._times[order], self._valid[order]
+        self._allocate_buffers(new_buffer_size)
+        # store the kept readings in chronological order, with the latest one at the head (index 0)
+        self._values[-np.arange(order.size)] = values
+        self._times[-np.arange(order.size)] = times
+        self._valid[-np.arange(order.size)] = valid
+        self._interpolation_values[:] = self._values
+        self._interpolation_times[:] = self._times
+
+    def _allocate_buffers(self, buffer_size: int) -> None:
+        shape = (buffer_size, self.count, len(self._sensor_dof_names))
+        self._values = np.zeros(shape, dtype=np.float32)
+        self._times = np.zeros(buffer_size, dtype=np.float64)
+        self._valid = np.zeros(buffer_size, dtype=bool)
+        self._interpolation_values = np.zeros(shape, dtype=np.float32)
+        self._interpolation_times = np.zeros(buffer_size, dtype=np.float64)
+        self._head = 0
+        self._interpolation_head = 0
+
+    def _default_readings(self) -> dict:
+        return {"time": 0.0, "value": np.zeros(self._values.shape[1:], dtype=np.float32), "is_valid": False}
+
+    def _timeline_stop_callback_fn(self, event) -> None:
+        self.current_time = 0
+        self.sensor_time = 0
+        self._allocate_buffers(self.data_buffer_size)
+
+    def _data_acquisition_callback(self, step_size: float) -> None:
+        self.step_size = step_size
+        self.current_time = SimulationManager.get_simulation_time()
+        if not self.enabled or not self.is_physics_handle_valid():
+            return
+        if self._sensor_dof_indices is None:
+            try:
+                self._sensor_dof_indices = np.array(
+                    [self.get_dof_index(dof_name) for dof_name in self._sensor_dof_names], dtype=np.int64
+                )
+            except KeyError as e:
+                carb.log_warn(f"Effort sensor error, joint {e} not found in {self.prim_paths}, disabling sensors")
+                self.enabled = False
+                return
+        # single tensor read for all the sensors
+        efforts = self._backend_utils.to_numpy(self._physics_view.get_dof_projected_joint_forces())
+        self._head = (self._head + 1) % self.data_buffer_size
+        np.take(efforts, self._sensor_dof_indices, axis=1, out=self._values[self._head])
+        self._times[self._head] = self.current_time
+        self._valid[self._head] = True
+        if self.sensor_period <= self.step_size:
+            self.sensor_time = self.current_time
+        elif self.sensor_time + self.sensor_period <= self.current_time:
+            np.copyto(self._interpolation_values, self._values)
+            np.copyto(self._interpolation_times, self._times)
+            self._interpolation_head = self._head
+            self.sensor_time += self.sensor_period
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Optional, Union
+
+import numpy as np
+import omni.isaac.IsaacSensorSchema as IsaacSensorSchema
+from isaacsim.sensors.physics import _sensor
+
+from .base_sensor_view import BaseSensorView
+
+
+class IMUSensorView(BaseSensorView):
+    """IMU sensors of many prims (e.g.: the IMU sensor of all the cloned environments).
+
+    The readings of all the sensors are read with a single call to the native interface, and reported as one array
+    per quantity (in the current backend). As for :py:class:`IMUSensor`, the last valid reading of a sensor is kept
+    when its current reading is not valid (e.g.: the sensor is disabled).
+
+    Args:
+        prim_paths_expr (Union[str, List[str]]): prim paths regex expression(s) of the IMU sensor prims.
+        name (str, optional): name of the view. Defaults to "imu_sensor_view".
+
+    Raises:
+        Exception: if a matched prim is not an IMU sensor prim.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> from isaacsim.sensors.physics import IMUSensorView
+        >>>
+        >>> sensors = IMUSensorView("/World/envs/env_.*/Robot/base_link/Imu_Sensor")
+        >>> # ... step the simulation
+        >>> frame = sensors.get_current_frame()
+        >>> frame["lin_acc"].shape  # (number of sensors, 3)
+        (16, 3)
+    """
+
+    def __init__(self, prim_paths_expr: Union[str, List[str]], name: str = "imu_sensor_view") -> None:
+        BaseSensorView.__init__(self, prim_paths_expr, IsaacSensorSchema.IsaacImuSensor, name)
+        self._imu_sensor_interface = _sensor.acquire_imu_sensor_interface()
+        self._time = np.zeros(self.count, dtype=np.float32)
+        self._lin_acc = np.zeros((self.count, 3), dtype=np.float32)
+        self._ang_vel = np.zeros((self.count, 3), dtype=np.float32)
+        self._orientation = np.zeros((self.count, 4), dtype=np.float32)
+        self._orientation[:, 0] = 1
+        return
+
+    def get_current_frame(
+        self, read_gravity: bool = True, use_latest_data: bool = False, out: Optional[dict] = None
+    ) -> dict:
+        """Get the current readings of all the sensors.
+
+        Args:
+            read_gravity (bool, optional): whether to include gravity in the linear accelerations. Defaults to True.
+            use_latest_data (bool, optional): whether to report the latest simulation values. Defaults to False.
+            out (Optional[dict], optional): preallocated buffers (in the current backend and device) to copy
+                                            the readings into, keyed as the returned frame. Missing keys are allocated.
+                                            Defaults to None.
+
+        Returns:
+            dict: readings with the following keys: ``time`` (shape ``(N,)``), ``physics_step`` (float),
+            ``lin_acc`` (shape ``(N, 3)``), ``ang_vel`` (shape ``(N, 3)``), ``orientation`` (quaternion
+            scalar-first (w, x, y, z), shape ``(N, 4)``) and ``is_valid`` (shape ``(N,)``).
+        """
+        out = out or {}
+        readings = self._imu_sensor_interface.get_sensor_readings(
+            self.prim_paths, use_latest_data=use_latest_data, read_gravity=read_gravity
+        )
+        is_valid = readings["isValid"].astype(bool)
+        if is_valid.any():
+            where = is_valid[:, np.newaxis]
+            orientation = readings["orientation"]
+            np.copyto(self._time, readings["time"], where=is_valid)
+            np.copyto(
+                self._lin_acc,
+                np.stack([readings["linAccX"], readings["linAccY"], readings["linAccZ"]], -1),
+                where=where,
+            )
+            np.copyto(
+                self._ang_vel,
+                np.stack([readings["angVelX"], readings["angVelY"], readings["angVelZ"]], -1),
+                where=where,
+            )
+            np.copyto(
+                self._orientation,
+                np.stack([orientation["w"], orientation["x"], orientation["y"], orientation["z"]], -1),
+                where=where,
+            )
+        return {
+            "time": self._to_frame_value(self._time, "float32", out.get("time")),
+            "physics_step": float(self._core_nodes.get_physics_num_steps()),
+            "lin_acc": self._to_frame_value(self._lin_acc, "float32", out.get("lin_acc")),
+            "ang_vel": self._to_frame_value(self._ang_vel, "float32", out.get("ang_vel")),
+            "orientation": self._to_frame_value(self._orientation, "float32", out.get("orientation")),
+            "is_valid": self._to_frame_value(is_valid, "bool", out.get("is_valid")),
+        }
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+
+import numpy as np
+import omni.kit.test
+from isaacsim.core.api import World
+from isaacsim.core.api.objects import DynamicCuboid
+from isaacsim.core.utils.stage import create_new_stage_async, update_stage_async
+from isaacsim.sensors.physics import ContactSensor, ContactSensorView
+
+
+class TestContactSensorView(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        await create_new_stage_async()
+        self.my_world = World(stage_units_in_meters=1.0)
+        await self.my_world.initialize_simulation_context_async()
+        await update_stage_async()
+        self.my_world.scene.add_default_ground_plane()
+        self._contact_sensors = []
+        # the first cube rests on the ground, the others are falling
+        for i in range(3):
+            self.my_world.scene.add(
+                DynamicCuboid(
+                    prim_path=f"/World/env_{i}/cube",
+                    name=f"cube_{i}",
+                    position=np.array([2.0 * i, 0, 0.25 + 10 * i]),
+                    size=0.5,
+                )
+            )
+            self._contact_sensors.append(
+                self.my_world.scene.add(
+                    ContactSensor(
+                        prim_path=f"/World/env_{i}/cube/contact_sensor",
+                        name=f"contact_sensor_{i}",
+                        min_threshold=0,
+                        max_threshold=10000000,
+                        radius=-1,
+                    )
+                )
+            )
+        await self.my_world.reset_async()
+        return
+
+    # After running each test
+    async def tearDown(self):
+        self.my_world.clear_instance()
+        await omni.kit.app.get_app().next_update_async()
+        while omni.usd.get_context().get_stage_loading_status()[2] > 0:
+            await asyncio.sleep(1.0)
+        await omni.kit.app.get_app().next_update_async()
+        return
+
+    async def test_data_acquisition(self):
+        view = ContactSensorView("/World/env_.*/cube/contact_sensor")
+        self.assertEqual(view.count, 3)
+        for _ in range(10):
+            await update_stage_async()
+        frame = view.get_current_frame()
+        for key in ["time", "in_contact", "force", "is_valid"]:
+            self.assertEqual(tuple(frame[key].shape), (3,))
+        self.assertTrue(np.all(frame["is_valid"]))
+        self.assertListEqual(frame["in_contact"].tolist(), [True, False, False])
+        self.assertGreater(frame["force"][0], 0)
+        # same readings as the individual sensors
+        for i, contact_sensor in enumerate(self._contact_sensors):
+            data = contact_sensor.get_current_frame()
+            self.assertEqual(bool(frame["in_contact"][i]), data["in_contact"])
+            self.assertAlmostEqual(float(frame["force"][i]), data["force"], delta=1e-3)
+        # preallocated buffers
+        out = {"force": np.zeros(3, dtype=np.float32)}
+        frame = view.get_current_frame(out=out)
+        self.assertIs(frame["force"], out["force"])
+        self.assertGreater(out["force"][0], 0)
+        return
+
+    async def test_invalid_prims(self):
+        with self.assertRaises(Exception):
+            ContactSensorView("/World/env_.*/cube")
+        return
@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import carb
+import numpy as np
+import omni.kit.test
+from isaacsim.core.api import World
+from isaacsim.core.utils.prims import get_prim_at_path
+from isaacsim.sensors.physics import EffortSensor, EffortSensorView
+from isaacsim.storage.native import get_assets_root_path_async
+from pxr import UsdPhysics
+
+
+class TestEffortSensorView(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self._assets_root_path = await get_assets_root_path_async()
+        if self._assets_root_path is None:
+            carb.log_error("Could not find Isaac Sim assets folder")
+            return
+        await omni.usd.get_context().open_stage_async(
+            self._assets_root_path + "/Isaac/Robots/IsaacSim/SimpleArticulation/simple_articulation.usd"
+        )
+        await omni.kit.app.get_app().next_update_async()
+        await omni.kit.app.get_app().next_update_async()
+        self.my_world = World(stage_units_in_meters=1.0, physics_dt=1.0 / 60, rendering_dt=1.0 / 60)
+        await self.my_world.initialize_simulation_context_async()
+        UsdPhysics.RevoluteJoint(get_prim_at_path("/Articulation/Arm/RevoluteJoint")).CreateAxisAttr("Y")
+        self.effort_sensor = None
+        self.effort_sensor_view = None
+        await omni.kit.app.get_app().next_update_async()
+
+    # After running each test
+    async def tearDown(self):
+        self.my_world.stop()
+        self.my_world.clear_instance()
+        if self.effort_sensor is not None:
+            self.effort_sensor._stage_open_callback_fn()
+            self.effort_sensor = None
+        self.effort_sensor_view = None
+        await omni.kit.app.get_app().next_update_async()
+        while omni.usd.get_context().get_stage_loading_status()[2] > 0:
+            await asyncio.sleep(1.0)
+        await omni.kit.app.get_app().next_update_async()
+
+    async def test_sensor_readings(self):
+        self.effort_sensor = EffortSensor("/Articulation/Arm/RevoluteJoint")
+        self.effort_sensor_view = EffortSensorView("/Articulation", dof_names=["RevoluteJoint"])
+        self.my_world.play()
+        for _ in range(6):
+            await omni.kit.app.get_app().next_update_async()
+        readings = self.effort_sensor_view.get_sensor_readings()
+        self.assertTrue(readings["is_valid"])
+        self.assertEqual(readings["value"].shape, (1, 1))
+        self.assertNotEqual(readings["time"], 0)
+        # arm only, 2kg with C of G 1m away from the joint
+        self.assertAlmostEqual(float(readings["value"][0, 0]), -2 * 9.81, 1)
+        self.assertAlmostEqual(
+            float(readings["value"][0, 0]), self.effort_sensor.get_sensor_reading(use_latest_data=True).value, 3
+        )
+        # disabled sensors
+        self.effort_sensor_view.enabled = False
+        self.assertFalse(self.effort_sensor_view.get_sensor_readings()["is_valid"])
+
+    async def test_sensor_period(self):
+        self.effort_sensor_view = EffortSensorView("/Articulation", dof_names=["RevoluteJoint"], sensor_period=1 / 10)
+        self.my_world.play()
+        for _ in range(4):
+            await omni.kit.app.get_app().next_update_async()
+        times = []
+        for _ in range(60):  # simulate for one second
+            await omni.kit.app.get_app().next_update_async()
+            readings = self.effort_sensor_view.get_sensor_readings()
+            if not times or times[-1] != readings["time"]:
+                times.append(readings["time"])
+        # the sensor is running at 10hz, while the sim is 60hz (tolerance +-1 reading)
+        self.assertTrue(abs(len(times) - 10) <= 1)
+        # custom interpolation function
+        readings = self.effort_sensor_view.get_sensor_readings(
+            lambda values, times, time: {"time": time, "value": np.full(values.shape[1:], 1000.0), "is_valid": True}
+        )
+        self.assertEqual(float(readings["value"][0, 0]), 1000.0)
+
+    async def test_single_physics_step(self):
+        self.effort_sensor_view = EffortSensorView("/Articulation", dof_names=["RevoluteJoint"], sensor_period=1 / 10)
+        await self.my_world.play_async()
+        # step the physics until the first reading is stored
+        for _ in range(10):
+            self.my_world.step(render=False)
+            if self.effort_sensor_view._valid.any():
+                break
+        self.assertEqual(int(self.effort_sensor_view._valid.sum()), 1)
+        # only the latest readings are valid: they are reported (instead of the default readings)
+        readings = self.effort_sensor_view.get_sensor_readings()
+        self.assertTrue(readings["is_valid"])
+        self.assertNotEqual(readings["time"], 0)
+        self.assertEqual(readings["value"].shape, (1, 1))
+
+    async def test_change_buffer_size(self):
+        self.effort_sensor_view = EffortSensorView("/Articulation", dof_names=["RevoluteJoint"])
+        self.my_world.play()
+        for _ in range(15):
+            await omni.kit.app.get_app().next_update_async()
+        latest = self.effort_sensor_view.get_sensor_readings()
+        self.effort_sensor_view.change_buffer_size(20)
+        self.assertEqual(self.effort_sensor_view.data_buffer_size, 20)
+        self.assertTrue(np.allclose(self.effort_sensor_view.get_sensor_readings()["value"], latest["value"]))
+        self.effort_sensor_view.change_buffer_size(5)
+        self.assertEqual(self.effort_sensor_view.data_buffer_size, 5)
+        self.assertEqual(self.effort_sensor_view.get_sensor_readings()["time"], latest["time"])
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+
+import numpy as np
+import omni.kit.test
+from isaacsim.core.api import World
+from isaacsim.core.api.objects import DynamicCuboid
+from isaacsim.core.utils.stage import create_new_stage_async, update_stage_async
+from isaacsim.sensors.physics import IMUSensor, IMUSensorView
+
+
+class TestIMUSensorView(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        await create_new_stage_async()
+        self.my_world = World(stage_units_in_meters=1.0)
+        await self.my_world.initialize_simulation_context_async()
+        await update_stage_async()
+        self.my_world.scene.add_default_ground_plane()
+        self._imus = []
+        for i in range(3):
+            self.my_world.scene.add(
+                DynamicCuboid(
+                    prim_path=f"/World/env_{i}/cube",
+                    name=f"cube_{i}",
+                    position=np.array([2.0 * i, 0, 0.5 + i]),
+                    size=0.5,
+                )
+            )
+            self._imus.append(self.my_world.scene.add(IMUSensor(prim_path=f"/World/env_{i}/cube/imu", name=f"imu_{i}")))
+        await self.my_world.reset_async()
+        return
+
+    # After running each test
+    async def tearDown(self):
+        self.my_world.clear_instance()
+        await omni.kit.app.get_app().next_update_async()
+        while omni.usd.get_context().get_stage_loading_status()[2] > 0:
+            await asyncio.sleep(1.0)
+        await omni.kit.app.get_app().next_update_async()
+        return
+
+    async def test_data_acquisition(self):
+        view = IMUSensorView("/World/env_.*/cube/imu")
+        self.assertEqual(view.count, 3)
+        for _ in range(5):
+            await update_stage_async()
+        frame = view.get_current_frame()
+        shapes = {"time": (3,), "lin_acc": (3, 3), "ang_vel": (3, 3), "orientation": (3, 4), "is_valid": (3,)}
+        for key, shape in shapes.items():
+            self.assertEqual(tuple(frame[key].shape), shape)
+        self.assertTrue(np.all(frame["is_valid"]))
+        # same readings as the individual sensors
+        for i, imu in enumerate(self._imus):
+            data = imu.get_current_frame()
+            self.assertAlmostEqual(float(frame["time"][i]), data["time"], delta=1e-5)
+            for key in ["lin_acc", "ang_vel", "orientation"]:
+                self.assertTrue(np.allclose(frame[key][i], data[key], atol=1e-4), key)
+        # preallocated buffers
+        out = {"lin_acc": np.zeros((3, 3), dtype=np.float32), "is_valid": np.zeros(3, dtype=bool)}
+        frame = view.get_current_frame(read_gravity=False, out=out)
+        self.assertIs(frame["lin_acc"], out["lin_acc"])
+        self.assertIs(frame["is_valid"], out["is_valid"])
+        self.assertTrue(np.all(out["is_valid"]))
+        return
+
+    async def test_pause_resume(self):
+        view = IMUSensorView("/World/env_.*/cube/imu")
+        await update_stage_async()
+        await update_stage_async()
+        view.pause([1])
+        self.assertListEqual(view.is_paused().tolist(), [False, True, False])
+        time = np.array(view.get_current_frame()["time"])
+        await update_stage_async()
+        await update_stage_async()
+        frame = view.get_current_frame()
+        self.assertListEqual(frame["is_valid"].tolist(), [True, False, True])
+        # the last valid reading is kept for the paused sensor
+        self.assertEqual(frame["time"][1], time[1])
+        self.assertGreater(frame["time"][0], time[0])
+        view.resume()
+        self.assertFalse(np.any(view.is_paused()))
+        return
+
+    async def test_invalid_prims(self):
+        with self.assertRaises(Exception):
+            IMUSensorView("/World/env_.*/cube")
+        return
@@ -42,5 +42,4 @@ class Extension(omni.ext.IExt):
         _range_sensor.release_lightbeam_sensor_interface(self._lightbeam)
 
     def _on_update(self, dt):
-        self._proximity_sensor_manager.update()
-        pass
+        self._proximity_sensor_manager.update(dt)
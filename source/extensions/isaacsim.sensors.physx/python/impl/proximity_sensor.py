@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import time
 from typing import Dict, List
 
@@ -19,6 +20,7 @@ import carb
 import numpy as np
 import omni.ext
 import omni.usd
+from isaacsim.core.utils.rotations import rot_matrices_to_quats
 from omni.physx import get_physx_scene_query_interface
 from omni.usd._impl.utils import get_prim_at_path, get_world_transform_matrix
 from pxr import Sdf, Usd, UsdGeom
@@ -192,12 +194,23 @@ class ProximitySensor:
 
 
 class ProximitySensorManager(object):
+    """Singleton that updates all the registered proximity sensors at once.
+
+    The sensors world transforms (and those of the overlapped geometries) are computed with a single transform cache,
+    the zone membership of all the sensors is kept as a boolean (sensors, zones) array, and the entered/exited zones,
+    overlap durations and distances are computed for all the sensors at once. Overlap durations are measured
+    in simulation time (accumulated physics step sizes), so results are deterministic.
+    Only the sensors that are (or were) overlapping some geometry are written back and notified, and only the
+    geometries overlapped in the current or previous update are tracked as zones.
+    """
+
     _instance = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(ProximitySensorManager, cls).__new__(cls)
             cls.sensors = []
+            cls._instance._reset_state()
         return cls._instance
 
     def register_sensor(self, sensor: ProximitySensor):
@@ -205,10 +218,124 @@ class ProximitySensorManager(object):
 
     def clear_sensors(self):
         self.sensors = []
+        self._reset_state()
 
-    def update(self):
-        for sensor in self.sensors:
-            sensor.update()
+    def update(self, dt: float = 0.0):
+        """Update all the registered sensors.
+
+        Args:
+            dt (float, optional): Elapsed simulation time since the last update (physics step size). Defaults to 0.0.
+        """
+        self.current_time += dt
+        if not self.sensors:
+            return
+        stage = omni.usd.get_context().get_stage()
+        xform_cache = UsdGeom.XformCache()
+        # sensors poses and box extents
+        matrices = np.array([xform_cache.GetLocalToWorldTransform(sensor.parent) for sensor in self.sensors])
+        extents = np.array([sensor.parent.GetAttribute("xformOp:scale").Get() for sensor in self.sensors])
+        origins = matrices[:, 3, :3]
+        bases = matrices[:, :3, :3] / np.linalg.norm(matrices[:, :3, :3], axis=-1, keepdims=True)
+        quaternions = rot_matrices_to_quats(bases.transpose(0, 2, 1))  # USD matrices transform row vectors
+        # overlap queries (PhysX scene queries are issued per box)
+        self._compact_zones()
+        hits = []
+        scene_query_interface = get_physx_scene_query_interface()
+        for i, sensor in enumerate(self.sensors):
+            scene_query_interface.overlap_box(
+                carb.Float3(*(extents[i] * 0.5).tolist()),
+                carb.Float3(*origins[i].tolist()),
+                carb.Float4(*quaternions[i, [1, 2, 3, 0]].tolist()),
+                functools.partial(self._report_hit, hits, i, sensor._exclusions),
+                False,
+            )
+        # zone membership
+        self._resize_state(len(self.sensors), len(self._zone_paths))
+        membership = np.zeros_like(self._membership)
+        if hits:
+            membership[tuple(np.array(hits).T)] = True
+        entered = membership & ~self._membership
+        exited = self._membership & ~membership
+        self._start_times[entered] = self.current_time
+        durations = np.where(membership, self.current_time - self._start_times, 0.0)
+        # distances to the overlapped geometries
+        zones = np.flatnonzero(membership.any(axis=0))
+        distances = np.zeros(membership.shape)
+        if zones.size:
+            positions = np.array(
+                [xform_cache.GetLocalToWorldTransform(stage.GetPrimAtPath(self._zone_paths[j])) for j in zones]
+            )[:, 3, :3]
+            distances[:, zones] = np.linalg.norm(origins[:, np.newaxis, :] - positions[np.newaxis, :, :], axis=-1)
+        # write back the sensors (and call the callbacks) that are or were overlapping some geometry
+        for i in np.flatnonzero(membership.any(axis=1) | self._membership.any(axis=1)):
+            self._update_sensor(
+                self.sensors[i], membership[i], entered[i], exited[i], self._start_times[i], durations[i], distances[i]
+            )
+        self._membership = membership
+
+    def _reset_state(self):
+        self.current_time = 0.0
+        self._zone_indices = {}
+        self._zone_paths = []
+        self._membership = np.zeros((0, 0), dtype=bool)
+        self._start_times = np.zeros((0, 0), dtype=np.float64)
+
+    def _compact_zones(self):
+        # keep only the zones overlapped in the previous update (needed to detect the exits), so that the zones
+        # tracked (and the per update work) do not grow with every geometry ever overlapped
+        keep = np.flatnonzero(self._membership.any(axis=0))
+        if keep.size == len(self._zone_paths):
+            return
+        self._zone_paths = [self._zone_paths[j] for j in keep]
+        self._zone_indices = {path: j for j, path in enumerate(self._zone_paths)}
+        self._membership = self._membership[:, keep]
+        self._start_times = self._start_times[:, keep]
+
+    def _resize_state(self, num_sensors: int, num_zones: int):
+        rows, columns = self._membership.shape
+        if (rows, columns) != (num_sensors, num_zones):
+            padding = ((0, num_sensors - rows), (0, num_zones - columns))
+            self._membership = np.pad(self._membership, padding)
+            self._start_times = np.pad(self._start_times, padding)
+
+    def _report_hit(self, hits: list, sensor_index: int, exclusions: List[str], hit) -> bool:
+        path = str(hit.rigid_body)
+        if path not in exclusions:
+            zone_index = self._zone_indices.get(path)
+            if zone_index is None:
+                zone_index = self._zone_indices[path] = len(self._zone_paths)
+                self._zone_paths.append(path)
+            hits.append((sensor_index, zone_index))
+        return True  # return True to continue the query
+
+    def _update_sensor(self, sensor, membership, entered, exited, start_times, durations, distances):
+        sensor._prev_active_zones = sensor._active_zones
+        sensor._active_zones = [self._zone_paths[j] for j in np.flatnonzero(membership)]
+        sensor._entered_zones = [self._zone_paths[j] for j in np.flatnonzero(entered)]
+        sensor._exited_zones = [self._zone_paths[j] for j in np.flatnonzero(exited)]
+        sensor._data = {
+            self._zone_paths[j]: {
+                "start_time": float(start_times[j]),
+                "duration": float(durations[j]),
+                "distance": float(distances[j]),
+            }
+            for j in np.flatnonzero(membership)
+        }
+        # Pass to external on_enter and on_exit callback_fn
+        if sensor._entered_zones and sensor._callback_fns[0] is not None:
+            sensor._callback_fns[0](sensor)
+        if sensor._exited_zones and sensor._callback_fns[2] is not None:
+            sensor._callback_fns[2](sensor)
+        is_inside = bool(sensor._active_zones)
+        if sensor._is_inside != is_inside:
+            # Reset the Tracker if we've moved outside
+            if not is_inside:
+                sensor.reset()
+            sensor._is_inside = is_inside
+            sensor.overlapping = is_inside
+        # Pass to external is_inside callback_fn
+        if is_inside and sensor._callback_fns[1] is not None:
+            sensor._callback_fns[1](sensor)
 
 
 # Public API:
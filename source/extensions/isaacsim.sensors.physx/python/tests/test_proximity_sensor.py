@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import omni.kit.test
+from isaacsim.core.api import World
+from isaacsim.sensors.physx import ProximitySensor, ProximitySensorManager, clear_sensors, register_sensor
+from pxr import Gf, UsdGeom, UsdPhysics
+
+
+class TestProximitySensor(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        await omni.usd.get_context().new_stage_async()
+        self._stage = omni.usd.get_context().get_stage()
+        self._physics_dt = 1.0 / 60.0
+        self.my_world = World(stage_units_in_meters=1.0, physics_dt=self._physics_dt, rendering_dt=self._physics_dt)
+        await self.my_world.initialize_simulation_context_async()
+        clear_sensors()
+        pass
+
+    # After running each test
+    async def tearDown(self):
+        clear_sensors()
+        self.my_world.stop()
+        self.my_world.clear_instance()
+        await omni.kit.app.get_app().next_update_async()
+        while omni.usd.get_context().get_stage_loading_status()[2] > 0:
+            print("tearDown, assets still loading, waiting to finish...")
+            await asyncio.sleep(1.0)
+        await omni.kit.app.get_app().next_update_async()
+        pass
+
+    def step(self, num_steps=1):
+        for _ in range(num_steps):
+            self.my_world.step(render=False)
+
+    async def test_enter_and_exit_zone(self):
+        # static collider
+        cube_path = "/World/Cube"
+        cube = UsdGeom.Cube.Define(self._stage, cube_path)
+        cube.CreateSizeAttr(1.0)
+        await omni.kit.app.get_app().next_update_async()  # Need this to avoid flatcache errors
+        UsdPhysics.CollisionAPI.Apply(cube.GetPrim())
+        # sensor box (the scale is the extent of the box), away from the collider
+        sensor_xform = UsdGeom.Xform.Define(self._stage, "/World/Sensor")
+        translate_op = sensor_xform.AddTranslateOp()
+        translate_op.Set(Gf.Vec3d(5.0, 0.0, 0.0))
+        sensor_xform.AddScaleOp().Set(Gf.Vec3f(0.5, 0.5, 0.5))
+
+        events = {"enter": [], "inside": 0, "exit": []}
+
+        def on_enter(sensor):
+            events["enter"].append(list(sensor.get_entered_zones()))
+
+        def on_inside(sensor):
+            events["inside"] += 1
+
+        def on_exit(sensor):
+            events["exit"].append(list(sensor.get_exited_zones()))
+
+        sensor = ProximitySensor(sensor_xform.GetPrim(), callback_fns=[on_enter, on_inside, on_exit])
+        register_sensor(sensor)
+        await self.my_world.play_async()
+
+        # outside of the collider
+        self.step(2)
+        self.assertFalse(sensor.is_overlapping())
+        self.assertEqual(events, {"enter": [], "inside": 0, "exit": []})
+
+        # move into the collider
+        translate_op.Set(Gf.Vec3d(0.0, 0.0, 0.0))
+        self.step()
+        self.assertTrue(sensor.is_overlapping())
+        self.assertEqual(sensor.get_active_zones(), [cube_path])
+        self.assertEqual(sensor.get_entered_zones(), [cube_path])
+        self.assertEqual(events["enter"], [[cube_path]])
+        self.assertAlmostEqual(sensor.get_data()[cube_path]["duration"], 0.0)
+
+        # stay inside: the zone is no longer reported as entered, the duration is the summed physics steps
+        num_steps = 5
+        self.step(num_steps)
+        self.assertEqual(sensor.get_entered_zones(), [])
+        self.assertEqual(sensor.get_exited_zones(), [])
+        self.assertEqual(len(events["enter"]), 1)
+        self.assertEqual(events["inside"], num_steps + 1)
+        self.assertAlmostEqual(sensor.get_data()[cube_path]["duration"], num_steps * self._physics_dt, places=5)
+        self.assertAlmostEqual(sensor.get_data()[cube_path]["distance"], 0.0, places=5)
+
+        # move out of the collider
+        translate_op.Set(Gf.Vec3d(5.0, 0.0, 0.0))
+        self.step()
+        self.assertFalse(sensor.is_overlapping())
+        self.assertEqual(sensor.get_active_zones(), [])
+        self.assertEqual(events["exit"], [[cube_path]])
+        self.assertEqual(events["inside"], num_steps + 1)
+
+        # zones no longer overlapped are not tracked anymore
+        self.step()
+        self.assertEqual(ProximitySensorManager()._zone_paths, [])
+        self.assertEqual(len(events["exit"]), 1)
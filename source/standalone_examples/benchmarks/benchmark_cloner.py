@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--num-envs", type=int, default=4096, help="Number of environments to clone.")
+parser.add_argument("--copy-from-source", action="store_true", help="Copy the source prim instead of inheriting it")
+parser.add_argument(
+    "--backend-type",
+    default="OmniPerfKPIFile",
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile", "TimeSeriesFileMetrics"],
+    help="Benchmarking backend, defaults",
+)
+
+args, unknown = parser.parse_known_args()
+
+n_envs = args.num_envs
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+from isaacsim.core.utils.extensions import enable_extension
+
+enable_extension("isaacsim.benchmark.services")
+
+import time
+
+import omni.usd
+from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics.measurements import SingleMeasurement
+from isaacsim.core.cloner import GridCloner
+from pxr import UsdGeom
+
+
+def create_source_env():
+    stage = omni.usd.get_context().get_stage()
+    UsdGeom.Xform.Define(stage, "/World/envs/env_0")
+    for i in range(4):
+        UsdGeom.Cube.Define(stage, f"/World/envs/env_0/Cube_{i}")
+    return stage
+
+
+def clone_environments(batch_authoring: bool) -> float:
+    cloner = GridCloner(spacing=2)
+    cloner.define_base_env("/World/envs")
+    prim_paths = cloner.generate_paths("/World/envs/env", n_envs)
+    start_time = time.perf_counter()
+    cloner.clone(
+        source_prim_path="/World/envs/env_0",
+        prim_paths=prim_paths,
+        copy_from_source=args.copy_from_source,
+        batch_authoring=batch_authoring,
+    )
+    return time.perf_counter() - start_time
+
+
+# Create the benchmark
+benchmark = BaseIsaacBenchmark(
+    benchmark_name="benchmark_cloner",
+    workflow_metadata={"metadata": [{"name": "num_envs", "data": n_envs}]},
+    backend_type=args.backend_type,
+)
+
+for phase, batch_authoring in [("clone_per_prim", False), ("clone_batch_authoring", True)]:
+    omni.usd.get_context().new_stage()
+    simulation_app.update()
+    create_source_env()
+
+    benchmark.set_phase(phase, start_recording_frametime=False, start_recording_runtime=True)
+    elapsed = clone_environments(batch_authoring)
+    benchmark.store_measurements()
+
+    clones_per_second = (n_envs - 1) / elapsed if elapsed > 0 else 0.0
+    print(f"[{phase}] cloned {n_envs - 1} environments in {elapsed:.3f} s ({clones_per_second:.1f} clones/s)")
+    benchmark.store_custom_measurement(
+        phase, SingleMeasurement(name="Clones Per Second", value=clones_per_second, unit="clones/s")
+    )
+
+benchmark.stop()
+simulation_app.close()
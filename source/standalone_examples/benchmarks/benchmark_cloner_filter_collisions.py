@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-envs", type=int, nargs="+", default=[1024, 4096, 16384], help="Number of environments to filter."
+)
+parser.add_argument(
+    "--backend-type",
+    default="OmniPerfKPIFile",
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile", "TimeSeriesFileMetrics"],
+    help="Benchmarking backend, defaults",
+)
+
+args, unknown = parser.parse_known_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+from isaacsim.core.utils.extensions import enable_extension
+
+enable_extension("isaacsim.benchmark.services")
+
+import time
+
+from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics.measurements import SingleMeasurement
+from isaacsim.core.cloner import Cloner
+from pxr import Usd, UsdGeom, UsdPhysics
+
+
+def filter_collisions(num_envs: int, batch_authoring: bool):
+    stage = Usd.Stage.CreateInMemory()
+    UsdPhysics.Scene.Define(stage, "/physicsScene")
+    UsdGeom.Cube.Define(stage, "/World/groundPlane")
+    cloner = Cloner(stage=stage)
+    prim_paths = cloner.generate_paths("/World/envs/env", num_envs)
+    start_time = time.perf_counter()
+    cloner.filter_collisions(
+        "/physicsScene",
+        "/World/collisions",
+        prim_paths,
+        global_paths=["/World/groundPlane"],
+        batch_authoring=batch_authoring,
+    )
+    elapsed = time.perf_counter() - start_time
+    layer_size = len(stage.GetRootLayer().ExportToString())
+    return elapsed, layer_size
+
+
+# Create the benchmark
+benchmark = BaseIsaacBenchmark(
+    benchmark_name="benchmark_cloner_filter_collisions",
+    workflow_metadata={"metadata": []},
+    backend_type=args.backend_type,
+)
+
+for num_envs in args.num_envs:
+    for mode, batch_authoring in [("default", False), ("batch_authoring", True)]:
+        phase = f"filter_collisions_{mode}_{num_envs}"
+        benchmark.set_phase(phase, start_recording_frametime=False, start_recording_runtime=True)
+        elapsed, layer_size = filter_collisions(num_envs, batch_authoring)
+        benchmark.store_measurements()
+
+        print(f"[{phase}] authored in {elapsed:.3f} s, layer size {layer_size / 1024.0:.1f} KB")
+        benchmark.store_custom_measurement(
+            phase, SingleMeasurement(name="Authoring Time", value=elapsed * 1000.0, unit="ms")
+        )
+        benchmark.store_custom_measurement(
+            phase, SingleMeasurement(name="Layer Size", value=layer_size / 1024.0, unit="KB")
+        )
+
+benchmark.stop()
+simulation_app.close()
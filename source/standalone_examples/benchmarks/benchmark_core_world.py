@@ -20,7 +20,7 @@ parser.add_argument("--num-gpus", type=int, default=None, help="Number of GPUs o
 parser.add_argument(
     "--backend-type",
     default="OmniPerfKPIFile",
-    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile"],
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile", "TimeSeriesFileMetrics"],
     help="Benchmarking backend, defaults",
 )
 
@@ -0,0 +1,174 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--num-candidates", type=int, nargs="+", default=[1000, 10000, 100000], help="Number of grasp candidates."
+)
+parser.add_argument("--num-orientations", type=int, default=4, help="Number of orientations per grasp axis.")
+parser.add_argument("--lateral-sigma", type=float, default=0.005, help="Lateral perturbation of the grasp center.")
+parser.add_argument("--chunk-size", type=int, default=8192, help="Chunk size of the streamed sampler.")
+parser.add_argument(
+    "--max-legacy-candidates",
+    type=int,
+    default=20000,
+    help="Skip the legacy per-sample loop above this number of candidates.",
+)
+parser.add_argument(
+    "--backend-type",
+    default="OmniPerfKPIFile",
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile", "TimeSeriesFileMetrics"],
+    help="Benchmarking backend, defaults",
+)
+
+args, unknown = parser.parse_known_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+from isaacsim.core.utils.extensions import enable_extension
+
+enable_extension("isaacsim.benchmark.services")
+enable_extension("isaacsim.replicator.grasping")
+
+import time
+
+import numpy as np
+import trimesh
+import trimesh.transformations as tra
+from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics.measurements import SingleMeasurement
+from isaacsim.replicator.grasping import sampler_utils
+from scipy import stats
+
+SAMPLER_CONFIG = {
+    "gripper_maximum_aperture": 0.08,
+    "gripper_standoff_fingertips": 0.1,
+    "gripper_approach_direction": np.array([0, 0, 1]),
+    "grasp_align_axis": np.array([0, 1, 0]),
+    "orientation_sample_axis": np.array([0, 1, 0]),
+    "random_seed": 12,
+}
+
+
+def sample_antipodal_legacy(object_mesh, num_candidates, num_orientations, lateral_sigma, **kwargs):
+    """Reference implementation: per-sample Python loop of the original sampler."""
+    np.random.seed(kwargs["random_seed"])
+    num_surface_samples = max(1, int(num_candidates // num_orientations))
+    surface_points, face_indices = object_mesh.sample(num_surface_samples, return_index=True)
+    ray_intersections, ray_indices, _ = object_mesh.ray.intersects_location(
+        surface_points, -object_mesh.face_normals[face_indices], multiple_hits=True
+    )
+    grasp_centers, grasp_axes = [], []
+    for point_idx in range(num_surface_samples):
+        ray_hits = ray_intersections[np.where(ray_indices == point_idx)]
+        if len(ray_hits) == 0:
+            continue
+        distances = np.linalg.norm(ray_hits - surface_points[point_idx], axis=1)
+        valid_indices = np.where(distances <= kwargs["gripper_maximum_aperture"])[0]
+        if len(valid_indices) == 0:
+            continue
+        grasp_axis = ray_hits[valid_indices[np.argmax(distances[valid_indices])]] - surface_points[point_idx]
+        axis_length = np.linalg.norm(grasp_axis)
+        if axis_length <= trimesh.tol.zero:
+            continue
+        ratio = 0.5
+        if lateral_sigma > 0:
+            sigma_ratio = lateral_sigma / axis_length
+            ratio = stats.truncnorm(-0.5 / sigma_ratio, 0.5 / sigma_ratio, loc=0.5, scale=sigma_ratio).rvs()
+        grasp_centers.append(surface_points[point_idx] + grasp_axis * ratio)
+        grasp_axes.append(grasp_axis / axis_length)
+
+    rotation_angles = np.linspace(-np.pi, np.pi, num_orientations, endpoint=False)
+    standoff_transform = tra.translation_matrix(
+        kwargs["gripper_approach_direction"] * -kwargs["gripper_standoff_fingertips"]
+    )
+    grasp_transforms = []
+    for center, axis in zip(grasp_centers, grasp_axes):
+        align_matrix = trimesh.geometry.align_vectors(kwargs["grasp_align_axis"], axis)
+        for angle in rotation_angles:
+            orient_tf = tra.rotation_matrix(angle=angle, direction=kwargs["orientation_sample_axis"])
+            grasp_transforms.append(tra.translation_matrix(center) @ align_matrix @ orient_tf @ standoff_transform)
+    return grasp_transforms
+
+
+def sample_antipodal_streamed(object_mesh, num_candidates, num_orientations, lateral_sigma, **kwargs):
+    num_grasps = 0
+    for chunk in sampler_utils.sample_antipodal_chunks(
+        object_mesh,
+        chunk_size=args.chunk_size,
+        num_candidates=num_candidates,
+        num_orientations=num_orientations,
+        lateral_sigma=lateral_sigma,
+        **kwargs,
+    ):
+        num_grasps += len(chunk)
+    return num_grasps
+
+
+def sample_antipodal_vectorized(object_mesh, num_candidates, num_orientations, lateral_sigma, **kwargs):
+    return sampler_utils.sample_antipodal(
+        object_mesh,
+        num_candidates=num_candidates,
+        num_orientations=num_orientations,
+        lateral_sigma=lateral_sigma,
+        **kwargs,
+    )
+
+
+SAMPLERS = [
+    ("legacy", sample_antipodal_legacy),
+    ("vectorized", sample_antipodal_vectorized),
+    ("streamed", sample_antipodal_streamed),
+]
+
+MESHES = {
+    "box": trimesh.creation.box((0.04, 0.06, 0.2)),
+    "cylinder": trimesh.creation.cylinder(radius=0.03, height=0.15, sections=64),
+}
+
+# Create the benchmark
+benchmark = BaseIsaacBenchmark(
+    benchmark_name="benchmark_grasp_sampler",
+    workflow_metadata={"metadata": []},
+    backend_type=args.backend_type,
+)
+
+for mesh_name, mesh in MESHES.items():
+    for num_candidates in args.num_candidates:
+        for mode, sampler in SAMPLERS:
+            if mode == "legacy" and num_candidates > args.max_legacy_candidates:
+                continue
+            phase = f"grasp_sampler_{mesh_name}_{mode}_{num_candidates}"
+            benchmark.set_phase(phase, start_recording_frametime=False, start_recording_runtime=True)
+            start_time = time.perf_counter()
+            result = sampler(mesh, num_candidates, args.num_orientations, args.lateral_sigma, **SAMPLER_CONFIG)
+            elapsed = time.perf_counter() - start_time
+            benchmark.store_measurements()
+
+            num_grasps = result if isinstance(result, int) else len(result)
+            print(f"[{phase}] sampled {num_grasps} grasps in {elapsed:.3f} s")
+            benchmark.store_custom_measurement(
+                phase, SingleMeasurement(name="Sampling Time", value=elapsed * 1000.0, unit="ms")
+            )
+            benchmark.store_custom_measurement(
+                phase, SingleMeasurement(name="Candidates Per Second", value=num_candidates / elapsed, unit="1/s")
+            )
+            benchmark.store_custom_measurement(phase, SingleMeasurement(name="Valid Grasps", value=num_grasps, unit=""))
+
+benchmark.stop()
+simulation_app.close()
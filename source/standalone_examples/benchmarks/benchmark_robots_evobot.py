@@ -22,7 +22,7 @@ parser.add_argument("--num-frames", type=int, default=600, help="Number of frame
 parser.add_argument(
     "--backend-type",
     default="OmniPerfKPIFile",
-    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile"],
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile", "TimeSeriesFileMetrics"],
     help="Benchmarking backend, defaults",
 )
 
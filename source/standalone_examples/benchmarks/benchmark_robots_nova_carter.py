@@ -25,7 +25,7 @@ parser.add_argument("--viewport-updates", action="store_false", help="Enable vie
 parser.add_argument(
     "--backend-type",
     default="OmniPerfKPIFile",
-    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile"],
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile", "TimeSeriesFileMetrics"],
     help="Benchmarking backend, defaults",
 )
 
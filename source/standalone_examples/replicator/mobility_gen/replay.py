@@ -52,6 +52,10 @@ if __name__ == "__main__":
     parser.add_argument("--normals_enabled", type=bool, default=False)
     parser.add_argument("--render_rt_subframes", type=int, default=1)
     parser.add_argument("--render_interval", type=int, default=1)
+    parser.add_argument("--output_format", type=str, default="chunked", choices=["chunked", "legacy"])
+    parser.add_argument("--chunk_size", type=int, default=256)
+    parser.add_argument("--compress", type=bool, default=False)
+    parser.add_argument("--num_workers", type=int, default=4)
 
     args, unknown = parser.parse_known_args()
 
@@ -84,7 +88,13 @@ if __name__ == "__main__":
     if os.path.exists(args.output_path):
         shutil.rmtree(args.output_path)
 
-    writer = MobilityGenWriter(args.output_path)
+    writer = MobilityGenWriter(
+        args.output_path,
+        format=args.output_format,
+        chunk_size=args.chunk_size,
+        compress=args.compress,
+        num_workers=args.num_workers,
+    )
     writer.copy_init(args.input_path)
 
     carb.log_warn(f"============== Replaying ==============")
@@ -97,9 +107,10 @@ if __name__ == "__main__":
 
     t0 = time.perf_counter()
     count = 0
-    for step in tqdm.tqdm(range(0, num_steps, args.render_interval)):
-
-        state_dict_original = reader.read_state_dict(index=step)
+    for step, state_dict_original in tqdm.tqdm(
+        zip(range(0, num_steps, args.render_interval), reader.iter_state_dicts(step=args.render_interval)),
+        total=len(range(0, num_steps, args.render_interval)),
+    ):
 
         scenario.load_state_dict(state_dict_original)
         scenario.write_replay_data()
@@ -129,6 +140,8 @@ if __name__ == "__main__":
         writer.write_state_dict_normals(state_normals, step)
 
         count += 1
+    writer.close()
+    reader.close()
     t1 = time.perf_counter()
 
     carb.log_warn(f"Process time per frame: {count / (t1 - t0)}")
@@ -56,6 +56,10 @@ if __name__ == "__main__":
     parser.add_argument("--normals_enabled", type=bool, default=False)
     parser.add_argument("--render_rt_subframes", type=int, default=1)
     parser.add_argument("--render_interval", type=int, default=1)
+    parser.add_argument("--output_format", type=str, default="chunked", choices=["chunked", "legacy"])
+    parser.add_argument("--chunk_size", type=int, default=256)
+    parser.add_argument("--compress", type=bool, default=False)
+    parser.add_argument("--num_workers", type=int, default=4)
     args, unknown = parser.parse_known_args()
 
     if args.input is None:
@@ -105,7 +109,13 @@ if __name__ == "__main__":
         if os.path.exists(output_path):
             shutil.rmtree(output_path)
 
-        writer = MobilityGenWriter(output_path)
+        writer = MobilityGenWriter(
+            output_path,
+            format=args.output_format,
+            chunk_size=args.chunk_size,
+            compress=args.compress,
+            num_workers=args.num_workers,
+        )
         writer.copy_init(recording_path)
 
         carb.log_warn(f"============== Replaying {recording_count} / {len(recording_paths)}==============")
@@ -118,10 +128,11 @@ if __name__ == "__main__":
 
         t0 = time.perf_counter()
         count = 0
-        for step in range(0, num_steps, args.render_interval):
+        for step, state_dict_original in zip(
+            range(0, num_steps, args.render_interval), reader.iter_state_dicts(step=args.render_interval)
+        ):
 
             carb.log_warn(f"{step} / {num_steps}")
-            state_dict_original = reader.read_state_dict(index=step)
 
             scenario.load_state_dict(state_dict_original)
             scenario.write_replay_data()
@@ -151,6 +162,8 @@ if __name__ == "__main__":
             writer.write_state_dict_normals(state_normals, step)
 
             count += 1
+        writer.close()
+        reader.close()
         t1 = time.perf_counter()
 
         carb.log_warn(f"Process time per frame: {count / (t1 - t0)}")